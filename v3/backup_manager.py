@@ -4,15 +4,31 @@
 Stream notify on Bluesky - v3 バックアップ・復元管理
 
 DB・テンプレート・設定を ZIP 形式で一括エクスポート/インポート
+
+増分バックアップ（create_incremental_backup）:
+- backup/incremental/ にコンテンツアドレス方式で保存する
+  （ファイルを 1MB ごとのチャンクに分け、SHA-256 をファイル名に objects/ に格納）
+- 同じ内容のチャンクは一度しか保存しないため、2回目以降は変更・追加された画像だけが増える
+- 前回のスナップショットからサイズ・更新時刻が変わっていないファイルは読み直さない
+- スナップショットごとに snapshots/<ID>.json（ファイル一覧とチャンクのハッシュ）を保存し、
+  verify_snapshot() / restore_snapshot() でハッシュを照合してから復元する
+
+DB は稼働中でも一貫した状態を保存するため、SQLite のオンラインバックアップ API で
+複製してから保存する（ZIP バックアップも同様）。
 """
 
 import os
+import json
 import shutil
+import sqlite3
+import hashlib
 import logging
+import tempfile
 import zipfile
+import zlib
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger("AppLogger")
 
@@ -20,6 +36,12 @@ __author__ = "mayuneco(mayunya)"
 __copyright__ = "Copyright (C) 2025 mayuneco(mayunya)"
 __license__ = "GPLv2"
 
+INCREMENTAL_CHUNK_SIZE = 1024 * 1024  # 1MB（SQLite のページサイズの倍数）
+INCREMENTAL_FORMAT_VERSION = 1
+
+# 圧縮しても小さくならない形式（チャンクをそのまま保存）
+_PRECOMPRESSED_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".zip"}
+
 
 class BackupManager:
     """バックアップ・復元を管理するクラス"""
@@ -38,6 +60,7 @@ class BackupManager:
         self.youtube_cache_file = self.base_dir / "data" / "youtube_video_detail_cache.json"
         self.deleted_videos_file = self.base_dir / "data" / "deleted_videos.json"
         self.images_dir = self.base_dir / "images"
+        self.incremental_dir = self.base_dir / "backup" / "incremental"
 
     def create_backup(
         self,
@@ -70,11 +93,14 @@ class BackupManager:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             backup_prefix = f"backup_{timestamp}"
 
-            with zipfile.ZipFile(backup_path, "w", zipfile.ZIP_DEFLATED) as zf:
-                # DB をバックアップ
+            with zipfile.ZipFile(backup_path, "w", zipfile.ZIP_DEFLATED) as zf, \
+                    tempfile.TemporaryDirectory() as snapshot_dir:
+                # DB をバックアップ（書き込み中でも一貫した状態を複製してから格納）
                 if self.db_path.exists():
                     arcname = f"{backup_prefix}/data/video_list.db"
-                    zf.write(self.db_path, arcname=arcname)
+                    db_snapshot = Path(snapshot_dir) / "video_list.db"
+                    self._snapshot_database(db_snapshot)
+                    zf.write(db_snapshot, arcname=arcname)
                     logger.debug(f"✅ DB をバックアップ: {self.db_path}")
                 else:
                     logger.warning(f"⚠️ DB ファイルが見つかりません: {self.db_path}")
@@ -87,13 +113,7 @@ class BackupManager:
                 else:
                     logger.warning(f"⚠️ YouTube キャッシュファイルが見つかりません: {self.youtube_cache_file}")
 
-                # 削除済み動画リストをバックアップ
-                if self.deleted_videos_file.exists():
-                    arcname = f"{backup_prefix}/data/deleted_videos.json"
-                    zf.write(self.deleted_videos_file, arcname=arcname)
-                    logger.debug(f"✅ 削除済み動画リストをバックアップ: {self.deleted_videos_file}")
-                else:
-                    logger.warning(f"⚠️ 削除済み動画リストが見つかりません: {self.deleted_videos_file}")
+                # 削除済み動画リストは DB（deleted_videos テーブル）に含まれるため個別のバックアップは不要
 
                 # テンプレートをバックアップ
                 if self.templates_dir.exists():
@@ -181,103 +201,524 @@ class BackupManager:
                 return False, "バックアップファイルの形式が無効です"
 
             backup_restore_dir = backup_dirs[0]
+            self._restore_from_dir(backup_restore_dir)
 
-            # DB を復元
-            db_backup = backup_restore_dir / "data" / "video_list.db"
-            if db_backup.exists():
-                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # 一時ディレクトリをクリーンアップ
+            shutil.rmtree(temp_dir)
 
-                # 既存 DB をバックアップ
-                if self.db_path.exists():
-                    backup_db = self.db_path.parent / f"video_list.db.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                    shutil.copy2(self.db_path, backup_db)
-                    logger.debug(f"✅ 既存 DB をバックアップ: {backup_db}")
+            logger.info(f"✅ バックアップから復元完了")
+            return True, "バックアップから復元しました\n\n⚠️ アプリケーションを再起動してください"
+
+        except Exception as e:
+            logger.error(f"❌ バックアップ復元に失敗: {e}")
+            return False, f"バックアップ復元に失敗しました:\n{e}"
 
-                shutil.copy2(db_backup, self.db_path)
-                logger.debug(f"✅ DB を復元: {self.db_path}")
-            else:
-                logger.warning(f"⚠️ バックアップに DB が含まれていません")
+    def _restore_from_dir(self, backup_restore_dir: Path) -> None:
+        """
+        展開済みのバックアップ（backup_YYYYMMdd_HHMMSS/ 相当のディレクトリ）から復元
 
-            # YouTube キャッシュを復元
-            youtube_cache_backup = backup_restore_dir / "data" / "youtube_video_detail_cache.json"
-            if youtube_cache_backup.exists():
-                self.youtube_cache_file.parent.mkdir(parents=True, exist_ok=True)
+        既存のファイルは .backup_<タイムスタンプ> を付けて退避してから置き換える。
 
-                # 既存キャッシュをバックアップ
+        Args:
+            backup_restore_dir: 復元元ディレクトリ
+        """
+        # DB を復元
+        db_backup = backup_restore_dir / "data" / "video_list.db"
+        if db_backup.exists():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # 既存 DB をバックアップ
+            if self.db_path.exists():
+                backup_db = self.db_path.parent / f"video_list.db.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                self._snapshot_database(backup_db)
+                logger.debug(f"✅ 既存 DB をバックアップ: {backup_db}")
+
+            # 既存 DB の WAL が残っていると、復元した DB を開いた時に適用されてしまう
+            for suffix in ("-wal", "-shm"):
+                try:
+                    Path(f"{self.db_path}{suffix}").unlink(missing_ok=True)
+                except OSError as e:
+                    logger.warning(f"⚠️ {self.db_path.name}{suffix} を削除できません（DB 使用中）: {e}")
+
+            shutil.copy2(db_backup, self.db_path)
+            logger.debug(f"✅ DB を復元: {self.db_path}")
+        else:
+            logger.warning(f"⚠️ バックアップに DB が含まれていません")
+
+        # YouTube キャッシュを復元
+        youtube_cache_backup = backup_restore_dir / "data" / "youtube_video_detail_cache.json"
+        if youtube_cache_backup.exists():
+            self.youtube_cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+            # 既存キャッシュをバックアップ
+            if self.youtube_cache_file.exists():
+                backup_cache = self.youtube_cache_file.parent / f"youtube_video_detail_cache.json.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                shutil.copy2(self.youtube_cache_file, backup_cache)
+                logger.debug(f"✅ 既存 YouTube キャッシュをバックアップ: {backup_cache}")
+
+            shutil.copy2(youtube_cache_backup, self.youtube_cache_file)
+            logger.debug(f"✅ YouTube キャッシュを復元: {self.youtube_cache_file}")
+        else:
+            logger.warning(f"⚠️ バックアップに YouTube キャッシュが含まれていません")
+
+        # 削除済み動画リストを復元（旧形式のバックアップのみ。次回起動時に DB へ取り込まれる）
+        deleted_videos_backup = backup_restore_dir / "data" / "deleted_videos.json"
+        if deleted_videos_backup.exists():
+            self.deleted_videos_file.parent.mkdir(parents=True, exist_ok=True)
+
+            # 既存リストをバックアップ
+            if self.deleted_videos_file.exists():
+                backup_deleted = self.deleted_videos_file.parent / f"deleted_videos.json.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                shutil.copy2(self.deleted_videos_file, backup_deleted)
+                logger.debug(f"✅ 既存削除済み動画リストをバックアップ: {backup_deleted}")
+
+            shutil.copy2(deleted_videos_backup, self.deleted_videos_file)
+            logger.debug(f"✅ 削除済み動画リストを復元: {self.deleted_videos_file}")
+        else:
+            logger.debug("バックアップに旧形式の削除済み動画リストは含まれていません（DB に含まれています）")
+
+        # テンプレートを復元
+        templates_backup = backup_restore_dir / "templates"
+        if templates_backup.exists():
+            if self.templates_dir.exists():
+                backup_templates = self.base_dir / f"templates.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                shutil.move(str(self.templates_dir), str(backup_templates))
+                logger.debug(f"✅ 既存テンプレートをバックアップ: {backup_templates}")
+
+            shutil.copytree(templates_backup, self.templates_dir)
+            logger.debug(f"✅ テンプレートを復元: {self.templates_dir}")
+        else:
+            logger.warning(f"⚠️ バックアップにテンプレートが含まれていません")
+
+        # settings.env を復元
+        settings_backup = backup_restore_dir / "settings.env"
+        if settings_backup.exists():
+            if self.settings_file.exists():
+                backup_settings = self.base_dir / f"settings.env.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                shutil.copy2(self.settings_file, backup_settings)
+                logger.debug(f"✅ 既存設定ファイルをバックアップ: {backup_settings}")
+
+            shutil.copy2(settings_backup, self.settings_file)
+            logger.debug(f"✅ 設定ファイルを復元: {self.settings_file}")
+        else:
+            logger.warning(f"⚠️ バックアップに設定ファイルが含まれていません")
+
+        # images/ フォルダを復元（存在する場合）
+        images_backup = backup_restore_dir / "images"
+        if images_backup.exists():
+            if self.images_dir.exists():
+                backup_images = self.base_dir / f"images.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                shutil.move(str(self.images_dir), str(backup_images))
+                logger.debug(f"✅ 既存画像フォルダをバックアップ: {backup_images}")
+
+            shutil.copytree(images_backup, self.images_dir)
+            logger.debug(f"✅ 画像フォルダを復元: {self.images_dir}")
+        else:
+            logger.debug(f"ℹ️ バックアップに画像フォルダが含まれていません")
+
+    # ============ DB スナップショット ============
+
+    def _snapshot_database(self, dest: Path) -> None:
+        """
+        稼働中の DB を SQLite のオンラインバックアップ API で複製
+
+        ファイルを直接コピーすると WAL に残っている書き込みが欠けたり、書き込み途中の
+        状態を拾ったりするため、読み取りトランザクション内で全ページを複製する。
+        複製先はジャーナルモードを DELETE に戻し、単独のファイルで完結させる。
+
+        Args:
+            dest: 複製先のファイルパス
+        """
+        source = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            target = sqlite3.connect(str(dest))
+            try:
+                source.backup(target)
+                target.execute("PRAGMA journal_mode=DELETE")
+            finally:
+                target.close()
+        finally:
+            source.close()
+
+    # ============ 増分バックアップ ============
+
+    def create_incremental_backup(
+        self,
+        repository_dir: Optional[str] = None,
+        include_api_keys: bool = False,
+        include_passwords: bool = False,
+        include_images: bool = True
+    ) -> Tuple[bool, str]:
+        """
+        増分バックアップ（スナップショット）を作成
+
+        Args:
+            repository_dir: 保存先ディレクトリ（省略時は backup/incremental/）
+            include_api_keys: settings.env に API キーを含めるか
+            include_passwords: settings.env にパスワードを含めるか
+            include_images: images/ フォルダを含めるか
+
+        Returns:
+            (成功フラグ, メッセージ)
+        """
+        try:
+            repository = Path(repository_dir) if repository_dir else self.incremental_dir
+            snapshots_dir = repository / "snapshots"
+            snapshots_dir.mkdir(parents=True, exist_ok=True)
+            (repository / "objects").mkdir(parents=True, exist_ok=True)
+
+            logger.info(f"🔄 増分バックアップを作成しています: {repository}")
+
+            snapshot_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+            suffix = 1
+            while (snapshots_dir / f"{snapshot_id}.json").exists():
+                snapshot_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{suffix}"
+                suffix += 1
+
+            # 前回のスナップショット（サイズ・更新時刻が同じファイルはチャンクを再利用）
+            previous_files = {}
+            previous = self.list_snapshots(str(repository))
+            if previous:
+                previous_files = self._load_manifest(previous[-1]).get("files", {})
+
+            stats = {"files": 0, "reused_files": 0, "new_chunks": 0, "new_bytes": 0}
+            files: Dict[str, Dict[str, Any]] = {}
+
+            with tempfile.TemporaryDirectory() as snapshot_dir:
+                # DB（一貫した状態を複製してから保存）
+                if self.db_path.exists():
+                    db_snapshot = Path(snapshot_dir) / "video_list.db"
+                    self._snapshot_database(db_snapshot)
+                    files["data/video_list.db"] = self._store_file(repository, db_snapshot, stats)
+                    logger.debug(f"✅ DB をバックアップ: {self.db_path}")
+                else:
+                    logger.warning(f"⚠️ DB ファイルが見つかりません: {self.db_path}")
+
+                # YouTube キャッシュ・テンプレート・画像
+                sources = []
                 if self.youtube_cache_file.exists():
-                    backup_cache = self.youtube_cache_file.parent / f"youtube_video_detail_cache.json.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                    shutil.copy2(self.youtube_cache_file, backup_cache)
-                    logger.debug(f"✅ 既存 YouTube キャッシュをバックアップ: {backup_cache}")
-
-                shutil.copy2(youtube_cache_backup, self.youtube_cache_file)
-                logger.debug(f"✅ YouTube キャッシュを復元: {self.youtube_cache_file}")
-            else:
-                logger.warning(f"⚠️ バックアップに YouTube キャッシュが含まれていません")
-
-            # 削除済み動画リストを復元
-            deleted_videos_backup = backup_restore_dir / "data" / "deleted_videos.json"
-            if deleted_videos_backup.exists():
-                self.deleted_videos_file.parent.mkdir(parents=True, exist_ok=True)
-
-                # 既存リストをバックアップ
-                if self.deleted_videos_file.exists():
-                    backup_deleted = self.deleted_videos_file.parent / f"deleted_videos.json.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                    shutil.copy2(self.deleted_videos_file, backup_deleted)
-                    logger.debug(f"✅ 既存削除済み動画リストをバックアップ: {backup_deleted}")
-
-                shutil.copy2(deleted_videos_backup, self.deleted_videos_file)
-                logger.debug(f"✅ 削除済み動画リストを復元: {self.deleted_videos_file}")
-            else:
-                logger.warning(f"⚠️ バックアップに削除済み動画リストが含まれていません")
-
-            # テンプレートを復元
-            templates_backup = backup_restore_dir / "templates"
-            if templates_backup.exists():
+                    sources.append(self.youtube_cache_file)
+                else:
+                    logger.warning(f"⚠️ YouTube キャッシュファイルが見つかりません: {self.youtube_cache_file}")
                 if self.templates_dir.exists():
-                    backup_templates = self.base_dir / f"templates.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                    shutil.move(str(self.templates_dir), str(backup_templates))
-                    logger.debug(f"✅ 既存テンプレートをバックアップ: {backup_templates}")
-
-                shutil.copytree(templates_backup, self.templates_dir)
-                logger.debug(f"✅ テンプレートを復元: {self.templates_dir}")
-            else:
-                logger.warning(f"⚠️ バックアップにテンプレートが含まれていません")
-
-            # settings.env を復元
-            settings_backup = backup_restore_dir / "settings.env"
-            if settings_backup.exists():
+                    sources.extend(f for f in self.templates_dir.rglob("*") if f.is_file())
+                else:
+                    logger.warning(f"⚠️ テンプレートディレクトリが見つかりません: {self.templates_dir}")
+                if include_images and self.images_dir.exists():
+                    sources.extend(f for f in self.images_dir.rglob("*") if f.is_file())
+                elif include_images:
+                    logger.warning(f"⚠️ 画像ディレクトリが見つかりません: {self.images_dir}")
+
+                for source in sources:
+                    rel_path = source.relative_to(self.base_dir).as_posix()
+                    files[rel_path] = self._store_file(repository, source, stats, previous_files.get(rel_path))
+
+                # settings.env（機密情報の除外を反映した内容を保存）
                 if self.settings_file.exists():
-                    backup_settings = self.base_dir / f"settings.env.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                    shutil.copy2(self.settings_file, backup_settings)
-                    logger.debug(f"✅ 既存設定ファイルをバックアップ: {backup_settings}")
-
-                shutil.copy2(settings_backup, self.settings_file)
-                logger.debug(f"✅ 設定ファイルを復元: {self.settings_file}")
-            else:
-                logger.warning(f"⚠️ バックアップに設定ファイルが含まれていません")
-
-            # images/ フォルダを復元（存在する場合）
-            images_backup = backup_restore_dir / "images"
-            if images_backup.exists():
-                if self.images_dir.exists():
-                    backup_images = self.base_dir / f"images.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                    shutil.move(str(self.images_dir), str(backup_images))
-                    logger.debug(f"✅ 既存画像フォルダをバックアップ: {backup_images}")
-
-                shutil.copytree(images_backup, self.images_dir)
-                logger.debug(f"✅ 画像フォルダを復元: {self.images_dir}")
-            else:
-                logger.debug(f"ℹ️ バックアップに画像フォルダが含まれていません")
+                    settings_content = self._prepare_settings_for_backup(
+                        include_api_keys=include_api_keys,
+                        include_passwords=include_passwords
+                    )
+                    settings_snapshot = Path(snapshot_dir) / "settings.env"
+                    settings_snapshot.write_text(settings_content, encoding="utf-8")
+                    files["settings.env"] = self._store_file(repository, settings_snapshot, stats)
+                else:
+                    logger.warning(f"⚠️ 設定ファイルが見つかりません: {self.settings_file}")
 
-            # 一時ディレクトリをクリーンアップ
-            shutil.rmtree(temp_dir)
+            stats["files"] = len(files)
+            manifest = {
+                "format": INCREMENTAL_FORMAT_VERSION,
+                "snapshot_id": snapshot_id,
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "chunk_size": INCREMENTAL_CHUNK_SIZE,
+                "options": {
+                    "include_api_keys": include_api_keys,
+                    "include_passwords": include_passwords,
+                    "include_images": include_images,
+                },
+                "stats": stats,
+                "files": files,
+            }
+
+            # スナップショット一覧はすべてのチャンクを書き終えてから保存する
+            manifest_path = snapshots_dir / f"{snapshot_id}.json"
+            tmp_path = manifest_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False)
+            tmp_path.replace(manifest_path)
+
+            new_size_mb = stats["new_bytes"] / (1024 * 1024)
+            logger.info(
+                f"✅ 増分バックアップ作成完了: {snapshot_id}（{stats['files']} ファイル、"
+                f"未変更 {stats['reused_files']} 件、追加チャンク {stats['new_chunks']} 件 / {new_size_mb:.2f} MB）"
+            )
+            return True, (
+                f"増分バックアップを作成しました\n\n"
+                f"スナップショット: {manifest_path}\n"
+                f"ファイル: {stats['files']} 件（未変更 {stats['reused_files']} 件）\n"
+                f"追加容量: {new_size_mb:.2f} MB"
+            )
 
-            logger.info(f"✅ バックアップから復元完了")
-            return True, "バックアップから復元しました\n\n⚠️ アプリケーションを再起動してください"
+        except Exception as e:
+            logger.error(f"❌ 増分バックアップ作成に失敗: {e}")
+            return False, f"増分バックアップ作成に失敗しました:\n{e}"
+
+    def list_snapshots(self, repository_dir: Optional[str] = None) -> List[Path]:
+        """
+        増分バックアップのスナップショット一覧を取得（古い順）
+
+        Args:
+            repository_dir: 保存先ディレクトリ（省略時は backup/incremental/）
+
+        Returns:
+            スナップショットファイル（snapshots/<ID>.json）のリスト
+        """
+        repository = Path(repository_dir) if repository_dir else self.incremental_dir
+        snapshots_dir = repository / "snapshots"
+        if not snapshots_dir.exists():
+            return []
+        return sorted(snapshots_dir.glob("*.json"))
+
+    def verify_snapshot(self, snapshot_file: str) -> Tuple[bool, str]:
+        """
+        スナップショットの全チャンクを読み出し、ハッシュとサイズを照合
+
+        Args:
+            snapshot_file: スナップショットファイル（snapshots/<ID>.json）
+
+        Returns:
+            (成功フラグ, メッセージ)
+        """
+        try:
+            snapshot_path = Path(snapshot_file)
+            repository = snapshot_path.parent.parent
+            manifest = self._load_manifest(snapshot_path)
+
+            verified = {}
+            errors = []
+            for rel_path, entry in manifest["files"].items():
+                size = 0
+                for digest in entry["chunks"]:
+                    if digest not in verified:
+                        try:
+                            verified[digest] = len(self._read_chunk(repository, digest))
+                        except Exception as e:
+                            verified[digest] = None
+                            errors.append(f"{rel_path}: {e}")
+                    if verified[digest] is not None:
+                        size += verified[digest]
+                if size != entry["size"] and not any(verified[d] is None for d in entry["chunks"]):
+                    errors.append(f"{rel_path}: サイズ不一致（{size} != {entry['size']}）")
+
+            if errors:
+                for error in errors[:20]:
+                    logger.error(f"❌ スナップショット検証エラー: {error}")
+                return False, f"スナップショットが破損しています（{len(errors)} 件）:\n" + "\n".join(errors[:5])
+
+            logger.info(f"✅ スナップショット検証完了: {manifest['snapshot_id']}（{len(manifest['files'])} ファイル）")
+            return True, f"スナップショットは正常です\n\nファイル: {len(manifest['files'])} 件\nチャンク: {len(verified)} 件"
 
         except Exception as e:
-            logger.error(f"❌ バックアップ復元に失敗: {e}")
-            return False, f"バックアップ復元に失敗しました:\n{e}"
+            logger.error(f"❌ スナップショット検証に失敗: {e}")
+            return False, f"スナップショット検証に失敗しました:\n{e}"
+
+    def restore_snapshot(self, snapshot_file: str) -> Tuple[bool, str]:
+        """
+        増分バックアップのスナップショットから復元
+
+        全ファイルを一時ディレクトリに組み立て、ハッシュがすべて一致した場合のみ
+        現在のデータを置き換える（1件でも一致しなければ何も変更しない）。
+
+        Args:
+            snapshot_file: スナップショットファイル（snapshots/<ID>.json）
+
+        Returns:
+            (成功フラグ, メッセージ)
+        """
+        try:
+            snapshot_path = Path(snapshot_file)
+            if not snapshot_path.exists():
+                logger.error(f"❌ スナップショットが見つかりません: {snapshot_file}")
+                return False, f"スナップショットが見つかりません:\n{snapshot_file}"
+
+            repository = snapshot_path.parent.parent
+            manifest = self._load_manifest(snapshot_path)
+            logger.info(f"🔄 スナップショットから復元しています: {manifest['snapshot_id']}")
+
+            # 復元用の一時ディレクトリ
+            temp_dir = self.base_dir / ".backup_restore_temp"
+            if temp_dir.exists():
+                shutil.rmtree(temp_dir)
+            backup_restore_dir = temp_dir / f"backup_{manifest['snapshot_id']}"
+            backup_restore_dir.mkdir(parents=True, exist_ok=True)
+
+            try:
+                for rel_path, entry in manifest["files"].items():
+                    restored = backup_restore_dir / rel_path
+                    if backup_restore_dir.resolve() not in restored.resolve().parents:
+                        raise ValueError(f"不正なパス: {rel_path}")
+                    restored.parent.mkdir(parents=True, exist_ok=True)
+                    file_hash = hashlib.sha256()
+                    with open(restored, "wb") as f:
+                        for digest in entry["chunks"]:
+                            data = self._read_chunk(repository, digest)
+                            file_hash.update(data)
+                            f.write(data)
+                    if file_hash.hexdigest() != entry["sha256"]:
+                        raise ValueError(f"ハッシュ不一致: {rel_path}")
+                logger.debug(f"✅ スナップショットを展開・検証: {len(manifest['files'])} ファイル")
+
+                self._restore_from_dir(backup_restore_dir)
+            finally:
+                # 一時ディレクトリをクリーンアップ
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+            logger.info(f"✅ スナップショットから復元完了: {manifest['snapshot_id']}")
+            return True, "スナップショットから復元しました\n\n⚠️ アプリケーションを再起動してください"
+
+        except Exception as e:
+            logger.error(f"❌ スナップショット復元に失敗: {e}")
+            return False, f"スナップショット復元に失敗しました:\n{e}"
+
+    def prune_snapshots(self, keep: int, repository_dir: Optional[str] = None) -> Tuple[bool, str]:
+        """
+        古いスナップショットを削除し、どのスナップショットからも参照されないチャンクを削除
+
+        Args:
+            keep: 残すスナップショットの数（新しい順）
+            repository_dir: 保存先ディレクトリ（省略時は backup/incremental/）
+
+        Returns:
+            (成功フラグ, メッセージ)
+        """
+        try:
+            repository = Path(repository_dir) if repository_dir else self.incremental_dir
+            snapshots = self.list_snapshots(str(repository))
+            keep = max(1, keep)
+            removed_snapshots = snapshots[:-keep]
+
+            # 参照中のチャンクを先に集めてから削除する（一覧が読めない場合は何も削除しない）
+            referenced = set()
+            for snapshot_path in snapshots[-keep:]:
+                for entry in self._load_manifest(snapshot_path)["files"].values():
+                    referenced.update(entry["chunks"])
+
+            for snapshot_path in removed_snapshots:
+                snapshot_path.unlink()
+
+            removed_chunks = 0
+            freed_bytes = 0
+            objects_dir = repository / "objects"
+            if objects_dir.exists():
+                for chunk_path in objects_dir.glob("*/*"):
+                    if chunk_path.name not in referenced:
+                        freed_bytes += chunk_path.stat().st_size
+                        chunk_path.unlink()
+                        removed_chunks += 1
+
+            freed_mb = freed_bytes / (1024 * 1024)
+            logger.info(
+                f"✅ 増分バックアップを整理: スナップショット {len(removed_snapshots)} 件、"
+                f"チャンク {removed_chunks} 件（{freed_mb:.2f} MB）を削除"
+            )
+            return True, f"スナップショット {len(removed_snapshots)} 件を削除しました（{freed_mb:.2f} MB 解放）"
+
+        except Exception as e:
+            logger.error(f"❌ 増分バックアップの整理に失敗: {e}")
+            return False, f"増分バックアップの整理に失敗しました:\n{e}"
+
+    def _store_file(
+        self,
+        repository: Path,
+        source: Path,
+        stats: Dict[str, int],
+        previous: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        ファイルをチャンクに分けて objects/ に保存し、スナップショット用のエントリを返す
+
+        Args:
+            repository: 保存先ディレクトリ
+            source: 保存するファイル
+            stats: 集計（reused_files / new_chunks / new_bytes を加算）
+            previous: 前回のスナップショットでの同じファイルのエントリ
+
+        Returns:
+            {"size", "mtime_ns", "sha256", "chunks"}
+        """
+        st = source.stat()
+        if (
+            previous
+            and previous.get("size") == st.st_size
+            and previous.get("mtime_ns") == st.st_mtime_ns
+            and all(self._chunk_path(repository, d).exists() for d in previous["chunks"])
+        ):
+            stats["reused_files"] += 1
+            return previous
+
+        compress = source.suffix.lower() not in _PRECOMPRESSED_SUFFIXES
+        file_hash = hashlib.sha256()
+        chunks = []
+        with open(source, "rb") as f:
+            while True:
+                data = f.read(INCREMENTAL_CHUNK_SIZE)
+                if not data:
+                    break
+                file_hash.update(data)
+                digest = hashlib.sha256(data).hexdigest()
+                chunks.append(digest)
+
+                chunk_path = self._chunk_path(repository, digest)
+                if chunk_path.exists():
+                    continue
+                payload = b"R" + data
+                if compress:
+                    compressed = zlib.compress(data, 6)
+                    if len(compressed) < len(data):
+                        payload = b"Z" + compressed
+                chunk_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = chunk_path.with_suffix(".tmp")
+                with open(tmp_path, "wb") as out:
+                    out.write(payload)
+                tmp_path.replace(chunk_path)
+                stats["new_chunks"] += 1
+                stats["new_bytes"] += len(payload)
+
+        return {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "sha256": file_hash.hexdigest(),
+            "chunks": chunks,
+        }
+
+    @staticmethod
+    def _chunk_path(repository: Path, digest: str) -> Path:
+        return repository / "objects" / digest[:2] / digest
+
+    def _read_chunk(self, repository: Path, digest: str) -> bytes:
+        """チャンクを読み出し、SHA-256 を照合して返す（不一致・欠落時は例外）"""
+        chunk_path = self._chunk_path(repository, digest)
+        if not chunk_path.exists():
+            raise FileNotFoundError(f"チャンクが見つかりません: {digest}")
+        payload = chunk_path.read_bytes()
+        kind, body = payload[:1], payload[1:]
+        if kind == b"Z":
+            data = zlib.decompress(body)
+        elif kind == b"R":
+            data = body
+        else:
+            raise ValueError(f"不明なチャンク形式: {digest}")
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"チャンクのハッシュ不一致: {digest}")
+        return data
+
+    @staticmethod
+    def _load_manifest(snapshot_path: Path) -> Dict[str, Any]:
+        with open(snapshot_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("format") != INCREMENTAL_FORMAT_VERSION:
+            raise ValueError(f"未対応のスナップショット形式: {manifest.get('format')}")
+        return manifest
 
     def _prepare_settings_for_backup(
         self,
@@ -351,3 +792,42 @@ class BackupManager:
 def get_backup_manager(base_dir=".") -> BackupManager:
     """BackupManager インスタンスを取得"""
     return BackupManager(base_dir)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="増分バックアップの作成・検証・復元・整理")
+    parser.add_argument("command", choices=["create", "list", "verify", "restore", "prune"], help="実行する操作")
+    parser.add_argument("snapshot", nargs="?", help="verify / restore の対象（snapshots/<ID>.json、省略時は最新）")
+    parser.add_argument("--repository", default=None, help="保存先ディレクトリ（デフォルト: backup/incremental）")
+    parser.add_argument("--no-images", action="store_true", help="images/ フォルダを含めない")
+    parser.add_argument("--keep", type=int, default=7, help="prune で残すスナップショット数（デフォルト: 7）")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    manager = get_backup_manager()
+
+    if args.command == "list":
+        for snapshot_path in manager.list_snapshots(args.repository):
+            print(snapshot_path)
+        raise SystemExit(0)
+
+    if args.command == "create":
+        ok, message = manager.create_incremental_backup(args.repository, include_images=not args.no_images)
+    elif args.command == "prune":
+        ok, message = manager.prune_snapshots(args.keep, args.repository)
+    else:
+        snapshot = args.snapshot
+        if not snapshot:
+            snapshots = manager.list_snapshots(args.repository)
+            if not snapshots:
+                parser.error("スナップショットがありません")
+            snapshot = str(snapshots[-1])
+        if args.command == "verify":
+            ok, message = manager.verify_snapshot(snapshot)
+        else:
+            ok, message = manager.restore_snapshot(snapshot)
+
+    print(message)
+    raise SystemExit(0 if ok else 1)
@@ -0,0 +1,4 @@
+﻿# -*- coding: utf-8 -*-
+"""
+Benchmarks module - 起動時間・パイプライン性能などの計測スクリプト
+"""
@@ -0,0 +1,586 @@
+# -*- coding: utf-8 -*-
+"""
+パイプラインベンチマーク（録画済みレスポンスの再生）
+
+YouTube RSS（Atom）・videos.list の JSON・ニコニコ RSS・Bluesky XRPC の録画済みレスポンスを
+ローカルのスタブサーバー（benchmarks/stub_servers.py）から返し、ネットワークに出ずに
+主要な処理を大規模な条件で繰り返し実行して、レイテンシ（p50 / p99）とスループット（ops/sec）を計測する。
+
+シナリオ（1 op の単位）:
+- youtube_rss_new     : YouTubeRSS.save_to_db（1チャンネル分、15件すべて新着）
+- youtube_rss_recheck : YouTubeRSS.save_to_db（同じチャンネルの再取得、15件すべて登録済み）
+- live_poll_cold      : LiveModule.poll_lives（1回分、動画詳細キャッシュなし → videos.list を呼び出す）
+- live_poll_warm      : LiveModule.poll_lives（1回分、動画詳細キャッシュ有効）
+- niconico_rss        : NiconicoPlugin.get_video_entries（1ユーザー分）
+- bluesky_post        : BlueskyImagePlugin.post_video（画像リサイズ・uploadBlob・createRecord を含む）
+- image_resize        : image_processor.resize_image（処理結果キャッシュなし）
+- image_resize_cached : image_processor.resize_image（処理結果キャッシュあり）
+
+計測は一時ディレクトリ（settings.env・DB・キャッシュ・画像）で行い、v3/data などは変更しない。
+DB には事前に --rows 件の動画（うち --live-rows 件は予約枠）を登録しておく。
+アプリのログは計測対象外とし、実行中は出力を止める（--with-logging で通常どおりログを出力して計測）。
+デフォルトの規模（1000 チャンネル・10 万行）は完了まで時間がかかるため、動作確認には --quick を使う。
+
+--save で結果を保存し、--baseline で保存済みの結果と比較する。
+p50 / p99 が --max-regression（%）を超えて悪化したシナリオがあれば終了コード 1 を返す（CI 用）。
+
+使い方:
+    python -m benchmarks.pipeline_benchmark
+    python -m benchmarks.pipeline_benchmark --quick
+    python -m benchmarks.pipeline_benchmark --save bench_baseline.json
+    python -m benchmarks.pipeline_benchmark --baseline bench_baseline.json --max-regression 25
+
+オプション:
+    --scenarios LIST   : 実行するシナリオ（カンマ区切り: youtube_rss,live_poll,niconico_rss,bluesky_post,image_resize）
+    --channels N       : YouTube チャンネル数（デフォルト: 1000）
+    --rows N           : 事前に DB に登録する動画数（デフォルト: 100000）
+    --live-rows N      : そのうち Live 予約枠として登録する動画数（デフォルト: 200）
+    --polls N          : poll_lives の実行回数（デフォルト: 5）
+    --niconico-users N : ニコニコのユーザー数（デフォルト: 200）
+    --posts N          : Bluesky 投稿数（デフォルト: 50）
+    --images N         : リサイズする画像数（デフォルト: 50）
+    --latency-ms N     : スタブサーバーの疑似ネットワーク遅延（ミリ秒、デフォルト: 0）
+    --with-logging     : logging_config.setup_logging() でログ設定を行い、ログ出力を含めて計測
+    --quick            : 小規模（チャンネル 20・DB 2000 行など）で実行
+    --json             : 結果を JSON で出力
+    --save FILE        : 結果を JSON で保存
+    --baseline FILE    : 比較対象の結果（--save で保存したもの）
+    --max-regression N : 許容する悪化率（%、デフォルト: 20）
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+V3_DIR = Path(__file__).parent.parent
+if str(V3_DIR) not in sys.path:
+    sys.path.insert(0, str(V3_DIR))
+
+from benchmarks.stub_servers import FixtureServer, json_response, load_fixture, load_template, redirect_to, xml_response
+
+SCENARIO_GROUPS = ("youtube_rss", "live_poll", "niconico_rss", "bluesky_post", "image_resize")
+
+DEFAULT_CHANNELS = 1000
+DEFAULT_ROWS = 100000
+DEFAULT_LIVE_ROWS = 200
+DEFAULT_POLLS = 5
+DEFAULT_NICONICO_USERS = 200
+DEFAULT_POSTS = 50
+DEFAULT_IMAGES = 50
+DEFAULT_MAX_REGRESSION = 20.0
+
+QUICK_SCALE = {
+    "channels": 20,
+    "rows": 2000,
+    "live_rows": 20,
+    "polls": 3,
+    "niconico_users": 20,
+    "posts": 5,
+    "images": 5,
+}
+
+BENCH_CHANNEL_NAME = "ベンチマークチャンネル"
+BENCH_NICONICO_USER_NAME = "ベンチマークユーザー"
+LIVE_ID_PREFIX = "LV"  # この接頭辞の動画 ID には videos.list が予約枠として応答する
+FEED_ENTRY_COUNT = 15
+THUMBNAIL_CONTENT_LENGTH = 65536  # HEAD の応答サイズ（プレースホルダー判定の閾値より大きくする）
+
+SETTINGS_ENV = """\
+YOUTUBE_CHANNEL_ID=UCbench00000000000000000
+YOUTUBE_API_KEY=benchmark
+BLUESKY_USERNAME=benchmark.bsky.social
+BLUESKY_PASSWORD=benchmark-password
+APP_MODE=selfpost
+DEBUG_MODE=false
+"""
+
+
+# ============ ID 生成（フィクスチャと DB で共通） ============
+
+def channel_id(index: int) -> str:
+    return f"UCbench{index:017d}"
+
+
+def channel_index(channel: str) -> int:
+    try:
+        return int(channel[7:])
+    except ValueError:
+        return 0
+
+
+def feed_video_id(channel: int, entry: int) -> str:
+    return f"RS{channel:07d}{entry:02d}"
+
+
+def niconico_video_id(user: int, entry: int) -> str:
+    return f"sm{user:07d}{entry:02d}"
+
+
+# ============ スタブサーバーのハンドラ ============
+
+def build_fixture_server(latency_ms: float = 0) -> FixtureServer:
+    """録画済みレスポンスを返すルートを登録したスタブサーバーを作成"""
+    youtube_feed = load_template("youtube_feed.xml")
+    video_item = load_template("youtube_video_item.json")
+    live_item = load_template("youtube_live_item.json")
+    niconico_rss = load_template("niconico_user_rss.xml")
+    thumbnail = _make_jpeg(1280, 720, seed=0)
+
+    def youtube_feed_handler(request):
+        channel = request.param("channel_id")
+        index = channel_index(channel)
+        values = {f"vid{i:02d}": feed_video_id(index, i) for i in range(FEED_ENTRY_COUNT)}
+        return xml_response(
+            youtube_feed.substitute(values, channel_id=channel, channel_name=BENCH_CHANNEL_NAME),
+            content_type="application/atom+xml",
+        )
+
+    def videos_list_handler(request):
+        items = []
+        for video_id in filter(None, request.param("id").split(",")):
+            template = live_item if video_id.startswith(LIVE_ID_PREFIX) else video_item
+            items.append(template.substitute(video_id=video_id, channel_id=channel_id(0), channel_name=BENCH_CHANNEL_NAME))
+        body = (
+            '{"kind": "youtube#videoListResponse", "etag": "benchmark", '
+            f'"items": [{",".join(items)}], '
+            f'"pageInfo": {{"totalResults": {len(items)}, "resultsPerPage": {len(items)}}}}}'
+        )
+        return json_response(body)
+
+    def thumbnail_handler(request):
+        if request.method == "HEAD":
+            return 200, {"Content-Type": "image/jpeg", "Content-Length": str(THUMBNAIL_CONTENT_LENGTH)}, b""
+        return 200, {"Content-Type": "image/jpeg"}, thumbnail
+
+    def niconico_rss_handler(request):
+        # /user/<user_id>/video
+        user_id = request.path.split("/")[2]
+        index = int(user_id) if user_id.isdigit() else 0
+        values = {f"vid{i:02d}": niconico_video_id(index, i) for i in range(FEED_ENTRY_COUNT)}
+        return xml_response(
+            niconico_rss.substitute(values, user_id=user_id, user_name=BENCH_NICONICO_USER_NAME),
+            content_type="application/rss+xml",
+        )
+
+    def fixture_handler(name):
+        body = load_fixture(name)
+        return lambda request: json_response(body)
+
+    server = FixtureServer(latency_ms=latency_ms)
+    server.route("GET", "www.youtube.com", "/feeds/videos.xml", youtube_feed_handler)
+    server.route("GET", "www.googleapis.com", "/youtube/v3/videos", videos_list_handler)
+    server.route("HEAD", "i.ytimg.com", "/vi/", thumbnail_handler)
+    server.route("GET", "i.ytimg.com", "/vi/", thumbnail_handler)
+    server.route("GET", "www.nicovideo.jp", "/user/", niconico_rss_handler)
+    server.route("POST", "bsky.social", "/xrpc/com.atproto.server.createSession", fixture_handler("bluesky_create_session.json"))
+    server.route("POST", "bsky.social", "/xrpc/com.atproto.repo.uploadBlob", fixture_handler("bluesky_upload_blob.json"))
+    server.route("POST", "bsky.social", "/xrpc/com.atproto.repo.createRecord", fixture_handler("bluesky_create_record.json"))
+    return server
+
+
+# ============ 計測環境 ============
+
+def _make_jpeg(width: int, height: int, seed: int) -> bytes:
+    """サムネイルに近い圧縮率になるよう、グラデーションにノイズを重ねた JPEG を生成"""
+    from PIL import Image
+
+    rng = random.Random(seed)
+    noise = Image.effect_noise((width, height), 24)
+    gradient = Image.linear_gradient("L").resize((width, height))
+    red = Image.blend(gradient, noise, 0.5)
+    green = gradient.rotate(90, expand=False).point(lambda v: (v + rng.randrange(256)) % 256)
+    blue = noise.point(lambda v: (v + rng.randrange(256)) % 256)
+    buffer = io.BytesIO()
+    Image.merge("RGB", (red, green, blue)).save(buffer, format="JPEG", quality=92)
+    return buffer.getvalue()
+
+
+@contextmanager
+def bench_environment(args):
+    """
+    一時ディレクトリを作業ディレクトリにして、DB・キャッシュ・画像をそこに作成する
+
+    v3/ からの絶対パスで保存されるキャッシュ（動画詳細・チャンネル ID）も一時ディレクトリに向ける。
+    終了時（atexit）に保存されるサムネイル解像度キャッシュは、一時ディレクトリの絶対パスで先に作成しておく。
+    """
+    import image_manager
+    import youtube_core.youtube_video_classifier as classifier_module
+    import plugins.youtube.youtube_api_plugin as api_plugin_module
+
+    original_cwd = os.getcwd()
+    original_paths = (
+        classifier_module.VIDEO_DETAIL_CACHE_FILE,
+        api_plugin_module.VIDEO_DETAIL_CACHE_FILE,
+        api_plugin_module.CHANNEL_ID_CACHE_FILE,
+    )
+    with tempfile.TemporaryDirectory(prefix="streamnotify_bench_") as workdir:
+        workdir = Path(workdir)
+        (workdir / "data").mkdir()
+        (workdir / "settings.env").write_text(SETTINGS_ENV, encoding="utf-8")
+        detail_cache = str(workdir / "data" / "youtube_video_detail_cache.json")
+        classifier_module.VIDEO_DETAIL_CACHE_FILE = detail_cache
+        api_plugin_module.VIDEO_DETAIL_CACHE_FILE = detail_cache
+        api_plugin_module.CHANNEL_ID_CACHE_FILE = str(workdir / "data" / "youtube_channel_cache.json")
+        original_probe_cache = image_manager._thumb_probe_cache
+        image_manager._thumb_probe_cache = image_manager.YouTubeThumbProbeCache(
+            str(workdir / image_manager.YOUTUBE_THUMB_PROBE_CACHE_FILE)
+        )
+        os.chdir(workdir)
+        if args.with_logging:
+            from logging_config import setup_logging, stop_queue_logging
+            setup_logging(debug_mode=False)
+        elif not args.verbose:
+            logging.disable(logging.CRITICAL)
+        try:
+            yield workdir
+        finally:
+            if args.with_logging:
+                stop_queue_logging()
+            logging.disable(logging.NOTSET)
+            image_manager._thumb_probe_cache = original_probe_cache
+            os.chdir(original_cwd)
+            (
+                classifier_module.VIDEO_DETAIL_CACHE_FILE,
+                api_plugin_module.VIDEO_DETAIL_CACHE_FILE,
+                api_plugin_module.CHANNEL_ID_CACHE_FILE,
+            ) = original_paths
+
+
+def prefill_database(db, rows: int, live_rows: int) -> None:
+    """DB に rows 件の動画を一括登録（末尾 live_rows 件は Live 予約枠）"""
+    normal_rows = max(rows - live_rows, 0)
+
+    def generate():
+        for n in range(normal_rows):
+            yield (f"DB{n:09d}", f"登録済み動画 {n}", f"https://www.youtube.com/watch?v=DB{n:09d}",
+                   "2025-01-01T00:00:00", BENCH_CHANNEL_NAME, "video", None, 1)
+        for n in range(live_rows):
+            video_id = f"{LIVE_ID_PREFIX}{n:09d}"
+            yield (video_id, f"ベンチマーク配信枠 {video_id}", f"https://www.youtube.com/watch?v={video_id}",
+                   "2099-12-31T21:00:00", BENCH_CHANNEL_NAME, "schedule", "upcoming", 0)
+
+    conn = sqlite3.connect(db.db_path)
+    try:
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO videos
+                (video_id, title, video_url, published_at, channel_name, content_type, live_status, posted_to_bluesky)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            generate(),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _clear_video_detail_cache() -> None:
+    import youtube_core.youtube_video_classifier as classifier_module
+    Path(classifier_module.VIDEO_DETAIL_CACHE_FILE).unlink(missing_ok=True)
+
+
+# ============ 集計 ============
+
+def percentile(sorted_values, pct: float) -> float:
+    """最近傍順位法によるパーセンタイル"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), round(pct / 100 * len(sorted_values) + 0.5)))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples, wall_seconds: float, errors: int = 0) -> dict:
+    """1 シナリオの計測結果（秒のリスト）を集計"""
+    values = sorted(samples)
+    count = len(values)
+    return {
+        "count": count,
+        "errors": errors,
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+        "mean_ms": round(sum(values) / count * 1000, 3) if count else 0.0,
+        "max_ms": round(values[-1] * 1000, 3) if count else 0.0,
+        "ops_per_sec": round(count / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+    }
+
+
+def _measure(operations):
+    """
+    操作を順に実行して計測
+
+    Args:
+        operations: 引数なしの呼び出し可能オブジェクトのイテラブル（戻り値が False なら失敗として数える）
+
+    Returns:
+        summarize() の結果
+    """
+    samples = []
+    errors = 0
+    wall_started = time.perf_counter()
+    for operation in operations:
+        started = time.perf_counter()
+        try:
+            ok = operation()
+        except Exception:
+            ok = False
+        samples.append(time.perf_counter() - started)
+        if ok is False:
+            errors += 1
+    return summarize(samples, time.perf_counter() - wall_started, errors)
+
+
+# ============ シナリオ ============
+
+def run_youtube_rss(db, args) -> dict:
+    """YouTubeRSS.save_to_db（分類器・LiveModule 付き、main_v3 と同じ呼び出し方）"""
+    from youtube_core.youtube_rss import YouTubeRSS
+    from youtube_core.youtube_video_classifier import get_video_classifier
+    from plugins.youtube.live_module import LiveModule
+
+    _clear_video_detail_cache()
+    classifier = get_video_classifier(api_key="benchmark")
+    live_module = LiveModule(db=db)
+    feeds = [YouTubeRSS(channel_id(i)) for i in range(args.channels)]
+
+    def save(feed):
+        return lambda: feed.save_to_db(db, classifier=classifier, live_module=live_module)
+
+    return {
+        "youtube_rss_new": _measure(save(feed) for feed in feeds),
+        "youtube_rss_recheck": _measure(save(feed) for feed in feeds),
+    }
+
+
+def run_live_poll(db, args) -> dict:
+    """LiveModule.poll_lives（予約枠の状態は変わらないため、イベントは発生しない）"""
+    from plugins.youtube.live_module import LiveModule
+
+    live_module = LiveModule(db=db)
+
+    def cold_poll():
+        _clear_video_detail_cache()
+        live_module.poll_lives()
+
+    _clear_video_detail_cache()
+    cold = _measure(cold_poll for _ in range(args.polls))
+    warm = _measure(live_module.poll_lives for _ in range(args.polls))
+    return {"live_poll_cold": cold, "live_poll_warm": warm}
+
+
+def run_niconico_rss(db, args) -> dict:
+    """NiconicoPlugin.get_video_entries（RSS 取得・パース）"""
+    from plugins.niconico_plugin import NiconicoPlugin
+
+    plugin = NiconicoPlugin(user_id="1", poll_interval=10, db=db)
+
+    def fetch(user_id):
+        return lambda: bool(plugin.get_video_entries(user_id))
+
+    return {"niconico_rss": _measure(fetch(str(i + 1)) for i in range(args.niconico_users))}
+
+
+def run_bluesky_post(db, args, workdir: Path) -> dict:
+    """BlueskyImagePlugin.post_video（DB 登録済み画像を添付して投稿）"""
+    from image_processor import clear_resize_cache
+    from plugins.bluesky_plugin import BlueskyImagePlugin
+
+    image_dir = workdir / "images" / "YouTube" / "import"
+    image_dir.mkdir(parents=True, exist_ok=True)
+    videos = []
+    for n in range(args.posts):
+        video_id = feed_video_id(9999999, n % 100)
+        filename = f"bench_post_{n}.jpg"
+        (image_dir / filename).write_bytes(_make_jpeg(1280, 720, seed=n + 1))
+        videos.append({
+            "video_id": video_id,
+            "title": f"ベンチマーク投稿 {n}",
+            "video_url": f"https://www.youtube.com/watch?v={video_id}",
+            "published_at": "2025-12-28T18:00:00",
+            "channel_name": BENCH_CHANNEL_NAME,
+            "content_type": "video",
+            "source": "youtube",
+            "image_mode": "import",
+            "image_filename": filename,
+        })
+
+    clear_resize_cache()
+    plugin = BlueskyImagePlugin("benchmark.bsky.social", "benchmark-password", dry_run=False)
+
+    def post(video):
+        return lambda: plugin.post_video(dict(video))
+
+    return {"bluesky_post": _measure(post(video) for video in videos)}
+
+
+def run_image_resize(db, args, workdir: Path) -> dict:
+    """image_processor.resize_image（横長・正方形・縦長の画像を順に処理）"""
+    from image_processor import clear_resize_cache, resize_image
+
+    sizes = ((1920, 1080), (1280, 720), (1500, 1500), (1080, 1920), (640, 480))
+    image_dir = workdir / "resize"
+    image_dir.mkdir(exist_ok=True)
+    paths = []
+    for n in range(args.images):
+        width, height = sizes[n % len(sizes)]
+        path = image_dir / f"bench_resize_{n}.jpg"
+        path.write_bytes(_make_jpeg(width, height, seed=1000 + n))
+        paths.append(str(path))
+
+    def cold(path):
+        def operation():
+            clear_resize_cache()
+            return resize_image(path) is not None
+        return operation
+
+    def cached(path):
+        return lambda: resize_image(path) is not None
+
+    results = {"image_resize": _measure(cold(path) for path in paths)}
+    # 処理結果キャッシュに収まる件数だけ先に処理しておき、2回目を計測する
+    warm_paths = paths[-32:]
+    for path in warm_paths:
+        resize_image(path)
+    results["image_resize_cached"] = _measure(cached(path) for path in warm_paths)
+    return results
+
+
+def run_benchmark(args) -> dict:
+    """
+    ベンチマークを実行
+
+    Returns:
+        {"scale": {...}, "scenarios": {シナリオ名: summarize() の結果}, "requests": {...}}
+    """
+    groups = [g.strip() for g in args.scenarios.split(",") if g.strip()]
+    unknown = [g for g in groups if g not in SCENARIO_GROUPS]
+    if unknown:
+        raise ValueError(f"不明なシナリオ: {', '.join(unknown)}（指定可能: {', '.join(SCENARIO_GROUPS)}）")
+
+    scale = {key: getattr(args, key) for key in QUICK_SCALE}
+    results = {}
+    server = build_fixture_server(latency_ms=args.latency_ms)
+    with server, redirect_to(server), bench_environment(args) as workdir:
+        from database import get_database
+
+        db = get_database()
+        prefill_started = time.perf_counter()
+        prefill_database(db, args.rows, args.live_rows)
+        prefill_seconds = time.perf_counter() - prefill_started
+
+        for group in groups:
+            if group == "youtube_rss":
+                results.update(run_youtube_rss(db, args))
+            elif group == "live_poll":
+                results.update(run_live_poll(db, args))
+            elif group == "niconico_rss":
+                results.update(run_niconico_rss(db, args))
+            elif group == "bluesky_post":
+                results.update(run_bluesky_post(db, args, workdir))
+            elif group == "image_resize":
+                results.update(run_image_resize(db, args, workdir))
+
+    return {
+        "scale": scale,
+        "prefill_seconds": round(prefill_seconds, 2),
+        "scenarios": results,
+        "requests": {f"{host}{prefix}": count for (host, prefix), count in sorted(server.request_counts.items())},
+    }
+
+
+def compare_with_baseline(result: dict, baseline: dict, max_regression: float) -> list:
+    """
+    保存済みの結果と比較し、p50 / p99 が max_regression（%）を超えて悪化したシナリオを返す
+
+    Returns:
+        [(シナリオ名, 指標, 基準値, 今回値, 悪化率%)]
+    """
+    regressions = []
+    for name, current in result["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base:
+            continue
+        for metric in ("p50_ms", "p99_ms"):
+            before, after = base.get(metric, 0), current.get(metric, 0)
+            if before <= 0:
+                continue
+            change = (after - before) / before * 100
+            if change > max_regression:
+                regressions.append((name, metric, before, after, round(change, 1)))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="録画済みレスポンスを再生してパイプラインのレイテンシ・スループットを計測")
+    parser.add_argument("--scenarios", default=",".join(SCENARIO_GROUPS), help="実行するシナリオ（カンマ区切り）")
+    parser.add_argument("--channels", type=int, default=DEFAULT_CHANNELS, help="YouTube チャンネル数")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS, help="事前に DB に登録する動画数")
+    parser.add_argument("--live-rows", type=int, default=DEFAULT_LIVE_ROWS, help="Live 予約枠として登録する動画数")
+    parser.add_argument("--polls", type=int, default=DEFAULT_POLLS, help="poll_lives の実行回数")
+    parser.add_argument("--niconico-users", type=int, default=DEFAULT_NICONICO_USERS, help="ニコニコのユーザー数")
+    parser.add_argument("--posts", type=int, default=DEFAULT_POSTS, help="Bluesky 投稿数")
+    parser.add_argument("--images", type=int, default=DEFAULT_IMAGES, help="リサイズする画像数")
+    parser.add_argument("--latency-ms", type=float, default=0, help="スタブサーバーの疑似ネットワーク遅延（ミリ秒）")
+    parser.add_argument("--quick", action="store_true", help="小規模で実行")
+    parser.add_argument("--json", action="store_true", help="結果を JSON で出力")
+    parser.add_argument("--save", default=None, help="結果を JSON で保存するファイル")
+    parser.add_argument("--baseline", default=None, help="比較対象の結果ファイル")
+    parser.add_argument("--max-regression", type=float, default=DEFAULT_MAX_REGRESSION, help="許容する悪化率（%%）")
+    parser.add_argument("--with-logging", action="store_true", help="ログ出力（logs/ へのファイル書き込み）を含めて計測")
+    parser.add_argument("--verbose", action="store_true", help="アプリのログを出力する")
+    args = parser.parse_args()
+
+    if args.quick:
+        for key, value in QUICK_SCALE.items():
+            setattr(args, key, value)
+
+    # --baseline / --save の相対パスは計測用の一時ディレクトリではなく実行時のディレクトリ基準
+    baseline_path = Path(args.baseline).resolve() if args.baseline else None
+    save_path = Path(args.save).resolve() if args.save else None
+
+    try:
+        result = run_benchmark(args)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        scale = result["scale"]
+        print(f"\n{'='*78}")
+        print(f"パイプラインベンチマーク: チャンネル {scale['channels']} / DB {scale['rows']} 行"
+              f"（Live {scale['live_rows']}）/ DB 準備 {result['prefill_seconds']} 秒")
+        print(f"{'='*78}")
+        print(f"{'シナリオ':<22}{'回数':>7}{'失敗':>6}{'p50 [ms]':>11}{'p99 [ms]':>11}{'平均 [ms]':>11}{'ops/sec':>10}")
+        for name, item in result["scenarios"].items():
+            print(f"{name:<22}{item['count']:>7}{item['errors']:>6}{item['p50_ms']:>11.2f}"
+                  f"{item['p99_ms']:>11.2f}{item['mean_ms']:>11.2f}{item['ops_per_sec']:>10.1f}")
+
+    if save_path:
+        save_path.parent.mkdir(parents=True, exist_ok=True)
+        save_path.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"💾 結果を保存しました: {save_path}")
+
+    failed = False
+    if baseline_path:
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        regressions = compare_with_baseline(result, baseline, args.max_regression)
+        for name, metric, before, after, change in regressions:
+            print(f"❌ {name} の {metric} が悪化しました: {before} ms → {after} ms（+{change}%）")
+        failed = bool(regressions)
+        if not failed:
+            print(f"✅ ベースラインからの悪化は許容範囲内です（上限 +{args.max_regression}%）")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+﻿# -*- coding: utf-8 -*-
+"""
+起動時間ベンチマーク
+
+ヘッドレス起動で読み込まれるモジュール群を `python -X importtime` 付きの
+別プロセスで繰り返しインポートし、インポート時間と読み込まれたモジュールを計測する。
+
+- 各回の合計インポート時間（中央値・最小・最大）
+- 累積時間の大きいモジュール上位 N 件
+- 起動時に読み込まれてはいけないモジュール（GUI スタック・Pillow・Jinja2・BeautifulSoup）の検出
+
+禁止モジュールが読み込まれた場合、インポートに失敗したモジュールがある場合（計測できていないため）、
+または --max-ms を超えた場合は終了コード 1 を返す（CI 用）。
+
+使い方:
+    python -m benchmarks.startup_benchmark
+
+オプション:
+    --runs N         : 計測回数（デフォルト: 5）
+    --top N          : 表示する上位モジュール数（デフォルト: 15）
+    --max-ms N       : 合計インポート時間（中央値）の上限（ミリ秒、省略時はチェックしない）
+    --json           : 結果を JSON で出力
+    --allow-skip     : インポートに失敗したモジュールがあっても失敗扱いにしない
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+V3_DIR = Path(__file__).parent.parent
+
+# ヘッドレス起動（main_v3.main(headless=True)）で初回ポーリングまでに読み込まれるモジュール
+STARTUP_MODULES = (
+    "main_v3",
+    "config",
+    "database",
+    "deleted_video_cache",
+    "youtube_core.youtube_video_classifier",
+    "youtube_core.youtube_rss",
+    "plugins.youtube.live_module",
+    "plugins.youtube.youtube_api_plugin",
+    "bluesky_core",
+    "plugins.bluesky_plugin",
+    "plugins.niconico_plugin",
+    "thumbnails.youtube_thumb_utils",
+)
+
+# 起動時に読み込まれてはいけないモジュール（使用時に遅延インポートする）
+FORBIDDEN_MODULES = (
+    "tkinter",
+    "gui_v3",
+    "unified_settings_window",
+    "template_editor_dialog",
+    "PIL",
+    "jinja2",
+    "bs4",
+)
+
+DEFAULT_RUNS = 5
+DEFAULT_TOP = 15
+
+
+def _build_script(modules) -> str:
+    lines = ["import importlib"]
+    for name in modules:
+        # 依存パッケージ未導入などで失敗したモジュールは計測対象から外す（stderr に出力）
+        lines.append(
+            f"try:\n    importlib.import_module({name!r})\n"
+            f"except Exception as e:\n    print('SKIP {name}:', type(e).__name__, e)"
+        )
+    return "\n".join(lines)
+
+
+def parse_importtime(stderr: str) -> dict:
+    """
+    -X importtime の出力を解析
+
+    Returns:
+        {モジュール名: (self_us, cumulative_us)}（トップレベルのインポートは cumulative が全体の時間）
+    """
+    result = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            _, values = line.split(":", 1)
+            self_us, cumulative_us, name = values.split("|", 2)
+            result[name.strip()] = (int(self_us), int(cumulative_us))
+        except ValueError:
+            continue
+    return result
+
+
+def _total_us(stderr: str) -> int:
+    """インデントなし（トップレベル）のインポートの累積時間の合計"""
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        parts = line.split("|", 2)
+        if len(parts) == 3 and not parts[2].startswith("  "):
+            total += int(parts[1])
+    return total
+
+
+def run_once(modules=STARTUP_MODULES) -> dict:
+    """1回分の計測（別プロセスでインポート）"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _build_script(modules)],
+        cwd=str(V3_DIR),
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    timings = parse_importtime(proc.stderr)
+    return {
+        "total_us": _total_us(proc.stderr),
+        "timings": timings,
+        "skipped": [line[5:] for line in proc.stdout.splitlines() if line.startswith("SKIP ")],
+    }
+
+
+def run_benchmark(runs: int = DEFAULT_RUNS, top: int = DEFAULT_TOP) -> dict:
+    """
+    ベンチマークを実行
+
+    Returns:
+        {"runs", "median_ms", "min_ms", "max_ms", "top", "forbidden", "skipped"}
+    """
+    results = [run_once() for _ in range(max(1, runs))]
+    totals_ms = [r["total_us"] / 1000 for r in results]
+
+    # 上位モジュールは最終回の結果から（初回はバイトコード生成を含むため）
+    last = results[-1]["timings"]
+    ranking = sorted(last.items(), key=lambda item: item[1][1], reverse=True)[:top]
+    imported = set(last)
+    forbidden = sorted(
+        name for name in imported
+        if any(name == f or name.startswith(f + ".") for f in FORBIDDEN_MODULES)
+    )
+
+    return {
+        "runs": len(results),
+        "median_ms": round(statistics.median(totals_ms), 1),
+        "min_ms": round(min(totals_ms), 1),
+        "max_ms": round(max(totals_ms), 1),
+        "top": [{"module": name, "self_ms": s / 1000, "cumulative_ms": c / 1000} for name, (s, c) in ranking],
+        "forbidden": forbidden,
+        "skipped": results[-1]["skipped"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="起動時のインポート時間を計測")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="計測回数")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="表示する上位モジュール数")
+    parser.add_argument("--max-ms", type=float, default=None, help="合計インポート時間（中央値）の上限（ミリ秒）")
+    parser.add_argument("--json", action="store_true", help="結果を JSON で出力")
+    parser.add_argument("--allow-skip", action="store_true", help="インポートに失敗したモジュールがあっても失敗扱いにしない")
+    args = parser.parse_args()
+
+    result = run_benchmark(runs=args.runs, top=args.top)
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print(f"\n{'='*60}")
+        print(f"起動時インポート時間（{result['runs']} 回）: "
+              f"中央値 {result['median_ms']} ms / 最小 {result['min_ms']} ms / 最大 {result['max_ms']} ms")
+        print(f"{'='*60}")
+        print(f"{'累積 [ms]':>10} {'自身 [ms]':>10}  モジュール")
+        for item in result["top"]:
+            print(f"{item['cumulative_ms']:>10.1f} {item['self_ms']:>10.1f}  {item['module']}")
+        for skipped in result["skipped"]:
+            print(f"⚠️ インポート失敗（計測対象外）: {skipped}")
+
+    failed = False
+    if result["skipped"] and not args.allow_skip:
+        print(f"❌ インポートに失敗したモジュールがあるため計測できていません: {', '.join(result['skipped'])}")
+        failed = True
+    if result["forbidden"]:
+        print(f"❌ 起動時に読み込まれてはいけないモジュールが読み込まれています: {', '.join(result['forbidden'])}")
+        failed = True
+    if args.max_ms is not None and result["median_ms"] > args.max_ms:
+        print(f"❌ 起動時インポート時間が上限を超えています: {result['median_ms']} ms > {args.max_ms} ms")
+        failed = True
+    if not failed:
+        print("✅ 起動時インポートのチェックに合格しました")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
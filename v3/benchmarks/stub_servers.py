@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+ベンチマーク用のスタブ HTTP サーバー
+
+録画済みレスポンス（benchmarks/fixtures/）をローカルの HTTP サーバーから返し、
+YouTube / ニコニコ / Bluesky への通信をオフラインで再現する。
+
+- FixtureServer: 127.0.0.1 の空きポートで待ち受ける ThreadingHTTPServer。
+  (ホスト名, パスの前方一致, メソッド) ごとにハンドラを登録する
+- redirect_to(): requests と feedparser の https://<ホスト>/<パス> へのアクセスを
+  http://127.0.0.1:<ポート>/<ホスト>/<パス> に書き換えるコンテキストマネージャ
+
+アプリ側のコードは変更せず、実際と同じ経路（requests.Session.request / feedparser.parse）で
+通信させるため、HTTP のシリアライズ・パースを含めて計測できる。
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from string import Template
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# 書き換え対象のホスト（これ以外への通信はそのまま）
+STUB_HOSTS = (
+    "www.youtube.com",
+    "www.googleapis.com",
+    "i.ytimg.com",
+    "www.nicovideo.jp",
+    "ext.nicovideo.jp",
+    "bsky.social",
+)
+
+
+def load_fixture(name: str) -> str:
+    """fixtures/ のファイルを文字列で読み込む"""
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+
+def load_template(name: str) -> Template:
+    """fixtures/ のファイルを string.Template として読み込む（${変数} を置換して使う）"""
+    return Template(load_fixture(name))
+
+
+class StubRequest:
+    """ハンドラに渡すリクエスト情報"""
+
+    def __init__(self, method: str, host: str, path: str, query: Dict[str, List[str]], headers, body: bytes):
+        self.method = method
+        self.host = host
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+    def param(self, name: str, default: str = "") -> str:
+        """クエリパラメータを取得（最初の値）"""
+        values = self.query.get(name)
+        return values[0] if values else default
+
+
+# ハンドラの戻り値: (ステータス, ヘッダー, 本文)
+StubResponse = Tuple[int, Dict[str, str], bytes]
+StubHandler = Callable[[StubRequest], StubResponse]
+
+
+def json_response(body: str, status: int = 200) -> StubResponse:
+    return status, {"Content-Type": "application/json; charset=utf-8"}, body.encode("utf-8")
+
+
+def xml_response(body: str, content_type: str = "application/xml") -> StubResponse:
+    return 200, {"Content-Type": f"{content_type}; charset=utf-8"}, body.encode("utf-8")
+
+
+class _FixtureRequestHandler(BaseHTTPRequestHandler):
+    """/<ホスト>/<パス> 形式のリクエストを登録済みハンドラに振り分ける"""
+
+    protocol_version = "HTTP/1.1"
+    # ヘッダーと本文を別々に送るため、Nagle + 遅延 ACK による 40ms 前後の待ちを避ける
+    disable_nagle_algorithm = True
+
+    def _dispatch(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        parts = urlsplit(self.path)
+        host, _, path = parts.path.lstrip("/").partition("/")
+        path = "/" + path
+        request = StubRequest(self.command, host, path, parse_qs(parts.query), self.headers, body)
+
+        handler = self.server.fixture_server.find_handler(self.command, host, path)
+        if handler is None:
+            status, headers, payload = 404, {"Content-Type": "text/plain"}, b"no fixture"
+        else:
+            status, headers, payload = handler(request)
+
+        latency = self.server.fixture_server.latency_ms
+        if latency:
+            time.sleep(latency / 1000)
+
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        if "Content-Length" not in headers:
+            self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(payload)
+
+    do_GET = _dispatch
+    do_POST = _dispatch
+    do_HEAD = _dispatch
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer:
+    """録画済みレスポンスを返すローカル HTTP サーバー"""
+
+    def __init__(self, latency_ms: float = 0):
+        """
+        初期化
+
+        Args:
+            latency_ms: 各レスポンスに加える疑似ネットワーク遅延（ミリ秒）
+        """
+        self.latency_ms = latency_ms
+        self._routes: List[Tuple[str, str, str, StubHandler]] = []
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.request_counts: Dict[Tuple[str, str], int] = {}
+
+    def route(self, method: str, host: str, path_prefix: str, handler: StubHandler) -> None:
+        """ハンドラを登録（後から登録したものほど優先度が低い）"""
+        self._routes.append((method.upper(), host, path_prefix, handler))
+
+    def find_handler(self, method: str, host: str, path: str) -> Optional[StubHandler]:
+        for route_method, route_host, prefix, handler in self._routes:
+            if route_method == method and route_host == host and path.startswith(prefix):
+                with self._lock:
+                    key = (host, prefix)
+                    self.request_counts[key] = self.request_counts.get(key, 0) + 1
+                return handler
+        return None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FixtureServer":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureRequestHandler)
+        self._server.daemon_threads = True
+        self._server.fixture_server = self
+        self._thread = threading.Thread(target=self._server.serve_forever, name="FixtureServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def rewrite_url(self, url: str) -> str:
+        """スタブ対象ホストへの URL をローカルサーバーの URL に書き換える"""
+        if not isinstance(url, str):
+            return url
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or parts.hostname not in STUB_HOSTS:
+            return url
+        rewritten = f"{self.base_url}/{parts.hostname}{parts.path or '/'}"
+        if parts.query:
+            rewritten += "?" + parts.query
+        return rewritten
+
+
+@contextmanager
+def redirect_to(server: FixtureServer):
+    """
+    requests と feedparser の通信先を FixtureServer に書き換える
+
+    requests.get / requests.post / Session.get などはすべて Session.request を経由するため、
+    Session.request の URL を書き換えれば足りる。feedparser は独自の urllib ハンドラを使うので
+    feedparser.parse の引数を書き換える。
+    """
+    import feedparser
+    import requests
+
+    original_request = requests.sessions.Session.request
+    original_parse = feedparser.parse
+
+    def request(self, method, url, *args, **kwargs):
+        return original_request(self, method, server.rewrite_url(url), *args, **kwargs)
+
+    def parse(url_file_stream_or_string, *args, **kwargs):
+        return original_parse(server.rewrite_url(url_file_stream_or_string), *args, **kwargs)
+
+    requests.sessions.Session.request = request
+    feedparser.parse = parse
+    try:
+        yield server
+    finally:
+        requests.sessions.Session.request = original_request
+        feedparser.parse = original_parse
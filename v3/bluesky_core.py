@@ -15,10 +15,12 @@ Rich Text Facet: https://docs.bsky.app/docs/advanced-guides/post-richtext
 import logging
 import re
 import json
+import time
 import requests
 from datetime import datetime, timezone
 from pathlib import Path
 from plugin_interface import NotificationPlugin
+from metrics import BLUESKY_REQUEST_SECONDS, BLUESKY_UPLOAD_BYTES
 
 logger = logging.getLogger("AppLogger")
 post_logger = logging.getLogger("PostLogger")
@@ -30,6 +32,30 @@ __license__ = "GPLv2"
 __version__ = "1.0.0"
 
 
+def xrpc_post(operation: str, url: str, **kwargs):
+    """
+    Bluesky XRPC への POST（所要時間を HTTP ステータス別にメトリクスへ記録）
+
+    Args:
+        operation: 操作名（"createSession" / "createRecord" / "uploadBlob"）
+        url: XRPC エンドポイント
+        **kwargs: requests.post に渡す引数
+
+    Returns:
+        requests.Response
+    """
+    if operation == "uploadBlob" and kwargs.get("data") is not None:
+        BLUESKY_UPLOAD_BYTES.observe(len(kwargs["data"]))
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        response = requests.post(url, **kwargs)
+        outcome = str(response.status_code)
+        return response
+    finally:
+        BLUESKY_REQUEST_SECONDS.observe(time.perf_counter() - started, operation=operation, outcome=outcome)
+
+
 # --- 最小限投稿API ---
 class BlueskyMinimalPoster:
     """Bluesky最小限投稿クラス（API本体）"""
@@ -52,7 +78,7 @@ class BlueskyMinimalPoster:
             auth_data = {"identifier": self.username, "password": self.password}
             if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("🔍 Bluesky login request: %s", auth_url)
-            response = requests.post(auth_url, json=auth_data, timeout=30)
+            response = xrpc_post("createSession", auth_url, json=auth_data, timeout=30)
             if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("🔍 Bluesky login response status: %s", response.status_code)
             response.raise_for_status()
@@ -112,8 +138,8 @@ class BlueskyMinimalPoster:
                 ]
             }
             facets.append(facet)
-            post_logger.info(f"  🔗 URL 検出: {url}")
-            post_logger.info(f"     バイト位置: {byte_start} - {byte_end}")
+            post_logger.info("  🔗 URL 検出: %s", url)
+            post_logger.debug("     バイト位置: %s - %s", byte_start, byte_end)
 
         # ============ ハッシュタグ facet の検出 ============
         # パターン: 単語境界または行頭または空白 + # + 連続する非空白文字（空白と#以外）
@@ -147,8 +173,8 @@ class BlueskyMinimalPoster:
                 ]
             }
             facets.append(facet)
-            post_logger.info(f"  #️⃣  ハッシュタグ検出: {tag_with_hash} (タグ: {tag_name})")
-            post_logger.info(f"     バイト位置: {byte_start} - {byte_end}")
+            post_logger.info("  #️⃣  ハッシュタグ検出: %s (タグ: %s)", tag_with_hash, tag_name)
+            post_logger.debug("     バイト位置: %s - %s", byte_start, byte_end)
 
         return facets if facets else None
 
@@ -156,12 +182,12 @@ class BlueskyMinimalPoster:
         """最小限の動画投稿API（テキスト + オプション画像埋め込み）"""
         try:
             # デバッグ: 受け取ったフィールドを確認
-            post_logger.debug(f"🔍 post_video_minimal に受け取ったフィールド:")
-            post_logger.debug(f"   source: {video.get('source')}")
-            post_logger.debug(f"   image_mode: {video.get('image_mode')}")
-            post_logger.debug(f"   image_filename: {video.get('image_filename')}")
-            post_logger.debug(f"   embed: {bool(video.get('embed'))}")
-            post_logger.debug(f"   text_override: {bool(video.get('text_override'))}")
+            post_logger.debug("🔍 post_video_minimal に受け取ったフィールド:")
+            post_logger.debug("   source: %s", video.get('source'))
+            post_logger.debug("   image_mode: %s", video.get('image_mode'))
+            post_logger.debug("   image_filename: %s", video.get('image_filename'))
+            post_logger.debug("   embed: %s", bool(video.get('embed')))
+            post_logger.debug("   text_override: %s", bool(video.get('text_override')))
 
             # text_override がある場合は優先（テンプレートレンダリング済み）
             text_override = video.get("text_override")
@@ -255,7 +281,7 @@ class BlueskyMinimalPoster:
             if facets:
                 post_logger.info(f"   facets: {[f['index'] for f in facets]}")
 
-            response = requests.post(post_url, json=post_data, headers=headers, timeout=30)
+            response = xrpc_post("createRecord", post_url, json=post_data, headers=headers, timeout=30)
             response.raise_for_status()
             response_data = response.json()
             uri = response_data.get("uri", "unknown")
@@ -389,7 +415,8 @@ class BlueskyMinimalPoster:
                 "Content-Type": mime_type
             }
 
-            upload_resp = requests.post(
+            upload_resp = xrpc_post(
+                "uploadBlob",
                 upload_url,
                 data=img_resp.content,
                 headers=headers,
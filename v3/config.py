@@ -8,7 +8,9 @@ Stream notify on Bluesky - v3 設定管理
 
 import os
 import logging
-from dotenv import load_dotenv
+import threading
+import time
+from dotenv import dotenv_values, load_dotenv
 from pathlib import Path
 
 logger = logging.getLogger("AppLogger")
@@ -19,6 +21,21 @@ __license__ = "GPLv2"
 
 DB_PATH = "data/video_list.db"
 
+# 設定ファイル監視の間隔（秒）
+CONFIG_WATCH_INTERVAL = 2.0
+
+# ホットリロードでは反映されず、アプリ再起動が必要な設定と、その値を保持する属性
+# （ログ設定・Bluesky セッション・起動時に構築するモジュール・セーフモード判定に関わるもの）
+RESTART_REQUIRED_KEYS = {
+    "DEBUG_MODE": ("debug_mode",),
+    "BLUESKY_USERNAME": ("bluesky_username",),
+    "BLUESKY_PASSWORD": ("bluesky_password",),
+    "YOUTUBE_API_KEY": ("youtube_api_key", "youtube_api_plugin_enabled"),
+    "YOUTUBE_FEED_MODE": ("youtube_feed_mode",),
+    "APP_MODE": ("operation_mode", "is_collect_mode"),
+    "NICONICO_USER_ID": ("niconico_user_id",),
+}
+
 
 class OperationMode:
     """動作モードの定義"""
@@ -43,8 +60,139 @@ class Config:
             env_path: settings.env ファイルのパス
         """
         load_dotenv(env_path, override=True)
+        self.env_path = env_path
+        self.version = 1
+        self._subscribers = []
+        self._reload_lock = threading.RLock()
+        self._file_values = self._read_file_values()
+        self._watcher_thread = None
+        self._watcher_stop = threading.Event()
         self.validate()
 
+    @property
+    def settings(self) -> dict:
+        """settings.env のパース済みスナップショット（読み取り専用）"""
+        return get_settings_snapshot(self.env_path).get_all()
+
+    def get_setting(self, key: str, default=None):
+        """settings.env の設定値をスナップショットから取得"""
+        return get_settings_snapshot(self.env_path).get(key, default)
+
+    # ============ ホットリロード ============
+
+    def _read_file_values(self) -> dict:
+        """settings.env の現在の内容を取得（スナップショットのコピー）"""
+        return dict(get_settings_snapshot(self.env_path).get_all())
+
+    def subscribe(self, callback):
+        """設定変更の通知先を登録
+
+        Args:
+            callback: callback(config, changed_keys: set) 形式の関数
+        """
+        with self._reload_lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """設定変更の通知先を解除"""
+        with self._reload_lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def reload(self, force: bool = False) -> set:
+        """settings.env を再読み込みし、変更があれば同じインスタンスに反映して通知
+
+        インスタンスを作り直さず属性を更新するため、Config を保持している
+        モジュール（LiveModule、スケジューラー等）はそのまま新しい値を参照する。
+        バリデーションに失敗した場合は変更前の値を維持する。
+
+        Args:
+            force: True の場合、スナップショットを破棄してから読み込む
+
+        Returns:
+            set: 変更されたキー（変更なし・失敗時は空集合）
+        """
+        with self._reload_lock:
+            snapshot = get_settings_snapshot(self.env_path)
+            if force:
+                snapshot.invalidate()
+            new_values = dict(snapshot.get_all())
+            old_values = self._file_values
+
+            changed_keys = {
+                key for key in set(old_values) | set(new_values)
+                if old_values.get(key) != new_values.get(key)
+            }
+            if not changed_keys:
+                return set()
+
+            previous_state = dict(self.__dict__)
+            previous_environ = {key: os.environ.get(key) for key in changed_keys}
+            try:
+                # ファイルから削除（コメントアウト）されたキーは環境変数からも外す
+                for key in changed_keys:
+                    if key not in new_values:
+                        os.environ.pop(key, None)
+                load_dotenv(self.env_path, override=True)
+                self.validate()
+            except Exception as e:
+                for key, value in previous_environ.items():
+                    if value is None:
+                        os.environ.pop(key, None)
+                    else:
+                        os.environ[key] = value
+                self.__dict__.update(previous_state)
+                logger.error(f"❌ 設定の再読み込みに失敗しました（変更前の設定を維持）: {e}")
+                return set()
+
+            # 再起動が必要な設定は、実行中の値を維持する
+            restart_keys = changed_keys & set(RESTART_REQUIRED_KEYS)
+            for key in restart_keys:
+                for attr in RESTART_REQUIRED_KEYS[key]:
+                    if attr in previous_state:
+                        setattr(self, attr, previous_state[attr])
+            # 動作モードは起動時のセーフモード判定と結びつくため、実行中は変更しない
+            # （BLUESKY_POST_ENABLED の変更で間接的に変わる場合も含む）
+            for attr in RESTART_REQUIRED_KEYS["APP_MODE"]:
+                setattr(self, attr, previous_state[attr])
+
+            self._file_values = new_values
+            self.version += 1
+            subscribers = list(self._subscribers)
+
+        logger.info(f"🔄 設定を再読み込みしました（v{self.version}）: {', '.join(sorted(changed_keys))}")
+        if restart_keys:
+            logger.warning(f"⚠️ 次の設定はアプリ再起動後に反映されます: {', '.join(sorted(restart_keys))}")
+
+        for callback in subscribers:
+            try:
+                callback(self, changed_keys)
+            except Exception as e:
+                logger.warning(f"⚠️ 設定変更の通知先でエラー: {getattr(callback, '__qualname__', callback)} - {e}")
+        return changed_keys
+
+    def start_watching(self, interval: float = CONFIG_WATCH_INTERVAL):
+        """settings.env の変更監視スレッドを開始（変更を検知したら reload()）"""
+        if self._watcher_thread and self._watcher_thread.is_alive():
+            return
+        self._watcher_stop.clear()
+
+        def _watch():
+            while not self._watcher_stop.wait(interval):
+                try:
+                    self.reload()
+                except Exception as e:
+                    logger.debug(f"⚠️ 設定監視エラー: {e}")
+
+        self._watcher_thread = threading.Thread(target=_watch, name="ConfigWatcher", daemon=True)
+        self._watcher_thread.start()
+        logger.debug(f"👀 設定ファイルの監視を開始しました（{interval}秒間隔）: {self.env_path}")
+
+    def stop_watching(self):
+        """settings.env の変更監視スレッドを停止"""
+        self._watcher_stop.set()
+
     def validate(self):
         """設定値をバリデーション"""
 
@@ -355,6 +503,24 @@ class Config:
         youtube_live_auto_post_archive = os.getenv("YOUTUBE_LIVE_AUTO_POST_ARCHIVE", "true").strip().lower()
         self.youtube_live_auto_post_archive = youtube_live_auto_post_archive in ("true", "1", "yes", "on")
 
+        # ローカル制御 API（未設定時はヘッドレス起動の場合のみ有効）
+        control_api_enabled_str = os.getenv("CONTROL_API_ENABLED", "").strip().lower()
+        if control_api_enabled_str:
+            self.control_api_enabled = control_api_enabled_str in ("true", "1", "yes", "on")
+        else:
+            self.control_api_enabled = None
+        self.control_api_host = os.getenv("CONTROL_API_HOST", "127.0.0.1").strip() or "127.0.0.1"
+        try:
+            self.control_api_port = int(os.getenv("CONTROL_API_PORT", "8765"))
+            if self.control_api_port < 0 or self.control_api_port > 65535:
+                logger.warning(f"CONTROL_API_PORT が範囲外です (0〜65535): {self.control_api_port}。8765 に設定します。")
+                self.control_api_port = 8765
+        except ValueError:
+            logger.warning("CONTROL_API_PORT が無効です。8765 に設定します。")
+            self.control_api_port = 8765
+        self.control_api_socket = os.getenv("CONTROL_API_SOCKET", "").strip()
+        self.control_api_token = os.getenv("CONTROL_API_TOKEN", "").strip()
+
     def _log_operation_mode(self):
         """現在の動作モードをログに出力"""
         mode_descriptions = {
@@ -393,6 +559,107 @@ class Config:
             logger.info("🤖 自動投稿モード。人間の介入なく自動投稿が実行されます。GUI投稿操作は無効化されます。")
 
 
+
+# ============ 設定スナップショット（settings.env のパース結果キャッシュ） ============
+
+# mtime を確認する最小間隔（秒）。この間隔内はファイルに一切アクセスしない
+SETTINGS_STAT_INTERVAL = 1.0
+
+
+class SettingsSnapshot:
+    """settings.env をパースした結果を保持するキャッシュ
+
+    - 初回アクセス時に1回だけパースし、以降は dict を返す
+    - ファイルの mtime が変わった場合、または invalidate() が呼ばれた場合に再パース
+    - mtime の確認は SETTINGS_STAT_INTERVAL 秒に1回まで
+    """
+
+    def __init__(self, env_path="settings.env"):
+        self.env_path = Path(env_path)
+        self._values = None
+        self._mtime = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _current_mtime(self):
+        try:
+            return self.env_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _load(self):
+        """settings.env をパース（値のない行は除外）"""
+        values = {}
+        if self.env_path.exists():
+            try:
+                for key, value in dotenv_values(self.env_path, encoding="utf-8").items():
+                    if value is not None:
+                        values[key] = value.strip()
+            except Exception as e:
+                logger.warning(f"⚠️ 設定ファイル読み込み失敗: {e}")
+        return values
+
+    def get_all(self) -> dict:
+        """パース済みの設定値を取得（読み取り専用として扱うこと）"""
+        now = time.monotonic()
+        values = self._values
+        if values is not None and now - self._checked_at < SETTINGS_STAT_INTERVAL:
+            return values
+
+        with self._lock:
+            mtime = self._current_mtime()
+            if self._values is None or mtime != self._mtime:
+                self._values = self._load()
+                self._mtime = mtime
+                logger.debug(f"🔧 設定スナップショットを更新しました: {self.env_path}")
+            self._checked_at = time.monotonic()
+            return self._values
+
+    def get(self, key: str, default=None):
+        """設定値を取得（未設定の場合は default）"""
+        return self.get_all().get(key, default)
+
+    def invalidate(self):
+        """次回アクセス時に再パースさせる"""
+        with self._lock:
+            self._values = None
+            self._mtime = None
+            self._checked_at = 0.0
+
+
+_settings_snapshots = {}
+_settings_snapshots_lock = threading.Lock()
+
+
+def get_settings_snapshot(env_path="settings.env") -> SettingsSnapshot:
+    """設定スナップショットを取得（パスごとに1インスタンス）"""
+    key = str(Path(env_path).resolve())
+    snapshot = _settings_snapshots.get(key)
+    if snapshot is None:
+        with _settings_snapshots_lock:
+            snapshot = _settings_snapshots.setdefault(key, SettingsSnapshot(env_path))
+    return snapshot
+
+
+def get_setting(key: str, default=None, env_path="settings.env"):
+    """settings.env の設定値をスナップショットから取得（ファイルを毎回読まない）"""
+    return get_settings_snapshot(env_path).get(key, default)
+
+
+def invalidate_settings_cache(env_path=None):
+    """設定スナップショットを破棄（設定ウィンドウでの保存後などに呼ぶ）
+
+    Args:
+        env_path: 対象ファイル。None の場合はすべて破棄
+    """
+    if env_path is None:
+        targets = list(_settings_snapshots.values())
+    else:
+        targets = [get_settings_snapshot(env_path)]
+    for snapshot in targets:
+        snapshot.invalidate()
+
+
 # グローバルキャッシュ（シングルトンパターン）
 _config_cache = {}
 
@@ -406,3 +673,15 @@ def get_config(env_path="settings.env") -> Config:
     if env_path not in _config_cache:
         _config_cache[env_path] = Config(env_path)
     return _config_cache[env_path]
+
+
+def reload_config(env_path="settings.env") -> set:
+    """生成済みの Config があれば settings.env を再読み込み（設定ウィンドウの保存後などに呼ぶ）
+
+    Returns:
+        set: 変更されたキー（Config 未生成の場合は空集合）
+    """
+    config = _config_cache.get(env_path)
+    if config is None:
+        return set()
+    return config.reload(force=True)
@@ -0,0 +1,446 @@
+﻿# -*- coding: utf-8 -*-
+
+"""
+Stream notify on Bluesky - v3 ローカル制御 API
+
+ヘッドレス運用（main_v3.py --headless）向けに、動画の選択・投稿・状態確認・統計を
+HTTP（JSON）で操作する。GUI と同じ Database / PluginManager を使用する。
+
+- 待ち受けは TCP（既定: 127.0.0.1:8765）または Unix ソケット（CONTROL_API_SOCKET 指定時）
+- TCP で待ち受ける場合は Authorization: Bearer <token> が必須。CONTROL_API_TOKEN 未設定時は
+  初回起動時にランダムなトークンを data/control_api_token に生成して使う
+  （Unix ソケットはファイルの権限で保護するため、CONTROL_API_TOKEN 未設定時は認証なし）
+- ブラウザ経由の操作（CSRF・DNS リバインディング）を防ぐため、Origin ヘッダー付きのリクエストと
+  Host ヘッダーが待ち受けアドレス以外のリクエストは拒否し、POST は Content-Type: application/json のみ受け付ける
+- 投稿は GUI の投稿ウィンドウと同じ手順（重複チェック → 全有効プラグインで投稿 → 投稿済みマーク）
+  で、同時に1件ずつ実行する
+
+エンドポイント:
+    GET  /status                    起動状態・動作モード・ポーリング状況
+    GET  /stats?days=7              統計（Database.get_stats）
+    GET  /metrics                   メトリクス（Prometheus テキスト形式）
+    GET  /videos?search=&posted=0&source=&limit=50&offset=0
+    GET  /videos/<video_id>
+    POST /videos/<video_id>/select  {"selected": true, "scheduled_at": null}
+    POST /videos/<video_id>/post    {"dry_run": false, "use_image": true}
+    POST /shutdown                  アプリケーションを終了
+"""
+
+import hmac
+import json
+import logging
+import os
+import secrets
+import socket
+import socketserver
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+logger = logging.getLogger("AppLogger")
+
+__author__ = "mayuneco(mayunya)"
+__copyright__ = "Copyright (C) 2025 mayuneco(mayunya)"
+__license__ = "GPLv2"
+
+DEFAULT_CONTROL_API_HOST = "127.0.0.1"
+DEFAULT_CONTROL_API_PORT = 8765
+_MAX_BODY_BYTES = 64 * 1024
+_MAX_LIST_LIMIT = 500
+_LOOPBACK_HOSTS = ("127.0.0.1", "::1", "localhost")
+CONTROL_API_TOKEN_FILE = Path(__file__).parent / "data" / "control_api_token"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class ControlAPIError(Exception):
+    """API の処理エラー（HTTP ステータス付き）"""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class _UnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    """Unix ソケットで待ち受ける HTTP サーバー"""
+
+    daemon_threads = True
+
+
+class _ControlRequestHandler(BaseHTTPRequestHandler):
+    """制御 API のリクエストハンドラ（server.controller に処理を委譲）"""
+
+    server_version = "StreamNotifyControl/1.0"
+
+    def address_string(self):
+        # Unix ソケットの場合 client_address はタプルではない
+        if isinstance(self.client_address, tuple) and self.client_address:
+            return str(self.client_address[0])
+        return "unix"
+
+    def log_message(self, format, *args):
+        logger.debug(f"[制御API] {self.address_string()} {format % args}")
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str):
+        controller = self.server.controller
+        try:
+            # ブラウザから送られたリクエスト（他サイトからの POST・DNS リバインディング）を拒否
+            if self.headers.get("Origin") is not None:
+                raise ControlAPIError(HTTPStatus.FORBIDDEN, "ブラウザからのリクエストは受け付けません")
+            if not controller.is_allowed_host(self.headers.get("Host", "")):
+                raise ControlAPIError(HTTPStatus.FORBIDDEN, "Host ヘッダーが待ち受けアドレスと一致しません")
+            if not controller.is_authorized(self.headers.get("Authorization", "")):
+                raise ControlAPIError(HTTPStatus.UNAUTHORIZED, "認証が必要です")
+            if method == "POST" and self.headers.get_content_type() != "application/json":
+                raise ControlAPIError(HTTPStatus.UNSUPPORTED_MEDIA_TYPE, "Content-Type: application/json を指定してください")
+            parsed = urlparse(self.path)
+            if method == "GET" and parsed.path.rstrip("/") == "/metrics":
+                self._send_text(HTTPStatus.OK, controller.render_metrics(), PROMETHEUS_CONTENT_TYPE)
+                return
+            body = self._read_json_body() if method == "POST" else {}
+            status, payload = controller.handle(method, parsed.path, parse_qs(parsed.query), body)
+        except ControlAPIError as e:
+            status, payload = e.status, {"error": e.message}
+        except Exception as e:
+            logger.error(f"❌ 制御 API 処理エラー: {e}", exc_info=True)
+            status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)}
+        self._send_json(status, payload)
+
+    def _read_json_body(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > _MAX_BODY_BYTES:
+            raise ControlAPIError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "リクエストが大きすぎます")
+        if length == 0:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length).decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ControlAPIError(HTTPStatus.BAD_REQUEST, f"JSON の形式が不正です: {e}")
+        if not isinstance(body, dict):
+            raise ControlAPIError(HTTPStatus.BAD_REQUEST, "JSON オブジェクトを指定してください")
+        return body
+
+    def _send_json(self, status: HTTPStatus, payload: Dict[str, Any]):
+        data = json.dumps(payload, ensure_ascii=False, default=str)
+        self._send_text(status, data, "application/json; charset=utf-8")
+
+    def _send_text(self, status: HTTPStatus, text: str, content_type: str):
+        data = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class ControlAPIServer:
+    """ローカル制御 API サーバー"""
+
+    def __init__(
+        self,
+        db,
+        plugin_manager,
+        config,
+        stop_event: Optional[threading.Event] = None,
+        status_provider: Optional[Callable[[], Dict[str, Any]]] = None,
+        host: str = DEFAULT_CONTROL_API_HOST,
+        port: int = DEFAULT_CONTROL_API_PORT,
+        socket_path: str = "",
+        token: str = "",
+        token_file: Path = CONTROL_API_TOKEN_FILE,
+    ):
+        """
+        初期化
+
+        Args:
+            db: Database インスタンス
+            plugin_manager: PluginManager インスタンス
+            config: Config インスタンス（動作モード・重複投稿防止の判定に使用）
+            stop_event: /shutdown で set する Event（None の場合 /shutdown は無効）
+            status_provider: /status に含める実行状況（ポーリング回数など）を返す関数
+            host: 待ち受けアドレス（TCP）
+            port: 待ち受けポート（TCP、0 の場合は空きポートを自動選択）
+            socket_path: Unix ソケットのパス（指定時は TCP の代わりに使用）
+            token: 認証トークン（空の場合、TCP では token_file のトークンを使用 / Unix ソケットでは認証なし）
+            token_file: 自動生成したトークンの保存先
+        """
+        self.db = db
+        self.plugin_manager = plugin_manager
+        self.config = config
+        self.stop_event = stop_event
+        self.status_provider = status_provider
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.token = token
+        self.token_file = Path(token_file)
+        self.started_at = time.time()
+        self._server = None
+        self._thread = None
+        self._post_lock = threading.Lock()
+
+    @property
+    def address(self) -> str:
+        """待ち受けアドレス（表示用）"""
+        if self.socket_path:
+            return f"unix:{self.socket_path}"
+        if self._server is not None:
+            host, port = self._server.server_address[:2]
+            return f"http://{host}:{port}"
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> bool:
+        """
+        サーバーをバックグラウンドスレッドで開始
+
+        Returns:
+            開始できた場合 True
+        """
+        if self._server is not None:
+            return True
+
+        if not self.socket_path and self.host not in _LOOPBACK_HOSTS and not self.token:
+            logger.error(f"❌ 制御 API: ループバック以外（{self.host}）で待ち受ける場合は CONTROL_API_TOKEN が必要です")
+            return False
+
+        if not self.socket_path and not self.token:
+            try:
+                self.token = self._load_or_create_token()
+            except OSError as e:
+                logger.error(f"❌ 制御 API: 認証トークンを用意できませんでした（{self.token_file}）: {e}")
+                return False
+            logger.info(f"🔑 制御 API の認証トークン: {self.token_file}（Authorization: Bearer <トークン> で指定）")
+
+        try:
+            if self.socket_path:
+                if not hasattr(socket, "AF_UNIX"):
+                    logger.error("❌ 制御 API: この環境では Unix ソケットを使用できません")
+                    return False
+                if os.path.exists(self.socket_path):
+                    os.unlink(self.socket_path)  # 前回異常終了時の残骸
+                self._server = _UnixHTTPServer(self.socket_path, _ControlRequestHandler)
+                os.chmod(self.socket_path, 0o600)
+            else:
+                self._server = ThreadingHTTPServer((self.host, self.port), _ControlRequestHandler)
+        except OSError as e:
+            logger.error(f"❌ 制御 API の待ち受けを開始できませんでした（{self.address}）: {e}")
+            self._server = None
+            return False
+
+        self._server.controller = self
+        self._thread = threading.Thread(target=self._server.serve_forever, name="ControlAPI", daemon=True)
+        self._thread.start()
+        logger.info(f"🛰️ 制御 API を開始しました: {self.address}")
+        return True
+
+    def stop(self) -> None:
+        """サーバーを停止"""
+        if self._server is None:
+            return
+        try:
+            self._server.shutdown()
+            self._server.server_close()
+        finally:
+            self._server = None
+            if self.socket_path and os.path.exists(self.socket_path):
+                try:
+                    os.unlink(self.socket_path)
+                except OSError:
+                    pass
+        logger.info("🛰️ 制御 API を停止しました")
+
+    def _load_or_create_token(self) -> str:
+        """自動生成トークンを読み込む（存在しない場合は生成して保存）"""
+        if self.token_file.exists():
+            token = self.token_file.read_text(encoding="utf-8").strip()
+            if token:
+                return token
+        token = secrets.token_urlsafe(32)
+        self.token_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(str(self.token_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(token)
+        return token
+
+    def is_allowed_host(self, host_header: str) -> bool:
+        """Host ヘッダーが待ち受けアドレスを指しているか（DNS リバインディング対策）"""
+        if self.socket_path:
+            return True
+        host, port = host_header.strip().lower(), ""
+        if host.startswith("["):
+            host, _, rest = host[1:].partition("]")
+            port = rest[1:] if rest.startswith(":") else ""
+        elif host.count(":") == 1:
+            host, _, port = host.partition(":")
+        bound_host, bound_port = self._server.server_address[:2] if self._server is not None else (self.host, self.port)
+        allowed = {str(bound_host).lower(), self.host.lower()}
+        if self.host in _LOOPBACK_HOSTS:
+            allowed.update(_LOOPBACK_HOSTS)
+        return host in allowed and (not port or port == str(bound_port))
+
+    def is_authorized(self, authorization: str) -> bool:
+        """Authorization ヘッダーを検証"""
+        if not self.token:
+            return True
+        scheme, _, value = authorization.partition(" ")
+        return scheme.lower() == "bearer" and hmac.compare_digest(value.strip(), self.token)
+
+    # ============ ルーティング ============
+
+    def handle(self, method: str, path: str, query: Dict[str, list], body: Dict[str, Any]) -> Tuple[HTTPStatus, Dict[str, Any]]:
+        """リクエストを処理して (HTTP ステータス, レスポンス JSON) を返す"""
+        parts = [unquote(p) for p in path.strip("/").split("/") if p]
+
+        if method == "GET" and parts == ["status"]:
+            return HTTPStatus.OK, self.get_status()
+        if method == "GET" and parts == ["stats"]:
+            return HTTPStatus.OK, self.db.get_stats(days=_int_param(query, "days", 7, 1, 366))
+        if method == "GET" and parts == ["videos"]:
+            return HTTPStatus.OK, self.list_videos(query)
+        if len(parts) >= 2 and parts[0] == "videos":
+            video_id = parts[1]
+            if method == "GET" and len(parts) == 2:
+                return HTTPStatus.OK, {"video": self._get_video(video_id)}
+            if method == "POST" and parts[2:] == ["select"]:
+                return HTTPStatus.OK, self.select_video(video_id, body)
+            if method == "POST" and parts[2:] == ["post"]:
+                return HTTPStatus.OK, self.post_video(video_id, body)
+        if method == "POST" and parts == ["shutdown"]:
+            return HTTPStatus.ACCEPTED, self.shutdown()
+
+        raise ControlAPIError(HTTPStatus.NOT_FOUND, f"不明なエンドポイント: {method} {path}")
+
+    # ============ 各 API ============
+
+    def get_status(self) -> Dict[str, Any]:
+        """起動状態・動作モード・有効なプラグイン"""
+        from app_version import get_version_info
+
+        status = {
+            "version": get_version_info(),
+            "operation_mode": str(self.config.operation_mode),
+            "bluesky_post_enabled": self.config.bluesky_post_enabled,
+            "uptime_seconds": int(time.time() - self.started_at),
+            "enabled_plugins": sorted(self.plugin_manager.get_enabled_plugins().keys()),
+        }
+        if self.status_provider:
+            status.update(self.status_provider())
+        return status
+
+    def render_metrics(self) -> str:
+        """メトリクスを Prometheus テキスト形式で出力"""
+        from metrics import get_metrics_registry
+
+        return get_metrics_registry().render_prometheus()
+
+    def list_videos(self, query: Dict[str, list]) -> Dict[str, Any]:
+        """動画一覧（GUI 一覧と同じフィルタ）"""
+        search = _str_param(query, "search")
+        source = _str_param(query, "source")
+        display_type = _str_param(query, "display_type")
+        posted_param = _str_param(query, "posted")
+        posted = None if posted_param is None else posted_param.lower() in ("1", "true", "yes")
+        limit = _int_param(query, "limit", 50, 1, _MAX_LIST_LIMIT)
+        offset = _int_param(query, "offset", 0, 0, None)
+        videos = self.db.query_videos(search, posted, source, display_type, limit=limit, offset=offset)
+        total = self.db.count_videos(search, posted, source, display_type)
+        return {"total": total, "limit": limit, "offset": offset, "videos": videos}
+
+    def select_video(self, video_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """投稿対象の選択状態・予約日時を更新"""
+        self._get_video(video_id)
+        selected = bool(body.get("selected", True))
+        scheduled_at = body.get("scheduled_at") if selected else None
+        if not self.db.update_selection(video_id, selected=selected, scheduled_at=scheduled_at):
+            raise ControlAPIError(HTTPStatus.INTERNAL_SERVER_ERROR, "選択状態の更新に失敗しました")
+        logger.info(f"[制御API] 選択状態を更新: {video_id} (selected={selected}, scheduled_at={scheduled_at})")
+        return {"video": self._get_video(video_id)}
+
+    def post_video(self, video_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        動画を投稿（GUI の投稿ウィンドウと同じ手順）
+
+        AUTOPOST / COLLECT モードでは手動投稿は禁止、DRY_RUN モードでは常に投稿テストになる。
+        """
+        from config import OperationMode
+
+        mode = self.config.operation_mode
+        if mode in (OperationMode.AUTOPOST, OperationMode.COLLECT):
+            raise ControlAPIError(HTTPStatus.CONFLICT, f"{mode} モードでは手動投稿は無効です")
+
+        video = self._get_video(video_id)
+        dry_run = bool(body.get("dry_run", False)) or mode == OperationMode.DRY_RUN
+        use_image = bool(body.get("use_image", bool(video.get("image_filename"))))
+
+        with self._post_lock:
+            if self.config.prevent_duplicate_posts and not dry_run and self.db.is_duplicate_post(video_id):
+                raise ControlAPIError(HTTPStatus.CONFLICT, "この動画は既に投稿済みです（重複投稿防止）")
+
+            video_with_settings = dict(video)
+            video_with_settings["use_image"] = use_image
+            logger.info(f"[制御API] {'【投稿テスト】' if dry_run else ''}投稿開始: {video.get('title', '')[:40]} (画像: {use_image})")
+            results = self.plugin_manager.post_video_with_all_enabled(video_with_settings, dry_run=dry_run)
+            success = any(results.values())
+            if success and not dry_run:
+                self.db.mark_as_posted(video_id)
+                self.db.update_selection(video_id, selected=False, scheduled_at=None)
+
+        return {"success": success, "dry_run": dry_run, "results": results}
+
+    def shutdown(self) -> Dict[str, Any]:
+        """アプリケーションの終了を要求"""
+        if self.stop_event is None:
+            raise ControlAPIError(HTTPStatus.NOT_IMPLEMENTED, "終了要求は無効です")
+        logger.info("[制御API] 終了要求を受け付けました")
+        self.stop_event.set()
+        return {"stopping": True}
+
+    def _get_video(self, video_id: str) -> Dict[str, Any]:
+        video = self.db.get_video_by_id(video_id)
+        if not video:
+            raise ControlAPIError(HTTPStatus.NOT_FOUND, f"動画が見つかりません: {video_id}")
+        return video
+
+
+def _str_param(query: Dict[str, list], name: str) -> Optional[str]:
+    values = query.get(name)
+    if not values or values[0] == "":
+        return None
+    return values[0]
+
+
+def _int_param(query: Dict[str, list], name: str, default: int, minimum: int, maximum: Optional[int]) -> int:
+    value = _str_param(query, name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise ControlAPIError(HTTPStatus.BAD_REQUEST, f"{name} は整数で指定してください")
+    number = max(minimum, number)
+    return min(maximum, number) if maximum is not None else number
+
+
+def create_control_api_server(db, plugin_manager, config, stop_event=None, status_provider=None) -> ControlAPIServer:
+    """Config の CONTROL_API_* 設定から ControlAPIServer を作成"""
+    return ControlAPIServer(
+        db,
+        plugin_manager,
+        config,
+        stop_event=stop_event,
+        status_provider=status_provider,
+        host=config.control_api_host,
+        port=config.control_api_port,
+        socket_path=config.control_api_socket,
+        token=config.control_api_token,
+    )
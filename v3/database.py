@@ -11,11 +11,14 @@ import sqlite3
 import logging
 import os
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
+from metrics import instrument_methods
+from log_routing import install_module_log_router
 
 logger = logging.getLogger("AppLogger")
+install_module_log_router(logger)
 post_logger = logging.getLogger("PostLogger")
 
 __author__ = "mayuneco(mayunya)"
@@ -25,6 +28,8 @@ __license__ = "GPLv2"
 DB_PATH = "data/video_list.db"
 DB_TIMEOUT = 10
 DB_RETRY_MAX = 3
+# 一括処理で1つの IN 句に含める最大件数（SQLite のバインド変数上限より十分小さく）
+DELETE_BATCH_CHUNK = 500
 
 # バリデーション用の許可リスト（v3.3.0: 5カテゴリ対応）
 # - "video": 通常動画
@@ -35,6 +40,32 @@ DB_RETRY_MAX = 3
 VALID_CONTENT_TYPES = {"video", "archive", "schedule", "live", "completed", "none"}
 VALID_LIVE_STATUSES = {None, "none", "upcoming", "live", "completed"}
 
+# 全文検索（FTS5 trigram）の1語あたりの最小文字数。これより短い語は LIKE で検索する
+FTS_MIN_TERM_LENGTH = 3
+
+# GUI 一覧の表示タイプ（query_videos の display_type）と SQL 条件の対応
+# GUI の表示ロジックと同じ優先順位: プレミア > ニコニコ（常に動画）> content_type
+_LIVE_CONTENT_TYPES = ("archive", "schedule", "live", "completed")
+DISPLAY_TYPE_CONDITIONS = {
+    "premiere": "is_premiere = 1",
+    "video": (
+        "COALESCE(is_premiere, 0) = 0 AND (LOWER(source) = 'niconico' "
+        "OR content_type IS NULL OR content_type NOT IN ('archive', 'schedule', 'live', 'completed'))"
+    ),
+}
+for _content_type in _LIVE_CONTENT_TYPES:
+    DISPLAY_TYPE_CONDITIONS[_content_type] = (
+        f"COALESCE(is_premiere, 0) = 0 AND LOWER(source) != 'niconico' AND content_type = '{_content_type}'"
+    )
+
+# GUI 一覧で取得するカラム（get_all_videos と同じ）
+_LIST_COLUMNS = """
+    id, video_id, published_at, title, posted_to_bluesky,
+    selected_for_post, scheduled_at, posted_at, video_url, channel_name, thumbnail_url,
+    content_type, live_status, is_premiere, source, image_mode, image_filename,
+    classification_type, broadcast_status
+"""
+
 
 class Database:
     """SQLite データベースを管理するクラス"""
@@ -57,9 +88,11 @@ class Database:
             return
         self.db_path = db_path
         self.is_first_run = not Path(db_path).exists()
+        self._fts_available = False
         self._ensure_directory()
         self._init_db()
         self._migrate_schema()
+        self._init_fts()
         self._initialized = True
 
     def _ensure_directory(self):
@@ -146,6 +179,36 @@ class Database:
                 )
             """)
 
+            # サムネイル一括補完の進捗チェックポイント（中断時の再開用）
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS backfill_progress (
+                    job_name TEXT NOT NULL,
+                    video_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (job_name, video_id)
+                )
+            """)
+
+            # 削除済み動画の除外リスト（AUTOPOST 候補・新着検出から除外）
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS deleted_videos (
+                    video_id TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    deleted_at TEXT NOT NULL,
+                    PRIMARY KEY (video_id, source)
+                ) WITHOUT ROWID
+            """)
+
+            # RSS フィードごとの処理済み位置（最後に処理したエントリ ID、再起動後の差分取り込み用）
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS feed_state (
+                    feed_key TEXT PRIMARY KEY,
+                    last_entry_id TEXT,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+
             conn.commit()
             conn.close()
 
@@ -189,6 +252,12 @@ class Database:
                 logger.info("🔄 カラムを追加します: representative_time_jst")
                 cursor.execute("ALTER TABLE videos ADD COLUMN representative_time_jst TEXT")
 
+            # GUI 一覧のページング・フィルタ用インデックス
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_videos_published_at ON videos(published_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_videos_source ON videos(LOWER(source), published_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_videos_posted ON videos(posted_to_bluesky, published_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_videos_content_type ON videos(content_type)")
+
             conn.commit()
             conn.close()
 
@@ -196,6 +265,108 @@ class Database:
             logger.error(f"スキーママイグレーションエラー: {e}")
             raise
 
+    def _init_fts(self):
+        """タイトル・チャンネル名の全文検索インデックス（FTS5）を初期化
+
+        - videos を外部コンテンツとする FTS5 仮想テーブル videos_fts を作成
+        - トリガーで videos の INSERT / UPDATE / DELETE に追従
+        - 日本語タイトルでも部分一致できるよう trigram トークナイザを使用
+        - trigram 非対応の SQLite（3.34 未満）では作成せず、LIKE 検索にフォールバック
+        """
+        conn = None
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'videos_fts'")
+            exists = cursor.fetchone() is not None
+
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS videos_fts USING fts5(
+                    title, channel_name,
+                    content='videos', content_rowid='id',
+                    tokenize='trigram'
+                )
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS videos_fts_ai AFTER INSERT ON videos BEGIN
+                    INSERT INTO videos_fts(rowid, title, channel_name)
+                    VALUES (new.id, new.title, new.channel_name);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS videos_fts_ad AFTER DELETE ON videos BEGIN
+                    INSERT INTO videos_fts(videos_fts, rowid, title, channel_name)
+                    VALUES ('delete', old.id, old.title, old.channel_name);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS videos_fts_au AFTER UPDATE OF title, channel_name ON videos BEGIN
+                    INSERT INTO videos_fts(videos_fts, rowid, title, channel_name)
+                    VALUES ('delete', old.id, old.title, old.channel_name);
+                    INSERT INTO videos_fts(rowid, title, channel_name)
+                    VALUES (new.id, new.title, new.channel_name);
+                END
+            """)
+
+            if not exists:
+                # 既存の動画をインデックスに登録
+                logger.info("🔄 全文検索インデックスを作成します: videos_fts")
+                cursor.execute("INSERT INTO videos_fts(videos_fts) VALUES ('rebuild')")
+
+            conn.commit()
+            self._fts_available = True
+
+        except sqlite3.OperationalError as e:
+            # FTS5 / trigram に対応していない SQLite
+            logger.info(f"ℹ️ 全文検索（FTS5 trigram）を利用できません。LIKE 検索を使用します: {e}")
+            self._fts_available = False
+        finally:
+            if conn:
+                conn.close()
+
+    def _build_search_clause(self, query: str):
+        """
+        検索文字列をタイトル・チャンネル名の検索条件に変換
+
+        空白区切りの各語を AND で結合する。FTS_MIN_TERM_LENGTH 文字以上の語は
+        FTS5 インデックス、それより短い語（trigram で検索できない）は LIKE で評価する。
+
+        Returns:
+            (clauses, params) のタプル
+        """
+        clauses = []
+        params = []
+        fts_terms = []
+
+        for term in query.split():
+            if self._fts_available and len(term) >= FTS_MIN_TERM_LENGTH:
+                # フレーズとして扱い、FTS5 の演算子は無効化する
+                fts_terms.append('"' + term.replace('"', '""') + '"')
+            else:
+                escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                clauses.append("(title LIKE ? ESCAPE '\\' OR channel_name LIKE ? ESCAPE '\\')")
+                params.extend([f"%{escaped}%", f"%{escaped}%"])
+
+        if fts_terms:
+            clauses.insert(0, "id IN (SELECT rowid FROM videos_fts WHERE videos_fts MATCH ?)")
+            params.insert(0, " ".join(fts_terms))
+
+        return clauses, params
+
+    def search_videos(self, query: str, limit: int = 50) -> list:
+        """
+        タイトル・チャンネル名で動画を全文検索（公開日時の新しい順）
+
+        Args:
+            query: 検索文字列（空白区切りで AND 検索、部分一致）
+            limit: 最大取得件数
+
+        Returns:
+            動画情報の辞書リスト（get_all_videos と同じカラム）
+        """
+        return self.query_videos(search=query, limit=limit)
+
     def insert_video(self, video_id, title, video_url, published_at, channel_name="", thumbnail_url="", content_type="video", live_status=None, is_premiere=False, source="youtube", skip_dedup=False, representative_time_utc=None, representative_time_jst=None):
         """
         動画情報を挿入（リトライ付き、YouTube重複排除対応）
@@ -279,6 +450,130 @@ class Database:
 
         return False
 
+    def insert_videos_batch(self, videos: list) -> list:
+        """
+        複数の動画情報を1トランザクションで挿入（既存の video_id は無視）
+
+        Args:
+            videos: insert_video と同じキーを持つ辞書のリスト
+                    （video_id, title, video_url, published_at, channel_name, thumbnail_url,
+                     content_type, live_status, is_premiere, source）
+
+        Returns:
+            list: 新規に挿入された video_id のリスト
+        """
+        rows = []
+        for video in videos:
+            content_type = self._validate_content_type(video.get("content_type", "video"))
+            live_status = self._validate_live_status(video.get("live_status"), content_type)
+            rows.append((
+                video["video_id"], video.get("title", ""), video.get("video_url", ""),
+                video.get("published_at", ""), video.get("channel_name", ""), video.get("thumbnail_url", ""),
+                content_type, live_status, 1 if video.get("is_premiere") else 0, video.get("source", "youtube"),
+                video.get("representative_time_utc"), video.get("representative_time_jst"),
+            ))
+        if not rows:
+            return []
+
+        for attempt in range(DB_RETRY_MAX):
+            conn = None
+            try:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+
+                inserted_rows = []
+                for row in rows:
+                    cursor.execute("""
+                        INSERT OR IGNORE INTO videos (video_id, title, video_url, published_at, channel_name, thumbnail_url, content_type, live_status, is_premiere, source, representative_time_utc, representative_time_jst)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, row)
+                    if cursor.rowcount:
+                        inserted_rows.append(row)
+
+                conn.commit()
+                conn.close()
+                for row in inserted_rows:
+                    logger.info(f"動画を保存しました: {row[1]}")
+                logger.debug(f"一括保存: 新規 {len(inserted_rows)} 件 / {len(rows)} 件")
+                return [row[0] for row in inserted_rows]
+
+            except sqlite3.OperationalError as e:
+                if conn:
+                    conn.close()
+                if "locked" in str(e).lower() and attempt < DB_RETRY_MAX - 1:
+                    logger.debug(f"DB ロック中。{attempt + 1}/{DB_RETRY_MAX} リトライします...")
+                    time.sleep(0.5)
+                    continue
+                logger.error(f"DB エラー: {e}")
+                return []
+
+            except Exception as e:
+                if conn:
+                    conn.close()
+                logger.error(f"動画の一括保存に失敗しました: {e}")
+                return []
+
+        return []
+
+    def get_existing_video_ids(self, video_ids: list) -> set:
+        """
+        指定した video_id のうち DB に登録済みのものを取得
+
+        Args:
+            video_ids: 動画ID のリスト
+
+        Returns:
+            set: 登録済みの video_id
+        """
+        video_ids = list(dict.fromkeys(v for v in video_ids if v))
+        existing = set()
+        if not video_ids:
+            return existing
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            for i in range(0, len(video_ids), DELETE_BATCH_CHUNK):
+                chunk = video_ids[i:i + DELETE_BATCH_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(f"SELECT video_id FROM videos WHERE video_id IN ({placeholders})", chunk)
+                existing.update(row[0] for row in cursor.fetchall())
+            conn.close()
+
+        except Exception as e:
+            logger.error(f"登録済み動画の確認に失敗しました: {e}")
+        return existing
+
+    def get_feed_state(self, feed_key: str) -> Optional[str]:
+        """RSS フィードの処理済み位置（最後に処理したエントリ ID）を取得"""
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute("SELECT last_entry_id FROM feed_state WHERE feed_key = ?", (feed_key,))
+            row = cursor.fetchone()
+            conn.close()
+            return row[0] if row else None
+
+        except Exception as e:
+            logger.error(f"フィード処理位置の取得に失敗: {feed_key} - {e}")
+            return None
+
+    def set_feed_state(self, feed_key: str, last_entry_id: str) -> bool:
+        """RSS フィードの処理済み位置（最後に処理したエントリ ID）を保存"""
+        try:
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            conn = self._get_connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO feed_state (feed_key, last_entry_id, updated_at) VALUES (?, ?, ?)",
+                (feed_key, last_entry_id, now)
+            )
+            conn.commit()
+            conn.close()
+            return True
+
+        except Exception as e:
+            logger.error(f"フィード処理位置の保存に失敗: {feed_key} - {e}")
+            return False
+
     def get_unposted_videos(self):
         """未投稿の動画を取得"""
         try:
@@ -374,6 +669,164 @@ class Database:
             logger.error(f"全動画の取得に失敗しました: {e}")
             return []
 
+    def _build_video_filter(self, search: str = None, posted: Optional[bool] = None,
+                            source: str = None, display_type: str = None):
+        """
+        GUI 一覧のフィルタ条件を WHERE 句に変換
+
+        Returns:
+            (where_sql, params) のタプル（条件なしの場合 where_sql は空文字）
+        """
+        clauses = []
+        params = []
+
+        if search and search.strip():
+            search_clauses, search_params = self._build_search_clause(search)
+            clauses.extend(search_clauses)
+            params.extend(search_params)
+
+        if posted is not None:
+            clauses.append("posted_to_bluesky = ?" if posted else "COALESCE(posted_to_bluesky, 0) = ?")
+            params.append(1 if posted else 0)
+
+        if source:
+            clauses.append("LOWER(source) = ?")
+            params.append(source.lower())
+
+        if display_type:
+            condition = DISPLAY_TYPE_CONDITIONS.get(display_type)
+            if condition is None:
+                raise ValueError(f"不明な表示タイプ: {display_type}")
+            clauses.append(f"({condition})")
+
+        where_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where_sql, params
+
+    def query_videos(self, search: str = None, posted: Optional[bool] = None, source: str = None,
+                     display_type: str = None, limit: int = 200, offset: int = 0) -> list:
+        """
+        GUI 一覧用: フィルタ条件に一致する動画を1ページ分取得（公開日時の新しい順）
+
+        フィルタは SQL の WHERE 句で評価されるため、全件をメモリに読み込まない。
+
+        Args:
+            search: タイトル・チャンネル名の検索文字列（部分一致、空白区切りで AND）
+            posted: True=投稿済みのみ / False=未投稿のみ / None=すべて
+            source: 配信元（"youtube" / "niconico" など、大文字小文字は区別しない）
+            display_type: 表示タイプ（DISPLAY_TYPE_CONDITIONS のキー）
+            limit: 取得件数
+            offset: 先頭からのオフセット
+
+        Returns:
+            動画情報の辞書リスト
+        """
+        try:
+            where_sql, params = self._build_video_filter(search, posted, source, display_type)
+            conn = self._get_connection()
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT {_LIST_COLUMNS} FROM videos {where_sql} "
+                "ORDER BY published_at DESC, id DESC LIMIT ? OFFSET ?",
+                (*params, limit, offset),
+            )
+            videos = [dict(row) for row in cursor.fetchall()]
+            conn.close()
+            return videos
+
+        except Exception as e:
+            logger.error(f"動画一覧の取得に失敗しました: {e}")
+            return []
+
+    def count_videos(self, search: str = None, posted: Optional[bool] = None, source: str = None,
+                     display_type: str = None) -> int:
+        """
+        GUI 一覧用: フィルタ条件に一致する動画数を取得（引数は query_videos と同じ）
+        """
+        try:
+            where_sql, params = self._build_video_filter(search, posted, source, display_type)
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT COUNT(*) FROM videos {where_sql}", params)
+            count = cursor.fetchone()[0]
+            conn.close()
+            return count
+
+        except Exception as e:
+            logger.error(f"動画数の取得に失敗しました: {e}")
+            return 0
+
+    def get_stats(self, days: int = 7) -> dict:
+        """
+        統計ダイアログ用の集計を SQL 側で取得（全件をメモリに読み込まない）
+
+        Args:
+            days: 日別集計の対象日数（今日を含む）
+
+        Returns:
+            dict: {
+                "total", "posted", "unposted", "selected": 件数,
+                "by_source": {source: {"total": 件数, "posted": 件数}},
+                "daily": [{"date": "YYYY-MM-DD", "total": 件数, "posted": 件数}, ...]（新しい日付順）
+            }
+        """
+        today = datetime.now().date()
+        dates = [(today - timedelta(days=i)).isoformat() for i in range(max(days, 0))]
+        stats = {
+            "total": 0,
+            "posted": 0,
+            "unposted": 0,
+            "selected": 0,
+            "by_source": {},
+            "daily": [{"date": d, "total": 0, "posted": 0} for d in dates],
+        }
+
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+
+            # 配信元 × 投稿状態ごとの件数（source 未設定は youtube 扱い）
+            cursor.execute("""
+                SELECT LOWER(COALESCE(source, 'youtube')) AS src,
+                       COALESCE(posted_to_bluesky, 0) != 0 AS posted,
+                       COUNT(*),
+                       SUM(COALESCE(selected_for_post, 0) != 0)
+                FROM videos
+                GROUP BY src, posted
+            """)
+            for src, posted, count, selected in cursor.fetchall():
+                source_stats = stats["by_source"].setdefault(src, {"total": 0, "posted": 0})
+                source_stats["total"] += count
+                stats["total"] += count
+                stats["selected"] += selected or 0
+                if posted:
+                    source_stats["posted"] += count
+                    stats["posted"] += count
+            stats["unposted"] = stats["total"] - stats["posted"]
+
+            # 日別件数（published_at の日付部分で集計、idx_videos_published_at で範囲検索）
+            if dates:
+                cursor.execute("""
+                    SELECT substr(published_at, 1, 10) AS day,
+                           COUNT(*),
+                           SUM(COALESCE(posted_to_bluesky, 0) != 0)
+                    FROM videos
+                    WHERE published_at >= ?
+                    GROUP BY day
+                """, (dates[-1],))
+                daily = {d["date"]: d for d in stats["daily"]}
+                for day, count, posted in cursor.fetchall():
+                    if day in daily:
+                        daily[day]["total"] = count
+                        daily[day]["posted"] = posted or 0
+
+            conn.close()
+
+        except Exception as e:
+            logger.error(f"統計情報の取得に失敗しました: {e}")
+
+        return stats
+
     def count_unposted_in_lookback(self, lookback_minutes: int) -> int:
         """
         LOOKBACK 時間窓内の未投稿動画数をカウント（AUTOPOST 起動抑止判定用）
@@ -446,22 +899,10 @@ class Database:
             type_filter = " OR ".join(type_conditions)
             where_clauses.append(f"({type_filter})")
 
-            # DELETE された動画を除外
-            deleted_ids = []
-            from deleted_video_cache import get_deleted_video_cache
-            try:
-                deleted_cache = get_deleted_video_cache()
-                deleted_ids = deleted_cache.get_deleted_video_ids()
-                if deleted_ids:
-                    placeholders = ",".join("?" * len(deleted_ids))
-                    where_clauses.append(f"video_id NOT IN ({placeholders})")
-                    logger.debug(f"除外動画リスト: {len(deleted_ids)} 件を除外フィルタに適用")
-            except ImportError:
-                logger.debug("deleted_video_cache モジュールが見つかりません")
-            except AttributeError as ae:
-                logger.warning(f"⚠️ get_deleted_video_ids() 呼び出しエラー: {ae}")
-            except Exception as e:
-                logger.warning(f"⚠️ 除外動画リスト取得エラー: {e}")
+            # DELETE された動画を除外（除外リストテーブルとの anti-join、件数に依存しない）
+            where_clauses.append(
+                "NOT EXISTS (SELECT 1 FROM deleted_videos d WHERE d.video_id = videos.video_id)"
+            )
 
             where_clause = " AND ".join(where_clauses)
 
@@ -469,7 +910,7 @@ class Database:
                 SELECT * FROM videos
                 WHERE {where_clause}
                 ORDER BY published_at DESC
-            """, deleted_ids)
+            """)
 
             videos = [dict(row) for row in cursor.fetchall()]
             conn.close()
@@ -686,6 +1127,211 @@ class Database:
             logger.error(f"画像情報の更新に失敗: {video_id} - {e}")
             return False
 
+    def get_backfill_targets(self, source: str) -> list:
+        """サムネイル URL または画像ファイルが未設定の動画を取得（一括補完用）
+
+        Args:
+            source: 配信元（"youtube" / "niconico" など）
+
+        Returns:
+            List[Dict]: 補完対象の動画リスト（新しい順）
+        """
+        try:
+            conn = self._get_connection()
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT id, video_id, title, source, thumbnail_url, image_mode, image_filename
+                FROM videos
+                WHERE LOWER(source) = ?
+                  AND (thumbnail_url IS NULL OR thumbnail_url = ''
+                       OR image_filename IS NULL OR image_filename = '')
+                ORDER BY published_at DESC
+            """, (source.lower(),))
+
+            videos = [dict(row) for row in cursor.fetchall()]
+            conn.close()
+            return videos
+
+        except Exception as e:
+            logger.error(f"補完対象動画の取得に失敗: {source} - {e}")
+            return []
+
+    def get_backfill_progress(self, job_name: str) -> dict:
+        """一括補完ジョブのチェックポイントを取得
+
+        Args:
+            job_name: ジョブ名（"youtube_thumb_backfill" など）
+
+        Returns:
+            {video_id: status} の辞書（status は "done" / "failed"）
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT video_id, status FROM backfill_progress WHERE job_name = ?",
+                (job_name,)
+            )
+            progress = {row[0]: row[1] for row in cursor.fetchall()}
+            conn.close()
+            return progress
+
+        except Exception as e:
+            logger.error(f"補完チェックポイントの取得に失敗: {job_name} - {e}")
+            return {}
+
+    def clear_backfill_progress(self, job_name: str) -> bool:
+        """一括補完ジョブのチェックポイントを削除（ジョブ完了時・最初からやり直す時）"""
+        try:
+            conn = self._get_connection()
+            conn.execute("DELETE FROM backfill_progress WHERE job_name = ?", (job_name,))
+            conn.commit()
+            conn.close()
+            return True
+
+        except Exception as e:
+            logger.error(f"補完チェックポイントの削除に失敗: {job_name} - {e}")
+            return False
+
+    def get_deleted_video_entries(self) -> list:
+        """除外動画リストの全件を (source, video_id) のリストで取得"""
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute("SELECT source, video_id FROM deleted_videos")
+            entries = cursor.fetchall()
+            conn.close()
+            return entries
+
+        except Exception as e:
+            logger.error(f"除外動画リストの取得に失敗: {e}")
+            return []
+
+    def add_deleted_video_entries(self, entries) -> bool:
+        """除外動画リストに (source, video_id) をまとめて追加（登録済みは無視）"""
+        entries = list(entries)
+        if not entries:
+            return True
+        try:
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            conn = self._get_connection()
+            conn.executemany(
+                "INSERT OR IGNORE INTO deleted_videos (video_id, source, deleted_at) VALUES (?, ?, ?)",
+                [(video_id, source, now) for source, video_id in entries]
+            )
+            conn.commit()
+            conn.close()
+            return True
+
+        except Exception as e:
+            logger.error(f"除外動画リストへの追加に失敗: {e}")
+            return False
+
+    def remove_deleted_video_entry(self, video_id: str, source: str) -> bool:
+        """除外動画リストから1件削除"""
+        try:
+            conn = self._get_connection()
+            conn.execute("DELETE FROM deleted_videos WHERE video_id = ? AND source = ?", (video_id, source))
+            conn.commit()
+            conn.close()
+            return True
+
+        except Exception as e:
+            logger.error(f"除外動画リストからの削除に失敗: {video_id} - {e}")
+            return False
+
+    def clear_deleted_video_entries(self) -> bool:
+        """除外動画リストを全件削除"""
+        try:
+            conn = self._get_connection()
+            conn.execute("DELETE FROM deleted_videos")
+            conn.commit()
+            conn.close()
+            return True
+
+        except Exception as e:
+            logger.error(f"除外動画リストのクリアに失敗: {e}")
+            return False
+
+    def save_backfill_batch(self, job_name: Optional[str], image_updates=(), thumbnail_updates=(), progress=()) -> Optional[int]:
+        """一括補完の結果をまとめて書き込む（1トランザクション）
+
+        画像情報・サムネイル URL・チェックポイントを同じトランザクションで保存するため、
+        中断されても「画像は保存済みだがチェックポイント未記録」の状態にならない。
+
+        Args:
+            job_name: ジョブ名（None の場合はチェックポイントを記録しない）
+            image_updates: (video_id, image_mode, image_filename) のリスト
+            thumbnail_updates: (video_id, thumbnail_url) のリスト
+            progress: (video_id, status) のリスト
+
+        Returns:
+            画像情報の更新件数、書き込み失敗時は None（0 件更新と区別するため）
+        """
+        image_updates = list(image_updates)
+        thumbnail_updates = list(thumbnail_updates)
+        progress = list(progress)
+
+        if not image_updates and not thumbnail_updates and not progress:
+            return 0
+
+        for attempt in range(DB_RETRY_MAX):
+            conn = None
+            try:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+
+                if thumbnail_updates:
+                    cursor.executemany(
+                        "UPDATE videos SET thumbnail_url = ? WHERE video_id = ?",
+                        [(url, video_id) for video_id, url in thumbnail_updates]
+                    )
+
+                updated = 0
+                if image_updates:
+                    cursor.executemany(
+                        "UPDATE videos SET image_mode = ?, image_filename = ? WHERE video_id = ?",
+                        [(mode, filename, video_id) for video_id, mode, filename in image_updates]
+                    )
+                    updated = cursor.rowcount
+
+                if job_name and progress:
+                    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    cursor.executemany(
+                        """
+                        INSERT OR REPLACE INTO backfill_progress (job_name, video_id, status, updated_at)
+                        VALUES (?, ?, ?, ?)
+                        """,
+                        [(job_name, video_id, status, now) for video_id, status in progress]
+                    )
+
+                conn.commit()
+                conn.close()
+                logger.info(
+                    f"✅ 一括更新: 画像情報 {len(image_updates)} 件, サムネイルURL {len(thumbnail_updates)} 件"
+                )
+                return updated
+
+            except sqlite3.OperationalError as e:
+                if conn:
+                    conn.close()
+                if "locked" in str(e).lower() and attempt < DB_RETRY_MAX - 1:
+                    logger.debug(f"DB ロック中。{attempt + 1}/{DB_RETRY_MAX} リトライします...")
+                    time.sleep(0.5)
+                    continue
+                logger.error(f"❌ 一括更新に失敗: {e}")
+                return None
+
+            except Exception as e:
+                if conn:
+                    conn.close()
+                logger.error(f"❌ 一括更新に予期しないエラー: {e}")
+                return None
+
+        return None
+
     def update_video_status(self, video_id: str, content_type: str = None, live_status = None) -> bool:
         """動画のコンテンツ種別とライブ配信状態を更新
 
@@ -901,61 +1547,19 @@ class Database:
             "source": "youtube"
         }
 
-        for attempt in range(DB_RETRY_MAX):
-            try:
-                conn = sqlite3.connect(self.db_path, timeout=DB_TIMEOUT)
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-
-                # 削除前に video_id, source, image_filename, image_mode を取得
-                cursor.execute(
-                    "SELECT source, image_filename, image_mode FROM videos WHERE video_id = ?",
-                    (video_id,)
-                )
-                row = cursor.fetchone()
-
-                if row:
-                    result["source"] = row["source"] or "youtube"
-                    result["image_filename"] = row["image_filename"]  # None でも OK（呼び出し元で判定）
-
-                # DB から削除
-                cursor.execute("DELETE FROM videos WHERE video_id = ?", (video_id,))
-                conn.commit()
-                conn.close()
-
-                result["success"] = True
-
-                # ★ 新: 除外動画リストに追加
-                try:
-                    from deleted_video_cache import get_deleted_video_cache
-                    cache = get_deleted_video_cache()
-                    cache.add_deleted_video(video_id, source=result["source"])
-                except ImportError:
-                    logger.warning("deleted_video_cache モジュールが見つかりません")
-                except Exception as e:
-                    logger.error(f"除外動画リスト登録エラー: {video_id} - {e}")
-
-                logger.info(f"✅ 動画を削除しました: {video_id}")
-                return result
-
-            except sqlite3.OperationalError as e:
-                if "locked" in str(e).lower() and attempt < DB_RETRY_MAX - 1:
-                    logger.debug(f"DB ロック中。{attempt + 1}/{DB_RETRY_MAX} リトライします...")
-                    time.sleep(0.5)
-                    continue
-                else:
-                    logger.error(f"動画削除に失敗: {video_id} - {e}")
-                    return result
-
-            except Exception as e:
-                logger.error(f"動画削除エラー: {video_id} - {e}")
-                return result
-
-        logger.error(f"動画削除に失敗（リトライ上限）: {video_id}")
+        batch = self.delete_videos_batch([video_id])
+        if batch["deleted_videos"]:
+            deleted = batch["deleted_videos"][0]
+            result["success"] = True
+            result["image_filename"] = deleted["image_filename"]
+            result["source"] = deleted["source"]
         return result
 
     def delete_videos_batch(self, video_ids: list) -> dict:
-        """複数の動画をDBから削除
+        """複数の動画をDBから削除（1トランザクション）
+
+        画像情報の取得・削除を DELETE_BATCH_CHUNK 件ずつの IN 句でまとめて行い、
+        除外動画リストへの登録も1回で行う。
 
         Args:
             video_ids: 削除対象の動画ID リスト
@@ -973,23 +1577,107 @@ class Database:
                 ]
             }
         """
-        deleted_videos = []
+        result = {
+            "deleted_count": 0,
+            "deleted_videos": []
+        }
+        video_ids = list(dict.fromkeys(v for v in video_ids if v))
+        if not video_ids:
+            return result
+
+        chunks = [video_ids[i:i + DELETE_BATCH_CHUNK] for i in range(0, len(video_ids), DELETE_BATCH_CHUNK)]
+
+        for attempt in range(DB_RETRY_MAX):
+            conn = None
+            try:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+
+                # 削除前に source, image_filename をまとめて取得
+                found = {}
+                for chunk in chunks:
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(
+                        f"SELECT video_id, source, image_filename FROM videos WHERE video_id IN ({placeholders})",
+                        chunk
+                    )
+                    for video_id, source, image_filename in cursor.fetchall():
+                        found[video_id] = (source or "youtube", image_filename)
+
+                # DB から削除
+                for chunk in chunks:
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(f"DELETE FROM videos WHERE video_id IN ({placeholders})", chunk)
+
+                conn.commit()
+                conn.close()
+                break
+
+            except sqlite3.OperationalError as e:
+                if conn:
+                    conn.close()
+                if "locked" in str(e).lower() and attempt < DB_RETRY_MAX - 1:
+                    logger.debug(f"DB ロック中。{attempt + 1}/{DB_RETRY_MAX} リトライします...")
+                    time.sleep(0.5)
+                    continue
+                logger.error(f"動画の一括削除に失敗: {len(video_ids)} 件 - {e}")
+                return result
+
+            except Exception as e:
+                if conn:
+                    conn.close()
+                logger.error(f"動画の一括削除エラー: {len(video_ids)} 件 - {e}")
+                return result
+        else:
+            logger.error(f"動画の一括削除に失敗（リトライ上限）: {len(video_ids)} 件")
+            return result
 
         for video_id in video_ids:
-            result = self.delete_video(video_id)
-            if result["success"]:
-                deleted_videos.append({
-                    "video_id": video_id,
-                    "image_filename": result["image_filename"],
-                    "source": result["source"]
-                })
-
-        return {
-            "deleted_count": len(deleted_videos),
-            "deleted_videos": deleted_videos
-        }
+            source, image_filename = found.get(video_id, ("youtube", None))
+            result["deleted_videos"].append({
+                "video_id": video_id,
+                "image_filename": image_filename,  # None でも OK（呼び出し元で判定）
+                "source": source
+            })
+        result["deleted_count"] = len(result["deleted_videos"])
+
+        # ★ 新: 除外動画リストにまとめて追加
+        try:
+            from deleted_video_cache import get_deleted_video_cache
+            cache = get_deleted_video_cache()
+            cache.add_deleted_videos([(v["video_id"], v["source"]) for v in result["deleted_videos"]])
+        except ImportError:
+            logger.warning("deleted_video_cache モジュールが見つかりません")
+        except Exception as e:
+            logger.error(f"除外動画リスト登録エラー: {len(video_ids)} 件 - {e}")
+
+        if len(video_ids) == 1:
+            logger.info(f"✅ 動画を削除しました: {video_ids[0]}")
+        else:
+            logger.info(f"✅ 動画を一括削除しました: {result['deleted_count']} 件")
+        return result
+
+
+# 公開メソッドごとの所要時間をメトリクス（db_query_seconds）に記録
+instrument_methods(Database)
 
 
 def get_database(db_path=DB_PATH) -> Database:
     """データベースオブジェクトを取得"""
     return Database(db_path)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="動画データベースの検索")
+    parser.add_argument("query", help="検索文字列（タイトル・チャンネル名、空白区切りで AND）")
+    parser.add_argument("--limit", type=int, default=50, help="最大表示件数（デフォルト: 50）")
+    parser.add_argument("--db", default=DB_PATH, help=f"データベースファイル（デフォルト: {DB_PATH}）")
+    args = parser.parse_args()
+
+    results = get_database(args.db).search_videos(args.query, limit=args.limit)
+    for video in results:
+        posted = "✓" if video.get("posted_to_bluesky") else "–"
+        print(f"{posted} {video['published_at'][:16]}  {video['video_id']}  [{video.get('source') or ''}]  {video['title']}")
+    print(f"\n{len(results)} 件")
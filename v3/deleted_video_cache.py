@@ -3,10 +3,17 @@
 """
 Stream notify on Bluesky - 削除済み動画除外リスト管理
 
-削除済み動画の ID をサービス別に JSON ファイルで管理。
+削除済み動画の ID をサービス別に管理。
 新着動画検出時にこのリストをチェック。
 
-削除除外動画リストは以下のように構成されます:
+- 永続化は DB の deleted_videos テーブル（主キー: video_id, source）
+  - 追加・削除は 1 行単位の INSERT / DELETE（ファイル全体の書き直しはしない）
+  - AUTOPOST 候補の取得は SQL の anti-join で除外するため、件数が増えても遅くならない
+- 参照（is_deleted）はメモリ上のサービス別 set で O(1)
+- 旧形式の JSON ファイル（data/deleted_videos.json）が存在する場合は起動時に取り込み、
+  取り込み後は deleted_videos.json.migrated にリネームする
+
+旧形式の JSON は以下のように構成されます:
 {
     "youtube": ["video_id1", "video_id2"],
     "niconico": ["sm12345678"],
@@ -14,9 +21,9 @@ Stream notify on Bluesky - 削除済み動画除外リスト管理
 }
 """
 
-import os
 import json
 import logging
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -29,61 +36,71 @@ __license__ = "GPLv2"
 # グローバル キャッシュインスタンス
 _deleted_video_cache = None
 
+DEFAULT_SOURCES = ("youtube", "niconico", "twitch")
+
 
 class DeletedVideoCache:
     """削除済み動画キャッシュ管理"""
 
-    def __init__(self, cache_file: str = "data/deleted_videos.json"):
+    def __init__(self, cache_file: str = "data/deleted_videos.json", db=None):
         """
         初期化
 
         Args:
-            cache_file: 除外動画リスト JSON ファイルのパス
+            cache_file: 旧形式の除外動画リスト JSON ファイルのパス（存在する場合のみ取り込む）
+            db: Database インスタンス（None の場合は get_database() を使用）
         """
+        if db is None:
+            from database import get_database
+            db = get_database()
+        self.db = db
         self.cache_file = Path(cache_file)
-        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
         self.data = {}
+        self._lock = threading.Lock()
         self._load()
 
     def _load(self) -> None:
-        """JSON ファイルから読み込み"""
+        """DB から読み込み（旧形式の JSON があれば先に取り込む）"""
+        self._import_legacy_json()
+
+        self._create_default()
+        for source, video_id in self.db.get_deleted_video_entries():
+            self.data.setdefault(source, set()).add(video_id)
+        logger.info(f"✅ 除外動画リストを読み込みました: {self.get_deleted_count()} 件")
+
+    def _import_legacy_json(self) -> None:
+        """旧形式の JSON ファイルを DB に取り込み、取り込み済みとしてリネーム"""
         if not self.cache_file.exists():
-            logger.debug(f"除外動画リスト JSON が存在しません。新規作成します: {self.cache_file}")
-            self._create_default()
-            self._save()
             return
 
         try:
             with open(self.cache_file, "r", encoding="utf-8") as f:
-                self.data = json.load(f)
-            logger.info(f"✅ 除外動画リストを読み込みました: {self.cache_file}")
+                legacy = json.load(f)
         except json.JSONDecodeError as e:
-            logger.error(f"❌ 除外動画リスト JSON の形式エラー: {e}")
-            logger.warning("除外動画リスト JSON をリセットします")
-            self._create_default()
-            self._save()
+            logger.error(f"❌ 除外動画リスト JSON の形式エラー（取り込みをスキップ）: {e}")
+            return
         except Exception as e:
             logger.error(f"❌ 除外動画リスト読み込みエラー: {e}")
-            self._create_default()
+            return
+
+        entries = [
+            (source.lower(), video_id)
+            for source, ids in (legacy or {}).items()
+            for video_id in (ids or [])
+        ]
+        if not self.db.add_deleted_video_entries(entries):
+            return
 
-    def _save(self) -> bool:
-        """JSON ファイルに保存"""
+        migrated = self.cache_file.with_name(self.cache_file.name + ".migrated")
         try:
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, ensure_ascii=False, indent=2)
-            logger.debug(f"✅ 除外動画リストを保存しました: {self.cache_file}")
-            return True
+            self.cache_file.replace(migrated)
         except Exception as e:
-            logger.error(f"❌ 除外動画リスト保存エラー: {e}")
-            return False
+            logger.warning(f"⚠️ 旧除外動画リスト JSON のリネームに失敗: {e}")
+        logger.info(f"✅ 旧除外動画リスト JSON を DB に取り込みました: {len(entries)} 件 ({self.cache_file})")
 
     def _create_default(self) -> None:
         """デフォルト構造を作成"""
-        self.data = {
-            "youtube": [],
-            "niconico": [],
-            "twitch": [],
-        }
+        self.data = {source: set() for source in DEFAULT_SOURCES}
         logger.debug("除外動画リストをリセットしました")
 
     def is_deleted(self, video_id: str, source: str = "youtube") -> bool:
@@ -98,11 +115,7 @@ class DeletedVideoCache:
             True: 除外動画リストに含まれている（削除済み）
             False: 除外動画リストに含まれていない
         """
-        source_lower = source.lower()
-        if source_lower not in self.data:
-            return False
-
-        is_blacklisted = video_id in self.data[source_lower]
+        is_blacklisted = video_id in self.data.get(source.lower(), ())
         if is_blacklisted:
             logger.debug(f"⏭️ 除外動画リスト確認: {video_id} (source: {source})")
         return is_blacklisted
@@ -120,21 +133,45 @@ class DeletedVideoCache:
         """
         source_lower = source.lower()
 
-        # サービスキーがなければ作成
-        if source_lower not in self.data:
-            self.data[source_lower] = []
-
         # 重複チェック
-        if video_id in self.data[source_lower]:
+        if video_id in self.data.get(source_lower, ()):
             logger.debug(f"既に除外動画リスト登録済みです: {video_id} (source: {source})")
             return True
 
-        # リストに追加
-        self.data[source_lower].append(video_id)
+        if not self.db.add_deleted_video_entries([(source_lower, video_id)]):
+            return False
+
+        with self._lock:
+            self.data.setdefault(source_lower, set()).add(video_id)
         logger.info(f"✅ 除外動画リストに追加しました: {video_id} (source: {source})")
+        return True
+
+    def add_deleted_videos(self, videos: list) -> bool:
+        """
+        除外動画リストに複数の ID をまとめて追加（DB 書き込みは1回）
+
+        Args:
+            videos: (video_id, source) のリスト
+
+        Returns:
+            成功の可否
+        """
+        entries = []
+        for video_id, source in videos:
+            source_lower = (source or "youtube").lower()
+            if video_id not in self.data.get(source_lower, ()):
+                entries.append((source_lower, video_id))
+        if not entries:
+            return True
+
+        if not self.db.add_deleted_video_entries(entries):
+            return False
 
-        # 保存
-        return self._save()
+        with self._lock:
+            for source_lower, video_id in entries:
+                self.data.setdefault(source_lower, set()).add(video_id)
+        logger.info(f"✅ 除外動画リストに追加しました: {len(entries)} 件")
+        return True
 
     def remove_deleted_video(self, video_id: str, source: str = "youtube") -> bool:
         """
@@ -157,12 +194,13 @@ class DeletedVideoCache:
             logger.debug(f"動画 ID '{video_id}' は除外動画リスト登録されていません")
             return False
 
-        # リストから削除
-        self.data[source_lower].remove(video_id)
-        logger.info(f"🗑️ 除外動画リストから削除しました: {video_id} (source: {source})")
+        if not self.db.remove_deleted_video_entry(video_id, source_lower):
+            return False
 
-        # 保存
-        return self._save()
+        with self._lock:
+            self.data[source_lower].discard(video_id)
+        logger.info(f"🗑️ 除外動画リストから削除しました: {video_id} (source: {source})")
+        return True
 
     def get_deleted_count(self, source: Optional[str] = None) -> int:
         """
@@ -179,13 +217,15 @@ class DeletedVideoCache:
             return sum(len(ids) for ids in self.data.values())
 
         source_lower = source.lower()
-        return len(self.data.get(source_lower, []))
+        return len(self.data.get(source_lower, ()))
 
     def clear_all_deleted(self) -> bool:
         """全除外動画リストをクリア"""
         try:
-            self._create_default()
-            self._save()
+            if not self.db.clear_deleted_video_entries():
+                return False
+            with self._lock:
+                self._create_default()
             logger.info("✅ 除外動画リストをクリアしました")
             return True
         except Exception as e:
@@ -200,17 +240,20 @@ class DeletedVideoCache:
             source: サービス名（None の場合は全体）
 
         Returns:
-            除外動画リストデータ
+            除外動画リストデータ（{サービス名: [動画 ID, ...]}）
         """
         if source is None:
-            return dict(self.data)
+            return {key: sorted(ids) for key, ids in self.data.items()}
 
         source_lower = source.lower()
-        return {source_lower: self.data.get(source_lower, [])}
+        return {source_lower: sorted(self.data.get(source_lower, ()))}
 
     def get_deleted_video_ids(self, source: Optional[str] = None) -> list:
         """
-        削除済み動画 ID のリストを取得（database.py の get_autopost_candidates で使用）
+        削除済み動画 ID のリストを取得
+
+        AUTOPOST 候補の除外は database.py の get_autopost_candidates が
+        deleted_videos テーブルとの anti-join で行うため、ここは表示・集計用。
 
         Args:
             source: サービス名（None の場合は全サービス統合）
@@ -226,7 +269,7 @@ class DeletedVideoCache:
             return all_ids
 
         source_lower = source.lower()
-        return self.data.get(source_lower, [])
+        return list(self.data.get(source_lower, ()))
 
 
 def get_deleted_video_cache(cache_file: str = "data/deleted_videos.json") -> DeletedVideoCache:
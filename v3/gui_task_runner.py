@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+"""
+Stream notify on Bluesky - v3 GUI バックグラウンドタスク実行
+
+ネットワーク通信や重い DB 処理を Tk のメインスレッド外で実行し、
+完了・失敗・進捗のコールバックを root.after 経由でメインスレッドに戻す。
+
+- ワーカースレッドから Tk ウィジェットには一切触れない
+  （結果はキューに積み、メインスレッドのポーリングで取り出して処理）
+- タスク関数は progress(current, total, message) を受け取り、進捗を通知できる
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from metrics import QUEUE_DEPTH
+
+logger = logging.getLogger("GUILogger")
+
+__author__ = "mayuneco(mayunya)"
+__copyright__ = "Copyright (C) 2025 mayuneco(mayunya)"
+__license__ = "GPLv2"
+
+# 結果キューを確認する間隔（ミリ秒）
+POLL_INTERVAL_MS = 50
+DEFAULT_MAX_WORKERS = 4
+
+
+class GuiTaskRunner:
+    """GUI 用のバックグラウンドタスク実行クラス"""
+
+    def __init__(self, root, max_workers: int = DEFAULT_MAX_WORKERS, on_status=None):
+        """
+        初期化
+
+        Args:
+            root: Tk ルートウィンドウ
+            max_workers: 同時実行数
+            on_status: on_status(message, current, total) 形式の進捗表示関数（メインスレッドで呼ばれる）
+                       タスクがすべて終了すると on_status(None, 0, 0) が呼ばれる
+        """
+        self.root = root
+        self.on_status = on_status
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="GuiTask")
+        self._events = queue.Queue()
+        self._running = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self._after_id = self.root.after(POLL_INTERVAL_MS, self._poll)
+        QUEUE_DEPTH.set_function(lambda: self.running_count, queue="gui_tasks")
+
+    @property
+    def running_count(self) -> int:
+        """実行中のタスク数"""
+        with self._lock:
+            return self._running
+
+    def submit(self, func, *args, on_success=None, on_error=None, description: str = "", **kwargs):
+        """
+        タスクをバックグラウンドで実行
+
+        func は progress キーワード引数（progress(current, total, message)）を受け取る。
+
+        Args:
+            func: 実行する関数
+            on_success: on_success(result) 完了時のコールバック（メインスレッド）
+            on_error: on_error(exception) 失敗時のコールバック（メインスレッド、未指定時はログのみ）
+            description: 進捗表示用のタスク名
+
+        Returns:
+            concurrent.futures.Future
+        """
+        if self._closed:
+            raise RuntimeError("GuiTaskRunner は終了済みです")
+
+        with self._lock:
+            self._running += 1
+        if description:
+            self._events.put(("progress", (description, 0, 0)))
+
+        def progress(current: int, total: int, message: str = ""):
+            self._events.put(("progress", (message or description, current, total)))
+
+        def run():
+            try:
+                result = func(*args, progress=progress, **kwargs)
+            except Exception as e:
+                logger.error(f"❌ バックグラウンド処理エラー（{description or getattr(func, '__name__', func)}）: {e}", exc_info=True)
+                self._events.put(("error", (on_error, e)))
+            else:
+                self._events.put(("success", (on_success, result)))
+            return None
+
+        return self._executor.submit(run)
+
+    def _poll(self):
+        """キューに溜まったイベントをメインスレッドで処理"""
+        try:
+            while True:
+                kind, payload = self._events.get_nowait()
+                if kind == "progress":
+                    self._notify_status(*payload)
+                    continue
+
+                callback, value = payload
+                with self._lock:
+                    self._running -= 1
+                    idle = self._running == 0
+                try:
+                    if callback:
+                        callback(value)
+                except Exception as e:
+                    logger.error(f"❌ 完了コールバックでエラー: {e}", exc_info=True)
+                if idle:
+                    self._notify_status(None, 0, 0)
+        except queue.Empty:
+            pass
+
+        if not self._closed:
+            self._after_id = self.root.after(POLL_INTERVAL_MS, self._poll)
+
+    def _notify_status(self, message, current, total):
+        if not self.on_status:
+            return
+        try:
+            self.on_status(message, current, total)
+        except Exception as e:
+            logger.debug(f"⚠️ 進捗表示エラー: {e}")
+
+    def shutdown(self):
+        """ポーリングを停止し、実行中のタスクの完了を待たずに終了"""
+        self._closed = True
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
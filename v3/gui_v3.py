@@ -16,6 +16,7 @@ import sys
 import calendar
 from database import get_database
 from image_manager import get_image_manager
+from gui_task_runner import GuiTaskRunner
 from pathlib import Path
 from unified_settings_window import UnifiedSettingsWindow
 from template_editor_dialog import TemplateEditorDialog
@@ -32,6 +33,22 @@ __author__ = "mayuneco(mayunya)"
 __copyright__ = "Copyright (C) 2025 mayuneco(mayunya)"
 __license__ = "GPLv2"
 
+# 動画一覧の1ページあたりの表示件数
+PAGE_SIZE = 200
+# タイトル検索の入力からフィルタ適用までの待ち時間（ミリ秒）
+FILTER_DELAY_MS = 250
+# メトリクスパネルの自動更新間隔（ミリ秒）
+METRICS_REFRESH_MS = 2000
+# タイプフィルタの表示名 → Database.query_videos() の display_type
+DISPLAY_TYPE_FILTERS = {
+    "🎬 動画": "video",
+    "📹 アーカイブ": "archive",
+    "📅 放送予約": "schedule",
+    "🔴 放送中": "live",
+    "⏹️ 放送終了": "completed",
+    "🎆 プレミア": "premiere",
+}
+
 
 class CreateToolTip:
     """ウィジェットにツールチップを作成する"""
@@ -101,11 +118,15 @@ class StreamNotifyGUI:
         self.config = get_config("settings.env")
         self.operation_mode = self.config.operation_mode
 
-        # フィルタ用の変数
-        self.all_videos = []  # フィルタ前のすべての動画
-        self.filtered_videos = []  # フィルタ後の動画
+        # フィルタ用の変数（一覧は DB から1ページ分ずつ取得する）
+        self.filtered_videos = []  # 表示中のページの動画
+        self.total_count = 0  # フィルタ条件に一致する総件数
+        self.current_page = 0
+        self._filter_after_id = None  # タイトル検索の遅延実行ID
 
         self.setup_ui()
+        # ネットワーク通信・重い DB 処理はバックグラウンドで実行（ウィンドウを固まらせない）
+        self.task_runner = GuiTaskRunner(self.root, on_status=self._on_task_status)
         self.refresh_data()
 
     def setup_ui(self):
@@ -145,6 +166,7 @@ class StreamNotifyGUI:
             self.execute_post_button.config(state=tk.DISABLED)
         ttk.Separator(toolbar, orient=tk.VERTICAL).pack(side=tk.LEFT, fill=tk.Y, padx=2)
         ttk.Button(toolbar, text="ℹ️ 統計", command=self.show_stats).pack(side=tk.LEFT, padx=2)
+        ttk.Button(toolbar, text="📈 メトリクス", command=self.show_metrics).pack(side=tk.LEFT, padx=2)
         ttk.Button(toolbar, text="⚙️ アプリ設定", command=self.show_app_settings).pack(side=tk.LEFT, padx=2)
         ttk.Button(toolbar, text="🔧 プラグイン", command=self.show_plugins).pack(side=tk.LEFT, padx=2)
         ttk.Button(toolbar, text="📝 テンプレート編集", command=self.show_template_editor).pack(side=tk.LEFT, padx=2)
@@ -155,10 +177,10 @@ class StreamNotifyGUI:
         filter_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
 
         # 第1行: タイトル検索
-        ttk.Label(filter_frame, text="タイトル検索:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        ttk.Label(filter_frame, text="検索（タイトル/チャンネル）:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
         self.filter_title_entry = ttk.Entry(filter_frame, width=30)
         self.filter_title_entry.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
-        self.filter_title_entry.bind("<KeyRelease>", lambda e: self.apply_filters())
+        self.filter_title_entry.bind("<KeyRelease>", lambda e: self._schedule_apply_filters())
 
         # 投稿状態フィルタ
         ttk.Label(filter_frame, text="投稿状態:").grid(row=0, column=2, sticky=tk.W, padx=5, pady=5)
@@ -171,7 +193,7 @@ class StreamNotifyGUI:
             width=12
         )
         status_combo.grid(row=0, column=3, sticky=tk.W, padx=5, pady=5)
-        status_combo.bind("<<ComboboxSelected>>", lambda e: self.apply_filters())
+        status_combo.bind("<<ComboboxSelected>>", lambda e: self._on_filter_changed())
 
         # 配信元フィルタ
         ttk.Label(filter_frame, text="配信元:").grid(row=0, column=4, sticky=tk.W, padx=5, pady=5)
@@ -184,7 +206,7 @@ class StreamNotifyGUI:
             width=12
         )
         source_combo.grid(row=0, column=5, sticky=tk.W, padx=5, pady=5)
-        source_combo.bind("<<ComboboxSelected>>", lambda e: self.apply_filters())
+        source_combo.bind("<<ComboboxSelected>>", lambda e: self._on_filter_changed())
 
         # タイプフィルタ（5カテゴリ対応: 動画/アーカイブ/放送予約/放送中/放送終了/プレミア）
         ttk.Label(filter_frame, text="タイプ:").grid(row=0, column=6, sticky=tk.W, padx=5, pady=5)
@@ -197,11 +219,17 @@ class StreamNotifyGUI:
             width=20
         )
         type_combo.grid(row=0, column=7, sticky=tk.W, padx=5, pady=5)
-        type_combo.bind("<<ComboboxSelected>>", lambda e: self.apply_filters())
+        type_combo.bind("<<ComboboxSelected>>", lambda e: self._on_filter_changed())
 
         # ボタン
         ttk.Button(filter_frame, text="🔄 リセット", command=self.reset_filters).grid(row=0, column=8, padx=5, pady=5)
 
+        # ページ送り
+        ttk.Button(filter_frame, text="◀ 前へ", command=self.prev_page).grid(row=0, column=9, padx=2, pady=5)
+        self.page_label = ttk.Label(filter_frame, text="1 / 1")
+        self.page_label.grid(row=0, column=10, padx=5, pady=5)
+        ttk.Button(filter_frame, text="次へ ▶", command=self.next_page).grid(row=0, column=11, padx=2, pady=5)
+
         table_frame = ttk.Frame(self.root)
         table_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
@@ -253,7 +281,34 @@ class StreamNotifyGUI:
         status_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=5)
 
         self.status_label = ttk.Label(status_frame, text="準備完了", relief=tk.SUNKEN)
-        self.status_label.pack(fill=tk.X)
+        self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        # バックグラウンド処理の進捗表示（実行中のみ表示）
+        self.task_progress = ttk.Progressbar(status_frame, length=160, mode="indeterminate")
+        self.task_label = ttk.Label(status_frame, text="")
+
+    def _on_task_status(self, message, current, total):
+        """バックグラウンド処理の進捗を表示（GuiTaskRunner から呼ばれる）"""
+        if message is None:
+            # すべてのタスクが終了
+            self.task_progress.stop()
+            self.task_progress.pack_forget()
+            self.task_label.pack_forget()
+            return
+
+        if not self.task_progress.winfo_ismapped():
+            self.task_progress.pack(side=tk.RIGHT, padx=5, before=self.status_label)
+            self.task_label.pack(side=tk.RIGHT, padx=5, before=self.task_progress)
+
+        if total > 0:
+            self.task_progress.stop()
+            self.task_progress.config(mode="determinate", maximum=total, value=current)
+            self.task_label.config(text=f"⏳ {message} ({current}/{total})")
+        else:
+            if str(self.task_progress.cget("mode")) != "indeterminate":
+                self.task_progress.config(mode="indeterminate", value=0)
+            self.task_progress.start(15)
+            self.task_label.config(text=f"⏳ {message}")
 
     def cleanup(self):
         """GUI クローズ時のクリーンアップ処理"""
@@ -267,8 +322,14 @@ class StreamNotifyGUI:
                 except:
                     pass
 
+            # バックグラウンド処理を停止
+            if getattr(self, "task_runner", None):
+                self.task_runner.shutdown()
+
             # その他のオブジェクト参照をクリア
-            self.all_videos = []
+            if self._filter_after_id is not None:
+                self.root.after_cancel(self._filter_after_id)
+                self._filter_after_id = None
             self.filtered_videos = []
             self.selected_rows = set()
         except Exception as e:
@@ -276,9 +337,8 @@ class StreamNotifyGUI:
 
     def refresh_data(self):
         """DB から最新データを取得して表示"""
-        # すべての動画をキャッシュ
-        self.all_videos = self.db.get_all_videos()
         self.selected_rows.clear()
+        self.current_page = 0
 
         # フィルタをリセット
         if hasattr(self, 'filter_title_entry'):
@@ -292,58 +352,56 @@ class StreamNotifyGUI:
         self.apply_filters()
 
     def fetch_rss_manually(self):
-        """RSS フィードを手動で今すぐ取得・更新"""
+        """RSS フィードを手動で今すぐ取得・更新（バックグラウンド実行）"""
         try:
             from youtube_core.youtube_rss import YouTubeRSS
             from youtube_core.youtube_websub import YouTubeWebSub
-            from config import Config
-            from plugin_manager import PluginManager
-
-            config = Config("settings.env")
-            channel_id = config.youtube_channel_id
+        except ImportError as e:
+            logger.error(f"❌ インポートエラー: {e}")
+            messagebox.showerror("エラー", f"必要なモジュールが見つかりません:\n{e}")
+            return
 
-            if not channel_id:
-                messagebox.showerror("エラー", "YouTube チャンネル ID が設定されていません。")
-                return
+        channel_id = self.config.youtube_channel_id
+        if not channel_id:
+            messagebox.showerror("エラー", "YouTube チャンネル ID が設定されていません。")
+            return
 
-            # フィード取得モード判定
-            feed_mode = config.youtube_feed_mode
+        # フィード取得モード判定
+        feed_mode = self.config.youtube_feed_mode
 
+        def fetch(progress):
             if feed_mode == "websub":
                 # WebSub モード時はWebSubサーバーから新着確認
-                messagebox.showinfo("RSS更新", "WebSub サーバーから新着を確認中...\n（ウィンドウを閉じないでください）")
                 fetcher = YouTubeWebSub(channel_id)
             else:
                 # ポーリングモード（デフォルト）：RSS フィードを取得
-                messagebox.showinfo("RSS更新", "YouTube RSS フィードを取得中...\n（ウィンドウを閉じないでください）")
                 fetcher = YouTubeRSS(channel_id)
 
             # ★ 重要: save_to_db メソッドを使用してDB保存（重複防止・API確認・YouTube Live自動分類を含む）
             # save_to_db は fetch_feed を内部で呼び出して、重複防止ロジックを正しく適用します
             added_count = fetcher.save_to_db(self.db)
             new_videos = fetcher.fetch_feed()
+            return added_count, new_videos
 
-            if not new_videos and added_count == 0:
+        def on_success(result):
+            added_count, new_videos = result
+            if not new_videos and not added_count:
                 messagebox.showinfo("RSS更新完了", "新着動画は検出されませんでした。")
                 return
 
-
-            # YouTubeLive プラグインは v3.3.0+ で廃止されました
-
             # DB を再読込して表示更新
             self.refresh_data()
             logger.info(f"✅ フィード手動更新完了: {added_count} 件追加（{feed_mode} モード）")
 
-        except ImportError as e:
-            logger.error(f"❌ インポートエラー: {e}")
-            messagebox.showerror("エラー", f"必要なモジュールが見つかりません:\n{e}")
-
-        except Exception as e:
+        def on_error(e):
             logger.error(f"❌ RSS更新中にエラー: {e}")
             messagebox.showerror("エラー", f"RSS更新中にエラーが発生しました:\n{e}")
 
+        description = "WebSub サーバーから新着を確認中" if feed_mode == "websub" else "YouTube RSS フィードを取得中"
+        self.task_runner.submit(fetch, on_success=on_success, on_error=on_error, description=description)
+
     def classify_youtube_live_manually(self):
-        """YouTube Live キャッシュ更新・分類を手動で実行
+        """YouTube Live キャッシュ更新・分類を手動で実行（バックグラウンド実行）
 
         処理フロー：
         1. DB から Live 関連動画を取得
@@ -352,59 +410,51 @@ class StreamNotifyGUI:
         4. 分類・DB更新を実行
         5. 動画取得と自動投稿はしない
         """
-        try:
-            # YouTube API プラグインを取得
-            youtube_api_plugin = self.plugin_manager.get_plugin("youtube_api_plugin")
-
-            if not youtube_api_plugin:
-                messagebox.showinfo(
-                    "情報",
-                    "YouTube API プラグインが導入されていません。\n"
-                    "YOUTUBE_API_KEY を settings.env に設定してください。"
-                )
-                logger.info("ℹ️ YouTube API プラグインは導入されていません")
-                return
-
-            if not youtube_api_plugin.is_available():
-                messagebox.showwarning(
-                    "警告",
-                    "YouTube API プラグインが利用不可です。\n"
-                    "YOUTUBE_API_KEY が正しく設定されていることを確認してください。"
-                )
-                return
+        # YouTube API プラグインを取得
+        youtube_api_plugin = self.plugin_manager.get_plugin("youtube_api_plugin") if self.plugin_manager else None
 
-            # 判定開始を通知
+        if not youtube_api_plugin:
             messagebox.showinfo(
-                "YouTube Live 判定",
-                "Live キャッシュ確認・更新を実行中...\n"
-                "（ウィンドウを閉じないでください）"
+                "情報",
+                "YouTube API プラグインが導入されていません。\n"
+                "YOUTUBE_API_KEY を settings.env に設定してください。"
             )
+            logger.info("ℹ️ YouTube API プラグインは導入されていません")
+            return
 
-            # 実行処理
-            import time
-            from datetime import datetime, timedelta
-            from database import get_database
+        if not youtube_api_plugin.is_available():
+            messagebox.showwarning(
+                "警告",
+                "YouTube API プラグインが利用不可です。\n"
+                "YOUTUBE_API_KEY が正しく設定されていることを確認してください。"
+            )
+            return
+
+        try:
             from youtube_core.youtube_video_classifier import get_video_classifier
+        except ImportError as ie:
+            logger.error(f"❌ インポートエラー: {ie}")
+            messagebox.showwarning(
+                "警告",
+                f"必要なモジュールが見つかりません。\nv3 の plugins/youtube/ ディレクトリを確認してください。\n\nエラー: {ie}"
+            )
+            return
 
-            db = get_database()
+        def classify(progress):
+            db = self.db
             classifier = get_video_classifier(api_key=os.getenv("YOUTUBE_API_KEY"))
 
             # DB から Live 関連動画を取得
-            all_videos = db.get_all_videos()
-            live_videos = [
-                v for v in all_videos
-                if v.get("content_type") in ["schedule", "live", "completed", "archive"]
-            ]
+            live_videos = []
+            for content_type in ("schedule", "live", "completed", "archive"):
+                live_videos.extend(db.get_videos_by_content_type(content_type))
 
             if not live_videos:
-                messagebox.showinfo("YouTube Live 判定", "Live 関連動画がありません。")
                 logger.info("ℹ️ Live 関連動画なし")
-                return
+                return {"message": "Live 関連動画がありません。"}
 
             # ★【新】24時間以内の動画のみを対象に絞り込む
-            now = datetime.now()
-            time_threshold = now - timedelta(hours=24)
-            current_timestamp = time.time()
+            time_threshold = datetime.now() - timedelta(hours=24)
 
             filtered_videos = []
             for video in live_videos:
@@ -432,19 +482,18 @@ class StreamNotifyGUI:
                     continue
 
             if not filtered_videos:
-                messagebox.showinfo("YouTube Live 判定", "24時間以内の Live 関連動画がありません。")
                 logger.info("ℹ️ 24時間以内の Live 関連動画なし")
-                return
+                return {"message": "24時間以内の Live 関連動画がありません。"}
 
             logger.info(f"🎬 {len(filtered_videos)} 件の Live 動画を API から更新中...")
 
             updated_count = 0
             api_fetched_count = 0
+            total = len(filtered_videos)
 
-            for video in filtered_videos:
+            for index, video in enumerate(filtered_videos, start=1):
                 video_id = video.get("video_id")
-                if not video_id:
-                    continue
+                progress(index - 1, total, "YouTube Live 判定中")
 
                 # ★【新】24時間以内の動画は常に API から最新情報を取得
                 logger.debug(f"📡 API から取得（24時間以内）: {video_id}")
@@ -455,10 +504,6 @@ class StreamNotifyGUI:
                     logger.debug(f"⏭️ 分類失敗（スキップ）: {video_id}")
                     continue
 
-                # ★ 分類結果を DB に反映（投稿なし）
-                from plugins.youtube.live_module import get_live_module
-                live_module = get_live_module()
-
                 content_type = classification_result.get("type", "video")
                 live_status = classification_result.get("live_status")
 
@@ -468,13 +513,26 @@ class StreamNotifyGUI:
                     updated_count += 1
                     logger.info(f"✅ 更新: {video_id} (type={content_type}, status={live_status})")
 
+            progress(total, total, "YouTube Live 判定中")
+            logger.info(f"✅ YouTube Live 判定完了: 対象 {total} 件、API 取得 {api_fetched_count} 件、DB 更新 {updated_count} 件")
+            return {
+                "target_count": total,
+                "api_fetched_count": api_fetched_count,
+                "updated_count": updated_count,
+            }
+
+        def on_success(result):
+            if "message" in result:
+                messagebox.showinfo("YouTube Live 判定", result["message"])
+                return
+
             # 結果をメッセージボックスで表示
             result_msg = f"""✅ YouTube Live 判定完了
 
 対象期間: 過去24時間以内
-対象動画: {len(filtered_videos)} 件
-API 取得: {api_fetched_count} 件
-DB 更新: {updated_count} 件
+対象動画: {result['target_count']} 件
+API 取得: {result['api_fetched_count']} 件
+DB 更新: {result['updated_count']} 件
 
 ※ 動画取得と自動投稿はしていません。
 DB を再読込みします。"""
@@ -482,148 +540,165 @@ DB を再読込みします。"""
 
             # DB を再読込して表示更新
             self.refresh_data()
-            logger.info(f"✅ YouTube Live 判定完了: 対象 {len(filtered_videos)} 件、API 取得 {api_fetched_count} 件、DB 更新 {updated_count} 件")
-
-        except ImportError as ie:
-            logger.error(f"❌ インポートエラー: {ie}")
-            messagebox.showwarning(
-                "警告",
-                f"必要なモジュールが見つかりません。\nv3 の plugins/youtube/ ディレクトリを確認してください。\n\nエラー: {ie}"
-            )
 
-        except Exception as e:
+        def on_error(e):
             logger.error(f"❌ YouTube Live 判定中にエラー: {e}")
             messagebox.showerror("エラー", f"YouTube Live 判定中にエラーが発生しました:\n{e}")
 
-    def apply_filters(self):
-        """現在のフィルタ条件をツリーに適用"""
-        # フィルタ条件を取得
-        title_filter = self.filter_title_entry.get().lower()
+        self.task_runner.submit(classify, on_success=on_success, on_error=on_error, description="Live 関連動画を確認中")
+
+    def _schedule_apply_filters(self):
+        """タイトル入力中はフィルタ適用を遅延させ、入力が止まってから1回だけ実行"""
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(FILTER_DELAY_MS, self._run_scheduled_filters)
+
+    def _on_filter_changed(self):
+        """フィルタ条件の変更時は先頭ページから表示し直す"""
+        self.current_page = 0
+        self.apply_filters()
+
+    def _run_scheduled_filters(self):
+        """遅延実行されたフィルタ適用（条件が変わったので先頭ページに戻す）"""
+        self._filter_after_id = None
+        self.current_page = 0
+        self.apply_filters()
+
+    def _get_filter_kwargs(self) -> dict:
+        """フィルタパネルの状態を Database.query_videos() の引数に変換"""
         status_filter = self.filter_status_var.get()
         source_filter = self.filter_source_var.get()
         type_filter = self.filter_type_var.get()
 
-        # Treeview をクリア
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # フィルタを適用
-        self.filtered_videos = []
-        for video in self.all_videos:
-            # タイトル検索
-            if title_filter and title_filter not in video.get("title", "").lower():
-                continue
-
-            # 投稿状態フィルタ
-            is_posted = video.get("posted_to_bluesky", 0)
-            if status_filter == "投稿済み" and not is_posted:
-                continue
-            elif status_filter == "未投稿" and is_posted:
-                continue
-
-            # 配信元フィルタ
-            # DBには小文字で保存されているため、フィルタ値を小文字に変換して比較
-            source = video.get("source", "").lower()
-            source_filter_lower = source_filter.lower()
-            if source_filter_lower != "全て" and source != source_filter_lower:
-                continue
-
-            # タイプフィルタ（5カテゴリ: 動画/アーカイブ/放送予約/放送中/放送終了/プレミア）
-            if type_filter != "全て":
-                # 表示用のタイプを計算（新分類対応）
-                content_type = video.get("content_type", "video")
-                is_premiere = video.get("is_premiere", 0)
-                source_for_display = video.get("source", "").lower()
-
-                if is_premiere:
-                    display_type = "🎆 プレミア"
-                elif source_for_display == "niconico":
-                    display_type = "🎬 動画"
-                elif content_type == "archive":
-                    display_type = "📹 アーカイブ"
-                elif content_type == "schedule":
-                    display_type = "📅 放送予約"
-                elif content_type == "live":
-                    display_type = "🔴 放送中"
-                elif content_type == "completed":
-                    display_type = "⏹️ 放送終了"
-                else:
-                    display_type = "🎬 動画"
+        posted = None
+        if status_filter == "投稿済み":
+            posted = True
+        elif status_filter == "未投稿":
+            posted = False
+
+        return {
+            "search": self.filter_title_entry.get().strip() or None,
+            "posted": posted,
+            "source": None if source_filter == "全て" else source_filter,
+            "display_type": DISPLAY_TYPE_FILTERS.get(type_filter),
+        }
 
-                # フィルタと比較
-                if display_type != type_filter:
-                    continue
+    @staticmethod
+    def _get_display_type(video: dict) -> str:
+        """動画の表示タイプ（5カテゴリ + プレミア）を取得"""
+        content_type = video.get("content_type", "video")
+        if video.get("is_premiere", 0):
+            return "🎆 プレミア"
+        if (video.get("source") or "").lower() == "niconico":
+            return "🎬 動画"
+        if content_type == "archive":
+            return "📹 アーカイブ"
+        if content_type == "schedule":
+            return "📅 放送予約"
+        if content_type == "live":
+            return "🔴 放送中"
+        if content_type == "completed":
+            return "⏹️ 放送終了"
+        return "🎬 動画"
+
+    def _build_row_values(self, video: dict) -> tuple:
+        """Treeview の1行分の表示値を作成"""
+        checked = "☑️" if video["video_id"] in self.selected_rows else "☐"
+
+        # 投稿済みの場合は投稿日時を表示、未投稿の場合は予約日時を表示
+        if video.get("posted_to_bluesky"):
+            if video.get("posted_at"):
+                date_info = video.get("posted_at")
+            else:
+                date_info = "不明"
+        else:
+            date_info = video.get("scheduled_at") or "（未設定）"
+
+        return (
+            checked,                         # Select
+            video["video_id"],              # Video ID
+            video["published_at"][:16].replace("T", " "),     # Published (with time)
+            video.get("source") or "",       # Source
+            self._get_display_type(video),   # Type (video/live/archive)
+            video["title"][:100],           # Title
+            date_info[:16] if date_info != "（未設定）" else date_info, # Date
+            "✓" if video.get("posted_to_bluesky") else "–",  # Posted
+            video.get("image_mode") or "",   # Image Mode
+            video.get("image_filename") or ""  # Image File
+        )
 
-            # フィルタを通った動画を表示
-            self.filtered_videos.append(video)
-            checked = "☑️" if video.get("selected_for_post") else "☐"
+    def apply_filters(self):
+        """現在のフィルタ条件で DB から現在ページを取得し、ツリーに差分反映"""
+        filter_kwargs = self._get_filter_kwargs()
 
-            # 投稿済みの場合は投稿日時を表示、未投稿の場合は予約日時を表示
-            if video.get("posted_to_bluesky"):
-                if video.get("posted_at"):
-                    date_info = video.get("posted_at")
-                else:
-                    date_info = "不明"
-            else:
-                date_info = video.get("scheduled_at") or "（未設定）"
-
-            source = video.get("source") or ""
-            image_mode = video.get("image_mode") or ""
-            image_filename = video.get("image_filename") or ""
-
-            # 分類情報を取得（5カテゴリ対応）
-            content_type = video.get("content_type", "video")
-            is_premiere = video.get("is_premiere", 0)
-            if is_premiere:
-                display_type = "🎆 プレミア"
-            elif source == "Niconico":
-                display_type = "🎬 動画"
-            elif content_type == "archive":
-                display_type = "📹 アーカイブ"
-            elif content_type == "schedule":
-                display_type = "📅 放送予約"
-            elif content_type == "live":
-                display_type = "🔴 放送中"
-            elif content_type == "completed":
-                display_type = "⏹️ 放送終了"
-            else:
-                display_type = "🎬 動画"
-
-            self.tree.insert("", tk.END, values=(
-                checked,                         # Select
-                video["video_id"],              # Video ID
-                video["published_at"][:16].replace("T", " "),     # Published (with time)
-                source,                          # Source
-                display_type,                    # Type (video/live/archive)
-                video["title"][:100],           # Title
-                date_info[:16] if date_info != "（未設定）" else date_info, # Date
-                "✓" if video.get("posted_to_bluesky") else "–",  # Posted
-                image_mode,                      # Image Mode
-                image_filename                   # Image File
-            ), iid=video["video_id"], tags=("even" if len(self.tree.get_children()) % 2 == 0 else "odd",))
+        self.total_count = self.db.count_videos(**filter_kwargs)
+        page_count = max(1, -(-self.total_count // PAGE_SIZE))
+        self.current_page = min(self.current_page, page_count - 1)
+
+        self.filtered_videos = self.db.query_videos(
+            limit=PAGE_SIZE,
+            offset=self.current_page * PAGE_SIZE,
+            **filter_kwargs
+        )
 
+        # DB 上で選択済みの動画は選択状態として扱う
+        for video in self.filtered_videos:
             if video.get("selected_for_post"):
                 self.selected_rows.add(video["video_id"])
 
+        # 差分反映: ページから外れた行だけ削除し、残る行は値が変わった場合のみ更新
+        new_ids = [video["video_id"] for video in self.filtered_videos]
+        new_id_set = set(new_ids)
+        stale = [item for item in self.tree.get_children() if item not in new_id_set]
+        if stale:
+            self.tree.delete(*stale)
+
+        for index, video in enumerate(self.filtered_videos):
+            video_id = video["video_id"]
+            values = self._build_row_values(video)
+            tag = "even" if index % 2 == 0 else "odd"
+            if self.tree.exists(video_id):
+                current = self.tree.item(video_id)
+                if tuple(str(v) for v in current["values"]) != tuple(str(v) for v in values) \
+                        or tuple(current["tags"]) != (tag,):
+                    self.tree.item(video_id, values=values, tags=(tag,))
+                if self.tree.index(video_id) != index:
+                    self.tree.move(video_id, "", index)
+            else:
+                self.tree.insert("", index, values=values, iid=video_id, tags=(tag,))
+
         self.tree.tag_configure("even", background="#f0f0f0")
         self.tree.tag_configure("odd", background="white")
 
-        # ステータスを更新
-        total = len(self.all_videos)
-        filtered = len(self.filtered_videos)
+        # ページ表示・ステータスを更新
+        self.page_label.config(text=f"{self.current_page + 1} / {page_count}")
         selected = len(self.selected_rows)
-        if filtered < total:
-            status_text = f"読み込み完了: {total} 件中 {filtered} 件を表示（選択: {selected} 件）"
+        first = self.current_page * PAGE_SIZE
+        if self.total_count > len(new_ids):
+            status_text = f"読み込み完了: {self.total_count} 件中 {first + 1}〜{first + len(new_ids)} 件目を表示（選択: {selected} 件）"
         else:
-            status_text = f"読み込み完了: {total} 件の動画（選択: {selected} 件）"
+            status_text = f"読み込み完了: {self.total_count} 件の動画（選択: {selected} 件）"
         self.status_label.config(text=status_text)
 
+    def prev_page(self):
+        """前のページを表示"""
+        if self.current_page > 0:
+            self.current_page -= 1
+            self.apply_filters()
+
+    def next_page(self):
+        """次のページを表示"""
+        if (self.current_page + 1) * PAGE_SIZE < self.total_count:
+            self.current_page += 1
+            self.apply_filters()
+
     def reset_filters(self):
         """フィルタをリセット"""
         self.filter_title_entry.delete(0, tk.END)
         self.filter_status_var.set("全て")
         self.filter_source_var.set("全て")
         self.filter_type_var.set("全て")
+        self.current_page = 0
         self.apply_filters()
         logger.info("✅ フィルタをリセットしました")
 
@@ -695,8 +770,7 @@ DB を再読込みします。"""
 
     def edit_scheduled_time(self, item_id):
         """予約日時をダイアログで編集"""
-        videos = self.db.get_all_videos()
-        video = next((v for v in videos if v["video_id"] == item_id), None)
+        video = self.db.get_video_by_id(item_id)
         if not video:
             messagebox.showerror("エラー", "動画情報が見つかりません。")
             return
@@ -893,8 +967,7 @@ DB を再読込みします。"""
 
     def edit_image_file(self, item_id):
         """画像ファイルをダイアログで編集（コンパクト版）"""
-        videos = self.db.get_all_videos()
-        video = next((v for v in videos if v["video_id"] == item_id), None)
+        video = self.db.get_video_by_id(item_id)
         if not video:
             messagebox.showerror("エラー", "動画情報が見つかりません。")
             return
@@ -1005,38 +1078,50 @@ DB を再読込みします。"""
         url_entry = ttk.Entry(url_input_frame, textvariable=url_var, width=35)
         url_entry.pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
 
+        def apply_downloaded_image(filename, success_message):
+            """ダウンロード結果をダイアログに反映（タスク完了時にメインスレッドで呼ばれる）"""
+            if not filename:
+                messagebox.showerror("エラー", "画像のダウンロードに失敗しました。")
+                return
+            if image_window.winfo_exists():
+                image_path_var.set(filename)
+                current_image_var.set(filename)
+                image_window.destroy()  # ダイアログを先に閉じる
+            messagebox.showinfo("成功", f"{success_message}\n{filename}")
+
+        def on_download_error(e):
+            messagebox.showerror("エラー", f"画像のダウンロードに失敗しました。\n{e}")
+
         def download_from_url():
-            """URLから画像をダウンロード"""
+            """URLから画像をダウンロード（バックグラウンド実行）"""
             url = url_var.get().strip()
             if not url:
                 messagebox.showwarning("警告", "URLを入力してください。")
                 return
 
-            # YouTube動画の場合、ロガーを切り替え
-            import image_manager as im_module
-            import logging
-            original_logger = im_module.logger
-            if site_dir == "YouTube":
-                im_module.logger = logging.getLogger("YouTubeLogger")
-
-            try:
-                # ダウンロード
-                filename = self.image_manager.download_and_save_thumbnail(
-                    thumbnail_url=url,
-                    site=site_dir,
-                    video_id=item_id,
-                    mode="import"
-                )
-            finally:
-                im_module.logger = original_logger
+            def download(progress):
+                # YouTube動画の場合、image_manager のログを YouTubeLogger に振り替え
+                from contextlib import nullcontext
+                from log_routing import route_module_logs
+                if site_dir == "YouTube":
+                    log_route = route_module_logs("YouTubeLogger", modules=("image_manager",))
+                else:
+                    log_route = nullcontext()
+
+                with log_route:
+                    return self.image_manager.download_and_save_thumbnail(
+                        thumbnail_url=url,
+                        site=site_dir,
+                        video_id=item_id,
+                        mode="import"
+                    )
 
-            if filename:
-                image_path_var.set(filename)
-                current_image_var.set(filename)
-                image_window.destroy()  # ダイアログを先に閉じる
-                messagebox.showinfo("成功", f"画像をダウンロードしました。\n{filename}")
-            else:
-                messagebox.showerror("エラー", "画像のダウンロードに失敗しました。")
+            self.task_runner.submit(
+                download,
+                on_success=lambda filename: apply_downloaded_image(filename, "画像をダウンロードしました。"),
+                on_error=on_download_error,
+                description=f"画像をダウンロード中: {item_id}",
+            )
 
         ttk.Button(url_input_frame, text="⬇️ ダウンロード", command=download_from_url).pack(side=tk.LEFT, padx=2)
 
@@ -1045,7 +1130,7 @@ DB を再読込みします。"""
         auto_frame.pack(fill=tk.X, pady=5)
 
         def run_youtube_thumbnail_fetch():
-            """YouTube動画の場合、高品質サムネイルを取得してDB反映"""
+            """YouTube動画の場合、高品質サムネイルを取得してDB反映（バックグラウンド実行）"""
             if site_dir != "YouTube":
                 messagebox.showinfo("情報", "YouTube動画のみ対応の機能です。")
                 return
@@ -1055,48 +1140,40 @@ DB を再読込みします。"""
                 messagebox.showerror("エラー", f"モジュール読み込みに失敗しました: {e}")
                 return
 
-            thumb_url = get_youtube_thumbnail_url(item_id)
-            if not thumb_url:
-                messagebox.showwarning("警告", "YouTubeサムネイルURLを取得できませんでした。")
-                return
-
-            # ロガーを一時的に切り替え
-            import image_manager as im_module
-            import logging
-            original_logger = im_module.logger
-            im_module.logger = logging.getLogger("YouTubeLogger")
-
-            try:
-                filename = self.image_manager.download_and_save_thumbnail(
-                    thumbnail_url=thumb_url,
-                    site=site_dir,
-                    video_id=item_id,
-                    mode="import",
-                )
-            finally:
-                im_module.logger = original_logger
+            def fetch(progress):
+                thumb_url = get_youtube_thumbnail_url(item_id)
+                if not thumb_url:
+                    return None, None
+
+                # image_manager / database のログを YouTubeLogger に振り替え
+                from log_routing import route_module_logs
+                with route_module_logs("YouTubeLogger"):
+                    filename = self.image_manager.download_and_save_thumbnail(
+                        thumbnail_url=thumb_url,
+                        site=site_dir,
+                        video_id=item_id,
+                        mode="import",
+                    )
 
-            if filename:
-                # DB更新時のロガーも切り替え
-                import database as db_module
-                db_original_logger = db_module.logger
-                db_module.logger = logging.getLogger("YouTubeLogger")
+                    if filename:
+                        self.db.update_thumbnail_url(item_id, thumb_url)
+                        self.db.update_image_info(item_id, image_mode="import", image_filename=filename)
+                return thumb_url, filename
 
-                try:
-                    self.db.update_thumbnail_url(item_id, thumb_url)
-                    self.db.update_image_info(item_id, image_mode="import", image_filename=filename)
-                finally:
-                    db_module.logger = db_original_logger
+            def on_success(result):
+                thumb_url, filename = result
+                if not thumb_url:
+                    messagebox.showwarning("警告", "YouTubeサムネイルURLを取得できませんでした。")
+                    return
+                apply_downloaded_image(filename, "YouTubeサムネイルを取得しました。")
 
-                image_path_var.set(filename)
-                current_image_var.set(filename)
-                image_window.destroy()  # ダイアログを先に閉じる
-                messagebox.showinfo("成功", f"YouTubeサムネイルを取得しました。\n{filename}")
-            else:
-                messagebox.showerror("エラー", "画像のダウンロードに失敗しました。")
+            self.task_runner.submit(
+                fetch, on_success=on_success, on_error=on_download_error,
+                description=f"YouTubeサムネイルを取得中: {item_id}",
+            )
 
         def run_niconico_ogp_fetch():
-            """ニコニコ動画の場合、OGPから即時取得してDB反映"""
+            """ニコニコ動画の場合、OGPから即時取得してDB反映（バックグラウンド実行）"""
             if site_dir != "Niconico":
                 messagebox.showinfo("情報", "ニコニコ動画のみ対応の機能です。")
                 return
@@ -1106,38 +1183,57 @@ DB を再読込みします。"""
                 messagebox.showerror("エラー", f"モジュール読み込みに失敗しました: {e}")
                 return
 
-            thumb_url = fetch_thumbnail_url(item_id)
-            if not thumb_url:
-                messagebox.showwarning("警告", "OGPからサムネイルURLを取得できませんでした。")
-                return
+            def fetch(progress):
+                thumb_url = fetch_thumbnail_url(item_id)
+                if not thumb_url:
+                    return None, None
+
+                filename = self.image_manager.download_and_save_thumbnail(
+                    thumbnail_url=thumb_url,
+                    site=site_dir,
+                    video_id=item_id,
+                    mode="import",
+                )
+                if filename:
+                    self.db.update_thumbnail_url(item_id, thumb_url)
+                    self.db.update_image_info(item_id, image_mode="import", image_filename=filename)
+                return thumb_url, filename
 
-            filename = self.image_manager.download_and_save_thumbnail(
-                thumbnail_url=thumb_url,
-                site=site_dir,
-                video_id=item_id,
-                mode="import",
+            def on_success(result):
+                thumb_url, filename = result
+                if not thumb_url:
+                    messagebox.showwarning("警告", "OGPからサムネイルURLを取得できませんでした。")
+                    return
+                apply_downloaded_image(filename, "OGPから画像を取得しました。")
+
+            self.task_runner.submit(
+                fetch, on_success=on_success, on_error=on_download_error,
+                description=f"OGPからサムネイルを取得中: {item_id}",
             )
-            if filename:
-                self.db.update_thumbnail_url(item_id, thumb_url)
-                self.db.update_image_info(item_id, image_mode="import", image_filename=filename)
-                image_path_var.set(filename)
-                current_image_var.set(filename)
-                image_window.destroy()  # ダイアログを先に閉じる
-                messagebox.showinfo("成功", f"OGPから画像を取得しました。\n{filename}")
-            else:
-                messagebox.showerror("エラー", "画像のダウンロードに失敗しました。")
 
         def run_redownload_all():
-            """画像未設定の動画を再ダウンロード（全体）"""
+            """画像未設定の動画を再ダウンロード（全体、バックグラウンド実行）"""
             if not messagebox.askyesno("確認", "画像未設定の動画をまとめて再ダウンロードしますか？"):
                 return
             try:
                 from thumbnails.image_re_fetch_module import redownload_missing_images
-                redownload_missing_images(dry_run=False)
-                messagebox.showinfo("完了", "再ダウンロードを実行しました。ログを確認してください。")
             except Exception as e:
+                messagebox.showerror("エラー", f"モジュール読み込みに失敗しました: {e}")
+                return
+
+            def on_success(_result):
+                self.refresh_data()
+                messagebox.showinfo("完了", "再ダウンロードを実行しました。ログを確認してください。")
+
+            def on_error(e):
                 messagebox.showerror("エラー", f"再ダウンロードに失敗しました: {e}")
 
+            self.task_runner.submit(
+                lambda progress: redownload_missing_images(dry_run=False),
+                on_success=on_success, on_error=on_error,
+                description="画像未設定の動画を再ダウンロード中",
+            )
+
         # 動画ソースに応じて適切なボタンを表示
         if site_dir == "YouTube":
             ttk.Button(auto_frame, text="YouTubeサムネイル取得", command=run_youtube_thumbnail_fetch).pack(side=tk.LEFT, padx=3, expand=True, fill=tk.X)
@@ -1302,8 +1398,7 @@ DB を再読込みします。"""
             messagebox.showwarning("警告", "投稿対象の動画がありません。\n\n☑️ をクリックして選択してください。")
             return
 
-        videos = self.db.get_all_videos()
-        selected = [v for v in videos if v["video_id"] in self.selected_rows]
+        selected = self._get_selected_videos()
 
         if not selected:
             messagebox.showwarning("警告", "投稿対象の動画がありません。\n\n選択して保存してから実行してください。")
@@ -1329,7 +1424,7 @@ DB を再読込みします。"""
         if messagebox.askyesno("確認", msg):
             for video in selected:
                 post_window = PostSettingsWindow(
-                    self.root, video, self.db, self.plugin_manager, self.bluesky_core,
+                    self.root, video, self.db, self.task_runner, self.plugin_manager, self.bluesky_core,
                     operation_mode=self.operation_mode, is_dry_run=True
                 )
                 self.root.wait_window(post_window.window)
@@ -1371,8 +1466,7 @@ DB を再読込みします。"""
             messagebox.showwarning("警告", "投稿対象の動画がありません。\n\n☑️ をクリックして選択してください。")
             return
 
-        videos = self.db.get_all_videos()
-        selected = [v for v in videos if v["video_id"] in self.selected_rows]
+        selected = self._get_selected_videos()
 
         if not selected:
             messagebox.showwarning("警告", "投稿対象の動画がありません。\n\n選択して保存してから実行してください。")
@@ -1381,47 +1475,33 @@ DB を再読込みします。"""
         # 各動画について投稿設定ウィンドウを表示
         for video in selected:
             post_window = PostSettingsWindow(
-                self.root, video, self.db, self.plugin_manager, self.bluesky_core,
+                self.root, video, self.db, self.task_runner, self.plugin_manager, self.bluesky_core,
                 operation_mode=self.operation_mode
             )
             self.root.wait_window(post_window.window)
 
+    def _get_selected_videos(self) -> list:
+        """選択中の動画を DB から取得（公開日時の新しい順）"""
+        videos = [self.db.get_video_by_id(video_id) for video_id in self.selected_rows]
+        videos = [v for v in videos if v]
+        videos.sort(key=lambda v: v.get("published_at") or "", reverse=True)
+        return videos
+
     def show_stats(self):
         """統計情報を表示（拡張版：日別・配信元別統計）"""
-        videos = self.db.get_all_videos()
-
-        total = len(videos)
-        posted = sum(1 for v in videos if v["posted_to_bluesky"])
-        selected = sum(1 for v in videos if v["selected_for_post"])
-        unposted = total - posted
-
-        # v3.2.0: 配信元別集計
-        youtube_count = sum(1 for v in videos if v.get("source", "youtube") == "youtube")
-        niconico_count = sum(1 for v in videos if v.get("source") == "niconico")
-
-        # v3.2.0: 配信元別投稿状況
-        youtube_posted = sum(1 for v in videos if v.get("source", "youtube") == "youtube" and v["posted_to_bluesky"])
-        niconico_posted = sum(1 for v in videos if v.get("source") == "niconico" and v["posted_to_bluesky"])
-
-        # v3.2.0: 日別集計（過去7日間）
-        from datetime import timedelta, datetime as dt
-        today = dt.now().date()
-        daily_stats = {}
+        summary = self.db.get_stats(days=7)
 
-        for i in range(7):
-            date = today - timedelta(days=i)
-            daily_stats[date] = {"total": 0, "posted": 0}
+        total = summary["total"]
+        posted = summary["posted"]
+        selected = summary["selected"]
+        unposted = summary["unposted"]
 
-        for video in videos:
-            try:
-                if video.get("published_at"):
-                    pub_date = dt.fromisoformat(video["published_at"]).date()
-                    if pub_date in daily_stats:
-                        daily_stats[pub_date]["total"] += 1
-                        if video["posted_to_bluesky"]:
-                            daily_stats[pub_date]["posted"] += 1
-            except:
-                pass
+        # v3.2.0: 配信元別集計・投稿状況
+        by_source = summary["by_source"]
+        youtube_count = by_source.get("youtube", {}).get("total", 0)
+        niconico_count = by_source.get("niconico", {}).get("total", 0)
+        youtube_posted = by_source.get("youtube", {}).get("posted", 0)
+        niconico_posted = by_source.get("niconico", {}).get("posted", 0)
 
         stats = f"""
 📊 統計情報（v3.2.0拡張版）
@@ -1439,9 +1519,9 @@ YouTube:      {youtube_count} 件 (投稿済み: {youtube_posted})
 
 【 過去7日間の投稿状況 】
 """
-        for i in range(7):
-            date = today - timedelta(days=i)
-            day_stats = daily_stats.get(date, {"total": 0, "posted": 0})
+        # v3.2.0: 日別集計（過去7日間）
+        for day_stats in summary["daily"]:
+            date = datetime.strptime(day_stats["date"], "%Y-%m-%d").date()
             date_str = date.strftime("%m/%d（%a）").replace("Mon", "月").replace("Tue", "火").replace("Wed", "水").replace("Thu", "木").replace("Fri", "金").replace("Sat", "土").replace("Sun", "日")
             stats += f"  {date_str}: 全 {day_stats['total']} 件 | 投稿済み {day_stats['posted']} 件\n"
 
@@ -1461,6 +1541,75 @@ YouTube:      {youtube_count} 件 (投稿済み: {youtube_posted})
         """
         messagebox.showinfo("統計情報", stats)
 
+    def show_metrics(self):
+        """メトリクスパネルを表示（取得時間・API コスト・キュー長など、一定間隔で自動更新）"""
+        from metrics import get_metrics_registry, summarize
+
+        if getattr(self, "_metrics_window", None) is not None and self._metrics_window.winfo_exists():
+            self._metrics_window.lift()
+            return
+
+        window = tk.Toplevel(self.root)
+        window.title("メトリクス")
+        window.geometry("900x520")
+        self._metrics_window = window
+
+        summary_var = tk.StringVar()
+        ttk.Label(window, textvariable=summary_var, justify=tk.LEFT).pack(fill=tk.X, padx=10, pady=(10, 5))
+
+        tree_frame = ttk.Frame(window)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        columns = ("name", "labels", "value", "avg", "p50", "p99", "max")
+        headings = ("メトリクス", "ラベル", "件数/値", "平均", "p50", "p99", "最大")
+        widths = (220, 240, 80, 80, 80, 80, 80)
+        tree = ttk.Treeview(tree_frame, columns=columns, show="headings")
+        for column, heading, width in zip(columns, headings, widths):
+            tree.heading(column, text=heading)
+            tree.column(column, width=width, anchor=tk.W if column in ("name", "labels") else tk.E)
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscroll=scrollbar.set)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        def fmt(value, unit_seconds):
+            if value is None:
+                return "-"
+            if unit_seconds:
+                return f"{value * 1000:.1f}ms" if value < 1 else f"{value:.2f}s"
+            return f"{value / 1024:.1f}KB" if value >= 1024 else f"{value:.0f}"
+
+        def ratio(value):
+            return "-" if value is None else f"{value * 100:.1f}%"
+
+        def refresh():
+            if not window.winfo_exists():
+                return
+            s = summarize()
+            summary_var.set(
+                f"フィード取得: {s['feed_fetches']:.0f} 回（304 未更新: {ratio(s['feed_not_modified_ratio'])}）   "
+                f"分類キャッシュヒット率: {ratio(s['classifier_cache_hit_rate'])}   "
+                f"YouTube クォータ消費: {s['youtube_quota_units']:.0f} ユニット\n"
+                f"ポーリング: {s['poll_cycles']} 回（平均 {fmt(s['poll_cycle_avg_seconds'], True)}）"
+            )
+            tree.delete(*tree.get_children())
+            for row in get_metrics_registry().snapshot():
+                labels = ", ".join(f"{k}={v}" for k, v in row["labels"].items())
+                if row["type"] == "histogram":
+                    seconds = row["name"].endswith("_seconds")
+                    values = (row["name"], labels, row["count"], fmt(row["avg"], seconds),
+                              fmt(row["p50"], seconds), fmt(row["p99"], seconds), fmt(row["max"], seconds))
+                else:
+                    values = (row["name"], labels, f"{row['value']:g}", "", "", "", "")
+                tree.insert("", tk.END, values=values)
+            window.after(METRICS_REFRESH_MS, refresh)
+
+        button_frame = ttk.Frame(window)
+        button_frame.pack(fill=tk.X, padx=10, pady=5)
+        ttk.Button(button_frame, text="閉じる", command=window.destroy).pack(side=tk.RIGHT)
+        ttk.Button(button_frame, text="リセット", command=get_metrics_registry().reset).pack(side=tk.RIGHT, padx=5)
+
+        refresh()
+
     def show_app_settings(self):
         """統合設定ウィンドウを基本設定タブをアクティブにして開く（アプリ設定）"""
         UnifiedSettingsWindow(self.root, initial_tab="basic", db=self.db)
@@ -1867,8 +2016,7 @@ YouTube:      {youtube_count} 件 (投稿済み: {youtube_posted})
             messagebox.showwarning("警告", "削除対象の動画がありません。\n\n☑️ をクリックして選択してください。")
             return
 
-        videos = self.db.get_all_videos()
-        selected = [v for v in videos if v["video_id"] in self.selected_rows]
+        selected = self._get_selected_videos()
 
         if not selected:
             messagebox.showwarning("警告", "削除対象の動画がありません。")
@@ -1899,29 +2047,48 @@ YouTube:      {youtube_count} 件 (投稿済み: {youtube_posted})
 
         # 削除実行
         logger.info(f"🗑️ {len(selected)} 件の動画削除を開始します")
-        result = self.db.delete_videos_batch([v["video_id"] for v in selected])
-        deleted_count = result.get("deleted_count", 0)
-        deleted_videos = result.get("deleted_videos", [])
 
-        if deleted_count > 0:
+        def on_success(result):
+            deleted_count, images_deleted = result
+            if deleted_count > 0:
+                logger.info(f"✅ {deleted_count} 件の動画を削除しました（画像ファイル {images_deleted} 件も削除）")
+                self.selected_rows.clear()
+                self.refresh_data()
+                messagebox.showinfo("成功", f"{deleted_count} 件の動画を削除しました。\n（画像ファイル {images_deleted} 件も削除）")
+            else:
+                logger.error(f"❌ 動画の削除に失敗しました（{len(selected)}件リクエスト）")
+                messagebox.showerror("エラー", "動画の削除に失敗しました。")
+
+        self._delete_videos_in_background([v["video_id"] for v in selected], on_success)
+
+    def _delete_videos_in_background(self, video_ids: list, on_success):
+        """動画の一括削除（DB は1トランザクション、画像ファイルはまとめて削除）をワーカースレッドで実行
+
+        on_success((削除件数, 画像を削除した件数)) はメインスレッドで呼ばれる。
+        """
+        def delete(progress):
+            result = self.db.delete_videos_batch(video_ids)
+            deleted_videos = result.get("deleted_videos", [])
+
             # 画像ファイルも削除
             images_deleted = 0
-            for del_video in deleted_videos:
-                if del_video.get("image_filename"):
-                    try:
-                        site = self._normalize_site_dir(del_video.get("source", "YouTube"))
-                        if self.image_manager.delete_images_by_video_id(site, del_video["image_filename"]):
-                            images_deleted += 1
-                    except Exception as e:
-                        logger.warning(f"⚠️ 画像削除に失敗: {del_video['video_id']} - {e}")
+            targets = [
+                (self._normalize_site_dir(v.get("source", "YouTube")), v["image_filename"])
+                for v in deleted_videos if v.get("image_filename")
+            ]
+            if targets and self.image_manager:
+                progress(0, len(targets), f"画像ファイルを削除中（{len(targets)} 件）")
+                images_deleted = self.image_manager.delete_images_batch(targets)
 
-            logger.info(f"✅ {deleted_count} 件の動画を削除しました（画像ファイル {images_deleted} 件も削除）")
-            self.selected_rows.clear()
-            self.refresh_data()
-            messagebox.showinfo("成功", f"{deleted_count} 件の動画を削除しました。\n（画像ファイル {images_deleted} 件も削除）")
-        else:
-            logger.error(f"❌ 動画の削除に失敗しました（{len(selected)}件リクエスト）")
-            messagebox.showerror("エラー", "動画の削除に失敗しました。")
+            return result.get("deleted_count", 0), images_deleted
+
+        def on_error(e):
+            messagebox.showerror("エラー", f"動画の削除に失敗しました。\n{e}")
+
+        self.task_runner.submit(
+            delete, on_success=on_success, on_error=on_error,
+            description=f"動画を削除中（{len(video_ids)} 件）"
+        )
 
     def context_delete(self):
         """右クリックメニューから動画を削除"""
@@ -1930,8 +2097,7 @@ YouTube:      {youtube_count} 件 (投稿済み: {youtube_posted})
             return
 
         item_id = self.current_context_item
-        videos = self.db.get_all_videos()
-        video = next((v for v in videos if v["video_id"] == item_id), None)
+        video = self.db.get_video_by_id(item_id)
 
         if not video:
             messagebox.showerror("エラー", "動画情報が見つかりません。")
@@ -1957,30 +2123,23 @@ YouTube:      {youtube_count} 件 (投稿済み: {youtube_posted})
 
         # 削除実行
         logger.info(f"🗑️ 動画削除を実行: {item_id} ({video['title'][:40]}...)")
-        result = self.db.delete_video(item_id)
-
-        if result.get("success"):
-            # 画像ファイルも削除
-            images_deleted = False
-            if result.get("image_filename"):
-                try:
-                    site = self._normalize_site_dir(result.get("source", "YouTube"))
-                    if self.image_manager.delete_images_by_video_id(site, result["image_filename"]):
-                        images_deleted = True
-                except Exception as e:
-                    logger.warning(f"⚠️ 画像削除に失敗: {item_id} - {e}")
 
-            logger.info(f"✅ 動画を削除しました: {item_id}（右クリックメニュー操作）")
-            self.selected_rows.discard(item_id)
-            self.refresh_data()
+        def on_success(result):
+            deleted_count, images_deleted = result
+            if deleted_count > 0:
+                logger.info(f"✅ 動画を削除しました: {item_id}（右クリックメニュー操作）")
+                self.selected_rows.discard(item_id)
+                self.refresh_data()
 
-            if images_deleted:
-                messagebox.showinfo("成功", f"動画を削除しました。\n{item_id}\n（画像ファイルも削除）")
+                if images_deleted:
+                    messagebox.showinfo("成功", f"動画を削除しました。\n{item_id}\n（画像ファイルも削除）")
+                else:
+                    messagebox.showinfo("成功", f"動画を削除しました。\n{item_id}")
             else:
-                messagebox.showinfo("成功", f"動画を削除しました。\n{item_id}")
-        else:
-            logger.error(f"❌ 動画削除に失敗: {item_id}")
-            messagebox.showerror("エラー", "動画の削除に失敗しました。")
+                logger.error(f"❌ 動画削除に失敗: {item_id}")
+                messagebox.showerror("エラー", "動画の削除に失敗しました。")
+
+        self._delete_videos_in_background([item_id], on_success)
 
     def add_video_dialog(self):
         """動画追加ダイアログを表示"""
@@ -2098,23 +2257,25 @@ YouTube:      {youtube_count} 件 (投稿済み: {youtube_posted})
                 self._add_video_manual(video_id)
                 return
 
+        except Exception as e:
+            logger.error(f"❌ YouTube 動画追加エラー: {e}", exc_info=True)
+            messagebox.showerror("エラー", f"エラーが発生しました:\n{e}")
+            return
+
+        def add(progress):
             # 動画情報を取得
             logger.info(f"🌐 YouTube API から動画情報を取得: {video_id}")
             video_details = youtube_api_plugin._fetch_video_detail(video_id)
 
             if not video_details:
                 logger.warning(f"⚠️ YouTube API での取得に失敗しました: {video_id}")
-                messagebox.showinfo("情報", "YouTube API での取得に失敗しました\n\n手動で動画情報を入力してください")
-                self._add_video_manual(video_id)
-                return
+                return None
 
             # 動画情報から video dict を構築
             snippet = video_details.get("snippet", {})
 
             # ★ ライブ判定を実行（API データから）
-            from plugins.youtube.youtube_api_plugin import YouTubeAPIPlugin
-            api_plugin = YouTubeAPIPlugin()
-            content_type, live_status, is_premiere = api_plugin._classify_video_core(video_details)
+            content_type, live_status, is_premiere = youtube_api_plugin._classify_video_core(video_details)
 
             # サムネイル URL を取得
             thumbnail_url = snippet.get("thumbnails", {}).get("high", {}).get("url", "")
@@ -2156,39 +2317,34 @@ YouTube:      {youtube_count} 件 (投稿済み: {youtube_posted})
                 skip_dedup=True  # ★ 手動追加は重複排除をスキップ
             )
 
-            if success:
-                # ★ 手動追加後にサムネイルをダウンロード
-                if thumbnail_url and self.image_manager:
-                    try:
-                        logger.info(f"📥 手動追加後、サムネイル画像をダウンロード中: {video_id}")
-                        image_filename = self.image_manager.download_and_save_thumbnail(
-                            thumbnail_url=thumbnail_url,
-                            site="YouTube",
-                            video_id=video_id,
-                            mode="autopost"
-                        )
-                        # ★ ダウンロード成功時、DB に画像情報を登録
-                        if image_filename:
-                            self.db.update_image_info(
-                                video_id=video_id,
-                                image_mode="autopost",
-                                image_filename=image_filename
-                            )
-                            logger.info(f"✅ DB に画像情報を登録しました: {video_id} → {image_filename}")
-                    except Exception as e:
-                        logger.warning(f"⚠️ サムネイルダウンロード失敗（継続）: {e}")
+            if not success:
+                logger.warning(f"⚠️ DB 保存に失敗しました: {video_id}")
+                return {"success": False, "video": video_dict}
+
+            # ★ 手動追加後にサムネイルをダウンロード
+            self._download_added_thumbnail(thumbnail_url, "YouTube", video_id)
+
+            logger.info(f"✅ YouTube 動画を追加しました: {video_id} (content_type={content_type}, live_status={live_status})")
+            return {"success": True, "video": video_dict}
 
-                logger.info(f"✅ YouTube 動画を追加しました: {video_id} (content_type={content_type}, live_status={live_status})")
-                messagebox.showinfo("成功", f"YouTube 動画を追加しました:\n{video_dict['title']}")
+        def on_success(result):
+            if result is None:
+                messagebox.showinfo("情報", "YouTube API での取得に失敗しました\n\n手動で動画情報を入力してください")
+                self._add_video_manual(video_id)
+            elif result["success"]:
+                messagebox.showinfo("成功", f"YouTube 動画を追加しました:\n{result['video']['title']}")
                 self.refresh_data()
             else:
-                logger.warning(f"⚠️ DB 保存に失敗しました: {video_id}")
                 messagebox.showerror("エラー", "動画情報の保存に失敗しました")
 
-        except Exception as e:
-            logger.error(f"❌ YouTube 動画追加エラー: {e}", exc_info=True)
+        def on_error(e):
             messagebox.showerror("エラー", f"エラーが発生しました:\n{e}")
 
+        self.task_runner.submit(
+            add, on_success=on_success, on_error=on_error,
+            description=f"YouTube 動画情報を取得中: {video_id}"
+        )
+
     def _add_niconico_video(self, input_value: str):
         """ニコニコ動画を追加"""
         # ニコニコ動画ID を抽出
@@ -2218,6 +2374,12 @@ YouTube:      {youtube_count} 件 (投稿済み: {youtube_posted})
                 messagebox.showwarning("警告", "ニコニコプラグインが有効化されていません\n\nニコニコユーザーIDを設定.envで設定してください")
                 return
 
+        except Exception as e:
+            logger.error(f"❌ ニコニコ動画追加エラー: {e}", exc_info=True)
+            messagebox.showerror("エラー", f"エラーが発生しました:\n{e}")
+            return
+
+        def add(progress):
             # 動画情報を取得
             logger.info(f"🌐 ニコニコ API から動画情報を取得: {video_id}")
 
@@ -2226,8 +2388,7 @@ YouTube:      {youtube_count} 件 (投稿済み: {youtube_posted})
 
             if not video_details:
                 logger.warning(f"⚠️ ニコニコ API での取得に失敗しました: {video_id}")
-                messagebox.showerror("エラー", f"ニコニコ動画情報の取得に失敗しました:\n{video_id}")
-                return
+                return None
 
             # 動画情報を構築
             video_id_clean = video_id if video_id.startswith("sm") or video_id.startswith("so") else f"sm{video_id}"
@@ -2256,47 +2417,60 @@ YouTube:      {youtube_count} 件 (投稿済み: {youtube_posted})
                 skip_dedup=True  # ★ 手動追加は重複排除をスキップ
             )
 
-            if success:
-                # ★ 手動追加後にサムネイルをダウンロード
-                if video_dict.get("thumbnail_url") and self.image_manager:
-                    try:
-                        logger.info(f"📥 手動追加後、サムネイル画像をダウンロード中: {video_id_clean}")
-                        image_filename = self.image_manager.download_and_save_thumbnail(
-                            thumbnail_url=video_dict["thumbnail_url"],
-                            site="Niconico",
-                            video_id=video_id_clean,
-                            mode="autopost"
-                        )
-                        # ★ ダウンロード成功時、DB に画像情報を登録
-                        if image_filename:
-                            self.db.update_image_info(
-                                video_id=video_id_clean,
-                                image_mode="autopost",
-                                image_filename=image_filename
-                            )
-                            logger.info(f"✅ DB に画像情報を登録しました: {video_id_clean} → {image_filename}")
-                    except Exception as e:
-                        logger.warning(f"⚠️ サムネイルダウンロード失敗（継続）: {e}")
+            if not success:
+                logger.warning(f"⚠️ DB 保存に失敗しました: {video_id_clean}")
+                return {"success": False, "video": video_dict}
 
-                logger.info(f"✅ ニコニコ動画を追加しました: {video_id_clean}")
-                messagebox.showinfo("成功", f"ニコニコ動画を追加しました:\n{video_dict['title']}")
+            # ★ 手動追加後にサムネイルをダウンロード
+            self._download_added_thumbnail(video_dict.get("thumbnail_url"), "Niconico", video_id_clean)
+
+            logger.info(f"✅ ニコニコ動画を追加しました: {video_id_clean}")
+            return {"success": True, "video": video_dict}
+
+        def on_success(result):
+            if result is None:
+                messagebox.showerror("エラー", f"ニコニコ動画情報の取得に失敗しました:\n{video_id}")
+            elif result["success"]:
+                messagebox.showinfo("成功", f"ニコニコ動画を追加しました:\n{result['video']['title']}")
                 self.refresh_data()
             else:
-                logger.warning(f"⚠️ DB 保存に失敗しました: {video_id_clean}")
                 messagebox.showerror("エラー", "動画情報の保存に失敗しました")
 
-        except Exception as e:
-            logger.error(f"❌ ニコニコ動画追加エラー: {e}", exc_info=True)
+        def on_error(e):
             messagebox.showerror("エラー", f"エラーが発生しました:\n{e}")
 
+        self.task_runner.submit(
+            add, on_success=on_success, on_error=on_error,
+            description=f"ニコニコ動画情報を取得中: {video_id}"
+        )
+
+    def _download_added_thumbnail(self, thumbnail_url: str, site: str, video_id: str):
+        """手動追加した動画のサムネイルをダウンロードし、DB に画像情報を登録（ワーカースレッドから呼ばれる）"""
+        if not thumbnail_url or not self.image_manager:
+            return
+        try:
+            logger.info(f"📥 手動追加後、サムネイル画像をダウンロード中: {video_id}")
+            image_filename = self.image_manager.download_and_save_thumbnail(
+                thumbnail_url=thumbnail_url,
+                site=site,
+                video_id=video_id,
+                mode="autopost"
+            )
+            # ★ ダウンロード成功時、DB に画像情報を登録
+            if image_filename:
+                self.db.update_image_info(
+                    video_id=video_id,
+                    image_mode="autopost",
+                    image_filename=image_filename
+                )
+                logger.info(f"✅ DB に画像情報を登録しました: {video_id} → {image_filename}")
+        except Exception as e:
+            logger.warning(f"⚠️ サムネイルダウンロード失敗（継続）: {e}")
+
     def _video_exists(self, video_id: str) -> bool:
         """動画がDBに存在するか確認"""
         try:
-            all_videos = self.db.get_all_videos()
-            for video in all_videos:
-                if video.get("video_id") == video_id:
-                    return True
-            return False
+            return self.db.get_video_by_id(video_id) is not None
         except Exception:
             return False
 
@@ -2361,7 +2535,7 @@ YouTube:      {youtube_count} 件 (投稿済み: {youtube_posted})
 
         # API から自動取得ボタン
         def on_fetch_from_api():
-            """API からメタデータを取得して自動入力"""
+            """API からメタデータを取得して自動入力（バックグラウンド実行）"""
             try:
                 from plugins.youtube.youtube_api_plugin import YouTubeAPIPlugin
 
@@ -2369,12 +2543,27 @@ YouTube:      {youtube_count} 件 (投稿済み: {youtube_posted})
                 if not api_plugin.is_available():
                     messagebox.showwarning("警告", "YouTube API が利用不可です。手動入力してください。")
                     return
+            except Exception as e:
+                logger.error(f"❌ API 取得エラー: {e}", exc_info=True)
+                messagebox.showerror("エラー", f"API 取得に失敗しました:\n{str(e)}")
+                return
 
+            def fetch(progress):
                 # API から詳細取得
                 details = api_plugin._fetch_video_detail(video_id)
                 if not details:
+                    return None
+
+                # ライブ判定
+                return details, api_plugin._classify_video_core(details)
+
+            def on_success(result):
+                if result is None:
                     messagebox.showerror("エラー", f"API から動画詳細を取得できませんでした: {video_id}")
                     return
+                if not dialog.winfo_exists():
+                    return
+                details, (content_type, live_status, is_premiere) = result
 
                 # 詳細から必要情報を抽出
                 snippet = details.get("snippet", {})
@@ -2384,18 +2573,12 @@ YouTube:      {youtube_count} 件 (投稿済み: {youtube_posted})
 
                 # ISO 8601 → YYYY-MM-DD HH:MM:SS に変換
                 try:
-                    from datetime import datetime
                     if published_at:
                         dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
                         published_at = dt.strftime("%Y-%m-%d %H:%M:%S")
                 except:
                     pass
 
-                # ライブ判定
-                from plugins.youtube.youtube_api_plugin import YouTubeAPIPlugin
-                api_plugin = YouTubeAPIPlugin()
-                content_type, live_status, is_premiere = api_plugin._classify_video_core(details)
-
                 # サムネイル URL
                 thumbnail_url = snippet.get("thumbnails", {}).get("high", {}).get("url", "")
 
@@ -2421,10 +2604,14 @@ YouTube:      {youtube_count} 件 (投稿済み: {youtube_posted})
                 logger.info(f"✅ API からメタデータを取得しました: {video_id} (content_type={content_type}, live_status={live_status})")
                 messagebox.showinfo("成功", "✅ API からメタデータを取得しました")
 
-            except Exception as e:
-                logger.error(f"❌ API 取得エラー: {e}", exc_info=True)
+            def on_error(e):
                 messagebox.showerror("エラー", f"API 取得に失敗しました:\n{str(e)}")
 
+            self.task_runner.submit(
+                fetch, on_success=on_success, on_error=on_error,
+                description=f"YouTube API から動画情報を取得中: {video_id}"
+            )
+
         ttk.Button(header_frame, text="🔍 API から自動取得", command=on_fetch_from_api).pack(side=tk.RIGHT, padx=5)
 
         # フォーム
@@ -2516,26 +2703,13 @@ YouTube:      {youtube_count} 件 (投稿済み: {youtube_posted})
                 )
 
                 if success:
-                    # ★ 手動追加後にサムネイルをダウンロード
+                    # ★ 手動追加後にサムネイルをダウンロード（バックグラウンド実行、完了後に一覧を再読込）
                     if thumbnail_url and self.image_manager:
-                        try:
-                            logger.info(f"📥 手動追加後、サムネイル画像をダウンロード中: {video_id}")
-                            image_filename = self.image_manager.download_and_save_thumbnail(
-                                thumbnail_url=thumbnail_url,
-                                site="YouTube",
-                                video_id=video_id,
-                                mode="autopost"
-                            )
-                            # ★ ダウンロード成功時、DB に画像情報を登録
-                            if image_filename:
-                                self.db.update_image_info(
-                                    video_id=video_id,
-                                    image_mode="autopost",
-                                    image_filename=image_filename
-                                )
-                                logger.info(f"✅ DB に画像情報を登録しました: {video_id} → {image_filename}")
-                        except Exception as e:
-                            logger.warning(f"⚠️ サムネイルダウンロード失敗（継続）: {e}")
+                        self.task_runner.submit(
+                            lambda progress: self._download_added_thumbnail(thumbnail_url, "YouTube", video_id),
+                            on_success=lambda _result: self.refresh_data(),
+                            description=f"サムネイル画像をダウンロード中: {video_id}"
+                        )
 
                     logger.info(f"✅ 動画を手動追加しました: {video_id} (content_type={content_type}, live_status={live_status})")
                     messagebox.showinfo("成功", f"✅ 動画を追加しました\n\n{title[:60]}...")
@@ -2556,7 +2730,7 @@ YouTube:      {youtube_count} 件 (投稿済み: {youtube_posted})
 class PostSettingsWindow:
     """投稿設定ウィンドウ - 動画の投稿設定を詳細に管理"""
 
-    def __init__(self, parent, video, db, plugin_manager=None, bluesky_core=None, operation_mode=None, is_dry_run=False):
+    def __init__(self, parent, video, db, task_runner, plugin_manager=None, bluesky_core=None, operation_mode=None, is_dry_run=False):
         """
         投稿設定ウィンドウを初期化
 
@@ -2564,6 +2738,7 @@ class PostSettingsWindow:
             parent: 親ウィンドウ
             video: 選択されたビデオレコード
             db: Database インスタンス
+            task_runner: GuiTaskRunner インスタンス（投稿処理をワーカーで実行する）
             plugin_manager: PluginManager インスタンス
             bluesky_core: Bluesky コア機能インスタンス
             operation_mode: 動作モード（OperationMode）
@@ -2572,11 +2747,13 @@ class PostSettingsWindow:
         self.parent = parent
         self.video = video
         self.db = db
+        self.task_runner = task_runner
         self.plugin_manager = plugin_manager
         self.bluesky_core = bluesky_core
         self.operation_mode = operation_mode
         self.is_dry_run = is_dry_run  # dry_run_post() から呼ばれたフラグ
         self.result = None  # 確定時の設定結果
+        self._posting = False  # 投稿処理の実行中フラグ（二重投稿防止）
 
         # ウィンドウを作成
         self.window = tk.Toplevel(parent)
@@ -2816,90 +2993,92 @@ class PostSettingsWindow:
         self._execute_post(dry_run=True)
 
     def _execute_post(self, dry_run=False):
-        """投稿を実行"""
-        try:
-            video = self.video
-            use_image = self.result["use_image"]
-            resize_small = self.result["resize_small_images"]
+        """投稿を実行（投稿処理はタスク実行器のワーカーで行い、結果表示は完了時に行う）"""
+        if self._posting:
+            logger.info("⏳ 投稿処理の実行中です。完了までお待ちください")
+            return
 
-            logger.info(f"📋 _execute_post 開始: use_image={use_image} (type={type(use_image).__name__}), resize_small={resize_small}")
+        video = self.video
+        use_image = self.result["use_image"]
+        resize_small = self.result["resize_small_images"]
 
-            # ⭐ 重複投稿チェック（設定値で有効化）
-            try:
-                from config import get_config
-                config = get_config("settings.env")
-                if config.prevent_duplicate_posts and not dry_run:
-                    if self.db.is_duplicate_post(video["video_id"]):
-                        messagebox.showwarning(
-                            "警告: 重複投稿防止",
-                            f"この動画は既に投稿済みです。\n\n{video['title'][:60]}...\n\n重複投稿を防止しました。"
-                        )
-                        logger.warning(f"🛑 重複投稿を防止しました: {video['video_id']}")
-                        return
-            except Exception as e:
-                logger.warning(f"重複チェック機能の読み込みエラー: {e}")
+        logger.info(f"📋 _execute_post 開始: use_image={use_image} (type={type(use_image).__name__}), resize_small={resize_small}")
+
+        # ⭐ 重複投稿チェック（設定値で有効化）
+        try:
+            from config import get_config
+            config = get_config("settings.env")
+            if config.prevent_duplicate_posts and not dry_run:
+                if self.db.is_duplicate_post(video["video_id"]):
+                    messagebox.showwarning(
+                        "警告: 重複投稿防止",
+                        f"この動画は既に投稿済みです。\n\n{video['title'][:60]}...\n\n重複投稿を防止しました。"
+                    )
+                    logger.warning(f"🛑 重複投稿を防止しました: {video['video_id']}")
+                    return
+        except Exception as e:
+            logger.warning(f"重複チェック機能の読み込みエラー: {e}")
+
+        if not self.plugin_manager and (use_image or not self.bluesky_core):
+            if use_image:
+                messagebox.showerror("エラー", "プラグインマネージャが初期化されていません")
+            else:
+                messagebox.showerror("エラー", "プラグインもコア機能も初期化されていません")
+            return
 
-            mode_str = "画像" if use_image else "URLリンクカード"
-            dry_str = "【投稿テスト】" if dry_run else ""
+        mode_str = "画像" if use_image else "URLリンクカード"
+        dry_str = "【投稿テスト】" if dry_run else ""
 
+        def post(progress):
             logger.info(f"{dry_str}投稿開始: {video['title'][:40]}... (投稿方法: {mode_str})")
 
-            if use_image:
-                # プラグイン経由で画像添付投稿
-                if self.plugin_manager:
-                    # video に投稿方法フラグを追加
-                    video_with_settings = dict(video)
-                    video_with_settings["use_image"] = True
+            if self.plugin_manager:
+                # プラグイン経由で投稿（画像添付 / テンプレート対応のテキスト + URLリンク）
+                video_with_settings = dict(video)
+                video_with_settings["use_image"] = use_image
+                if use_image:
                     logger.info(f"📤 プラグイン経由で投稿（画像添付）: {video['title']}")
-                    # ★ dry_run フラグを渡す
-                    results = self.plugin_manager.post_video_with_all_enabled(video_with_settings, dry_run=dry_run)
-                    logger.info(f"投稿結果: {results}")
-                    if any(results.values()) and not dry_run:
-                        self.db.mark_as_posted(video["video_id"])
                 else:
-                    messagebox.showerror("エラー", "プラグインマネージャが初期化されていません")
-                    return
-            else:
-                # テキスト + URLリンク投稿（プラグイン経由でテンプレート対応）← 修正: 2025-12-18
-                if self.plugin_manager:
                     logger.info(f"📤 プラグイン経由で投稿（テンプレート対応）: {video['title']}")
-                    video_with_settings = dict(video)
-                    video_with_settings["use_image"] = False  # 画像なしモード
-                    # ★ dry_run フラグを渡す
-                    results = self.plugin_manager.post_video_with_all_enabled(video_with_settings, dry_run=dry_run)
-                    logger.info(f"投稿結果: {results}")
-                    success = any(results.values())  # 任意のプラグイン成功で OK
-                    if success and not dry_run:
-                        self.db.mark_as_posted(video["video_id"])
-                elif self.bluesky_core:
-                    # フォールバック：プラグインがない場合はコア機能を直接呼び出し
-                    logger.info(f"📤 コア機能で投稿（テンプレート非対応、シンプルテキストのみ）: {video['title']}")
-                    # ★ 固定設定値を video 辞書に追加
-                    video_with_settings = dict(video)
-                    video_with_settings["via_plugin"] = False  # プラグイン非導入フラグ
-                    video_with_settings["use_link_card"] = False  # リンクカード無効（プラグイン機能）
-                    video_with_settings["embed"] = None  # 画像埋め込みなし
-                    # ★ dry_run フラグを設定
-                    if hasattr(self.bluesky_core, 'set_dry_run'):
-                        self.bluesky_core.set_dry_run(dry_run)
-                    success = self.bluesky_core.post_video_minimal(video_with_settings)
-                    if success and not dry_run:
-                        self.db.mark_as_posted(video["video_id"])
-                else:
-                    messagebox.showerror("エラー", "プラグインもコア機能も初期化されていません")
-                    return
-
-            msg = f"{'✅ 投稿テスト完了' if dry_run else '✅ 投稿完了'}\n\n{video['title'][:60]}...\n\n投稿方法: {mode_str}"
-            messagebox.showinfo("成功", msg)
+                # ★ dry_run フラグを渡す
+                results = self.plugin_manager.post_video_with_all_enabled(video_with_settings, dry_run=dry_run)
+                logger.info(f"投稿結果: {results}")
+                success = any(results.values())  # 任意のプラグイン成功で OK
+            else:
+                # フォールバック：プラグインがない場合はコア機能を直接呼び出し
+                logger.info(f"📤 コア機能で投稿（テンプレート非対応、シンプルテキストのみ）: {video['title']}")
+                # ★ 固定設定値を video 辞書に追加
+                video_with_settings = dict(video)
+                video_with_settings["via_plugin"] = False  # プラグイン非導入フラグ
+                video_with_settings["use_link_card"] = False  # リンクカード無効（プラグイン機能）
+                video_with_settings["embed"] = None  # 画像埋め込みなし
+                # ★ dry_run フラグを設定
+                if hasattr(self.bluesky_core, 'set_dry_run'):
+                    self.bluesky_core.set_dry_run(dry_run)
+                success = self.bluesky_core.post_video_minimal(video_with_settings)
+
+            if success and not dry_run:
+                self.db.mark_as_posted(video["video_id"])
 
             # ★ 投稿テスト後でも選択状態を更新（投稿テストは投稿済み扱いにしない）
             if not dry_run:
                 self.db.update_selection(video["video_id"], selected=False, scheduled_at=None)
                 logger.info(f"選択状態を更新: {video['video_id']} (selected=False)")
 
+        def on_success(_result):
+            self._posting = False
+            msg = f"{'✅ 投稿テスト完了' if dry_run else '✅ 投稿完了'}\n\n{video['title'][:60]}...\n\n投稿方法: {mode_str}"
+            messagebox.showinfo("成功", msg)
             # 窓を閉じる
-            self.window.destroy()
+            if self.window.winfo_exists():
+                self.window.destroy()
 
-        except Exception as e:
-            logger.error(f"投稿エラー: {e}", exc_info=True)
+        def on_error(e):
+            self._posting = False
             messagebox.showerror("エラー", f"投稿に失敗しました:\n{str(e)}")
+
+        self._posting = True
+        self.task_runner.submit(
+            post, on_success=on_success, on_error=on_error,
+            description=f"{dry_str}投稿中: {video['title'][:40]}"
+        )
@@ -8,19 +8,36 @@ GUI、プラグイン、その他のモジュールから共通利用可能。
 """
 
 import os
+import re
+import json
+import time
+import atexit
 import logging
+import threading
 import requests
 from pathlib import Path
 from typing import Optional, Tuple, List
 import io
+from log_routing import install_module_log_router
 
 # Pillowはオプション（画像情報取得機能で使用）
-try:
-    from PIL import Image, ImageOps
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-    logging.warning("⚠️ Pillow (PIL) がインストールされていません。画像情報取得機能は制限されます。")
+# 起動時間短縮のため、初回使用時に _pil_available() で読み込む
+Image = None
+ImageOps = None
+_pil_checked = False
+
+
+def _pil_available() -> bool:
+    """Pillow を読み込み、利用可能かどうかを返す（初回のみインポート）"""
+    global Image, ImageOps, _pil_checked
+    if not _pil_checked:
+        try:
+            from PIL import Image as _Image, ImageOps as _ImageOps
+            Image, ImageOps = _Image, _ImageOps
+        except ImportError:
+            logging.warning("⚠️ Pillow (PIL) がインストールされていません。画像情報取得機能は制限されます。")
+        _pil_checked = True
+    return Image is not None
 
 # ★ v3.4.0: ロギングプラグイン導入時はThumbnailsLogger、未導入時はAppLoggerにフォールバック
 def _get_logger():
@@ -33,6 +50,7 @@ def _get_logger():
     return logging.getLogger("AppLogger")
 
 logger = _get_logger()
+install_module_log_router(logger)
 
 __author__ = "mayuneco(mayunya)"
 __copyright__ = "Copyright (C) 2025 mayuneco(mayunya)"
@@ -41,19 +59,244 @@ __license__ = "GPLv2"
 __version__ = "1.0.0"
 
 
-def get_youtube_thumbnail_url(video_id: str) -> Optional[str]:
+# YouTube サムネイルの品質（優先度順）
+# maxres (1280x720) → sd (640x480) → hq (480x360) → mq (320x180)
+YOUTUBE_THUMB_QUALITIES = ("maxresdefault", "sddefault", "hqdefault", "mqdefault")
+YOUTUBE_THUMB_HOST_URL = "https://i.ytimg.com/"   # 解像度判定・ダウンロード先のホスト（同時接続数の制御用）
+
+# 存在しない解像度で返される 120x90 プレースホルダー画像の判定条件
+_YOUTUBE_PLACEHOLDER_SIZE = (120, 90)
+_YOUTUBE_PLACEHOLDER_MAX_BYTES = 2048   # プレースホルダーは約1KB（実画像はこれより十分大きい）
+_YOUTUBE_PROBE_RANGE_BYTES = 4096       # 解像度判定用に取得する先頭バイト数
+_YOUTUBE_PROBE_TIMEOUT = 5
+_YOUTUBE_THUMB_URL_RE = re.compile(r"^https://i\.ytimg\.com/vi/([\w-]+)/(maxresdefault|sddefault|hqdefault|mqdefault)\.jpg$")
+
+# 解像度プローブ結果のキャッシュ
+YOUTUBE_THUMB_PROBE_CACHE_FILE = "data/youtube_thumb_probe_cache.json"
+YOUTUBE_THUMB_NEGATIVE_TTL = 3 * 24 * 60 * 60   # 「存在しない」結果の有効期間（秒）: 後から生成される場合があるため
+_PROBE_CACHE_SAVE_INTERVAL = 5.0                # キャッシュ保存の最小間隔（秒）
+
+
+class YouTubeThumbProbeCache:
+    """
+    YouTube サムネイル解像度のプローブ結果キャッシュ
+
+    動画ごとに「存在する最高解像度」と「存在しない解像度（ネガティブキャッシュ）」を記録する。
+    ネガティブ結果は YOUTUBE_THUMB_NEGATIVE_TTL 経過後に再確認する。
+
+    JSON 構造:
+    {
+        "video_id": {
+            "quality": "hqdefault",
+            "missing": {"maxresdefault": 1735000000.0, "sddefault": 1735000000.0}
+        }
+    }
+    """
+
+    def __init__(self, cache_file: str = YOUTUBE_THUMB_PROBE_CACHE_FILE):
+        self.cache_file = Path(cache_file)
+        self.data = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = 0.0
+        self._load()
+
+    def _load(self) -> None:
+        """JSON ファイルから読み込み"""
+        if not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                self.data = json.load(f)
+            logger.debug(f"✅ サムネイル解像度キャッシュを読み込みました: {len(self.data)} 件")
+        except Exception as e:
+            logger.warning(f"⚠️ サムネイル解像度キャッシュの読み込みに失敗（リセットします）: {e}")
+            self.data = {}
+
+    def flush(self) -> bool:
+        """未保存の変更を JSON ファイルに書き込む"""
+        with self._lock:
+            if not self._dirty:
+                return True
+            snapshot = json.dumps(self.data, ensure_ascii=False)
+            self._dirty = False
+            self._last_save = time.monotonic()
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_file.with_suffix(".tmp")
+            tmp_path.write_text(snapshot, encoding="utf-8")
+            os.replace(tmp_path, self.cache_file)
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ サムネイル解像度キャッシュの保存に失敗: {e}")
+            return False
+
+    def get(self, video_id: str) -> dict:
+        """動画のプローブ結果を取得（期限切れのネガティブ結果は除外）"""
+        with self._lock:
+            entry = self.data.get(video_id)
+            if not entry:
+                return {"quality": None, "missing": set()}
+            now = time.time()
+            missing = {
+                q for q, checked_at in entry.get("missing", {}).items()
+                if now - checked_at < YOUTUBE_THUMB_NEGATIVE_TTL
+            }
+            return {"quality": entry.get("quality"), "missing": missing}
+
+    def update(self, video_id: str, quality: Optional[str], missing: List[str]) -> None:
+        """プローブ結果を記録（一定間隔でファイルへ保存）"""
+        now = time.time()
+        with self._lock:
+            entry = self.data.setdefault(video_id, {"quality": None, "missing": {}})
+            if quality:
+                entry["quality"] = quality
+                entry["missing"].pop(quality, None)
+            for q in missing:
+                entry["missing"][q] = now
+            self._dirty = True
+            should_save = time.monotonic() - self._last_save >= _PROBE_CACHE_SAVE_INTERVAL
+        if should_save:
+            self.flush()
+
+
+_thumb_probe_cache = None
+_thumb_probe_cache_lock = threading.Lock()
+
+
+def get_youtube_thumb_probe_cache() -> YouTubeThumbProbeCache:
+    """YouTubeThumbProbeCache のシングルトンインスタンスを取得"""
+    global _thumb_probe_cache
+    with _thumb_probe_cache_lock:
+        if _thumb_probe_cache is None:
+            _thumb_probe_cache = YouTubeThumbProbeCache()
+            atexit.register(_thumb_probe_cache.flush)
+        return _thumb_probe_cache
+
+
+def _parse_jpeg_dimensions(data: bytes) -> Optional[Tuple[int, int]]:
+    """JPEG の先頭バイトから SOF マーカーを探して (幅, 高さ) を返す（デコードなし）"""
+    if not data.startswith(b"\xFF\xD8"):
+        return None
+    i = 2
+    length = len(data)
+    while i + 9 < length:
+        if data[i] != 0xFF:
+            i += 1
+            continue
+        marker = data[i + 1]
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7 or marker == 0xFF:
+            i += 1 if marker == 0xFF else 2
+            continue
+        segment_length = int.from_bytes(data[i + 2:i + 4], "big")
+        # SOF0〜SOF15（DHT=C4, JPG=C8, DAC=CC を除く）
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height = int.from_bytes(data[i + 5:i + 7], "big")
+            width = int.from_bytes(data[i + 7:i + 9], "big")
+            return width, height
+        i += 2 + segment_length
+    return None
+
+
+def _probe_youtube_thumbnail(url: str) -> Optional[bool]:
+    """
+    サムネイル URL が実画像として存在するかを HEAD / Range リクエストで確認
+
+    Returns:
+        True: 存在する / False: 存在しない（404 またはプレースホルダー） / None: 判定不能（通信エラー）
+    """
+    try:
+        resp = requests.head(url, timeout=_YOUTUBE_PROBE_TIMEOUT, allow_redirects=True)
+        if resp.status_code == 404:
+            return False
+        if resp.status_code != 200:
+            return None
+
+        content_length = int(resp.headers.get("Content-Length") or 0)
+        if content_length > _YOUTUBE_PLACEHOLDER_MAX_BYTES:
+            return True
+
+        # サイズ不明・小さい場合は先頭バイトだけ取得して解像度を確認
+        resp = requests.get(
+            url,
+            headers={"Range": f"bytes=0-{_YOUTUBE_PROBE_RANGE_BYTES - 1}"},
+            timeout=_YOUTUBE_PROBE_TIMEOUT,
+        )
+        if resp.status_code == 404:
+            return False
+        if resp.status_code not in (200, 206):
+            return None
+
+        dimensions = _parse_jpeg_dimensions(resp.content[:_YOUTUBE_PROBE_RANGE_BYTES])
+        if dimensions == _YOUTUBE_PLACEHOLDER_SIZE:
+            return False
+        if dimensions:
+            return True
+        return content_length == 0 or content_length > _YOUTUBE_PLACEHOLDER_MAX_BYTES
+    except Exception as e:
+        logger.debug(f"⚠️ サムネイル解像度の確認に失敗: {url} - {e}")
+        return None
+
+
+def resolve_youtube_thumbnail_quality(video_id: str) -> Optional[str]:
+    """
+    実在する最高解像度のサムネイル品質名を返す（ネガティブキャッシュ付き）
+
+    キャッシュ済みの品質より高い解像度のうち、ネガティブキャッシュが有効なものは確認を省略する。
+    通信エラーで判定できなかった場合は None を返す。
+
+    Args:
+        video_id: YouTube 動画 ID
+
+    Returns:
+        品質名（"maxresdefault" など）、判定不能時は None
+    """
+    cache = get_youtube_thumb_probe_cache()
+    cached = cache.get(video_id)
+    cached_quality = cached["quality"]
+
+    base = f"https://i.ytimg.com/vi/{video_id}"
+    missing = []
+    for quality in YOUTUBE_THUMB_QUALITIES:
+        if quality == cached_quality:
+            # キャッシュ済みの品質に到達 → より高い解像度は存在しないことが確認済み
+            if missing:
+                cache.update(video_id, quality, missing)
+            return quality
+        if quality in cached["missing"]:
+            continue
+
+        exists = _probe_youtube_thumbnail(f"{base}/{quality}.jpg")
+        if exists is None:
+            # 判定不能 → キャッシュを更新せず、キャッシュ済みの品質があればそれを使う
+            if missing:
+                cache.update(video_id, None, missing)
+            return cached_quality
+        if exists:
+            cache.update(video_id, quality, missing)
+            logger.debug(f"✅ YouTube サムネイル解像度を確認: {video_id} -> {quality}")
+            return quality
+        missing.append(quality)
+
+    # すべて存在しない（hqdefault まで無いことは通常ない）
+    cache.update(video_id, None, missing)
+    return cached_quality
+
+
+def get_youtube_thumbnail_url(video_id: str, probe: bool = True) -> Optional[str]:
     """
     YouTube のサムネイル URL を複数品質から取得
 
-    複数の品質レベルを試行し、最初に取得できた URL を返す。
-    ★ v3.3.0+: パフォーマンス最適化 - デフォルト URL を直接返す
-    （HTTP リクエストなしで URL を構築）
+    HEAD / Range リクエストで実在する最高解像度を確認し、その URL を返す。
+    存在しない解像度は 404 または 120x90 のプレースホルダー画像として判定し、
+    動画ごとの結果をネガティブキャッシュに記録する（画像本体のダウンロードは行わない）。
 
-    優先度: maxres (1280x720) → sd (640x480) → hq (480x360) →
-            mq (320x180) → default (120x90)
+    優先度: maxres (1280x720) → sd (640x480) → hq (480x360) → mq (320x180)
 
     Args:
         video_id: YouTube 動画 ID
+        probe: False の場合は確認せず maxresdefault.jpg の URL を返す
+               （動画取り込み時は False。実在確認は download_and_save_thumbnail で行う）
 
     Returns:
         サムネイル URL、取得失敗時は None
@@ -61,13 +304,23 @@ def get_youtube_thumbnail_url(video_id: str) -> Optional[str]:
     if not video_id:
         return None
 
-    # ★ 修正: maxresdefault.jpg（最高品質 1280x720）を使用
-    # 全ての動画で利用可能（存在しない場合は下位品質にフォールバック）
     base = f"https://i.ytimg.com/vi/{video_id}"
-    maxres_url = f"{base}/maxresdefault.jpg"
+    quality = resolve_youtube_thumbnail_quality(video_id) if probe else None
+
+    if not quality:
+        # 確認しない／判定不能の場合は最高品質 URL を返す
+        quality = YOUTUBE_THUMB_QUALITIES[0]
 
-    logger.debug(f"✅ YouTube サムネイル URL 構築: {video_id} -> maxresdefault.jpg (1280x720)")
-    return maxres_url
+    logger.debug(f"✅ YouTube サムネイル URL 構築: {video_id} -> {quality}.jpg")
+    return f"{base}/{quality}.jpg"
+
+
+# ニコニコの getthumbinfo の thumbnail_url に付けると大サイズになる接尾辞（存在しない古い動画もある）
+NICONICO_LARGE_THUMB_SUFFIX = ".L"
+
+# ダウンロード時の最大サイズ（ストリーミング中に超過したら中断）
+DOWNLOAD_MAX_BYTES = 10 * 1024 * 1024
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
 
 class ImageManager:
@@ -82,6 +335,16 @@ class ImageManager:
         """
         self.base_dir = Path(base_dir)
         self._ensure_directories()
+        # スレッドごとの HTTP セッション（並列ダウンロード時の接続再利用）
+        self._local = threading.local()
+
+    def _get_session(self) -> requests.Session:
+        """現在のスレッド用の requests.Session を取得"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
 
     def _ensure_directories(self):
         """必要なディレクトリを作成"""
@@ -154,13 +417,38 @@ class ImageManager:
             logger.warning(f"⚠️ ローカル画像の読み込み失敗: {path} - {e}")
         return None
 
-    def _download_from_url(self, url: str, timeout: int = 10) -> Optional[bytes]:
-        """URLから画像をダウンロード"""
+    def _download_from_url(self, url: str, timeout: int = 10, max_bytes: int = DOWNLOAD_MAX_BYTES) -> Optional[bytes]:
+        """
+        URLから画像をストリーミングでダウンロード
+
+        Content-Length または受信済みサイズが max_bytes を超えた時点で中断する。
+
+        Args:
+            url: 画像URL
+            timeout: タイムアウト（秒）
+            max_bytes: 最大サイズ（バイト）
+
+        Returns:
+            画像データ（bytes）、失敗時は None
+        """
         try:
-            response = requests.get(url, timeout=timeout)
-            response.raise_for_status()
-            logger.info(f"✅ 画像ダウンロード成功: {len(response.content)} bytes")
-            return response.content
+            with self._get_session().get(url, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+
+                content_length = int(response.headers.get("Content-Length") or 0)
+                if content_length > max_bytes:
+                    logger.warning(f"⚠️ 画像サイズが上限を超えています: {url} ({content_length} bytes > {max_bytes} bytes)")
+                    return None
+
+                buffer = bytearray()
+                for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    buffer.extend(chunk)
+                    if len(buffer) > max_bytes:
+                        logger.warning(f"⚠️ 画像サイズが上限を超えたためダウンロードを中断: {url} (> {max_bytes} bytes)")
+                        return None
+
+            logger.info(f"✅ 画像ダウンロード成功: {len(buffer)} bytes")
+            return bytes(buffer)
         except Exception as e:
             logger.warning(f"⚠️ 画像ダウンロード失敗: {url} - {e}")
         return None
@@ -186,6 +474,8 @@ class ImageManager:
         """
         URLから画像をダウンロードして保存
 
+        メモリ上で検証してから一時ファイル経由でアトミックに書き込む。
+
         Args:
             url: 画像URL
             site: サイト名
@@ -199,36 +489,61 @@ class ImageManager:
         if not image_data:
             return None
 
+        is_valid, error_msg = self.validate_image(image_data, max_size_mb=DOWNLOAD_MAX_BYTES / (1024 * 1024))
+        if not is_valid:
+            logger.error(f"❌ ダウンロードしたファイルは有効な画像ではありません: {error_msg}")
+            return None
+
         if not filename:
-            # URLから拡張子を推測
+            # 先頭バイトから拡張子を推測
             ext = self._detect_image_extension(image_data)
             from datetime import datetime
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"{site}_{timestamp}.{ext}"
 
         save_path = self.base_dir / site / mode / filename
-        try:
-            save_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(save_path, 'wb') as f:
-                f.write(image_data)
+        if self._write_atomic(save_path, image_data):
             logger.info(f"✅ 画像保存成功: {save_path}")
             return filename
+        return None
+
+    def _write_atomic(self, path: Path, data: bytes) -> bool:
+        """一時ファイルに書き込んでから置き換える（既存ファイルは上書き）"""
+        tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.part")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            return True
         except Exception as e:
-            logger.error(f"❌ 画像保存失敗: {save_path} - {e}")
+            logger.error(f"❌ 画像保存失敗: {path} - {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+        return False
+
+    @staticmethod
+    def _sniff_image_extension(image_data: bytes) -> Optional[str]:
+        """先頭バイト（マジックナンバー）から拡張子を判定"""
+        if image_data.startswith(b'\x89PNG'):
+            return "png"
+        elif image_data.startswith(b'\xFF\xD8\xFF'):
+            return "jpg"
+        elif image_data.startswith(b'GIF87a') or image_data.startswith(b'GIF89a'):
+            return "gif"
+        elif image_data.startswith(b'RIFF') and b'WEBP' in image_data[:20]:
+            return "webp"
         return None
 
     def _detect_image_extension(self, image_data: bytes) -> str:
         """画像データから拡張子を推測"""
-        if not PIL_AVAILABLE:
-            # Pillowがない場合は先頭バイトから推測
-            if image_data.startswith(b'\x89PNG'):
-                return "png"
-            elif image_data.startswith(b'\xFF\xD8\xFF'):
-                return "jpg"
-            elif image_data.startswith(b'GIF87a') or image_data.startswith(b'GIF89a'):
-                return "gif"
-            elif image_data.startswith(b'RIFF') and b'WEBP' in image_data[:20]:
-                return "webp"
+        ext = self._sniff_image_extension(image_data)
+        if ext:
+            return ext
+
+        if not _pil_available():
             return "png"
 
         try:
@@ -323,6 +638,41 @@ class ImageManager:
 
         return deleted_any
 
+    def delete_images_batch(self, targets: list) -> int:
+        """
+        複数の動画の画像ファイルをまとめて削除
+
+        ★ 一括削除時に使用：delete_images_by_video_id と同じく import・autopost 両方のモードから削除。
+        存在確認を省いて unlink し、ログは件数のまとめのみ出力する。
+
+        Args:
+            targets: (site, image_filename) のリスト
+
+        Returns:
+            いずれかのファイルを削除できた動画の件数
+        """
+        deleted = 0
+        failed = 0
+        for site, image_filename in targets:
+            if not image_filename:
+                continue
+            deleted_any = False
+            for mode in ("import", "autopost"):
+                file_path = self.base_dir / site / mode / image_filename
+                try:
+                    file_path.unlink()
+                    deleted_any = True
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    failed += 1
+                    logger.warning(f"⚠️ 画像削除失敗: {file_path} - {e}")
+            if deleted_any:
+                deleted += 1
+
+        logger.info(f"✅ 画像を一括削除しました: {deleted} 件（失敗 {failed} 件）")
+        return deleted
+
     def get_image_info(self, site: str, mode: str, filename: str) -> Optional[dict]:
         """
         画像ファイルの情報を取得
@@ -342,7 +692,7 @@ class ImageManager:
         try:
             file_size = file_path.stat().st_size
 
-            if not PIL_AVAILABLE:
+            if not _pil_available():
                 # Pillowがない場合は基本情報のみ
                 return {
                     "filename": filename,
@@ -389,7 +739,7 @@ class ImageManager:
         if size_mb > max_size_mb:
             return False, f"ファイルサイズが大きすぎます ({size_mb:.2f}MB > {max_size_mb}MB)"
 
-        if not PIL_AVAILABLE:
+        if not _pil_available():
             # Pillowがない場合は基本的なバイナリチェックのみ
             if image_data.startswith(b'\x89PNG') or \
                image_data.startswith(b'\xFF\xD8\xFF') or \
@@ -429,7 +779,7 @@ class ImageManager:
         Returns:
             リサイズ後のファイル名、失敗時は None
         """
-        if not PIL_AVAILABLE:
+        if not _pil_available():
             logger.error("❌ Pillowがインストールされていないため、リサイズできません")
             return None
 
@@ -484,7 +834,7 @@ class ImageManager:
         Returns:
             変換後のファイル名、失敗時は None
         """
-        if not PIL_AVAILABLE:
+        if not _pil_available():
             logger.error("❌ Pillowがインストールされていないため、変換できません")
             return None
 
@@ -552,7 +902,7 @@ class ImageManager:
         Returns:
             サムネイルファイル名、失敗時は None
         """
-        if not PIL_AVAILABLE:
+        if not _pil_available():
             logger.error("❌ Pillowがインストールされていないため、サムネイル生成できません")
             return None
 
@@ -604,7 +954,7 @@ class ImageManager:
         Returns:
             最適化後のファイル名、失敗時は None
         """
-        if not PIL_AVAILABLE:
+        if not _pil_available():
             logger.error("❌ Pillowがインストールされていないため、最適化できません")
             return None
 
@@ -646,6 +996,34 @@ class ImageManager:
             logger.error(f"❌ 最適化失敗: {input_path} - {e}")
         return None
 
+    def _fallback_youtube_thumbnail(self, thumbnail_url: str, image_data: Optional[bytes]) -> Optional[bytes]:
+        """
+        YouTube の固定 URL（maxresdefault.jpg など）が存在しない・プレースホルダーだった場合、
+        実在する最高解像度を確認してダウンロードし直す
+
+        取り込み時は確認せずに URL だけ保存しているため、解像度の確認はここで初めて行う。
+
+        Args:
+            thumbnail_url: ダウンロードした URL
+            image_data: ダウンロード結果（失敗時は None）
+
+        Returns:
+            画像データ（フォールバックできない場合は image_data をそのまま返す）
+        """
+        match = _YOUTUBE_THUMB_URL_RE.match(thumbnail_url)
+        if not match:
+            return image_data
+        if image_data and _parse_jpeg_dimensions(image_data[:_YOUTUBE_PROBE_RANGE_BYTES]) != _YOUTUBE_PLACEHOLDER_SIZE:
+            return image_data
+
+        video_id, requested = match.groups()
+        quality = resolve_youtube_thumbnail_quality(video_id)
+        if not quality or quality == requested:
+            return image_data
+
+        logger.info(f"ℹ️ YouTube サムネイル {requested} が存在しないため {quality} を使用: {video_id}")
+        return self._download_from_url(f"https://i.ytimg.com/vi/{video_id}/{quality}.jpg") or image_data
+
     def download_and_save_thumbnail(
         self,
         thumbnail_url: str,
@@ -672,42 +1050,33 @@ class ImageManager:
         # 動画IDをサニタイズ（ファイル名として不適切な文字を除去）
         safe_video_id = "".join(c for c in video_id if c.isalnum() or c in "-_")
 
-        # ファイル名を生成（拡張子は自動検出）
-        filename = f"{safe_video_id}.tmp"
-
-        # 画像をダウンロード
-        result = self.save_image_from_url(thumbnail_url, site, mode, filename)
-
-        if result:
-            # 拡張子を正しく付け直す
-            temp_path = self.base_dir / site / mode / result
-            if temp_path.exists():
-                image_data = temp_path.read_bytes()
-
-                # 画像の検証
-                is_valid, error_msg = self.validate_image(image_data, max_size_mb=10.0)
-                if not is_valid:
-                    logger.error(f"❌ ダウンロードしたファイルは有効な画像ではありません: {error_msg}")
-                    temp_path.unlink()  # 無効なファイルを削除
-                    return None
+        # 画像をストリーミングでダウンロード（サイズ上限超過時は中断）
+        image_data = self._download_from_url(thumbnail_url)
+        if not image_data and site == "Niconico" and thumbnail_url.endswith(NICONICO_LARGE_THUMB_SUFFIX):
+            # 大サイズ（.L）が存在しない古い動画は通常サイズにフォールバック
+            image_data = self._download_from_url(thumbnail_url[:-len(NICONICO_LARGE_THUMB_SUFFIX)])
+        if site == "YouTube":
+            image_data = self._fallback_youtube_thumbnail(thumbnail_url, image_data)
+        if not image_data:
+            return None
 
-                ext = self._detect_image_extension(image_data)
-                final_filename = f"{safe_video_id}.{ext}"
-                final_path = self.base_dir / site / mode / final_filename
+        # 画像の検証（メモリ上で verify のみ、デコードはしない）
+        is_valid, error_msg = self.validate_image(image_data, max_size_mb=DOWNLOAD_MAX_BYTES / (1024 * 1024))
+        if not is_valid:
+            logger.error(f"❌ ダウンロードしたファイルは有効な画像ではありません: {error_msg}")
+            return None
 
-                # 既存があれば上書き
-                if final_path.exists():
-                    try:
-                        final_path.unlink()
-                    except Exception as e:
-                        logger.warning(f"⚠️ 既存ファイルの削除に失敗: {final_path} - {e}")
+        # 拡張子は先頭バイトから判定
+        ext = self._detect_image_extension(image_data)
+        final_filename = f"{safe_video_id}.{ext}"
+        final_path = self.base_dir / site / mode / final_filename
 
-                # ファイル名を変更
-                temp_path.rename(final_path)
-                logger.info(f"✅ サムネイル保存完了: {final_path}")
-                return final_filename
+        # 既存があればアトミックに上書き
+        if not self._write_atomic(final_path, image_data):
+            return None
 
-        return None
+        logger.info(f"✅ サムネイル保存完了: {final_path}")
+        return final_filename
 
 
 # シングルトンインスタンス
@@ -5,10 +5,15 @@ Blueskyへの投稿用に画像をリサイズ・最適化する機能を提供
 単体テストを想定して設計されています。
 """
 
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from PIL import Image
 import io
+from metrics import IMAGE_ENCODE_BYTES, IMAGE_ENCODE_SECONDS
 
 __author__ = "mayuneco(mayunya)"
 __copyright__ = "Copyright (C) 2025 mayuneco(mayunya)"
@@ -26,8 +31,17 @@ _IMAGE_CONFIG = {
     "quality_initial": 90,     # 初期JPEG品質
     "size_threshold": 900 * 1024,   # ファイルサイズ閾値（900KB）
     "size_limit": 1024 * 1024,      # ファイルサイズ上限（1MB）
+    "quality_min": 50,         # 再圧縮時の最低JPEG品質
+    "quality_step": 5,         # 再圧縮時の品質探索刻み
 }
 
+# 処理結果キャッシュ（元画像ハッシュ + 設定 → (JPEG バイナリ, 幅, 高さ)）
+_RESULT_CACHE_MAX = 64
+_result_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+# ファイルハッシュキャッシュ（(パス, mtime, サイズ) → SHA-256）
+_digest_cache: dict = {}
+_cache_lock = threading.Lock()
+
 # Blueskyの推奨画像サイズ（アスペクト比別）
 # 参考: https://docs.bsky.app/docs/advanced-guides/image-handling
 _RECOMMENDED_SIZES = {
@@ -39,7 +53,24 @@ _RECOMMENDED_SIZES = {
 
 def resize_image(file_path: str, config: dict = None) -> bytes:
     """
-    画像をリサイズして最適化
+    画像をリサイズして最適化（JPEG バイナリのみ返す互換 API）
+
+    詳細は resize_image_with_size() を参照。
+
+    Args:
+        file_path: 画像ファイルパス
+        config: 画像処理設定辞書（省略時は _IMAGE_CONFIG を使用）
+
+    Returns:
+        リサイズ・最適化済みの JPEG バイナリ、失敗時は None
+    """
+    result = resize_image_with_size(file_path, config)
+    return result[0] if result else None
+
+
+def resize_image_with_size(file_path: str, config: dict = None):
+    """
+    画像をリサイズして最適化し、出力画像の解像度と合わせて返す
 
     処理フロー:
     1. 元画像の情報を取得（解像度・フォーマット・ファイルサイズ）
@@ -51,19 +82,25 @@ def resize_image(file_path: str, config: dict = None) -> bytes:
        - 例: 1080×1920 → 800×1000
        - 例: 1500×1500 → 1000×1000
     3. JPEG品質で出力
-    4. ファイルサイズ確認 → 閾値超過なら品質低下して再圧縮
+    4. ファイルサイズ確認 → 閾値超過なら品質を二分探索して再圧縮
     5. 最終的に上限超過ならNoneを返す
 
+    同じ元画像（内容のハッシュ）と同じ設定の組み合わせは処理結果をキャッシュし、
+    2回目以降はエンコードを行わずに返します。
+
     Args:
         file_path: 画像ファイルパス
         config: 画像処理設定辞書（省略時は _IMAGE_CONFIG を使用）
 
     Returns:
-        リサイズ・最適化済みの JPEG バイナリ、失敗時は None
+        (JPEG バイナリ, 幅, 高さ) のタプル、失敗時は None
     """
+    started = time.perf_counter()
     try:
         if config is None:
             config = _IMAGE_CONFIG
+        else:
+            config = {**_IMAGE_CONFIG, **config}
 
         if not Path(file_path).exists():
             logger.warning(f"⚠️ 画像ファイルが見つかりません: {file_path}")
@@ -74,37 +111,48 @@ def resize_image(file_path: str, config: dict = None) -> bytes:
             original_data = f.read()
         original_size_bytes = len(original_data)
 
-        img = Image.open(file_path)
+        # ========== キャッシュ確認 ==========
+        cache_key = (_get_file_digest(file_path, original_data), _config_cache_key(config))
+        with _cache_lock:
+            cached = _result_cache.get(cache_key)
+            if cached is not None:
+                _result_cache.move_to_end(cache_key)
+        if cached is not None:
+            IMAGE_ENCODE_SECONDS.observe(time.perf_counter() - started, cache="hit")
+            post_logger.debug("♻️ 画像処理キャッシュを使用: %s (%.1fKB, %s×%s)", Path(file_path).name, len(cached[0]) / 1024, cached[1], cached[2])
+            return cached
+
+        img = Image.open(io.BytesIO(original_data))
         original_width, original_height = img.size
         original_format = img.format or "Unknown"
 
         aspect_ratio = original_width / original_height if original_height > 0 else 1.0
 
-        post_logger.debug(f"📏 元画像: {original_width}×{original_height} ({original_format}, {original_size_bytes / 1024:.1f}KB, アスペクト比: {aspect_ratio:.2f})")
+        post_logger.debug("📏 元画像: %s×%s (%s, %.1fKB, アスペクト比: %.2f)", original_width, original_height, original_format, original_size_bytes / 1024, aspect_ratio)
 
         # ========== アスペクト比に応じたリサイズ処理 ==========
         if aspect_ratio < 0.8:
             # 縦長画像 (4:5)
             target_w, target_h = _RECOMMENDED_SIZES["portrait"]
-            post_logger.debug(f"🔄 縦長画像（アスペクト比 {aspect_ratio:.2f}）: {target_w}×{target_h}px にリサイズ")
+            post_logger.debug("🔄 縦長画像（アスペクト比 %.2f）: %s×%spx にリサイズ", aspect_ratio, target_w, target_h)
         elif aspect_ratio <= 1.25:
             # 正方形〜やや横長 (1:1)
             target_w, target_h = _RECOMMENDED_SIZES["square"]
-            post_logger.debug(f"🔄 正方形/やや横長（アスペクト比 {aspect_ratio:.2f}）: {target_w}×{target_h}px にリサイズ")
+            post_logger.debug("🔄 正方形/やや横長（アスペクト比 %.2f）: %s×%spx にリサイズ", aspect_ratio, target_w, target_h)
         else:
             # 横長画像 (16:9)
             target_w, target_h = _RECOMMENDED_SIZES["landscape"]
-            post_logger.debug(f"🔄 横長画像（アスペクト比 {aspect_ratio:.2f}）: {target_w}×{target_h}px にリサイズ")
+            post_logger.debug("🔄 横長画像（アスペクト比 %.2f）: %s×%spx にリサイズ", aspect_ratio, target_w, target_h)
 
         resized_img = _resize_to_target(img, target_w, target_h)
 
         resized_width, resized_height = resized_img.size
-        post_logger.debug(f"   リサイズ後: {resized_width}×{resized_height}")
+        post_logger.debug("   リサイズ後: %s×%s", resized_width, resized_height)
 
         # ========== JPEG 出力（初期品質） ==========
         jpeg_data = _encode_jpeg(resized_img, config["quality_initial"])
         current_size_bytes = len(jpeg_data)
-        post_logger.debug(f"   JPEG品質{config['quality_initial']}: {current_size_bytes / 1024:.1f}KB")
+        post_logger.debug("   JPEG品質%s: %.1fKB", config['quality_initial'], current_size_bytes / 1024)
 
         # ========== ファイルサイズチェック＆品質調整 ==========
         if current_size_bytes > config["size_threshold"]:
@@ -129,13 +177,68 @@ def resize_image(file_path: str, config: dict = None) -> bytes:
             f"→ {resized_width}×{resized_height} ({current_size_bytes / 1024:.1f}KB)"
         )
 
-        return jpeg_data
+        IMAGE_ENCODE_SECONDS.observe(time.perf_counter() - started, cache="miss")
+        IMAGE_ENCODE_BYTES.observe(current_size_bytes)
+
+        result = (jpeg_data, resized_width, resized_height)
+        with _cache_lock:
+            _result_cache[cache_key] = result
+            _result_cache.move_to_end(cache_key)
+            while len(_result_cache) > _RESULT_CACHE_MAX:
+                _result_cache.popitem(last=False)
+
+        return result
 
     except Exception as e:
         post_logger.error(f"❌ 画像リサイズ失敗: {e}")
         return None
 
 
+def clear_resize_cache() -> None:
+    """画像処理結果キャッシュを破棄"""
+    with _cache_lock:
+        _result_cache.clear()
+        _digest_cache.clear()
+
+
+def _get_file_digest(file_path: str, data: bytes) -> str:
+    """
+    ファイル内容の SHA-256 を返す（(パス, mtime, サイズ) が同じなら再計算しない）
+
+    Args:
+        file_path: 画像ファイルパス
+        data: ファイル内容
+
+    Returns:
+        16進数のハッシュ文字列
+    """
+    try:
+        stat = Path(file_path).stat()
+        stat_key = (str(Path(file_path).resolve()), stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        stat_key = None
+
+    if stat_key is not None:
+        with _cache_lock:
+            digest = _digest_cache.get(stat_key)
+        if digest is not None:
+            return digest
+
+    digest = hashlib.sha256(data).hexdigest()
+
+    if stat_key is not None:
+        with _cache_lock:
+            if len(_digest_cache) >= _RESULT_CACHE_MAX * 4:
+                _digest_cache.clear()
+            _digest_cache[stat_key] = digest
+    return digest
+
+
+def _config_cache_key(config: dict) -> tuple:
+    """設定辞書をキャッシュキー用のタプルに変換"""
+    return tuple(sorted((k, repr(v)) for k, v in config.items()))
+
+
 def resize_to_aspect_ratio(img, target_width: int, target_height: int):
     """
     アスペクト比を指定値に寄せて縮小+中央トリミング
@@ -270,30 +373,61 @@ def _encode_jpeg(img, quality: int) -> bytes:
 
 def _optimize_image_quality(img, config: dict) -> bytes:
     """
-    画像の品質を段階的に下げて再圧縮（ファイルサイズを上限未満に）
+    品質を下げて再圧縮（ファイルサイズを上限以下にできる最高品質を採用）
+
+    quality_min〜quality_initial の範囲を quality_step 刻みの候補に分け、
+    まず最も高い品質（既定値では 85）を試します。多くの画像はこの1回で収まります。
+    超過した場合のみ残りの候補を二分探索します（既定値の 50〜80 では最大3回）。
+    再圧縮は最大4回で、呼び出し元の初期出力と合わせたエンコードは最悪5回です。
 
     Args:
         img: PIL Image オブジェクト
-        config: 画像処理設定辞書（size_limitを含む）
+        config: 画像処理設定辞書（size_limit, quality_min, quality_step を含む）
 
     Returns:
         最適化された JPEG バイナリ、失敗時は None
     """
-    # 品質を段階的に下げてテスト: 85, 75, 65, 55, 50
-    quality_levels = [85, 75, 65, 55, 50]
+    quality_min = config.get("quality_min", 50)
+    quality_step = max(1, config.get("quality_step", 5))
+    quality_max = config["quality_initial"] - quality_step
+
+    # 品質候補（昇順）: 50, 55, ..., 85
+    quality_levels = list(range(quality_min, quality_max + 1, quality_step)) or [quality_min]
 
-    for quality in quality_levels:
+    best_data = None
+    best_quality = None
+
+    # 最高品質で収まればそのまま採用
+    jpeg_data = _encode_jpeg(img, quality_levels[-1])
+    logger.debug("   JPEG品質%s: %.1fKB", quality_levels[-1], len(jpeg_data) / 1024)
+    if len(jpeg_data) <= config["size_limit"]:
+        best_data, best_quality = jpeg_data, quality_levels[-1]
+
+    # 超過した場合のみ残りの候補（最高品質より下）を二分探索
+    low, high = 0, (len(quality_levels) - 2 if best_data is None else -1)
+
+    while low <= high:
+        mid = (low + high) // 2
+        quality = quality_levels[mid]
         jpeg_data = _encode_jpeg(img, quality)
         size_bytes = len(jpeg_data)
 
-        logger.debug(f"   JPEG品質{quality}: {size_bytes / 1024:.1f}KB")
+        logger.debug("   JPEG品質%s: %.1fKB", quality, size_bytes / 1024)
 
         if size_bytes <= config["size_limit"]:
-            logger.info(f"✅ 品質{quality}で {config['size_limit'] / 1024:.0f}KB 以下に圧縮: {size_bytes / 1024:.1f}KB")
-            return jpeg_data
+            # 上限以下 → より高い品質を試す
+            best_data, best_quality = jpeg_data, quality
+            low = mid + 1
+        else:
+            # 上限超過 → より低い品質を試す
+            high = mid - 1
+
+    if best_data is not None:
+        logger.info(f"✅ 品質{best_quality}で {config['size_limit'] / 1024:.0f}KB 以下に圧縮: {len(best_data) / 1024:.1f}KB")
+        return best_data
 
-    # すべての品質レベルでも上限を超えた
-    logger.error(f"❌ 品質{quality_levels[-1]}でも {config['size_limit'] / 1024:.0f}KB を超えています")
+    # 最低品質でも上限を超えた
+    logger.error(f"❌ 品質{quality_levels[0]}でも {config['size_limit'] / 1024:.0f}KB を超えています")
     return None
 
 
@@ -0,0 +1,85 @@
+﻿# -*- coding: utf-8 -*-
+
+"""
+Stream notify on Bluesky - v3 ログの振り替え（コンテキスト単位）
+
+database / image_manager など共通モジュールのログを、呼び出し元の処理
+（YouTube 取り込み・ニコニコ取り込みなど）のロガーに振り替える。
+
+以前はモジュール変数 logger を一時的に差し替えていたが、差し替えはプロセス全体に効くため、
+GUI スレッド・ニコニコ監視スレッド・スケジューラが同時に動くと別スレッドのログまで
+振り替わったり、元に戻す順序が入れ替わって誤ったロガーが残ったりしていた。
+
+- route_module_logs(): with ブロック内で出力されたログだけを振り替える。
+  振り替え先は contextvars で保持するため、スレッド（コンテキスト）ごとに独立している
+- ModuleLogRouter: 元のロガーに付けるフィルター。振り替え中のレコードを振り替え先ロガーの
+  ハンドラーに渡し、元のロガーでは出力しない
+
+新しいスレッドや ThreadPoolExecutor のワーカーは振り替えなしの状態で始まる。
+ワーカー側でも振り替えたい場合は、ワーカー内で route_module_logs() を使うこと。
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import FrozenSet, Iterable, Optional, Tuple
+
+__author__ = "mayuneco(mayunya)"
+__copyright__ = "Copyright (C) 2025 mayuneco(mayunya)"
+__license__ = "GPLv2"
+
+# 振り替え対象の共通モジュール（LogRecord.module の値）
+ROUTABLE_MODULES = ("database", "image_manager")
+
+# (振り替え先ロガー名, 対象モジュール) / 振り替えなしは None
+_current_route: ContextVar[Optional[Tuple[str, FrozenSet[str]]]] = ContextVar("log_route", default=None)
+
+
+@contextmanager
+def route_module_logs(logger_name: str, modules: Iterable[str] = ROUTABLE_MODULES):
+    """
+    with ブロック内で modules が出力したログを logger_name のロガーに振り替える
+
+    Args:
+        logger_name: 振り替え先のロガー名（例: "YouTubeLogger"）
+        modules: 振り替え対象のモジュール名（既定: database, image_manager）
+    """
+    token = _current_route.set((logger_name, frozenset(modules)))
+    try:
+        yield
+    finally:
+        _current_route.reset(token)
+
+
+def current_route() -> Optional[str]:
+    """現在のコンテキストの振り替え先ロガー名（振り替えなしは None）"""
+    route = _current_route.get()
+    return route[0] if route else None
+
+
+class ModuleLogRouter(logging.Filter):
+    """振り替え中のレコードを振り替え先ロガーに渡すフィルター（元のロガーに付ける）"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        route = _current_route.get()
+        if route is None:
+            return True
+        logger_name, modules = route
+        if record.module not in modules or record.name == logger_name:
+            return True
+
+        target = logging.getLogger(logger_name)
+        if target.isEnabledFor(record.levelno):
+            # 元のロガーでは出力しないので、レコードをそのまま振り替え先の名前で渡す
+            record.name = logger_name
+            target.handle(record)
+        return False
+
+
+_router = ModuleLogRouter()
+
+
+def install_module_log_router(logger: logging.Logger) -> None:
+    """共通モジュールのロガーに振り替え用フィルターを付ける（重複して付けない）"""
+    if _router not in logger.filters:
+        logger.addFilter(_router)
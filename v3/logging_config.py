@@ -5,14 +5,23 @@ Stream notify on Bluesky - v3 ロギング設定
 
 ロギングの設定を一元管理するモジュール。
 ロギングプラグインが導入されている場合は、そちらの設定を優先的に使用。
+
+設定したロガーのハンドラはキュー（QueueHandler / QueueListener）経由に切り替え、
+ファイル書き込みは専用スレッドでまとめて行う（LOG_QUEUE_ENABLED=false で無効化）。
+- 溜まったレコードの書き込み・flush は LOG_FLUSH_INTERVAL 秒ごと（ERROR 以上は即座に書き込み・flush）
+- 呼び出し側のスレッドはメッセージの組み立てとキューへの追加のみ行う
 """
 
 
 
+import atexit
 import os
+import queue
 import sys
+import threading
 import logging
-from logging.handlers import RotatingFileHandler
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 
@@ -32,10 +41,21 @@ class NoExcInfoStreamHandler(logging.StreamHandler):
 # --- CRLF→LF対応: LFでファイルを開くRotatingFileHandler ---
 import io
 class LFRotatingFileHandler(RotatingFileHandler):
+    # True の間は emit ごとの flush を行わない（キュー経由時に QueueListener が定期的に flush する）
+    buffered = False
+
     def _open(self):
         # encoding, errors, newline を明示的に指定
         return open(self.baseFilename, self.mode, encoding=self.encoding, errors=self.errors, newline='\n')
 
+    def flush(self):
+        if not self.buffered:
+            super().flush()
+
+    def force_flush(self):
+        """buffered の設定に関わらずストリームを書き出す"""
+        super().flush()
+
 __author__ = "mayuneco(mayunya)"
 __copyright__ = "Copyright (C) 2025 mayuneco(mayunya)"
 __license__ = "GPLv2"
@@ -82,6 +102,9 @@ def setup_logging(debug_mode=False):
     Returns:
         logging.Logger: 設定済みのAppLoggerインスタンス
     """
+    # 再設定時は一旦キュー経由の出力を止め、元のハンドラに戻してから設定する
+    stop_queue_logging()
+
     # まずロギングプラグインの読み込みを試みる
     logging_plugin = _try_load_logging_plugin()
 
@@ -95,6 +118,7 @@ def setup_logging(debug_mode=False):
         if debug_mode:
             _apply_debug_mode(logger)
 
+        start_queue_logging()
         return logger
 
     # プラグインが利用できない場合は、デフォルトのシンプルな設定を使用
@@ -115,6 +139,7 @@ def setup_logging(debug_mode=False):
             post_logger.addHandler(handler)
 
         post_logger.propagate = False
+        start_queue_logging()
         return logger
 
 
@@ -199,6 +224,7 @@ def setup_logging(debug_mode=False):
     logger.info(f"ℹ️  {mode_msg}を使用しています")
     logger.debug(f"🔧 複数ロガーを初期化しました: {', '.join(loggers_to_setup)}")
 
+    start_queue_logging()
     return logger
 
 
@@ -238,3 +264,192 @@ def _apply_debug_mode(logger):
             target_logger.setLevel(logging.DEBUG)
 
     logger.debug("🔍 デバッグモードが有効になりました")
+
+
+# ============ キュー経由のロギング（非同期・まとめ書き） ============
+
+DEFAULT_LOG_FLUSH_INTERVAL = 1.0  # ファイルへの flush 間隔（秒）
+
+_queue_listener = None
+_queue_routes = {}  # {ロガー名: キュー化する前のハンドラのリスト}
+_queue_lock = threading.Lock()
+
+
+class _RoutingQueueHandler(QueueHandler):
+    """ロガーごとのハンドラへ振り分けられるよう、ロガー名を付けてキューに入れる"""
+
+    def __init__(self, log_queue, route: str, wake_event: threading.Event):
+        super().__init__(log_queue)
+        self.route = route
+        self.wake_event = wake_event
+
+    def prepare(self, record):
+        # メッセージの組み立て（% 形式の引数の展開）だけ呼び出し元で行う
+        # exc_info は残し、トレースバックの整形はハンドラ側（コンソールでは抑制）に任せる
+        # 伝播先の別ロガーでも同じレコードが使われるため、属性はコピーに設定する
+        prepared = logging.LogRecord.__new__(logging.LogRecord)
+        prepared.__dict__.update(record.__dict__)
+        prepared.msg = record.getMessage()
+        prepared.args = None
+        prepared.log_route = self.route
+        return prepared
+
+    def handle(self, record):
+        # キューへの追加はスレッドセーフなので、ハンドラのロックは取らない
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record):
+        try:
+            self.enqueue(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+            return
+        # ERROR 以上はリスナーをすぐに起こす（それ以外は次のまとめ書きまで待つ）
+        if record.levelno >= logging.ERROR:
+            self.wake_event.set()
+
+
+class _BufferedQueueListener(QueueListener):
+    """
+    キューに溜まったレコードを flush_interval 秒ごとにまとめて元のハンドラで出力し、flush する
+
+    レコードごとにリスナーのスレッドを起こさないため、呼び出し元のスレッドの処理を妨げない。
+    ERROR 以上のレコードと停止要求はすぐにリスナーを起こし、出力直後に flush する。
+    """
+
+    def __init__(self, log_queue, routes: dict, flush_interval: float, wake_event: threading.Event):
+        handlers = []
+        for route_handlers in routes.values():
+            for handler in route_handlers:
+                if handler not in handlers:
+                    handlers.append(handler)
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.routes = routes
+        self.flush_interval = flush_interval
+        self.wake_event = wake_event
+        self._pending = deque()
+
+    def dequeue(self, block):
+        while not self._pending:
+            if not block:
+                return self.queue.get_nowait()
+            self.wake_event.wait(self.flush_interval)
+            self.wake_event.clear()
+            try:
+                while True:
+                    self._pending.append(self.queue.get_nowait())
+            except queue.Empty:
+                pass
+        return self._pending.popleft()
+
+    def enqueue_sentinel(self):
+        super().enqueue_sentinel()
+        self.wake_event.set()
+
+    def handle(self, record):
+        for handler in self.routes.get(getattr(record, "log_route", None), ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+        # 取り出した分を出力し終えた時点、または ERROR 以上の出力直後に flush
+        if not self._pending or record.levelno >= logging.ERROR:
+            self.flush()
+
+    def flush(self):
+        for handler in self.handlers:
+            try:
+                getattr(handler, "force_flush", handler.flush)()
+            except Exception:
+                pass
+
+
+def start_queue_logging(flush_interval: float = None) -> bool:
+    """
+    ハンドラを持つロガーをキュー経由の出力に切り替える
+
+    各ロガーのハンドラを QueueHandler 1つに置き換え、元のハンドラは QueueListener の
+    スレッドから呼び出す。ファイルハンドラは emit ごとの flush をやめ、flush_interval 秒ごとに flush する。
+
+    Args:
+        flush_interval: flush 間隔（秒、省略時は LOG_FLUSH_INTERVAL 環境変数、既定 1.0 秒）
+
+    Returns:
+        切り替えた場合 True（LOG_QUEUE_ENABLED=false の場合は False）
+    """
+    global _queue_listener
+
+    if os.getenv("LOG_QUEUE_ENABLED", "true").strip().lower() in ("false", "0", "no"):
+        return False
+
+    if flush_interval is None:
+        try:
+            flush_interval = float(os.getenv("LOG_FLUSH_INTERVAL", DEFAULT_LOG_FLUSH_INTERVAL))
+        except ValueError:
+            flush_interval = DEFAULT_LOG_FLUSH_INTERVAL
+    flush_interval = max(flush_interval, 0.05)
+
+    with _queue_lock:
+        if _queue_listener is not None:
+            return True
+
+        loggers = [logging.getLogger()] + [
+            item for item in logging.Logger.manager.loggerDict.values()
+            if isinstance(item, logging.Logger)
+        ]
+        log_queue = queue.SimpleQueue()
+        wake_event = threading.Event()
+        routes = {}
+        for target in loggers:
+            if not target.handlers:
+                continue
+            routes[target.name] = list(target.handlers)
+            for handler in target.handlers:
+                if hasattr(handler, "buffered"):
+                    handler.buffered = True
+            target.handlers = [_RoutingQueueHandler(log_queue, target.name, wake_event)]
+
+        if not routes:
+            return False
+
+        _queue_routes.update(routes)
+        _queue_listener = _BufferedQueueListener(log_queue, routes, flush_interval, wake_event)
+        _queue_listener.start()
+
+    try:
+        from metrics import QUEUE_DEPTH
+        QUEUE_DEPTH.set_function(log_queue.qsize, queue="log_records")
+    except ImportError:
+        pass
+
+    logging.getLogger("AppLogger").debug(
+        "🔧 キュー経由のロギングを開始しました（%d ロガー、flush 間隔 %.2f 秒）", len(routes), flush_interval
+    )
+    return True
+
+
+def stop_queue_logging() -> None:
+    """キュー経由のロギングを停止（残りのレコードを出力・flush し、元のハンドラに戻す）"""
+    global _queue_listener
+
+    with _queue_lock:
+        if _queue_listener is None:
+            return
+        _queue_listener.stop()
+        _queue_listener.flush()
+        _queue_listener = None
+
+        for name, handlers in _queue_routes.items():
+            target = logging.getLogger(name) if name != "root" else logging.getLogger()
+            for handler in handlers:
+                if hasattr(handler, "buffered"):
+                    handler.buffered = False
+            target.handlers = handlers
+        _queue_routes.clear()
+
+
+atexit.register(stop_queue_logging)
@@ -8,6 +8,7 @@ DB に収集。投稿対象は GUI で選択。
 収集モード時は投稿なし。
 
 GUI はマルチスレッドで動作（メインループは継続）
+--headless 指定時は GUI（tkinter / gui_v3 / unified_settings_window）を一切読み込まずに常駐する
 """
 
 import sys
@@ -15,8 +16,8 @@ import os
 import time
 import signal
 import logging
+import argparse
 import threading
-import tkinter as tk
 import gc
 from datetime import datetime, timedelta, timezone
 
@@ -33,10 +34,10 @@ from config import OperationMode
 from asset_manager import get_asset_manager
 
 # ロギング設定
-from logging_config import setup_logging
+from logging_config import setup_logging, stop_queue_logging
 
-# GUI クラスをインポート
-from gui_v3 import StreamNotifyGUI
+# メトリクス
+from metrics import POLL_CYCLE_SECONDS
 
 logger = None  # グローバル変数として後で初期化
 gui_instance = None  # GUI インスタンスをグローバルで保持（プラグイン判定後のリロード用）
@@ -50,6 +51,10 @@ def run_gui(db, plugin_manager, stop_event, bluesky_core=None):
     """GUI をスレッドで実行 (プラグイン対応)"""
     global gui_instance
 
+    # GUI スタックは管理画面を開くときだけ読み込む（ヘッドレスモードでは読み込まない）
+    import tkinter as tk
+    from gui_v3 import StreamNotifyGUI
+
     root = tk.Tk()
     gui_instance = StreamNotifyGUI(root, db, plugin_manager, bluesky_core=bluesky_core)
 
@@ -90,14 +95,51 @@ def run_gui(db, plugin_manager, stop_event, bluesky_core=None):
         gui_instance = None
 
 
+def warm_up_caches(classifier, plugin_manager):
+    """起動後にバックグラウンドでキャッシュファイルを読み込む（初回ポーリングと並行して実行）"""
+    targets = [classifier, plugin_manager.loaded_plugins.get("youtube_api_plugin")]
+    for target in targets:
+        if target is None or not hasattr(target, "warm_up"):
+            continue
+        try:
+            started = time.monotonic()
+            target.warm_up()
+            logger.debug(f"🔥 キャッシュ事前読み込み完了: {type(target).__name__}（{time.monotonic() - started:.2f} 秒）")
+        except Exception as e:
+            logger.debug(f"⚠️ キャッシュ事前読み込みに失敗（初回参照時に再試行）: {e}")
+
+
+def on_template_config_changed(config, changed_keys: set) -> None:
+    """テンプレート設定の変更時のみ template_utils（Jinja2）を読み込んで通知"""
+    if any(key.startswith("TEMPLATE_") for key in changed_keys):
+        from template_utils import on_config_changed
+        on_config_changed(config, changed_keys)
+
+
+def parse_args(argv=None):
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="StreamNotify on Bluesky v3")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="管理画面（GUI）を起動せずにサービスとして動作する",
+    )
+    return parser.parse_args(argv)
+
+
 def signal_handler(signum, frame):
     """シグナルハンドラ"""
     logger.info("\n[INFO] 管理画面が閉じられたためアプリケーションを終了します...")
     sys.exit(0)
 
 
-def main():
-    """メインエントリポイント (v3: プラグインアーキテクチャ対応)"""
+def main(headless: bool = False):
+    """
+    メインエントリポイント (v3: プラグインアーキテクチャ対応)
+
+    Args:
+        headless: True の場合は GUI を起動しない（GUI 関連モジュールも読み込まない）
+    """
     global logger
     global gui_instance
 
@@ -340,10 +382,39 @@ def main():
     else:
         logger.info("ニコニコプラグインが導入されていないため、ニコニコ関連機能は無効化されます。")
 
+    # ★ 設定のホットリロード: settings.env の変更を監視し、プラグイン・テンプレートキャッシュに通知
+    # （ポーリング間隔・AUTOPOST フィルター等は同じ Config インスタンスが更新されるため次回参照時に反映）
+    try:
+        config.subscribe(plugin_manager.notify_config_changed)
+        config.subscribe(on_template_config_changed)
+        config.start_watching()
+    except Exception as e:
+        logger.warning(f"⚠️ 設定ファイルの監視を開始できませんでした（再起動で反映されます）: {e}")
+
+    # 動画詳細キャッシュの読み込みは初回ポーリングと並行してバックグラウンドで行う
+    threading.Thread(
+        target=warm_up_caches, args=(classifier, plugin_manager), name="CacheWarmUp", daemon=True
+    ).start()
+
     stop_event = threading.Event()
-    gui_thread = threading.Thread(target=run_gui, args=(db, plugin_manager, stop_event, bluesky_core), daemon=True)
-    gui_thread.start()
-    logger.info("✅ アプリケーションの起動が完了しました。 管理画面を開きます。")
+    gui_thread = None
+    if headless:
+        logger.info("✅ アプリケーションの起動が完了しました。 ヘッドレスモードで動作します（管理画面なし）。")
+    else:
+        gui_thread = threading.Thread(target=run_gui, args=(db, plugin_manager, stop_event, bluesky_core), daemon=True)
+        gui_thread.start()
+        logger.info("✅ アプリケーションの起動が完了しました。 管理画面を開きます。")
+
+    # ローカル制御 API（CONTROL_API_ENABLED 未設定時はヘッドレスモードのみ有効）
+    runtime_status = {"headless": headless, "polling_count": 0, "last_poll_at": None}
+    control_api = None
+    if config.control_api_enabled or (config.control_api_enabled is None and headless):
+        from control_api import create_control_api_server
+        control_api = create_control_api_server(
+            db, plugin_manager, config, stop_event=stop_event, status_provider=lambda: dict(runtime_status)
+        )
+        if not control_api.start():
+            control_api = None
 
     polling_count = 0
     last_post_time = None
@@ -374,6 +445,8 @@ def main():
     try:
         while not stop_event.is_set():
             polling_count += 1
+            cycle_started = time.perf_counter()
+            runtime_status.update(polling_count=polling_count, last_poll_at=datetime.now().isoformat(timespec="seconds"))
             logger.info(f"\n=== ポーリング #{polling_count} ===")
             logger.info(f"実行時刻: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
@@ -551,10 +624,14 @@ def main():
                     logger.warning(f"⚠️  動的ポーリング間隔決定エラー（デフォルト使用）: {e}")
                     next_live_poll_interval = config.poll_interval_minutes
 
+            POLL_CYCLE_SECONDS.observe(time.perf_counter() - cycle_started)
+
             # 待機時間を計算（次回 RSS/WebSub ポーリングの時刻）
             logger.info(f"次のポーリング（RSS/WebSub）まで {config.poll_interval_minutes} 分待機中...")
             # 待機中も stop_event をチェック（1秒間隔）
-            for _ in range(config.poll_interval_minutes * 60):
+            # ポーリング間隔は毎秒参照し直す（待機中の設定変更も反映）
+            wait_started = time.monotonic()
+            while time.monotonic() - wait_started < config.poll_interval_minutes * 60:
                 if stop_event.is_set():
                     raise KeyboardInterrupt()
                 time.sleep(1)
@@ -579,7 +656,8 @@ def main():
         logger.info("🛑 アプリケーションをシャットダウン中...")
         stop_event.set()
         gui_instance = None  # GUI インスタンスをクリア
-        gui_thread.join(timeout=5)  # GUI スレッドの終了を待つ（最大5秒）
+        if gui_thread:
+            gui_thread.join(timeout=5)  # GUI スレッドの終了を待つ（最大5秒）
         gc.collect()  # 強制ガベージコレクション
         sys.exit(0)
     except Exception as e:
@@ -595,13 +673,23 @@ def main():
         logger.info("🛑 アプリケーションをシャットダウン中...")
         stop_event.set()
         gui_instance = None  # GUI インスタンスをクリア
-        gui_thread.join(timeout=5)  # GUI スレッドの終了を待つ（最大5秒）
+        if gui_thread:
+            gui_thread.join(timeout=5)  # GUI スレッドの終了を待つ（最大5秒）
         gc.collect()  # 強制ガベージコレクション
         sys.exit(1)
+    finally:
+        if control_api:
+            control_api.stop()
+        # キューに残っているログを書き出してから終了
+        stop_queue_logging()
 
 
 if __name__ == "__main__":
+    args = parse_args()
     signal.signal(signal.SIGINT, signal_handler)
     if sys.platform.startswith('win'):
         signal.signal(signal.SIGBREAK, signal_handler)
-    main()
+    else:
+        # サービスとして常駐させた場合（systemd など）の停止要求
+        signal.signal(signal.SIGTERM, signal_handler)
+    main(headless=args.headless)
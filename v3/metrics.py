@@ -0,0 +1,415 @@
+﻿# -*- coding: utf-8 -*-
+
+"""
+Stream notify on Bluesky - v3 メトリクス
+
+ポーリング 1 周期の時間配分や API コストを把握するためのプロセス内メトリクス。
+Prometheus のテキスト形式（制御 API の GET /metrics）と GUI のメトリクスパネルで参照する。
+
+- Counter（累計値）/ Gauge（現在値）/ Histogram（所要時間・サイズの分布）の3種類
+- ラベルはキーワード引数で指定する（例: FEED_FETCH_SECONDS.observe(0.3, source="youtube")）
+- 外部ライブラリには依存しない（記録はロック1回 + 加算のみ）
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+__author__ = "mayuneco(mayunya)"
+__copyright__ = "Copyright (C) 2025 mayuneco(mayunya)"
+__license__ = "GPLv2"
+
+METRIC_PREFIX = "streamnotify_"
+
+# 所要時間（秒）のバケット境界
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# サイズ（バイト）のバケット境界
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 524288, 1048576, 2097152, 4194304)
+
+
+class _Metric:
+    """メトリクスの基底クラス（ラベル値の組ごとに値を保持）"""
+
+    metric_type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: ラベルが一致しません（必要: {self.labelnames}、指定: {tuple(labels)}）")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def clear(self) -> None:
+        """記録済みの値をすべて破棄"""
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> List[Tuple[Dict[str, str], Any]]:
+        """(ラベル辞書, 値) のスナップショット"""
+        with self._lock:
+            items = list(self._values.items())
+        return [(dict(zip(self.labelnames, key)), _copy_value(value)) for key, value in items]
+
+
+class Counter(_Metric):
+    """単調増加する累計値"""
+
+    metric_type = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        if amount < 0:
+            raise ValueError(f"{self.name}: Counter は減算できません")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    """増減する現在値（キュー長など）"""
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._functions: Dict[Tuple[str, ...], Callable[[], float]] = {}
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set_function(self, func: Callable[[], float], **labels) -> None:
+        """参照時に func() を呼んで値を取得する（キューの長さなど、記録側で更新しにくい値向け）"""
+        key = self._key(labels)
+        with self._lock:
+            self._functions[key] = func
+
+    def get(self, **labels) -> float:
+        key = self._key(labels)
+        with self._lock:
+            func = self._functions.get(key)
+            if func is None:
+                return self._values.get(key, 0)
+        return func()
+
+    def samples(self) -> List[Tuple[Dict[str, str], Any]]:
+        result = super().samples()
+        with self._lock:
+            functions = list(self._functions.items())
+        for key, func in functions:
+            try:
+                value = func()
+            except Exception:
+                continue
+            result.append((dict(zip(self.labelnames, key)), value))
+        return result
+
+
+class Histogram(_Metric):
+    """所要時間・サイズの分布（累積バケット + 合計 + 件数）"""
+
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0, "max": 0.0}
+                self._values[key] = state
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state["buckets"][i] += 1
+                    break
+            state["sum"] += value
+            state["count"] += 1
+            state["max"] = max(state["max"], value)
+
+    @contextmanager
+    def time(self, **labels):
+        """with ブロックの所要時間（秒）を記録"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+
+def _copy_value(value):
+    if isinstance(value, dict):
+        return {**value, "buckets": list(value["buckets"])}
+    return value
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str], extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(labels.items())
+    if extra:
+        items.append(extra)
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label_value(str(v))}"' for k, v in items) + "}"
+
+
+def _format_number(value: float) -> str:
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(value)
+    return str(value)
+
+
+def _quantile_from_counts(quantile: float, bounds, counts, total: int, maximum: float) -> float:
+    """
+    バケットの件数（累積ではない）から分位点を推定（Prometheus の histogram_quantile と同じ線形補間）
+
+    total は全件数（最後のバケットを超えた観測値を含む）。超えた分は最後の境界〜最大値の区間として扱う。
+    """
+    if total == 0:
+        return maximum
+    rank = quantile * total
+    cumulative = 0
+    lower = 0.0
+    for bound, count in zip(bounds, counts):
+        if count and cumulative + count >= rank:
+            upper = min(bound, maximum)
+            return lower + (upper - lower) * ((rank - cumulative) / count)
+        cumulative += count
+        lower = bound
+    # 最後のバケットを超えた分（オーバーフロー）
+    overflow = total - cumulative
+    if overflow <= 0:
+        return maximum
+    return lower + (maximum - lower) * min(1.0, (rank - cumulative) / overflow)
+
+
+class MetricsRegistry:
+    """メトリクスの登録・出力"""
+
+    def __init__(self, prefix: str = METRIC_PREFIX):
+        self.prefix = prefix
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def _register(self, cls, name: str, documentation: str, labelnames, **kwargs) -> _Metric:
+        full_name = self.prefix + name
+        with self._lock:
+            metric = self._metrics.get(full_name)
+            if metric is None:
+                metric = cls(full_name, documentation, tuple(labelnames), **kwargs)
+                self._metrics[full_name] = metric
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"メトリクス {full_name} は別の種類・ラベルで登録済みです")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames=(), buckets=LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def metrics(self) -> List[_Metric]:
+        with self._lock:
+            return list(self._metrics.values())
+
+    def reset(self) -> None:
+        """記録済みの値をすべて破棄（登録は維持）"""
+        for metric in self.metrics():
+            metric.clear()
+        self.started_at = time.time()
+
+    def render_prometheus(self) -> str:
+        """Prometheus テキスト形式（version 0.0.4）で出力"""
+        lines = []
+        for metric in sorted(self.metrics(), key=lambda m: m.name):
+            samples = metric.samples()
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+            for labels, value in sorted(samples, key=lambda s: sorted(s[0].items())):
+                if isinstance(metric, Histogram):
+                    cumulative = 0
+                    for bound, count in zip(metric.buckets, value["buckets"]):
+                        cumulative += count
+                        lines.append(f"{metric.name}_bucket{_format_labels(labels, ('le', _format_number(float(bound))))} {cumulative}")
+                    lines.append(f"{metric.name}_bucket{_format_labels(labels, ('le', '+Inf'))} {value['count']}")
+                    lines.append(f"{metric.name}_sum{_format_labels(labels)} {_format_number(float(value['sum']))}")
+                    lines.append(f"{metric.name}_count{_format_labels(labels)} {value['count']}")
+                else:
+                    lines.append(f"{metric.name}{_format_labels(labels)} {_format_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        GUI・JSON 向けのスナップショット
+
+        Returns:
+            [{"name", "type", "labels", "value"（Counter/Gauge）
+              または "count", "sum", "avg", "p50", "p99", "max"（Histogram）}, ...]
+        """
+        rows = []
+        for metric in sorted(self.metrics(), key=lambda m: m.name):
+            for labels, value in sorted(metric.samples(), key=lambda s: sorted(s[0].items())):
+                row = {"name": metric.name[len(self.prefix):], "type": metric.metric_type, "labels": labels}
+                if isinstance(metric, Histogram):
+                    count = value["count"]
+                    row.update(
+                        count=count,
+                        sum=value["sum"],
+                        avg=value["sum"] / count if count else 0.0,
+                        p50=_quantile_from_counts(0.5, metric.buckets, value["buckets"], count, value["max"]),
+                        p99=_quantile_from_counts(0.99, metric.buckets, value["buckets"], count, value["max"]),
+                        max=value["max"],
+                    )
+                else:
+                    row["value"] = value
+                rows.append(row)
+        return rows
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """MetricsRegistry インスタンスを取得（シングルトン）"""
+    return _registry
+
+
+# ============ 標準メトリクス ============
+
+FEED_FETCH_SECONDS = _registry.histogram(
+    "feed_fetch_seconds", "RSS/Atom フィード取得の所要時間（秒）", ("source",))
+FEED_FETCH_BYTES = _registry.histogram(
+    "feed_fetch_bytes", "RSS/Atom フィードの受信サイズ（バイト）", ("source",), buckets=SIZE_BUCKETS)
+FEED_FETCH_TOTAL = _registry.counter(
+    "feed_fetch_total", "RSS/Atom フィード取得回数（HTTP ステータス別、304 は未更新）", ("source", "status"))
+
+DB_QUERY_SECONDS = _registry.histogram(
+    "db_query_seconds", "Database メソッドの所要時間（秒）", ("method",))
+
+CLASSIFIER_CACHE_TOTAL = _registry.counter(
+    "classifier_cache_total", "動画分類器の詳細キャッシュ参照（hit / miss / expired）", ("result",))
+
+YOUTUBE_QUOTA_UNITS_TOTAL = _registry.counter(
+    "youtube_quota_units_total", "YouTube Data API のクォータ消費（ユニット）", ("caller", "operation"))
+
+BLUESKY_REQUEST_SECONDS = _registry.histogram(
+    "bluesky_request_seconds", "Bluesky XRPC 呼び出しの所要時間（秒）", ("operation", "outcome"))
+BLUESKY_UPLOAD_BYTES = _registry.histogram(
+    "bluesky_upload_bytes", "Bluesky にアップロードした画像のサイズ（バイト）", (), buckets=SIZE_BUCKETS)
+
+IMAGE_ENCODE_SECONDS = _registry.histogram(
+    "image_encode_seconds", "投稿用画像のリサイズ・JPEG エンコードの所要時間（秒）", ("cache",))
+IMAGE_ENCODE_BYTES = _registry.histogram(
+    "image_encode_bytes", "投稿用画像のエンコード後サイズ（バイト）", (), buckets=SIZE_BUCKETS)
+
+PLUGIN_POST_SECONDS = _registry.histogram(
+    "plugin_post_seconds", "プラグインごとの投稿処理（画像アップロード含む）の所要時間（秒）", ("plugin", "outcome"))
+
+POLL_CYCLE_SECONDS = _registry.histogram(
+    "poll_cycle_seconds", "メインループのポーリング 1 周期（待機を除く）の所要時間（秒）", ())
+
+QUEUE_DEPTH = _registry.gauge(
+    "queue_depth", "処理待ちの件数（キュー別）", ("queue",))
+
+
+def summarize() -> Dict[str, Any]:
+    """
+    調整の目安になる派生値（GUI のメトリクスパネル用）
+
+    Returns:
+        {"feed_fetches", "feed_not_modified_ratio", "classifier_cache_hit_rate",
+         "youtube_quota_units", "poll_cycles", "poll_cycle_avg_seconds"}
+        （比率は対象の記録がない場合 None）
+    """
+    fetches = FEED_FETCH_TOTAL.samples()
+    fetch_total = sum(value for _, value in fetches)
+    not_modified = sum(value for labels, value in fetches if labels["status"] == "304")
+
+    cache = {labels["result"]: value for labels, value in CLASSIFIER_CACHE_TOTAL.samples()}
+    cache_total = sum(cache.values())
+
+    cycles = [value for _, value in POLL_CYCLE_SECONDS.samples()]
+    cycle_count = sum(v["count"] for v in cycles)
+    cycle_sum = sum(v["sum"] for v in cycles)
+
+    return {
+        "feed_fetches": fetch_total,
+        "feed_not_modified_ratio": not_modified / fetch_total if fetch_total else None,
+        "classifier_cache_hit_rate": cache.get("hit", 0) / cache_total if cache_total else None,
+        "youtube_quota_units": sum(value for _, value in YOUTUBE_QUOTA_UNITS_TOTAL.samples()),
+        "poll_cycles": cycle_count,
+        "poll_cycle_avg_seconds": cycle_sum / cycle_count if cycle_count else None,
+    }
+
+
+def record_feed_fetch(source: str, feed, seconds: float) -> None:
+    """
+    feedparser.parse() の結果から取得時間・サイズ・HTTP ステータスを記録
+
+    サイズは Content-Length ヘッダーから取得する（ヘッダーがない場合は記録しない）。
+    """
+    status = getattr(feed, "get", lambda *_: None)("status") or "error"
+    FEED_FETCH_SECONDS.observe(seconds, source=source)
+    FEED_FETCH_TOTAL.inc(source=source, status=status)
+    headers = getattr(feed, "get", lambda *_: None)("headers") or {}
+    try:
+        length = int(headers.get("content-length", ""))
+    except (TypeError, ValueError):
+        return
+    FEED_FETCH_BYTES.observe(length, source=source)
+
+
+def instrument_methods(cls, histogram: Histogram = DB_QUERY_SECONDS, label: str = "method"):
+    """
+    クラスの公開メソッドをすべて計測対象にする（所要時間を histogram に記録）
+
+    Database のように「1メソッド = 1クエリ」のクラスで、メソッドごとの所要時間を取るために使用。
+    アンダースコアで始まるメソッド・特殊メソッドは対象外。
+    """
+    import functools
+
+    def wrap(name, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - started, **{label: name})
+        return wrapper
+
+    for name, func in list(vars(cls).items()):
+        if name.startswith("_") or not callable(func) or isinstance(func, (staticmethod, classmethod, type)):
+            continue
+        setattr(cls, name, wrap(name, func))
+    return cls
@@ -0,0 +1,185 @@
+﻿# -*- coding: utf-8 -*-
+
+"""
+Stream notify on Bluesky - ニコニコ ユーザー名キャッシュ
+
+ニコニコのユーザー ID → ユーザー名（投稿者名）を取得時刻付きで保持する。
+監視（RSS 取得）・手動追加（get_video_details）・メタデータ取得（getthumbinfo）で
+共有し、ユーザー名の解決（RSS / 静画API / ユーザーページ）を TTL 内で1回にとどめる。
+
+- 永続化は data/niconico_user_names.json（settings.env は書き換えない）
+- 有効期間は NICONICO_USER_NAME_TTL、解決できなかった結果は NICONICO_USER_NAME_NEGATIVE_TTL の間再試行しない
+- 同じユーザー ID の解決は同時に1件のみ（並行する呼び出しは結果を待って共有）
+
+JSON は以下のように構成されます:
+{
+    "12345": {"name": "ユーザー名", "source": "rss", "fetched_at": 1735000000.0},
+    "67890": {"name": null, "source": null, "fetched_at": 1735000000.0}
+}
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+logger = logging.getLogger("AppLogger")
+
+__author__ = "mayuneco(mayunya)"
+__copyright__ = "Copyright (C) 2025 mayuneco(mayunya)"
+__license__ = "GPLv2"
+
+NICONICO_USER_NAME_CACHE_FILE = "data/niconico_user_names.json"
+NICONICO_USER_NAME_TTL = 7 * 24 * 60 * 60        # ユーザー名の有効期間（秒）
+NICONICO_USER_NAME_NEGATIVE_TTL = 60 * 60        # 解決できなかった結果の有効期間（秒）
+
+# グローバル キャッシュインスタンス
+_user_name_cache = None
+_user_name_cache_lock = threading.Lock()
+
+
+class NiconicoUserNameCache:
+    """ニコニコ ユーザー名キャッシュ管理"""
+
+    def __init__(self, cache_file: str = NICONICO_USER_NAME_CACHE_FILE):
+        """
+        初期化
+
+        Args:
+            cache_file: キャッシュ JSON ファイルのパス
+        """
+        self.cache_file = Path(cache_file)
+        self.data = {}
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._resolve_locks = {}
+        self._load()
+
+    def _load(self) -> None:
+        """JSON ファイルから読み込み"""
+        if not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                self.data = json.load(f)
+            logger.debug(f"✅ ニコニコユーザー名キャッシュを読み込みました: {len(self.data)} 件")
+        except Exception as e:
+            logger.warning(f"⚠️ ニコニコユーザー名キャッシュの読み込みに失敗（リセットします）: {e}")
+            self.data = {}
+
+    def _save(self) -> None:
+        """JSON ファイルに書き込む（一時ファイル経由で置き換え）"""
+        with self._lock:
+            snapshot = json.dumps(self.data, ensure_ascii=False, indent=2)
+        with self._save_lock:
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.cache_file.with_suffix(".tmp")
+                tmp_path.write_text(snapshot, encoding="utf-8")
+                os.replace(tmp_path, self.cache_file)
+            except Exception as e:
+                logger.warning(f"⚠️ ニコニコユーザー名キャッシュの保存に失敗: {e}")
+
+    def _get_entry(self, user_id: str) -> Optional[dict]:
+        """有効期間内のエントリを取得"""
+        with self._lock:
+            entry = self.data.get(user_id)
+        if not entry:
+            return None
+        ttl = NICONICO_USER_NAME_TTL if entry.get("name") else NICONICO_USER_NAME_NEGATIVE_TTL
+        if time.time() - entry.get("fetched_at", 0) >= ttl:
+            return None
+        return entry
+
+    def get(self, user_id: str, allow_stale: bool = False) -> Optional[str]:
+        """
+        キャッシュ済みのユーザー名を取得
+
+        Args:
+            user_id: ニコニコユーザーID
+            allow_stale: True の場合は有効期限切れのユーザー名も返す
+
+        Returns:
+            ユーザー名、未取得・期限切れの場合は None
+        """
+        if not user_id:
+            return None
+        if allow_stale:
+            with self._lock:
+                entry = self.data.get(user_id) or {}
+            return entry.get("name")
+        entry = self._get_entry(user_id)
+        return entry.get("name") if entry else None
+
+    def put(self, user_id: str, name: Optional[str], source: Optional[str] = None) -> None:
+        """
+        ユーザー名を記録（name=None は「解決できなかった」として記録）
+
+        同じ名前が有効期間の半分以内に記録済みの場合はファイルに書き込まない。
+
+        Args:
+            user_id: ニコニコユーザーID
+            name: ユーザー名
+            source: 取得元（rss, seiga, user_page, thumbinfo など）
+        """
+        if not user_id:
+            return
+        now = time.time()
+        with self._lock:
+            entry = self.data.get(user_id)
+            if (
+                name
+                and entry
+                and entry.get("name") == name
+                and now - entry.get("fetched_at", 0) < NICONICO_USER_NAME_TTL / 2
+            ):
+                return
+            # 解決できなかった場合は既知の名前を残し、有効期間だけ延長する（再試行の連発を防ぐ）
+            if not name and entry and entry.get("name"):
+                entry["fetched_at"] = now
+            else:
+                self.data[user_id] = {"name": name, "source": source, "fetched_at": now}
+        self._save()
+        if name:
+            logger.debug(f"[ユーザー名キャッシュ] {user_id} -> {name} ({source})")
+
+    def resolve(self, user_id: str, lookup: Callable[[str], tuple]) -> Optional[str]:
+        """
+        ユーザー名を取得（キャッシュになければ lookup で解決して記録）
+
+        Args:
+            user_id: ニコニコユーザーID
+            lookup: lookup(user_id) -> (ユーザー名 または None, 取得元)
+
+        Returns:
+            ユーザー名（解決できない場合は None）
+        """
+        if not user_id:
+            return None
+        entry = self._get_entry(user_id)
+        if entry:
+            return entry.get("name")
+
+        with self._lock:
+            resolve_lock = self._resolve_locks.setdefault(user_id, threading.Lock())
+        with resolve_lock:
+            # 待っている間に他のスレッドが解決済みならそれを使う
+            entry = self._get_entry(user_id)
+            if entry:
+                return entry.get("name")
+
+            name, source = lookup(user_id)
+            self.put(user_id, name, source)
+            return self.get(user_id)
+
+
+def get_niconico_user_name_cache() -> NiconicoUserNameCache:
+    """NiconicoUserNameCache インスタンスを取得（シングルトン）"""
+    global _user_name_cache
+    with _user_name_cache_lock:
+        if _user_name_cache is None:
+            _user_name_cache = NiconicoUserNameCache()
+        return _user_name_cache
@@ -101,3 +101,13 @@ class NotificationPlugin(ABC):
         プラグインが無効になった時に呼ばれる（オプション）
         """
         pass
+
+    def on_config_changed(self, config, changed_keys: set) -> None:
+        """
+        settings.env が再読み込みされた時に呼ばれる（オプション）
+
+        Args:
+            config: 更新後の Config インスタンス
+            changed_keys: 変更された設定キー
+        """
+        pass
@@ -9,10 +9,12 @@ Stream notify on Bluesky - プラグインマネージャー
 import os
 import sys
 import logging
+import time
 import importlib.util
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from plugin_interface import NotificationPlugin
+from metrics import PLUGIN_POST_SECONDS
 
 logger = logging.getLogger("AppLogger")
 post_error_logger = logging.getLogger("PostErrorLogger")
@@ -315,6 +317,23 @@ class PluginManager:
         """
         return self.enabled_plugins.get(plugin_name) or self.loaded_plugins.get(plugin_name)
 
+    def notify_config_changed(self, config, changed_keys: set) -> None:
+        """
+        設定の再読み込みをロード済みプラグインに通知（Config.subscribe() に登録して使用）
+
+        Args:
+            config: 更新後の Config インスタンス
+            changed_keys: 変更された設定キー
+        """
+        for plugin_name, plugin in list(self.loaded_plugins.items()):
+            handler = getattr(plugin, "on_config_changed", None)
+            if not handler:
+                continue
+            try:
+                handler(config, changed_keys)
+            except Exception as e:
+                logger.warning(f"⚠️ プラグイン {plugin_name} への設定変更通知でエラー: {e}")
+
     def post_video_with_all_enabled(self, video: dict, dry_run: bool = False) -> Dict[str, bool]:
         """
         すべての有効なプラグインで動画をポスト
@@ -329,6 +348,7 @@ class PluginManager:
         results = {}
 
         for plugin_name, plugin in self.enabled_plugins.items():
+            started = time.perf_counter()
             try:
                 # ★ dry_run フラグをプラグインに設定
                 if hasattr(plugin, 'set_dry_run'):
@@ -336,6 +356,8 @@ class PluginManager:
 
                 success = plugin.post_video(video)
                 results[plugin_name] = success
+                outcome = "dry_run" if dry_run else ("success" if success else "skipped")
+                PLUGIN_POST_SECONDS.observe(time.perf_counter() - started, plugin=plugin_name, outcome=outcome)
 
                 # ログ出力：成功のみ記録（False はスキップ・既存と認識）
                 video_id = video.get("video_id") or video.get("id", "unknown")
@@ -348,6 +370,7 @@ class PluginManager:
             except Exception as e:
                 post_error_logger.error(f"❌ プラグイン {plugin_name} でのポスト失敗: {e}", exc_info=True)
                 results[plugin_name] = False
+                PLUGIN_POST_SECONDS.observe(time.perf_counter() - started, plugin=plugin_name, outcome="error")
 
         return results
 
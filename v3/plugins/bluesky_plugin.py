@@ -7,20 +7,22 @@ Bluesky への画像添付機能を提供する拡張プラグイン。
 bluesky_core.py のコア機能（投稿・Facet・認証・ドライラン）とは独立。
 """
 
+import importlib.util
 import logging
 import sys
 import re
 from pathlib import Path
 import os
 
-# PIL (Pillow) をインポート
-from PIL import Image
+# PIL (Pillow) は画像アップロード時にインポート（起動時間短縮のため）
+# 未導入の場合はこれまでどおりプラグインを読み込まない
+if importlib.util.find_spec("PIL") is None:
+    raise ImportError("Pillow (PIL) がインストールされていません")
 
 # 親ディレクトリをパスに追加（image_manager.pyをインポートするため）
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from image_manager import get_image_manager
-from bluesky_core import BlueskyMinimalPoster
-from image_processor import resize_image
+from bluesky_core import BlueskyMinimalPoster, xrpc_post
 
 logger = logging.getLogger("AppLogger")
 post_logger = logging.getLogger("PostLogger")
@@ -31,20 +33,11 @@ __license__ = "GPLv2"
 
 
 # settings.env から値を取得する簡易関数
-def get_env_setting(key: str, default: str = None) -> str:
-    env_path = Path(__file__).parent.parent / "settings.env"
-    if not env_path.exists():
-        return default
+def get_env_setting(key: str, default=None):
+    """settings.env から設定値を取得（汎用関数・設定スナップショット経由）"""
     try:
-        with open(env_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                if '=' in line:
-                    k, v = line.split('=', 1)
-                    if k.strip() == key:
-                        return v.strip()
+        from config import get_setting
+        return get_setting(key, default)
     except Exception as e:
         logger.warning(f"⚠️ 設定ファイル読み込み失敗: {e}")
     return default
@@ -82,25 +75,6 @@ def _load_image_resize_config():
 
 # 画像処理ロジックは image_processor モジュールで実装
 
-def get_env_setting(key: str, default=None):
-    """settings.env から設定値を取得（汎用関数）"""
-    try:
-        settings_path = Path("settings.env")
-        if not settings_path.exists():
-            return default
-        with open(settings_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if not line or line.startswith('#'):
-                    continue
-                if '=' in line:
-                    k, v = line.split('=', 1)
-                    if k.strip() == key:
-                        return v.strip()
-    except Exception as e:
-        logger.warning(f"⚠️ 設定ファイル読み込み失敗: {e}")
-    return default
-
-
 from plugin_interface import NotificationPlugin
 
 
@@ -134,7 +108,7 @@ class BlueskyImagePlugin(NotificationPlugin):
         プラグインマネージャー経由で実行される場合にのみ使用されます。
         """
         # ★ メソッド入り口で入力値をチェック
-        post_logger.info(f"📥 【post_video() 入力値】 classification_type={video.get('classification_type')}, content_type={video.get('content_type')}, live_status={video.get('live_status')}, event_type={video.get('event_type')}")
+        post_logger.info("📥 【post_video() 入力値】 classification_type=%s, content_type=%s, live_status=%s, event_type=%s", video.get('classification_type'), video.get('content_type'), video.get('live_status'), video.get('event_type'))
         # ★ classification_type が None の場合、content_type から直接自動判定（v3.3.0+）
         # content_type は既に 5カテゴリに分類されている：video, archive, schedule, live, completed
         if not video.get('classification_type') and video.get('content_type'):
@@ -143,11 +117,11 @@ class BlueskyImagePlugin(NotificationPlugin):
             # content_type を classification_type に設定（1:1マッピング）
             if content_type in ('video', 'archive', 'schedule', 'live', 'completed'):
                 video['classification_type'] = content_type
-                post_logger.info(f"✅ 【自動判定】 content_type='{content_type}' → classification_type='{content_type}'")
+                post_logger.info("✅ 【自動判定】 content_type='%s' → classification_type='%s'", content_type, content_type)
             else:
                 # 不明な content_type はデフォルト 'video' に
                 video['classification_type'] = 'video'
-                post_logger.info(f"✅ 【自動判定】 content_type='{content_type}' → classification_type='video' (デフォルト)")
+                post_logger.info("✅ 【自動判定】 content_type='%s' → classification_type='video' (デフォルト)", content_type)
 
         # ========== YouTube Live 投稿直前の API 確認（v3.3.0+） ==========
         # Live/Schedule/Archive の場合、投稿直前に API で最新情報を確認
@@ -162,8 +136,9 @@ class BlueskyImagePlugin(NotificationPlugin):
                 youtube_api_plugin = plugin_mgr.get_plugin("youtube_api_plugin")
 
                 if youtube_api_plugin and youtube_api_plugin.is_available():
-                    # API で最新情報を取得
-                    latest_details = youtube_api_plugin.fetch_video_detail(video_id)
+                    # API で最新情報を取得（直近 DETAIL_FRESHNESS_SECONDS 秒以内の取得結果があれば再利用）
+                    from youtube_core.youtube_detail_freshness import DETAIL_FRESHNESS_SECONDS
+                    latest_details = youtube_api_plugin.fetch_video_detail(video_id, max_age=DETAIL_FRESHNESS_SECONDS)
                     if latest_details:
                         # 最新情報でビデオ情報を更新
                         latest_info = youtube_api_plugin._extract_video_info(latest_details)
@@ -211,7 +186,7 @@ class BlueskyImagePlugin(NotificationPlugin):
         use_image = video.get("use_image", True)  # デフォルトは画像添付
         resize_small_images = video.get("resize_small_images", True)  # デフォルトはリサイズ有効
 
-        post_logger.info(f"🔍 post_video 開始: use_image={use_image}, resize_small_images={resize_small_images}, image_filename={video.get('image_filename')}")
+        post_logger.info("🔍 post_video 開始: use_image=%s, resize_small_images=%s, image_filename=%s", use_image, resize_small_images, video.get('image_filename'))
 
         # DBに画像ファイルが登録されている場合、そのファイルを優先して使用
         image_filename = video.get("image_filename")
@@ -219,7 +194,7 @@ class BlueskyImagePlugin(NotificationPlugin):
         video = dict(video)  # 元の辞書を変更しないようコピー
 
         # ★ コピー直後にフィールド値をチェック
-        post_logger.info(f"📋 【dict(video)直後の入力値チェック】 classification_type={video.get('classification_type')}, content_type={video.get('content_type')}, live_status={video.get('live_status')}")
+        post_logger.info("📋 【dict(video)直後の入力値チェック】 classification_type=%s, content_type=%s, live_status=%s", video.get('classification_type'), video.get('content_type'), video.get('live_status'))
 
         embed = None
 
@@ -231,7 +206,7 @@ class BlueskyImagePlugin(NotificationPlugin):
         elif image_filename and image_filename.strip():
             # ファイル名から完全パスを構築
             image_path = self._resolve_image_path(image_filename, image_mode, source)
-            post_logger.info(f"💾 DB登録済み画像を使用: {image_filename}")
+            post_logger.info("💾 DB登録済み画像を使用: %s", image_filename)
             video["image_source"] = "database"
             # 画像ファイルをアップロードして embed を取得
             if image_path and Path(image_path).exists():
@@ -261,7 +236,7 @@ class BlueskyImagePlugin(NotificationPlugin):
         if embed:
             video["embed"] = embed
             video["use_link_card"] = False  # 画像を優先（リンクカードは無効化）
-            post_logger.info(f"🖼️ 画像埋め込み: {embed}")
+            post_logger.info("🖼️ 画像埋め込み: %s", embed)
         else:
             # 画像がない場合、リンクカード機能を有効化
             video["use_link_card"] = True  # リンクカード機能を有効化
@@ -317,7 +292,7 @@ class BlueskyImagePlugin(NotificationPlugin):
 
         # classification_type ベースのテンプレート選択（推奨・優先度高）
         if source == "youtube":
-            post_logger.info(f"🔍 テンプレート選択判定開始: classification_type={classification_type}, content_type={content_type}, live_status={live_status}")
+            post_logger.info("🔍 テンプレート選択判定開始: classification_type=%s, content_type=%s, live_status=%s", classification_type, content_type, live_status)
 
             if classification_type == "live":
                 # ライブ開始テンプレート（配信中）
@@ -395,7 +370,7 @@ class BlueskyImagePlugin(NotificationPlugin):
                 post_logger.debug(f"ℹ️ nico_new_video テンプレート未使用またはレンダリング失敗（従来フォーマットを使用）")
 
         # 最終的に minimal_poster で投稿
-        post_logger.info(f"📊 最終投稿設定: use_link_card={video.get('use_link_card')}, embed={bool(embed)}, text_override={bool(video.get('text_override'))}")
+        post_logger.info("📊 最終投稿設定: use_link_card=%s, embed=%s, text_override=%s", video.get('use_link_card'), bool(embed), bool(video.get('text_override')))
         return self.minimal_poster.post_video_minimal(video)
 
     def is_available(self) -> bool:
@@ -426,6 +401,14 @@ class BlueskyImagePlugin(NotificationPlugin):
     def on_disable(self) -> None:
         logger.info(f"⛔ プラグイン無効化: {self.get_name()}")
 
+    def on_config_changed(self, config, changed_keys: set) -> None:
+        """設定の再読み込みを反映（ログインセッションは維持）"""
+        if "BLUESKY_IMAGE_PATH" in changed_keys:
+            self.default_image_path = get_env_setting("BLUESKY_IMAGE_PATH")
+            logger.info(f"🔄 デフォルト画像パスを更新しました: {self.default_image_path}")
+        if "BLUESKY_POST_ENABLED" in changed_keys:
+            self.set_dry_run(not config.bluesky_post_enabled)
+
     # ============ ファイルパス解決機能 ============
 
     def _resolve_image_path(self, image_filename: str, image_mode: str = None, source: str = "youtube") -> str:
@@ -472,7 +455,7 @@ class BlueskyImagePlugin(NotificationPlugin):
 
         処理フロー:
         1. 画像ファイルを読み込む
-        2. resize_small_images=True の場合、_resize_image() で自動リサイズ・最適化
+        2. resize_small_images=True の場合、resize_image_with_size() で自動リサイズ・最適化
         3. resize_small_images=False の場合、元の画像をそのまま使用
         4. Bluesky API にアップロード
 
@@ -499,6 +482,9 @@ class BlueskyImagePlugin(NotificationPlugin):
                 post_logger.warning(f"⚠️ 画像ファイルが見つかりません: {file_path}")
                 return None
 
+            from PIL import Image
+            from image_processor import resize_image_with_size
+
             # ========== 元画像の情報を取得してログ出力 ==========
             file_size_bytes = Path(file_path).stat().st_size
 
@@ -519,34 +505,24 @@ class BlueskyImagePlugin(NotificationPlugin):
                 )
             except Exception as e:
                 post_logger.warning(f"⚠️ 元画像情報の取得失敗: {e}")
-                post_logger.info(f"📊 【元画像情報】ファイルサイズ: {file_size_bytes / 1024:.1f}KB")
+                post_logger.info("📊 【元画像情報】ファイルサイズ: %.1fKB", file_size_bytes / 1024)
 
             # ========== 変換判定ロジックをログ出力 ==========
-            post_logger.info(f"🔍 【変換判定】resize_small_images={resize_small_images}")
+            post_logger.info("🔍 【変換判定】resize_small_images=%s", resize_small_images)
 
             # ========== 画像処理 ==========
             if resize_small_images:
                 # リサイズして最適化
                 post_logger.info(f"✅ 判定結果: 画像をリサイズ・最適化します")
                 post_logger.info(f"📏 リサイズ処理開始...")
-                image_data = resize_image(file_path)
-                if image_data is None:
+                resized = resize_image_with_size(file_path)
+                if resized is None:
                     # リサイズ失敗 → この投稿では画像添付をスキップ
                     post_logger.error(f"❌ 画像リサイズ失敗のため、この投稿では画像添付をスキップします")
                     return None
+                image_data, resized_width, resized_height = resized
                 mime_type = 'image/jpeg'
-
-                # リサイズ後の画像情報を取得
-                try:
-                    from PIL import Image as PILImage
-                    import io
-                    resized_img = PILImage.open(io.BytesIO(image_data))
-                    resized_width, resized_height = resized_img.size
-                    post_logger.info(f"   リサイズ後の解像度: {resized_width}×{resized_height}px")
-                except Exception as e:
-                    post_logger.warning(f"⚠️ リサイズ後の解像度取得失敗: {e}")
-                    resized_width = None
-                    resized_height = None
+                post_logger.info("   リサイズ後の解像度: %s×%spx", resized_width, resized_height)
 
                 # 変換後の情報をログ出力
                 post_logger.info(
@@ -593,15 +569,14 @@ class BlueskyImagePlugin(NotificationPlugin):
                 "Content-Type": mime_type
             }
 
-            import requests
-            response = requests.post(upload_url, data=image_data, headers=headers, timeout=30)
+            response = xrpc_post("uploadBlob", upload_url, data=image_data, headers=headers, timeout=30)
             response.raise_for_status()
 
             result = response.json()
             blob = result.get("blob")
 
             if blob:
-                post_logger.info(f"✅ 画像アップロード成功: {blob.get('mimeType')} ({len(image_data)} bytes)")
+                post_logger.info("✅ 画像アップロード成功: %s (%s bytes)", blob.get('mimeType'), len(image_data))
 
                 # aspRatioはblobではなく、_build_image_embedで設定
                 # ここでは (blob, width, height) のtupleを返す
@@ -720,13 +695,10 @@ class BlueskyImagePlugin(NotificationPlugin):
     def _render_template(self, template_path: str, context: dict) -> str:
         """Jinja2 テンプレートをレンダリング"""
         try:
-            from jinja2 import Environment
-            from utils_v3 import format_datetime_filter
-            with open(template_path, encoding="utf-8") as f:
-                template_str = f.read()
-            env = Environment()
-            env.filters['datetimeformat'] = format_datetime_filter
-            template = env.from_string(template_str)
+            from pathlib import Path
+            from template_utils import get_template_environment
+            # 共有 Environment を使用（コンパイル済みテンプレートを再利用）
+            template = get_template_environment().get_template(str(Path(template_path).resolve()))
             return template.render(**context)
         except Exception as e:
             logger.error(f"❌ テンプレートレンダリング失敗: {e}")
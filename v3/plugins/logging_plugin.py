@@ -6,6 +6,7 @@ Stream notify on Bluesky - v3 ロギング拡張プラグイン
 - 複数ロガー（AppLogger, AuditLogger, TunnelLogger, YouTubeLogger, NiconicoLogger）
 - TimedRotatingFileHandler（日次ローテーション）
 - 環境変数ベースのログレベル制御
+- キュー経由（logging_config.start_queue_logging）時は emit ごとの flush を省略
 """
 
 import os
@@ -31,6 +32,9 @@ _logging_plugin_cache = {}
 class FlushTimedRotatingFileHandler(TimedRotatingFileHandler):
     """flush付きハンドラ（即座にディスクに書き込み、改行コードはLF統一）"""
 
+    # True の間は emit ごとの flush を行わない（キュー経由時に QueueListener が定期的に flush する）
+    buffered = False
+
     def _open(self):
         """ファイルを開く際に改行コードをLFに統一"""
         # newline='' で自動的なCRLF変換を防ぐ
@@ -61,7 +65,8 @@ class FlushTimedRotatingFileHandler(TimedRotatingFileHandler):
 
             try:
                 stream.write(msg + '\n')
-                stream.flush()
+                if not self.buffered:
+                    stream.flush()
             except ValueError:
                 # I/O operation on closed file
                 self.handleError(record)
@@ -2,30 +2,33 @@
 """
 ニコニコ動画 RSS取得プラグイン
 
-- ニコニコ動画の新着を監視
-- RSS ポーリング方式で実装
+- ニコニコ動画の新着を監視（NICONICO_USER_ID はカンマ区切りで複数ユーザー指定可）
+- RSS ポーリング方式で実装（前回処理したエントリ以降の未処理エントリをすべて取り込む）
 - リトライ・タイムアウト対応
 - NotificationPlugin 準拠
-- ユーザー名自動取得（RSS <dc:creator> > 静画API > ユーザーページ > 環境変数 > ユーザーID）
+- ユーザー名自動取得（RSS <dc:creator> > 静画API > ユーザーページ > 環境変数 > ユーザーID、
+  結果はユーザー名キャッシュに TTL 付きで保存し settings.env は書き換えない）
 """
 
 import os
 import logging
 import time
 import re
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from threading import Thread, Event
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import feedparser
 from socket import timeout as socket_timeout
 import requests
 import xml.etree.ElementTree as ET
-from bs4 import BeautifulSoup
 from image_manager import get_image_manager
-from thumbnails import get_niconico_ogp_url
+from thumbnails import get_niconico_ogp_url, fetch_niconico_metadata
 
 from plugin_interface import NotificationPlugin
 from database import Database
+from metrics import record_feed_fetch
+from log_routing import route_module_logs
+from niconico_user_name_cache import get_niconico_user_name_cache
 
 logger = logging.getLogger("NiconicoLogger")
 
@@ -37,7 +40,8 @@ NICONICO_USER_ID_PATTERN = r'^\d+$'  # ユーザーID は数字のみ
 SEIGA_API_URL = "http://seiga.nicovideo.jp/api/user/info"  # ニコニコ静画 API URL
 SEIGA_API_TIMEOUT = 5  # 静画API タイムアウト（秒）
 NICONICO_USER_PAGE_TIMEOUT = 5  # ユーザーページ取得タイムアウト（秒）
-SETTINGS_ENV_PATH = Path(__file__).parent.parent / "settings.env"  # 設定ファイルパス
+NICONICO_MAX_CONCURRENT_FEEDS = 4  # 複数ユーザーの RSS を同時に取得する最大数
+FEED_STATE_KEY_PREFIX = "niconico:"  # DB（feed_state）に保存する処理済み位置のキー接頭辞
 
 
 class NiconicoPlugin(NotificationPlugin):
@@ -48,23 +52,25 @@ class NiconicoPlugin(NotificationPlugin):
         初期化
 
         Args:
-            user_id: 監視対象のニコニコユーザーID（数字のみ）
+            user_id: 監視対象のニコニコユーザーID（数字のみ、カンマ区切りで複数指定可）
             poll_interval: ポーリング間隔（分）
             db: Database インスタンス
             user_name: ニコニコユーザー名（display用。省略時はIDから推測）
         """
-        self.user_id = user_id.strip() if user_id else ""
+        # 先頭のユーザーをメインユーザー（ユーザー名の自動取得・保存の対象）として扱う
+        self.user_ids = [u for u in re.split(r"[,\s]+", user_id or "") if u]
+        self.user_id = self.user_ids[0] if self.user_ids else ""
         self.poll_interval_min = max(int(poll_interval), 5)  # 最小 5 分
         self.poll_interval_sec = self.poll_interval_min * 60
         self.db = db
         self.shutdown_event = Event()
         self._monitor_thread = None
-        self.last_video_id = None
+        self._last_entry_ids = {}  # {user_id: 最後に処理した RSS エントリ ID}（DB の feed_state にも保存）
         self._validation_error = None
         self.image_manager = get_image_manager()
 
-        # ユーザー名キャッシング（初回のみ取得）
-        self._user_name_cache = None
+        # ユーザー名キャッシュ（監視・手動追加・メタデータ取得で共有、永続化あり）
+        self.user_name_cache = get_niconico_user_name_cache()
         self._user_name_env = user_name or os.getenv("NICONICO_USER_NAME", "")
 
         # バリデーション
@@ -77,69 +83,68 @@ class NiconicoPlugin(NotificationPlugin):
             logger.warning(f"[バリデーション] {self._validation_error}")
             return
 
-        if not re.match(NICONICO_USER_ID_PATTERN, self.user_id):
-            self._validation_error = f"ユーザーID は数字のみである必要があります: {self.user_id}"
-            logger.warning(f"[バリデーション] {self._validation_error}")
-            return
+        for user_id in self.user_ids:
+            if not re.match(NICONICO_USER_ID_PATTERN, user_id):
+                self._validation_error = f"ユーザーID は数字のみである必要があります: {user_id}"
+                logger.warning(f"[バリデーション] {self._validation_error}")
+                return
 
-        logger.debug(f"[バリデーション] ユーザーID OK: {self.user_id}")
+        logger.debug(f"[バリデーション] ユーザーID OK: {', '.join(self.user_ids)}")
         self._validation_error = None
 
-    def _get_user_name(self) -> str:
+    def _get_user_name(self, user_id: str = None) -> str:
         """
-        ユーザー名を取得（キャッシング付き）
+        ユーザー名を取得（ユーザー名キャッシュ経由、TTL 内は再取得しない）
 
         優先順位:
-        1. RSS <dc:creator> から取得
-        2. 静画API から取得
-        3. ニコニコ公式ユーザーページ から取得（og:title から抽出）
-        4. 環境変数または初期化パラメータ (NICONICO_USER_NAME)
-        5. ユーザーID をそのまま使用
+        1. ユーザー名キャッシュ（data/niconico_user_names.json、RSS 取得時・メタデータ取得時にも記録）
+        2. RSS <dc:creator> > 静画API > ニコニコ公式ユーザーページ（_lookup_user_name）
+        3. 環境変数または初期化パラメータ (NICONICO_USER_NAME、メインユーザーのみ)
+        4. ユーザーID をそのまま使用
+
+        Args:
+            user_id: ニコニコユーザーID（省略時はメインユーザー）
 
         Returns:
             str: ユーザー名またはユーザーID
         """
-        # キャッシュがあれば返す
-        if self._user_name_cache is not None:
-            return self._user_name_cache
+        user_id = user_id or self.user_id
+        user_name = self.user_name_cache.resolve(user_id, self._lookup_user_name)
+        if user_name:
+            return user_name
+
+        if user_id == self.user_id and self._user_name_env:
+            logger.debug(f"[ユーザー名取得] 環境変数から取得: {self._user_name_env}")
+            return self._user_name_env
+
+        logger.debug(f"[ユーザー名取得] デフォルト（ユーザーID）を使用: {user_id}")
+        return user_id
+
+    def _lookup_user_name(self, user_id: str) -> tuple:
+        """
+        ユーザー名をネットワークから解決（キャッシュ未登録・期限切れ時のみ呼ばれる）
 
-        # 優先度1: RSSから <dc:creator> を取得
-        rss_author = self._get_user_name_from_rss()
+        Returns:
+            tuple: (ユーザー名 または None, 取得元)
+        """
+        rss_author = self._get_user_name_from_rss(user_id)
         if rss_author:
             logger.debug(f"[ユーザー名取得] RSS <dc:creator> から取得: {rss_author}")
-            self._user_name_cache = rss_author
-            return self._user_name_cache
+            return rss_author, "rss"
 
-        # 優先度2: 静画API から取得
-        seiga_author = self._get_user_name_from_seiga_api()
+        seiga_author = self._get_user_name_from_seiga_api(user_id)
         if seiga_author:
             logger.debug(f"[ユーザー名取得] 静画API から取得: {seiga_author}")
-            self._user_name_cache = seiga_author
-            # 設定ファイルが未設定なら書き込む
-            self._save_user_name_to_config(seiga_author)
-            return self._user_name_cache
+            return seiga_author, "seiga"
 
-        # 優先度3: ニコニコ公式ページから取得
-        page_author = self._get_user_name_from_user_page()
+        page_author = self._get_user_name_from_user_page(user_id)
         if page_author:
             logger.debug(f"[ユーザー名取得] ユーザーページから取得: {page_author}")
-            self._user_name_cache = page_author
-            # 設定ファイルが未設定なら書き込む
-            self._save_user_name_to_config(page_author)
-            return self._user_name_cache
+            return page_author, "user_page"
 
-        # 優先度4: 環境変数が設定されていれば使用
-        if self._user_name_env:
-            logger.debug(f"[ユーザー名取得] 環境変数から取得: {self._user_name_env}")
-            self._user_name_cache = self._user_name_env
-            return self._user_name_cache
-
-        # 優先度5: ユーザーIDをそのまま使用
-        logger.debug(f"[ユーザー名取得] デフォルト（ユーザーID）を使用: {self.user_id}")
-        self._user_name_cache = self.user_id
-        return self._user_name_cache
+        return None, None
 
-    def _get_user_name_from_rss(self) -> Optional[str]:
+    def _get_user_name_from_rss(self, user_id: str) -> Optional[str]:
         """
         RSS フィード から <dc:creator> を抽出してユーザー名を取得
 
@@ -147,7 +152,7 @@ class NiconicoPlugin(NotificationPlugin):
             str または None: ユーザー名（取得できない場合は None）
         """
         try:
-            url = f"https://www.nicovideo.jp/user/{self.user_id}/video?rss=2.0"
+            url = f"https://www.nicovideo.jp/user/{user_id}/video?rss=2.0"
             logger.debug(f"[RSS著者取得] {url}")
 
             # feedparser で解析（namespace 対応）
@@ -178,7 +183,7 @@ class NiconicoPlugin(NotificationPlugin):
             logger.warning(f"[RSS著者取得エラー] {type(e).__name__}: {e}")
             return None
 
-    def _get_user_name_from_seiga_api(self) -> Optional[str]:
+    def _get_user_name_from_seiga_api(self, user_id: str) -> Optional[str]:
         """
         ニコニコ静画 API からユーザー名を取得
 
@@ -189,7 +194,7 @@ class NiconicoPlugin(NotificationPlugin):
             str または None: ユーザー名（取得できない場合は None）
         """
         try:
-            url = f"{SEIGA_API_URL}?id={self.user_id}"
+            url = f"{SEIGA_API_URL}?id={user_id}"
             logger.debug(f"[静画API] {url}")
 
             response = requests.get(url, timeout=SEIGA_API_TIMEOUT)
@@ -221,7 +226,7 @@ class NiconicoPlugin(NotificationPlugin):
             logger.warning(f"[静画API取得エラー] {type(e).__name__}: {e}")
             return None
 
-    def _get_user_name_from_user_page(self) -> Optional[str]:
+    def _get_user_name_from_user_page(self, user_id: str) -> Optional[str]:
         """
         ニコニコ公式ユーザーページ からユーザー名を取得
 
@@ -232,14 +237,15 @@ class NiconicoPlugin(NotificationPlugin):
             str または None: ユーザー名（取得できない場合は None）
         """
         try:
-            url = f"https://www.nicovideo.jp/user/{self.user_id}"
+            url = f"https://www.nicovideo.jp/user/{user_id}"
             logger.debug(f"[ユーザーページ] {url}")
 
             response = requests.get(url, timeout=NICONICO_USER_PAGE_TIMEOUT)
             response.raise_for_status()
             response.encoding = 'utf-8'
 
-            # BeautifulSoupでHTML解析
+            # BeautifulSoupでHTML解析（ユーザーページ取得時のみ使用するため遅延インポート）
+            from bs4 import BeautifulSoup
             soup = BeautifulSoup(response.text, 'html.parser')
 
             # og:title メタタグからユーザー名を抽出
@@ -266,61 +272,6 @@ class NiconicoPlugin(NotificationPlugin):
             logger.warning(f"[ユーザーページ取得エラー] {type(e).__name__}: {e}")
             return None
 
-    def _save_user_name_to_config(self, user_name: str) -> None:
-        """
-        取得したユーザー名を設定ファイルに保存
-
-        NICONICO_USER_NAME が未設定の場合のみ書き込む
-
-        Args:
-            user_name: 保存するユーザー名
-        """
-        try:
-            # 既に環境変数が設定されている場合はスキップ
-            if self._user_name_env:
-                logger.debug(f"[設定保存] NICONICO_USER_NAME は既に設定済み、スキップ")
-                return
-
-            # 設定ファイルが存在しない場合はスキップ
-            if not SETTINGS_ENV_PATH.exists():
-                logger.warning(f"[設定保存] 設定ファイルが見つかりません: {SETTINGS_ENV_PATH}")
-                return
-
-            # 既存の設定ファイルを読み込む
-            with open(SETTINGS_ENV_PATH, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            # NICONICO_USER_NAME が既に存在するかチェック
-            user_name_found = False
-            for i, line in enumerate(lines):
-                if line.startswith('NICONICO_USER_NAME='):
-                    user_name_found = True
-                    current_value = line.split('=', 1)[1].strip()
-                    # 既に値が設定されていれば何もしない
-                    if current_value:
-                        logger.debug(f"[設定保存] NICONICO_USER_NAME は既に設定済み: {current_value}")
-                        return
-                    # 空の場合は上書き
-                    lines[i] = f'NICONICO_USER_NAME={user_name}\n'
-                    logger.info(f"[設定保存] NICONICO_USER_NAME を更新: {user_name}")
-                    break
-
-            # NICONICO_USER_NAME が存在しない場合は追加
-            if not user_name_found:
-                # NICONICO_USER_ID の後に追加
-                for i, line in enumerate(lines):
-                    if line.startswith('NICONICO_USER_ID='):
-                        lines.insert(i + 1, f'NICONICO_USER_NAME={user_name}\n')
-                        logger.info(f"[設定保存] NICONICO_USER_NAME を新規追加: {user_name}")
-                        break
-
-            # 設定ファイルに書き込む
-            with open(SETTINGS_ENV_PATH, 'w', encoding='utf-8') as f:
-                f.writelines(lines)
-
-        except Exception as e:
-            logger.warning(f"[設定保存エラー] {type(e).__name__}: {e}")
-
     def is_available(self) -> bool:
         """プラグインが利用可能か判定"""
         return bool(self.user_id and not self._validation_error)
@@ -344,10 +295,17 @@ class NiconicoPlugin(NotificationPlugin):
             self.shutdown_event.clear()
             self._monitor_thread = Thread(target=self._monitor_loop, daemon=True)
             self._monitor_thread.start()
-            logger.info(f"[監視スレッド開始] ユーザーID={self.user_id}, ポーリング間隔={self.poll_interval_min}分")
+            logger.info(f"[監視スレッド開始] ユーザーID={', '.join(self.user_ids)}, ポーリング間隔={self.poll_interval_min}分")
         else:
             logger.debug("[監視スレッド] 既に実行中です")
 
+    def on_config_changed(self, config, changed_keys: set) -> None:
+        """設定の再読み込みを反映（監視スレッド・処理済み位置は維持）"""
+        if "NICONICO_POLL_INTERVAL" in changed_keys:
+            self.poll_interval_min = max(int(config.niconico_poll_interval_minutes), 5)  # 最小 5 分
+            self.poll_interval_sec = self.poll_interval_min * 60
+            logger.info(f"🔄 ポーリング間隔を更新しました: {self.poll_interval_min}分（次回待機から反映）")
+
     def stop_monitoring(self):
         """監視スレッドを停止"""
         if self._monitor_thread and self._monitor_thread.is_alive():
@@ -362,31 +320,11 @@ class NiconicoPlugin(NotificationPlugin):
         """監視ループ（スレッド実行用）"""
         logger.info("[監視ループ] 開始")
         app_logger = logging.getLogger("AppLogger")
-        niconico_logger = logging.getLogger("NiconicoLogger")
         while not self.shutdown_event.is_set():
             try:
                 logger.info("[ニコニコ] ニコニコ動画から RSS を取得しています...")
                 app_logger.info("[ニコニコ] ニコニコ動画から RSS を取得しています...")
-
-                # 動画をチェック
-                video_entry = self.get_latest_video_entry()
-                if video_entry:
-                    if not self.last_video_id or video_entry.get("id") != self.last_video_id:
-                        # ニコニコ RSS の取得・照合・判定ログ（新着動画がある場合のみ）
-                        niconico_logger.info(f"[ニコニコ RSS] 1 個の動画を DB に照合しています...")
-
-                        video = self._entry_to_video_dict(video_entry)
-                        is_new = self.post_video(video)
-                        if is_new:
-                            niconico_logger.info(f"✅ 1 個の新着動画を保存しました")
-                        else:
-                            niconico_logger.info(f"ℹ️ 新着動画はありません（既存: 1 個）")
-                        self.last_video_id = video_entry.get("id")
-                        logger.debug(f"[ラストID更新] video_id={self.last_video_id}")
-                    else:
-                        logger.debug("[監視] 新着動画なし")
-                else:
-                    logger.debug("[監視] RSS エントリ取得失敗")
+                self.poll_feeds()
 
             except Exception as e:
                 logger.error(f"[監視ループエラー] {e}", exc_info=True)
@@ -398,7 +336,111 @@ class NiconicoPlugin(NotificationPlugin):
 
         logger.info("[監視ループ] 終了")
 
-    # ...existing code...
+    def poll_feeds(self) -> int:
+        """
+        全監視ユーザーの RSS を取得し、未処理のエントリをまとめて DB に取り込む
+
+        - 各ユーザーの RSS は並行して取得（最大 NICONICO_MAX_CONCURRENT_FEEDS 件）
+        - 前回処理したエントリ（処理済み位置）より新しいエントリをすべて対象にする
+          （処理済み位置が未保存・RSS から消えている場合はフィード全体が対象）
+        - DB 登録済み・除外動画リスト登録済みの動画は変換前に除外
+        - 新着は1トランザクションで一括保存し、保存後に処理済み位置を更新
+
+        Returns:
+            int: 新規保存した動画数
+        """
+        niconico_logger = logging.getLogger("NiconicoLogger")
+        max_workers = min(len(self.user_ids), NICONICO_MAX_CONCURRENT_FEEDS) or 1
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="NiconicoFeed") as executor:
+            results = list(executor.map(self._collect_new_videos, self.user_ids))
+
+        videos = []
+        for _, new_videos, _ in results:
+            videos.extend(new_videos)
+
+        saved = 0
+        if videos:
+            niconico_logger.info(f"[ニコニコ RSS] {len(videos)} 個の動画を DB に照合しています...")
+            saved_ids = self.post_videos(videos)
+            saved = len(saved_ids)
+            if saved:
+                niconico_logger.info(f"✅ {saved} 個の新着動画を保存しました")
+            else:
+                niconico_logger.info(f"ℹ️ 新着動画はありません（既存: {len(videos)} 個）")
+        else:
+            logger.debug("[監視] 新着動画なし")
+
+        # 取り込み後に処理済み位置を更新（RSS 取得失敗時は更新しない）
+        for user_id, _, newest_entry_id in results:
+            if newest_entry_id and newest_entry_id != self._last_entry_ids.get(user_id):
+                self._last_entry_ids[user_id] = newest_entry_id
+                self.db.set_feed_state(FEED_STATE_KEY_PREFIX + user_id, newest_entry_id)
+                logger.debug(f"[処理済み位置更新] user_id={user_id}, entry_id={newest_entry_id}")
+
+        return saved
+
+    def _collect_new_videos(self, user_id: str) -> tuple:
+        """
+        1ユーザー分の RSS から未処理エントリを抽出し、video dict に変換
+
+        Returns:
+            tuple: (user_id, 新着 video dict のリスト（古い順）, RSS 先頭のエントリ ID または None)
+        """
+        entries = self.get_video_entries(user_id)
+        if entries is None:
+            logger.debug(f"[監視] RSS エントリ取得失敗: user_id={user_id}")
+            return user_id, [], None
+        if not entries:
+            return user_id, [], None
+
+        # RSS の <dc:creator> をユーザー名キャッシュに記録（ユーザー名の追加取得を不要にする）
+        rss_author = entries[0].get("author")
+        if rss_author:
+            self.user_name_cache.put(user_id, rss_author, "rss")
+
+        last_entry_id = self._last_entry_ids.get(user_id)
+        if last_entry_id is None:
+            last_entry_id = self.db.get_feed_state(FEED_STATE_KEY_PREFIX + user_id)
+            if last_entry_id:
+                self._last_entry_ids[user_id] = last_entry_id
+
+        # RSS は新しい順。処理済み位置に到達するまでが未処理エントリ
+        if not last_entry_id:
+            # 初回（処理済み位置が未記録）は従来どおり最新1件のみを対象にし、RSS 全体の遡り取り込みはしない。
+            # 処理済み位置は呼び出し元で先頭エントリに更新されるため、次回以降は差分のみになる
+            unseen = entries[:1]
+            logger.info(f"[差分取得] user_id={user_id}: 処理済み位置が未記録のため最新1件のみ確認します")
+        else:
+            unseen = []
+            for entry in entries:
+                if entry.get("id") == last_entry_id:
+                    break
+                unseen.append(entry)
+
+        newest_entry_id = entries[0].get("id")
+        if not unseen:
+            return user_id, [], newest_entry_id
+
+        # 登録済み・除外動画リスト登録済みの動画はサムネイル取得前に除外
+        candidates = [(entry, self._extract_video_id(entry)) for entry in unseen]
+        existing = self.db.get_existing_video_ids([video_id for _, video_id in candidates])
+        deleted_cache = None
+        try:
+            from deleted_video_cache import get_deleted_video_cache
+            deleted_cache = get_deleted_video_cache()
+        except ImportError:
+            logger.debug("deleted_video_cache モジュールが見つかりません")
+
+        videos = []
+        for entry, video_id in reversed(candidates):
+            if not video_id or video_id in existing:
+                continue
+            if deleted_cache and deleted_cache.is_deleted(video_id, source="niconico"):
+                continue
+            videos.append(self._entry_to_video_dict(entry, user_id=user_id))
+
+        logger.debug(f"[差分取得] user_id={user_id}: 未処理 {len(unseen)} 件 / 新着候補 {len(videos)} 件")
+        return user_id, videos, newest_entry_id
 
     def get_latest_video_entry(self) -> Optional[Dict[str, Any]]:
         """
@@ -407,91 +449,57 @@ class NiconicoPlugin(NotificationPlugin):
         Returns:
             dict または None
         """
-        url = f"https://www.nicovideo.jp/user/{self.user_id}/video?rss=2.0"
-        logger.debug(f"[RSS取得] 動画: {url}")
-        return self._fetch_rss_with_retry(url, kind="video")
+        entries = self.get_video_entries(self.user_id)
+        return entries[0] if entries else None
 
-    def _fetch_rss_with_retry(self, url: str, kind: str = "video") -> Optional[Dict[str, Any]]:
+    def get_video_entries(self, user_id: str = None) -> Optional[List[Dict[str, Any]]]:
         """
-        RSS を取得（リトライロジック付き）
+        ユーザーの動画 RSS エントリをすべて取得（新しい順、リトライ対応）
 
         Args:
-            url: RSS フィード URL
-            kind: "video"
+            user_id: ニコニコユーザーID（省略時はメインユーザー）
 
         Returns:
-            dict または None
+            list（フィードが空の場合は空リスト）、取得失敗時は None
         """
-        for attempt in range(1, RSS_RETRY_MAX + 1):
-            try:
-                logger.debug(f"[RSS取得試行] {attempt}/{RSS_RETRY_MAX}")
-
-                # feedparser は timeout パラメータに対応していないため、
-                # 基本的なエラーハンドリングのみ実装
-                feed = feedparser.parse(url)
-
-                # feedparser のエラーチェック
-                if hasattr(feed, 'bozo_exception') and feed.bozo_exception:
-                    raise feed.bozo_exception
-
-                if feed.entries:
-                    entry = feed.entries[0]
-                    result = {
-                        "id": entry.get("id", ""),
-                        "title": entry.get("title", ""),
-                        "link": entry.get("link", ""),
-                        "published": entry.get("published", ""),
-                        "author": entry.get("author", ""),
-                    }
-                    logger.debug(f"[RSS取得成功] entry_id={result.get('id')}")
-                    return result
-
-                logger.debug(f"[RSS取得] エントリなし（フィード空）")
-                return None
-
-            except Exception as e:
-                logger.warning(f"[RSS取得エラー] 試行 {attempt}/{RSS_RETRY_MAX}: {type(e).__name__}: {e}")
+        url = f"https://www.nicovideo.jp/user/{user_id or self.user_id}/video?rss=2.0"
+        logger.debug(f"[RSS取得] 動画: {url}")
+        return self._fetch_rss_entries_with_retry(url)
 
-                if attempt < RSS_RETRY_MAX:
-                    logger.debug(f"[リトライ待機] {RSS_RETRY_WAIT}秒待機中...")
-                    time.sleep(RSS_RETRY_WAIT)
-                else:
-                    logger.error(f"[RSS取得失敗] 最大リトライ回数に達しました")
-                    return None
+    @staticmethod
+    def _extract_video_id(entry: Dict[str, Any]) -> str:
+        """RSS エントリからニコニコ動画IDを抽出"""
+        # ニコニコ動画IDをlinkから抽出
+        m = re.search(r'/watch/([a-z]{2}\d+)', entry.get("link", ""))
+        if m:
+            return m.group(1)
 
-        return None
+        # フォールバック: idフィールドの末尾がsm等ならそれを使う
+        id_field = entry.get("id", "")
+        m2 = re.search(r'/watch/([a-z]{2}\d+)', id_field)
+        if m2:
+            return m2.group(1)
+        return id_field  # それでもなければそのまま
 
-    def _entry_to_video_dict(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+    def _entry_to_video_dict(self, entry: Dict[str, Any], user_id: str = None) -> Dict[str, Any]:
         """
         RSS エントリを video dict に変換（動画専用）
 
         Args:
             entry: feedparser エントリ
+            user_id: エントリの投稿者のユーザーID（省略時はメインユーザー）
 
         Returns:
             video dict（DB insert 用）
         """
-        import re
         from email.utils import parsedate_to_datetime
         title = entry.get("title", "")
         link = entry.get("link", "")
         published = entry.get("published", "")
-        # ユーザー名を自動取得（キャッシング付き）
-        author = self._get_user_name()
+        # ユーザー名キャッシュから取得（RSS 取得時に記録済み）
+        author = self._get_user_name(user_id)
 
-        # ニコニコ動画IDをlinkから抽出
-        video_id = ""
-        m = re.search(r'/watch/([a-z]{2}\d+)', link)
-        if m:
-            video_id = m.group(1)
-        else:
-            # フォールバック: idフィールドの末尾がsm等ならそれを使う
-            id_field = entry.get("id", "")
-            m2 = re.search(r'/watch/([a-z]{2}\d+)', id_field)
-            if m2:
-                video_id = m2.group(1)
-            else:
-                video_id = id_field  # それでもなければそのまま
+        video_id = self._extract_video_id(entry)
 
         # publishedをISO8601に変換
         published_at = published
@@ -538,13 +546,8 @@ class NiconicoPlugin(NotificationPlugin):
         thumbnail_url = video.get("thumbnail_url", "")
 
         try:
-            # database モジュールのロガーを一時的に NiconicoLogger に切り替え
-            import database as db_module
-            original_db_logger = db_module.logger
-            niconico_logger = logging.getLogger("NiconicoLogger")
-            db_module.logger = niconico_logger
-
-            try:
+            # database モジュールのログを NiconicoLogger に振り替え（このスレッド内のみ）
+            with route_module_logs("NiconicoLogger", modules=("database",)):
                 logger.debug(f"[DB保存] video_id={video_id}, title={title}")
                 is_new = self.db.insert_video(
                     video_id=video_id,
@@ -564,29 +567,46 @@ class NiconicoPlugin(NotificationPlugin):
                 else:
                     logger.debug(f"[DB保存] 既存レコード（スキップ）: video_id={video_id}")
                 return is_new
-            finally:
-                # ロガーを元に戻す
-                db_module.logger = original_db_logger
         except Exception as e:
             logger.error(f"[DB保存エラー] {type(e).__name__}: {e}", exc_info=True)
             return False
 
-    def _ensure_image_download(self, video_id: str, thumbnail_url: str):
-        """DBに画像ファイルがなければダウンロードして登録"""
+    def post_videos(self, videos: List[Dict[str, Any]]) -> List[str]:
+        """
+        複数のビデオ情報を DB に一括保存（1トランザクション）
+
+        Args:
+            videos: post_video と同じ形式の video dict のリスト
+
+        Returns:
+            list: 新規登録された video_id のリスト
+        """
+        videos = [dict(v, source="niconico") for v in videos if v.get("video_id")]
+        if not videos:
+            return []
+
         try:
-            # database と image_manager のロガーを一時的に NiconicoLogger に切り替え
-            import database as db_module
-            import image_manager as im_module
+            # database モジュールのログを NiconicoLogger に振り替え（このスレッド内のみ）
+            with route_module_logs("NiconicoLogger", modules=("database",)):
+                logger.debug(f"[DB一括保存] {len(videos)} 件")
+                saved_ids = self.db.insert_videos_batch(videos)
+        except Exception as e:
+            logger.error(f"[DB保存エラー] {type(e).__name__}: {e}", exc_info=True)
+            return []
 
-            original_db_logger = db_module.logger
-            original_im_logger = im_module.logger
-            niconico_logger = logging.getLogger("NiconicoLogger")
-            db_module.logger = niconico_logger
-            im_module.logger = niconico_logger
+        # 新規登録の場合のみ画像処理を実行
+        saved = set(saved_ids)
+        for video in videos:
+            if video["video_id"] in saved and video.get("thumbnail_url"):
+                self._ensure_image_download(video["video_id"], video["thumbnail_url"])
+        return saved_ids
 
-            try:
-                videos = self.db.get_all_videos()
-                video = next((v for v in videos if v.get("video_id") == video_id), None)
+    def _ensure_image_download(self, video_id: str, thumbnail_url: str):
+        """DBに画像ファイルがなければダウンロードして登録"""
+        try:
+            # database と image_manager のログを NiconicoLogger に振り替え（このスレッド内のみ）
+            with route_module_logs("NiconicoLogger"):
+                video = self.db.get_video_by_id(video_id)
                 if video and video.get("image_filename"):
                     return
 
@@ -599,15 +619,11 @@ class NiconicoPlugin(NotificationPlugin):
                 if filename:
                     self.db.update_image_info(video_id, image_mode="import", image_filename=filename)
                     logger.info(f"[自動画像取得] {video_id} -> {filename}")
-            finally:
-                # ロガーを元に戻す
-                db_module.logger = original_db_logger
-                im_module.logger = original_im_logger
         except Exception as e:
             logger.warning(f"[自動画像取得失敗] {video_id}: {e}")
 
     def _fetch_thumbnail_url(self, video_id: str) -> Optional[str]:
-        """ニコニコ動画のOGP画像URLを取得（常にOGPを使用）"""
+        """ニコニコ動画のサムネイルURLを取得（getthumbinfo API、動画IDごとにキャッシュ）"""
         if not video_id:
             return None
 
@@ -620,6 +636,8 @@ class NiconicoPlugin(NotificationPlugin):
         """
         ニコニコ動画の詳細情報を取得（GUI マニュアル追加用）
 
+        動画ページの HTML ではなく getthumbinfo API を1回呼び出して取得する（動画IDごとにキャッシュ）。
+
         Args:
             video_id: ニコニコ動画ID（sm123456789 など）
 
@@ -632,129 +650,35 @@ class NiconicoPlugin(NotificationPlugin):
             return None
 
         try:
-            # ニコニコ動画ページから情報を取得
-            video_url = f"https://www.nicovideo.jp/watch/{video_id}"
             logger.debug(f"[get_video_details] 取得開始: {video_id}")
-
-            # ページ取得
-            try:
-                response = requests.get(video_url, timeout=NICONICO_USER_PAGE_TIMEOUT)
-                response.raise_for_status()
-            except requests.RequestException as e:
-                logger.warning(f"[get_video_details] ページ取得失敗: {video_id} - {e}")
+            metadata = fetch_niconico_metadata(video_id)
+            if not metadata:
+                logger.warning(f"[get_video_details] メタデータ取得失敗: {video_id}")
                 return None
 
-            # OGP メタデータから情報を抽出
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # OGP メタデータを取得
-            title = ""
-            description = ""
-            for meta in soup.find_all('meta'):
-                property_name = meta.get('property', '') or meta.get('name', '')
-                content = meta.get('content', '')
-
-                if property_name == 'og:title':
-                    title = content
-                elif property_name == 'og:description':
-                    description = content
-
-            # タイトルが取得できなければ動画URL としてスキップ
+            title = metadata.get("title")
             if not title:
                 logger.warning(f"[get_video_details] タイトルが取得できません: {video_id}")
                 title = "[ニコニコ]"
 
-            # ユーザー名を取得
-            author = self._get_user_name()
-
-            # 公開日時を抽出（優先度順）
-            from datetime import datetime, timezone
-            published_at = None
+            # getthumbinfo の投稿者名（取得時にユーザー名キャッシュにも記録される）
+            author = metadata.get("channel_name") or self._get_user_name(metadata.get("user_id"))
 
-            # 優先度1: video:release_date メタタグから取得（最も正確）
-            try:
-                for meta in soup.find_all('meta'):
-                    if meta.get('property') == 'video:release_date':
-                        published_at = meta.get('content', '')
-                        if published_at:
-                            logger.debug(f"[get_video_details] video:release_date から取得: {published_at}")
-                            break
-            except Exception as e:
-                logger.debug(f"[get_video_details] video:release_date からの抽出失敗: {e}")
-
-            # 優先度2: article:published_time メタタグから取得
-            if not published_at:
-                try:
-                    for meta in soup.find_all('meta'):
-                        if meta.get('property') == 'article:published_time':
-                            published_at = meta.get('content', '')
-                            if published_at:
-                                logger.debug(f"[get_video_details] article:published_time から取得: {published_at}")
-                                break
-                except Exception as e:
-                    logger.debug(f"[get_video_details] meta タグからの抽出失敗: {e}")
-
-            # 優先度3: ニコニコページの data-initial-state JSON から createTime を抽出
+            # first_retrieve は ISO 8601（+09:00）形式
+            published_at = metadata.get("published_at")
             if not published_at:
-                try:
-                    import json
-                    initial_state = soup.find("script", {"id": "__NUXT_STATE__"})
-                    if initial_state:
-                        state_text = initial_state.string
-                        if state_text:
-                            # createTime を正規表現で抽出
-                            match = re.search(r'"createTime":"([^"]+)"', state_text)
-                            if match:
-                                published_at = match.group(1)
-                                logger.debug(f"[get_video_details] createTime 抽出成功: {published_at}")
-                except Exception as e:
-                    logger.debug(f"[get_video_details] data-initial-state からの抽出失敗: {e}")
-
-            # 絶対的なフォールバック: 現在時刻（手動追加時の日時として記録）
-            if not published_at:
-                # 警告: 正確な公開日時が取得できません
+                # 絶対的なフォールバック: 現在時刻（手動追加時の日時として記録）
+                from datetime import datetime, timezone
                 logger.warning(f"[get_video_details] 公開日時が取得できません（手動入力で現在時刻を使用）: {video_id}")
                 published_at = datetime.now(timezone.utc).isoformat()
-            else:
-                # 既に ISO 8601 形式の場合はそのまま使用、そうでない場合は変換
-                if "T" not in str(published_at):
-                    try:
-                        published_str = str(published_at).strip()
-
-                        # 簡易パーサ: "YYYY-MM-DD HH:MM:SS" や "Mon, DD Mmm YYYY HH:MM:SS" に対応
-                        if "," in published_str and len(published_str) > 15:
-                            # RFC 2822 形式を想定
-                            try:
-                                from email.utils import parsedate_to_datetime
-                                dt = parsedate_to_datetime(published_str)
-                                published_at = dt.isoformat()
-                            except Exception:
-                                logger.debug(f"[get_video_details] RFC 2822 パース失敗: {published_str}")
-                        elif "-" in published_str and ":" in published_str:
-                            # "YYYY-MM-DD HH:MM:SS" または "YYYY-MM-DDTHH:MM:SS" 形式
-                            try:
-                                if " " in published_str and "T" not in published_str:
-                                    published_str = published_str.replace(" ", "T")
-                                # タイムゾーン情報がない場合は UTC を追加
-                                if "+" not in published_str and "Z" not in published_str:
-                                    published_str += "Z"
-                                published_at = published_str
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
-
-            # サムネイル URL を取得
-            thumbnail_url = self._fetch_thumbnail_url(video_id) or ""
-
-            # 詳細情報を辞書として返す
+
             result = {
                 "video_id": video_id,
                 "title": title,
-                "video_url": video_url,
+                "video_url": f"https://www.nicovideo.jp/watch/{video_id}",
                 "published_at": published_at,
                 "channel_name": author,
-                "thumbnail_url": thumbnail_url,
+                "thumbnail_url": metadata.get("thumbnail_url", ""),
                 "source": "niconico",
             }
 
@@ -765,16 +689,15 @@ class NiconicoPlugin(NotificationPlugin):
             logger.error(f"[get_video_details] エラー: {video_id} - {type(e).__name__}: {e}")
             return None
 
-    def _fetch_rss_with_retry(self, url: str, kind: str = "video") -> Optional[Dict[str, Any]]:
+    def _fetch_rss_entries_with_retry(self, url: str) -> Optional[List[Dict[str, Any]]]:
         """
-        RSS を取得（リトライロジック付き）
+        RSS のエントリ一覧を取得（リトライロジック付き）
 
         Args:
             url: RSS フィード URL
-            kind: "video"
 
         Returns:
-            dict または None
+            list（フィードが空の場合は空リスト）、取得失敗時は None
         """
         for attempt in range(1, RSS_RETRY_MAX + 1):
             try:
@@ -782,26 +705,29 @@ class NiconicoPlugin(NotificationPlugin):
 
                 # feedparser は timeout パラメータに対応していないため、
                 # 基本的なエラーハンドリングのみ実装
+                started = time.perf_counter()
                 feed = feedparser.parse(url)
+                record_feed_fetch("niconico_rss", feed, time.perf_counter() - started)
 
                 # feedparser のエラーチェック
                 if hasattr(feed, 'bozo_exception') and feed.bozo_exception:
                     raise feed.bozo_exception
 
-                if feed.entries:
-                    entry = feed.entries[0]
-                    result = {
+                entries = [
+                    {
                         "id": entry.get("id", ""),
                         "title": entry.get("title", ""),
                         "link": entry.get("link", ""),
                         "published": entry.get("published", ""),
                         "author": entry.get("author", ""),
                     }
-                    logger.debug(f"[RSS取得成功] entry_id={result.get('id')}")
-                    return result
-
-                logger.debug(f"[RSS取得] エントリなし（フィード空）")
-                return None
+                    for entry in feed.entries
+                ]
+                if entries:
+                    logger.debug(f"[RSS取得成功] {len(entries)} 件 (先頭 entry_id={entries[0].get('id')})")
+                else:
+                    logger.debug(f"[RSS取得] エントリなし（フィード空）")
+                return entries
 
             except Exception as e:
                 logger.warning(f"[RSS取得失敗] 試行 {attempt}/{RSS_RETRY_MAX}: {type(e).__name__}: {e}")
@@ -406,11 +406,11 @@ class LiveModule:
                 try:
                     result = classifier.classify_video(video_id)
                 except Exception as e:
-                    logger.debug(f"⏭️  分類エラー（スキップ）: {video_id} - {e}")
+                    logger.debug("⏭️  分類エラー（スキップ）: %s - %s", video_id, e)
                     continue
 
                 if not result.get("success"):
-                    logger.debug(f"⏭️  分類失敗（スキップ）: {video_id}")
+                    logger.debug("⏭️  分類失敗（スキップ）: %s", video_id)
                     continue
 
                 current_type = result.get("type")
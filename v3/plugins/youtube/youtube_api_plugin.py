@@ -18,6 +18,7 @@ import sys
 import logging
 import time
 import json
+import threading
 from typing import Dict, Any, Optional, Tuple, List
 from pathlib import Path
 import requests
@@ -28,6 +29,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from plugin_interface import NotificationPlugin
 from database import Database
 from image_manager import get_youtube_thumbnail_url
+from youtube_core.youtube_detail_freshness import get_fresh_video_detail, record_video_detail
+from metrics import YOUTUBE_QUOTA_UNITS_TOTAL
 
 logger = logging.getLogger("AppLogger")
 
@@ -81,13 +84,14 @@ class YouTubeAPIPlugin(NotificationPlugin):
         # ★ 【新 v3.4.3】クォータ超過フラグ（403 エラー時に設定）
         self.quota_exceeded = False
 
-        # ビデオ詳細キャッシュ
-        self.video_detail_cache: Dict[str, Dict[str, Any]] = {}
-        self.cache_timestamps: Dict[str, float] = {}
+        # ビデオ詳細キャッシュ（ファイルは初回参照時または warm_up() で読み込む）
+        self._video_detail_cache: Dict[str, Dict[str, Any]] = {}
+        self._cache_timestamps: Dict[str, float] = {}
+        self._video_detail_cache_loaded = False
+        self._video_detail_cache_lock = threading.Lock()
 
         # キャッシュ読み込み
         self._load_channel_cache()
-        self._load_video_detail_cache()
 
         # チャンネルID解決（キャッシュからまず確認）
         if self.api_key and self.channel_identifier:
@@ -157,8 +161,8 @@ class YouTubeAPIPlugin(NotificationPlugin):
             published_at = video.get("published_at", "")
             logger.debug(f"⚠️ video.published_at を使用（フォールバック）: {published_at}")
 
-        # サムネイル URL を取得（複数品質から最適なものを選択）
-        thumbnail_url = get_youtube_thumbnail_url(video_id)
+        # サムネイル URL を取得（実在確認・品質フォールバックは画像ダウンロード時に行う）
+        thumbnail_url = get_youtube_thumbnail_url(video_id, probe=False)
         if not thumbnail_url:
             # フォールバック: API から取得したもの
             thumbnail_url = snippet.get("thumbnails", {}).get("high", {}).get("url", "")
@@ -212,6 +216,28 @@ class YouTubeAPIPlugin(NotificationPlugin):
             logger.error(f"❌ チャンネルキャッシュ保存エラー: {e}")
 
     # --- ビデオ詳細キャッシュ機構 ---
+    @property
+    def video_detail_cache(self) -> Dict[str, Dict[str, Any]]:
+        """ビデオ詳細キャッシュ（未読み込みの場合はここで読み込む）"""
+        if not self._video_detail_cache_loaded:
+            self.warm_up()
+        return self._video_detail_cache
+
+    @property
+    def cache_timestamps(self) -> Dict[str, float]:
+        """ビデオ詳細キャッシュの取得時刻（未読み込みの場合はここで読み込む）"""
+        if not self._video_detail_cache_loaded:
+            self.warm_up()
+        return self._cache_timestamps
+
+    def warm_up(self) -> None:
+        """ビデオ詳細キャッシュを読み込む（初回のみ。起動時にバックグラウンドで事前に呼び出す）"""
+        with self._video_detail_cache_lock:
+            if self._video_detail_cache_loaded:
+                return
+            self._load_video_detail_cache()
+            self._video_detail_cache_loaded = True
+
     def _load_video_detail_cache(self) -> None:
         """ビデオ詳細をキャッシュから読み込み"""
         try:
@@ -221,10 +247,10 @@ class YouTubeAPIPlugin(NotificationPlugin):
                     cache_data = json.load(f)
                     # { video_id: { "data": {...}, "timestamp": 1234567890.0 } }
                     for video_id, entry in cache_data.items():
-                        self.video_detail_cache[video_id] = entry.get("data", {})
-                        self.cache_timestamps[video_id] = entry.get("timestamp", 0)
+                        self._video_detail_cache[video_id] = entry.get("data", {})
+                        self._cache_timestamps[video_id] = entry.get("timestamp", 0)
 
-                logger.debug(f"📦 ビデオ詳細キャッシュを読み込みました: {len(self.video_detail_cache)} 件")
+                logger.debug(f"📦 ビデオ詳細キャッシュを読み込みました: {len(self._video_detail_cache)} 件")
         except Exception as e:
             logger.warning(f"⚠️ ビデオ詳細キャッシュ読み込みエラー: {e}")
 
@@ -271,6 +297,8 @@ class YouTubeAPIPlugin(NotificationPlugin):
         """ビデオ詳細をキャッシュに保存（メモリのみ、ファイルはバッチ保存）"""
         self.video_detail_cache[video_id] = details
         self.cache_timestamps[video_id] = time.time()
+        # API から取得した直後の値として、鮮度付き共有キャッシュにも記録
+        record_video_detail(video_id, details)
         # ★ 修正: ファイル保存は update_video_detail_cache() または明示的な呼び出しで実施
         # （毎回保存するとI/Oが多発するため、バッチ完了時に保存する）
 
@@ -305,6 +333,12 @@ class YouTubeAPIPlugin(NotificationPlugin):
             return False
         return True
 
+    def get_remaining_quota(self) -> int:
+        """本日の残りクォータ（ユニット）を取得（クォータ超過検知後は 0）"""
+        if self.quota_exceeded:
+            return 0
+        return max(self.daily_quota - self.daily_cost, 0)
+
     def _record_cost(self, cost: int, operation: str) -> None:
         """APIコストを記録・ログ出力"""
         self.daily_cost += cost
@@ -366,6 +400,7 @@ class YouTubeAPIPlugin(NotificationPlugin):
 
                 resp.raise_for_status()
                 self._record_cost(expected_cost, operation)
+                YOUTUBE_QUOTA_UNITS_TOTAL.inc(expected_cost, caller="youtube_api_plugin", operation=f"{path}.list")
                 logger.debug(f"✅ API リクエスト成功: {operation}")
                 return resp.json()
 
@@ -493,27 +528,40 @@ class YouTubeAPIPlugin(NotificationPlugin):
 
         return None
 
-    def fetch_video_detail(self, video_id: str) -> Optional[Dict[str, Any]]:
+    def fetch_video_detail(self, video_id: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """
         単一動画の詳細を取得（キャッシュ優先、1ユニット）
 
         投稿直前の最新情報確認用 public メソッド
         キャッシュの有効期限が切れていれば自動的に API で再取得します
 
+        max_age を指定した場合は「max_age 秒以内に API から取得した結果」のみを再利用し、
+        それより古ければキャッシュをバイパスして API から取得します
+        （LiveModule の分類直後など、同じサイクル内での再取得を避けるため）。
+
         Args:
             video_id: YouTube 動画 ID
+            max_age: 許容する取得からの経過時間（秒）。None の場合は通常のキャッシュ有効期限
 
         Returns:
             動画詳細情報（API レスポンスの item）、取得失敗時は None
         """
-        return self._fetch_video_detail(video_id)
+        if max_age is None:
+            return self._fetch_video_detail(video_id)
+
+        fresh = get_fresh_video_detail(video_id, max_age)
+        if fresh:
+            logger.debug(f"📦 {max_age:.0f}秒以内に取得済みの動画詳細を再利用: {video_id}")
+            return fresh
+        return self._fetch_video_detail_bypass_cache(video_id)
 
-    def fetch_video_details_batch(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    def fetch_video_details_batch(self, video_ids: List[str], force_refresh: bool = False) -> Dict[str, Dict[str, Any]]:
         """
         最大50件の動画詳細をバッチ取得（キャッシュ優先、1ユニット）
 
         Args:
             video_ids: 動画IDのリスト（最大50件）
+            force_refresh: True の場合、キャッシュを使わずすべて API から取得
 
         Returns:
             {video_id: details} の辞書
@@ -526,7 +574,7 @@ class YouTubeAPIPlugin(NotificationPlugin):
 
         # キャッシュから取得可能な分を抽出
         for video_id in video_ids:
-            cached = self._get_cached_video_detail(video_id)
+            cached = None if force_refresh else self._get_cached_video_detail(video_id)
             if cached:
                 results[video_id] = cached
             else:
@@ -12,10 +12,12 @@ API エンドポイント:
 """
 
 import logging
+import time
 import requests
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import os
+from metrics import FEED_FETCH_BYTES, FEED_FETCH_SECONDS, FEED_FETCH_TOTAL
 
 logger = logging.getLogger("AppLogger")
 
@@ -115,7 +117,11 @@ class ProductionServerAPIClient:
             }
 
             logger.debug(f"📥 Websubサーバー HTTP API リクエスト: {url} params={params}")
+            started = time.perf_counter()
             response = requests.get(url, params=params, timeout=self.timeout)
+            FEED_FETCH_SECONDS.observe(time.perf_counter() - started, source="youtube_websub")
+            FEED_FETCH_TOTAL.inc(source="youtube_websub", status=response.status_code)
+            FEED_FETCH_BYTES.observe(len(response.content), source="youtube_websub")
             response.raise_for_status()
 
             data = response.json()
@@ -91,6 +91,9 @@ class TemplateEditorDialog(tk.Toplevel):
         )
     """
 
+    # キー入力からプレビュー更新までの待ち時間（ミリ秒）
+    PREVIEW_DELAY_MS = 200
+
     def __init__(
         self,
         master,
@@ -112,6 +115,7 @@ class TemplateEditorDialog(tk.Toplevel):
         self.sample_context = get_sample_context(template_type)
         self.last_preview_text = ""
         self.loaded_file_path = initial_file_path  # 読み込み済みファイルパスを記憶
+        self._preview_after_id = None  # プレビュー更新の遅延実行ID
 
         # UI を構築
         self._build_ui()
@@ -370,6 +374,18 @@ class TemplateEditorDialog(tk.Toplevel):
 
     def _on_text_changed(self, event):
         """テキスト変更時のコールバック（自動プレビュー更新）"""
+        # 連続入力中はプレビュー更新をまとめる（最後のキー入力から PREVIEW_DELAY_MS 後に1回）
+        if self._preview_after_id is not None:
+            self.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
+        if event is None:
+            self._update_preview()
+            return
+        self._preview_after_id = self.after(self.PREVIEW_DELAY_MS, self._run_scheduled_preview)
+
+    def _run_scheduled_preview(self):
+        """遅延実行されたプレビュー更新"""
+        self._preview_after_id = None
         self._update_preview()
 
     def _on_open_file(self):
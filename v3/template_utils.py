@@ -13,10 +13,12 @@ Vanilla 環境では、テンプレート仕様とファイル構成が整備さ
 import os
 import logging
 import random
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Tuple, List, Dict, Any
-from jinja2 import Environment, TemplateNotFound, TemplateSyntaxError
+from jinja2 import BaseLoader, Environment, FileSystemBytecodeCache, TemplateNotFound, TemplateSyntaxError
 
 logger = logging.getLogger("AppLogger")
 
@@ -595,6 +597,135 @@ DEFAULT_TEMPLATE_DIR = TEMPLATE_ROOT / ".templates"
 DEFAULT_TEMPLATE_PATH = DEFAULT_TEMPLATE_DIR / "default_template.txt"
 FALLBACK_TEMPLATE_PATH = DEFAULT_TEMPLATE_DIR / "fallback_template.txt"
 
+# ============ 共有 Jinja2 Environment（コンパイル済みテンプレートのキャッシュ） ============
+
+# バイトコードキャッシュの保存先（プロセス再起動後もコンパイル結果を再利用）
+TEMPLATE_BYTECODE_CACHE_DIR = Path("data") / "template_cache"
+# プレビュー用（文字列テンプレート）のキャッシュ件数
+_PREVIEW_CACHE_MAX = 32
+
+
+class _TemplatePathLoader(BaseLoader):
+    """
+    テンプレート名としてファイルの絶対パスを受け取る Loader（FileSystemLoader 相当）
+
+    テンプレートは任意のディレクトリに置けるため（settings.env でパス指定）、
+    検索パスを持たずにパスそのものを名前として扱う。
+    更新判定は mtime で行い、ファイルが変更されていれば自動で再コンパイルされる。
+    """
+
+    def get_source(self, environment, template):
+        path = Path(template)
+        try:
+            mtime = path.stat().st_mtime
+            source = path.read_text(encoding="utf-8")
+        except (FileNotFoundError, NotADirectoryError):
+            raise TemplateNotFound(template)
+
+        def uptodate() -> bool:
+            try:
+                return path.stat().st_mtime == mtime
+            except OSError:
+                return False
+
+        return source, str(path), uptodate
+
+
+_template_env: Optional[Environment] = None
+_template_env_lock = threading.Lock()
+_preview_cache: "OrderedDict[str, Any]" = OrderedDict()
+_preview_cache_lock = threading.Lock()
+
+
+def _register_filters(env: Environment) -> None:
+    """テンプレートで使用するフィルターを登録"""
+    # フィルターを登録（format_datetime_filter は別途提供）
+    from utils_v3 import format_datetime_filter
+    env.filters["datetimeformat"] = format_datetime_filter
+
+    # v3.2.0: 動的変数フィルターを登録
+    env.filters["format_date"] = _format_date_filter
+    env.filters["format_datetime"] = _format_datetime_filter
+    env.filters["random_emoji"] = _random_emoji_filter
+    env.filters["weekday"] = _weekday_filter
+
+    # v3.3.0: 拡張時刻フィルターを登録
+    env.filters["extended_time"] = _extended_time_filter
+    env.filters["extended_time_display"] = _extended_time_display_filter
+
+
+def get_template_environment() -> Environment:
+    """
+    共有 Jinja2 Environment を取得（初回のみ作成）
+
+    - フィルターは作成時に1回だけ登録
+    - auto_reload=True: テンプレートファイルの mtime が変わったら再コンパイル
+    - バイトコードキャッシュ: data/template_cache に保存（作成できない場合は無効）
+
+    Returns:
+        Jinja2 Environment
+    """
+    global _template_env
+    if _template_env is not None:
+        return _template_env
+
+    with _template_env_lock:
+        if _template_env is None:
+            bytecode_cache = None
+            try:
+                TEMPLATE_BYTECODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(str(TEMPLATE_BYTECODE_CACHE_DIR))
+            except Exception as e:
+                logger.debug(f"⚠️ テンプレートのバイトコードキャッシュを無効化: {e}")
+
+            env = Environment(
+                loader=_TemplatePathLoader(),
+                auto_reload=True,
+                bytecode_cache=bytecode_cache,
+            )
+            _register_filters(env)
+            _template_env = env
+            logger.debug("✅ 共有テンプレート Environment を作成しました")
+    return _template_env
+
+
+def clear_template_cache() -> None:
+    """コンパイル済みテンプレートのキャッシュを破棄（設定変更時など）"""
+    with _template_env_lock:
+        if _template_env is not None:
+            if _template_env.cache is not None:
+                _template_env.cache.clear()
+            if _template_env.bytecode_cache is not None:
+                _template_env.bytecode_cache.clear()
+    with _preview_cache_lock:
+        _preview_cache.clear()
+
+
+def on_config_changed(config, changed_keys: set) -> None:
+    """設定の再読み込み時にテンプレート関連の変更があればキャッシュを破棄（Config.subscribe() 用）"""
+    if any(key.startswith("TEMPLATE_") for key in changed_keys):
+        clear_template_cache()
+        logger.info("🔄 テンプレート設定の変更を検知したため、テンプレートキャッシュを破棄しました")
+
+
+def _get_preview_template(template_text: str):
+    """文字列テンプレートをコンパイル（同一テキストはキャッシュを再利用）"""
+    with _preview_cache_lock:
+        template_obj = _preview_cache.get(template_text)
+        if template_obj is not None:
+            _preview_cache.move_to_end(template_text)
+            return template_obj
+
+    # 構文エラー時は TemplateSyntaxError がそのまま送出される
+    template_obj = get_template_environment().from_string(template_text)
+
+    with _preview_cache_lock:
+        _preview_cache[template_text] = template_obj
+        while len(_preview_cache) > _PREVIEW_CACHE_MAX:
+            _preview_cache.popitem(last=False)
+    return template_obj
+
+
 # ============ ユーティリティ関数 ============
 
 
@@ -603,7 +734,8 @@ def _get_env_var_from_file(file_path: str, env_var_name: str) -> Optional[str]:
     settings.env などの設定ファイルから環境変数を読み込む（os.getenv の補完）。
 
     Python の os.getenv() は .env ファイルから環境変数を読み込まないため、
-    ここで手動でファイルを読んで、settings.env から値を取得します。
+    config の設定スナップショット（パース済み dict）から値を取得します。
+    ファイルは変更時のみ再パースされ、呼び出しごとの読み込みは発生しません。
 
     Args:
         file_path: 設定ファイルパス（例: "settings.env"）
@@ -613,22 +745,10 @@ def _get_env_var_from_file(file_path: str, env_var_name: str) -> Optional[str]:
         環境変数の値、見つからない場合は None
     """
     try:
-        file_path_obj = Path(file_path)
-        if not file_path_obj.exists():
-            return None
-
-        with open(file_path_obj, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    if key.strip() == env_var_name:
-                        return value.strip()
+        from config import get_setting
+        return get_setting(env_var_name, env_path=file_path)
     except Exception as e:
         logger.debug(f"⚠️ 設定ファイル読み込みエラー ({file_path}): {e}")
-
     return None
 
 
@@ -809,30 +929,12 @@ def load_template_with_fallback(
                 logger.warning(f"❌ フォールバックパスも指定されていません")
                 return None
 
-        # ファイル読み込み
-        logger.debug(f"🔍 ファイルを開く: {template_path}")
-        with open(template_path, encoding="utf-8") as f:
-            template_str = f.read()
-
-        # Jinja2 Environment でテンプレート化
-        env = Environment()
-        # ★ Jinja2 ビルトインフィルターを有効化（int, upper, lower など）
-
-        # フィルターを登録（format_datetime_filter は別途提供）
-        from utils_v3 import format_datetime_filter
-        env.filters["datetimeformat"] = format_datetime_filter
-
-        # v3.2.0: 動的変数フィルターを登録
-        env.filters["format_date"] = _format_date_filter
-        env.filters["format_datetime"] = _format_datetime_filter
-        env.filters["random_emoji"] = _random_emoji_filter
-        env.filters["weekday"] = _weekday_filter
-
-        # v3.3.0: 拡張時刻フィルターを登録
-        env.filters["extended_time"] = _extended_time_filter
-        env.filters["extended_time_display"] = _extended_time_display_filter
-
-        template_obj = env.from_string(template_str)
+        # 共有 Environment から取得（未変更ならコンパイル済みテンプレートを再利用）
+        logger.debug(f"🔍 テンプレートを取得: {template_path}")
+        try:
+            template_obj = get_template_environment().get_template(str(template_path.resolve()))
+        except TemplateNotFound as e:
+            raise FileNotFoundError(str(e)) from e
 
         logger.debug(f"✅ テンプレート読み込み成功: {path} (種別: {template_type})")
         return template_obj
@@ -1212,11 +1314,7 @@ def preview_template(
         event_context = get_sample_context(template_type)
 
     try:
-        env = Environment()
-        from utils_v3 import format_datetime_filter
-        env.filters["datetimeformat"] = format_datetime_filter
-
-        template_obj = env.from_string(template_text)
+        template_obj = _get_preview_template(template_text)
         rendered = template_obj.render(**event_context)
 
         logger.debug(f"✅ プレビューレンダリング成功: {template_type}")
@@ -1266,6 +1364,8 @@ def save_template_file(
 
         with open(output_path, "w", encoding="utf-8") as f:
             f.write(template_text)
+        # mtime で再コンパイルされるが、同一秒内の保存にも確実に反映させる
+        clear_template_cache()
 
         success_msg = f"✅ テンプレートを保存しました: {output_path}"
         logger.info(success_msg)
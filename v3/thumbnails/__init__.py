@@ -1,27 +1,36 @@
 ﻿# -*- coding: utf-8 -*-
 """
 Thumbnails module - OGP取得、画像再ダウンロード、バックフィル処理
-"""
-
-# ニコニコ関連
-from .niconico_ogp_backfill import backfill_niconico, fetch_thumbnail_url
-from .niconico_ogp_utils import get_niconico_ogp_url
 
-# YouTube関連
-from .youtube_thumb_utils import YouTubeThumbManager
-from .youtube_thumb_backfill import backfill_youtube
+各サブモジュールは初回参照時に読み込む（起動時に使わないバックフィル処理などを読み込まないため）
+"""
 
-# 統合画像再取得
-from .image_re_fetch_module import redownload_missing_images
+import importlib
 
-__all__ = [
+# 公開名 → 定義しているサブモジュール
+_EXPORTS = {
 	# ニコニコ関連
-	"backfill_niconico",
-	"fetch_thumbnail_url",
-	"get_niconico_ogp_url",
+	"backfill_niconico": ".niconico_ogp_backfill",
+	"fetch_thumbnail_url": ".niconico_ogp_backfill",
+	"get_niconico_ogp_url": ".niconico_ogp_utils",
+	"fetch_niconico_metadata": ".niconico_metadata",
+	"get_niconico_metadata_cache": ".niconico_metadata",
 	# YouTube関連
-	"YouTubeThumbManager",
-	"backfill_youtube",
-	# 統合
-	"redownload_missing_images",
-]
+	"YouTubeThumbManager": ".youtube_thumb_utils",
+	"backfill_youtube": ".youtube_thumb_backfill",
+	# 統合画像再取得
+	"redownload_missing_images": ".image_re_fetch_module",
+	# 並列ワーカープール
+	"BackfillPool": ".backfill_pool",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+	module_name = _EXPORTS.get(name)
+	if module_name is None:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	value = getattr(importlib.import_module(module_name, __name__), name)
+	globals()[name] = value
+	return value
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""
+サムネイル一括補完用の並列ワーカープール
+
+- ThreadPoolExecutor で最大 max_workers 件を同時に処理
+- ホスト単位の同時接続数を per_host_limit に制限（host_slot() で取得）
+- 処理結果は batch_size 件ごとに Database.save_backfill_batch() で一括書き込み
+- チェックポイント（backfill_progress テーブル）により、中断後の再実行で続きから再開
+  （最後まで処理が完了した時点でチェックポイントは削除される）
+
+youtube_thumb_backfill / niconico_ogp_backfill / image_re_fetch_module から利用する。
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+from metrics import QUEUE_DEPTH
+
+# ★ v3.4.0: ロギングプラグイン導入時はThumbnailsLogger、未導入時はAppLoggerにフォールバック
+def _get_logger():
+    """ロギングプラグイン対応のロガー取得（ThumbnailsLogger優先、未導入時はAppLogger）"""
+    thumbnails_logger = logging.getLogger("ThumbnailsLogger")
+    # ThumbnailsLogger にハンドラーが存在する = プラグイン導入時
+    if thumbnails_logger.handlers:
+        return thumbnails_logger
+    # プラグイン未導入時は AppLogger にフォールバック
+    return logging.getLogger("AppLogger")
+
+logger = _get_logger()
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_PER_HOST_LIMIT = 4
+DEFAULT_BATCH_SIZE = 50
+
+
+class BackfillPool:
+    """サムネイル一括補完の並列実行・チェックポイント管理"""
+
+    def __init__(
+        self,
+        db,
+        job_name: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        """
+        初期化
+
+        Args:
+            db: Database インスタンス
+            job_name: チェックポイントのジョブ名
+            max_workers: 同時実行数
+            per_host_limit: 1ホストあたりの同時接続数
+            batch_size: DB 一括書き込みの件数
+        """
+        self.db = db
+        self.job_name = job_name
+        self.max_workers = max(1, max_workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self.batch_size = max(1, batch_size)
+
+        self._host_semaphores = {}
+        self._host_lock = threading.Lock()
+
+        self._pending_images = []
+        self._pending_thumbs = []
+        self._pending_progress = []
+
+    @contextmanager
+    def host_slot(self, url: str):
+        """URL のホストに対する同時接続枠を取得するコンテキストマネージャ"""
+        host = urlparse(url).netloc.lower() if url else ""
+        with self._host_lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host_limit)
+                self._host_semaphores[host] = semaphore
+        with semaphore:
+            yield
+
+    def run(self, targets: list, worker, dry_run: bool = False, resume: bool = True, retry_failed: bool = False) -> dict:
+        """
+        補完対象を並列処理する
+
+        worker(video, pool) は次のキーを持つ辞書を返す:
+            - "status": "done" / "failed" / "skipped"
+            - "thumbnail_url": 更新するサムネイル URL（任意）
+            - "image_mode", "image_filename": 保存した画像（任意）
+
+        Args:
+            targets: 補完対象の動画リスト
+            worker: 1件分の処理関数
+            dry_run: True の場合は DB 書き込み・チェックポイント記録を行わない
+            resume: True の場合はチェックポイント済みの動画をスキップ
+            retry_failed: True の場合は前回失敗した動画も再試行
+
+        Returns:
+            {"done": int, "failed": int, "skipped": int, "resumed": int,
+             "updated_thumb": int, "saved_images": int, "interrupted": bool}
+        """
+        summary = {
+            "done": 0,
+            "failed": 0,
+            "skipped": 0,
+            "resumed": 0,
+            "updated_thumb": 0,
+            "saved_images": 0,
+            "interrupted": False,
+        }
+
+        if not dry_run and resume:
+            progress = self.db.get_backfill_progress(self.job_name)
+            if progress:
+                remaining = []
+                for v in targets:
+                    status = progress.get(v.get("video_id"))
+                    if status == "done" or (status == "failed" and not retry_failed):
+                        summary["resumed"] += 1
+                        continue
+                    remaining.append(v)
+                targets = remaining
+                logger.info(f"♻️ チェックポイントから再開: {summary['resumed']} 件スキップ ({self.job_name})")
+        elif not dry_run:
+            self.db.clear_backfill_progress(self.job_name)
+
+        total = len(targets)
+        if total == 0:
+            if not dry_run:
+                self.db.clear_backfill_progress(self.job_name)
+            return summary
+
+        logger.info(
+            f"🚀 並列補完開始: {total} 件 (workers={self.max_workers}, per_host={self.per_host_limit}, "
+            f"batch={self.batch_size}, dry_run={dry_run})"
+        )
+        started = time.monotonic()
+        completed = 0
+        queue_name = f"backfill_{self.job_name}"
+        QUEUE_DEPTH.set(total, queue=queue_name)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.job_name)
+        try:
+            futures = {executor.submit(self._run_one, worker, v): v for v in targets}
+            for future in as_completed(futures):
+                video = futures[future]
+                result = future.result()
+                completed += 1
+                QUEUE_DEPTH.set(total - completed, queue=queue_name)
+                self._collect(video, result, summary, dry_run)
+
+                if completed % self.batch_size == 0 or completed == total:
+                    if not dry_run:
+                        self._flush(summary)
+                    logger.info(f"📊 進捗: {completed}/{total} ({time.monotonic() - started:.1f}s)")
+
+        except KeyboardInterrupt:
+            summary["interrupted"] = True
+            logger.warning(f"⚠️ 中断されました。処理済み分を保存します ({completed}/{total})")
+            executor.shutdown(wait=False, cancel_futures=True)
+            if not dry_run:
+                self._flush(summary)
+            raise
+        finally:
+            executor.shutdown(wait=True)
+            QUEUE_DEPTH.set(0, queue=queue_name)
+
+        if not dry_run:
+            if self._flush(summary):
+                # 最後まで処理できたらチェックポイントは不要（失敗分は次回の実行で再試行）
+                self.db.clear_backfill_progress(self.job_name)
+            else:
+                logger.error("❌ 補完結果の一部を DB に保存できませんでした。次回の実行で再処理されます")
+
+        logger.info(f"✅ 並列補完完了: {completed} 件 ({time.monotonic() - started:.1f}s)")
+        return summary
+
+    def _run_one(self, worker, video: dict) -> dict:
+        """ワーカー関数を実行（例外は失敗として扱う）"""
+        try:
+            return worker(video, self) or {"status": "failed"}
+        except Exception as e:
+            logger.warning(f"⚠️ 補完処理エラー: {video.get('video_id')} - {e}")
+            return {"status": "failed"}
+
+    def _collect(self, video: dict, result: dict, summary: dict, dry_run: bool):
+        """ワーカーの結果を集計し、書き込み待ちバッファに追加"""
+        video_id = video.get("video_id")
+        status = result.get("status", "failed")
+        summary[status] = summary.get(status, 0) + 1
+
+        if dry_run:
+            return
+
+        if result.get("thumbnail_url"):
+            self._pending_thumbs.append((video_id, result["thumbnail_url"]))
+        if result.get("image_filename"):
+            self._pending_images.append((video_id, result.get("image_mode") or "import", result["image_filename"]))
+        if status in ("done", "failed"):
+            self._pending_progress.append((video_id, status))
+
+    def _flush(self, summary: dict) -> bool:
+        """
+        バッファの内容を1トランザクションで DB に書き込む
+
+        書き込みに失敗した場合はバッファを残し、次回の書き込みで再試行する。
+
+        Returns:
+            書き込めた場合（バッファが空の場合を含む） True
+        """
+        if not (self._pending_images or self._pending_thumbs or self._pending_progress):
+            return True
+        result = self.db.save_backfill_batch(
+            self.job_name,
+            image_updates=self._pending_images,
+            thumbnail_updates=self._pending_thumbs,
+            progress=self._pending_progress,
+        )
+        if result is None:
+            logger.warning(f"⚠️ 補完結果の DB 書き込みに失敗しました。次回の書き込みで再試行します（{len(self._pending_progress)} 件）")
+            return False
+        summary["updated_thumb"] += len(self._pending_thumbs)
+        summary["saved_images"] += len(self._pending_images)
+        self._pending_images = []
+        self._pending_thumbs = []
+        self._pending_progress = []
+        return True
@@ -13,8 +13,12 @@ thumbnail_urlから画像を再ダウンロードして保存します。
     python -m thumbnails.image_re_fetch_module --execute
 
 オプション:
-    --execute   : 実際にダウンロードを実行
-    --verbose   : 詳細ログを表示
+    --execute        : 実際にダウンロードを実行
+    --workers N      : 同時ダウンロード数（デフォルト: 8）
+    --per-host N     : 1ホストあたりの同時接続数（デフォルト: 4）
+    --restart        : チェックポイントを破棄して最初から実行
+    --retry-failed   : 中断前に失敗した動画も再試行
+    --verbose        : 詳細ログを表示
 """
 
 
@@ -30,18 +34,33 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 Path("logs").mkdir(exist_ok=True)
 
 from database import get_database
-from image_manager import get_image_manager, get_youtube_thumbnail_url
+from image_manager import YOUTUBE_THUMB_HOST_URL, get_image_manager, get_youtube_thumbnail_url
 from .niconico_ogp_utils import get_niconico_ogp_url
+from .niconico_metadata import NICONICO_THUMBINFO_URL
+from .backfill_pool import BackfillPool, DEFAULT_MAX_WORKERS, DEFAULT_PER_HOST_LIMIT
 
 # ThumbnailsLogger（logging_plugin.pyで設定管理）
 logger = logging.getLogger("ThumbnailsLogger")
 
-def redownload_missing_images(dry_run: bool = False):
+def redownload_missing_images(
+    dry_run: bool = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    resume: bool = True,
+    retry_failed: bool = False,
+):
     """
     画像が設定されていない動画のサムネイルを再ダウンロード
 
+    BackfillPool で並列にダウンロードし、DB は一括で更新する。
+    中断された場合は、次回実行時にチェックポイントから再開する。
+
     Args:
         dry_run: Trueの場合、実際のダウンロードは行わず、対象のみ表示
+        max_workers: 同時ダウンロード数
+        per_host_limit: 1ホストあたりの同時接続数
+        resume: Trueの場合、前回中断時のチェックポイントから再開
+        retry_failed: Trueの場合、中断前に失敗した動画も再試行
     """
     db = get_database()
     img_manager = get_image_manager()
@@ -58,11 +77,7 @@ def redownload_missing_images(dry_run: bool = False):
     print(f"画像未設定の動画: {len(videos)}件")
     print(f"{'='*60}\n")
 
-    success_count = 0
-    skip_count = 0
-    error_count = 0
-
-    for i, video in enumerate(videos, 1):
+    def worker(video: dict, pool: BackfillPool) -> dict:
         video_id = video["video_id"]
         title = video["title"]
         source = (video["source"] or "youtube").lower()
@@ -70,59 +85,49 @@ def redownload_missing_images(dry_run: bool = False):
 
         # YouTube は最新の高品質サムネイルを再取得
         if source == "youtube":
-            best_url = get_youtube_thumbnail_url(video_id)
+            with pool.host_slot(YOUTUBE_THUMB_HOST_URL):
+                best_url = get_youtube_thumbnail_url(video_id)
             if best_url:
                 thumbnail_url = best_url
                 logger.info(f"✅ YouTube サムネイル再取得: {video_id}")
         
-        # ニコニコはOGPから最新URLを再取得して利用
+        # ニコニコは getthumbinfo API から最新URLを再取得して利用
         elif source == "niconico":
-            ogp_url = get_niconico_ogp_url(video_id)
+            with pool.host_slot(NICONICO_THUMBINFO_URL):
+                ogp_url = get_niconico_ogp_url(video_id)
             if ogp_url:
                 thumbnail_url = ogp_url
-                logger.info(f"✅ ニコニコ OGP 再取得: {video_id}")
-
-        print(f"[{i}/{len(videos)}] {title}")
-        print(f"  ID: {video_id}")
-        print(f"  Source: {source}")
-        print(f"  URL: {thumbnail_url}")
+                logger.info(f"✅ ニコニコ サムネイルURL 再取得: {video_id}")
 
         if dry_run:
-            print(f"  → [DRY RUN] ダウンロード対象\n")
-            continue
+            print(f"[DRY RUN] {video_id} ({source}) {title}\n  URL: {thumbnail_url}")
+            return {"status": "skipped"}
 
         # サムネイルをダウンロード
-        filename = img_manager.download_and_save_thumbnail(
-            thumbnail_url=thumbnail_url,
-            site=source.capitalize(),
-            video_id=video_id,
-            mode="autopost"
-        )
-
-        if filename:
-            # データベースを更新
-            success = db.update_image_info(
+        with pool.host_slot(thumbnail_url):
+            filename = img_manager.download_and_save_thumbnail(
+                thumbnail_url=thumbnail_url,
+                site=source.capitalize(),
                 video_id=video_id,
-                image_mode="autopost",
-                image_filename=filename
+                mode="autopost"
             )
-            
-            if success:
-                print(f"  ✅ 成功: {filename}\n")
-                success_count += 1
-            else:
-                print(f"  ⚠️ ダウンロード成功、DB更新失敗\n")
-                error_count += 1
-        else:
-            print(f"  ❌ ダウンロード失敗\n")
-            error_count += 1
+
+        if not filename:
+            print(f"  ❌ ダウンロード失敗: {video_id} {title}")
+            return {"status": "failed"}
+
+        print(f"  ✅ 成功: {video_id} → {filename}")
+        return {"status": "done", "image_mode": "autopost", "image_filename": filename}
+
+    pool = BackfillPool(db, "image_re_fetch", max_workers=max_workers, per_host_limit=per_host_limit)
+    summary = pool.run(videos, worker, dry_run=dry_run, resume=resume, retry_failed=retry_failed)
 
     # サマリー表示
     print(f"\n{'='*60}")
     print("処理結果:")
-    print(f"  成功: {success_count}件")
-    print(f"  スキップ: {skip_count}件")
-    print(f"  失敗: {error_count}件")
+    print(f"  成功: {summary['saved_images']}件")
+    print(f"  スキップ: {summary['skipped'] + summary['resumed']}件")
+    print(f"  失敗: {summary['failed']}件")
     print(f"{'='*60}\n")
 
     if dry_run:
@@ -142,6 +147,28 @@ def main():
         action="store_true",
         help="実際にダウンロードを実行（指定しない場合はDRY RUN）"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help="同時ダウンロード数"
+    )
+    parser.add_argument(
+        "--per-host",
+        type=int,
+        default=DEFAULT_PER_HOST_LIMIT,
+        help="1ホストあたりの同時接続数"
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="チェックポイントを破棄して最初から実行"
+    )
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="中断前に失敗した動画も再試行"
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -164,7 +191,13 @@ def main():
     
 
     try:
-        redownload_missing_images(dry_run=dry_run)
+        redownload_missing_images(
+            dry_run=dry_run,
+            max_workers=args.workers,
+            per_host_limit=args.per_host,
+            resume=not args.restart,
+            retry_failed=args.retry_failed,
+        )
     except KeyboardInterrupt:
         print("\n\n⚠️ ユーザーによって中断されました")
         sys.exit(1)
@@ -0,0 +1,239 @@
+﻿# -*- coding: utf-8 -*-
+"""
+ニコニコ動画のメタデータ取得（getthumbinfo API）
+
+動画ページ（nicovideo.jp/watch/...）の HTML を取得・解析する代わりに、
+軽量な XML API（ext.nicovideo.jp/api/getthumbinfo/<video_id>）を1回呼び出し、
+<thumb> 要素を1回走査してタイトル・公開日時・投稿者・サムネイル URL をまとめて取得する。
+
+- 結果は動画 ID ごとにキャッシュ（data/niconico_metadata_cache.json、プロセス内共有）
+- 投稿者名は niconico_user_name_cache にも記録
+- 削除済み・非公開など API が fail を返した動画は NEGATIVE_TTL の間キャッシュ（再取得しない）
+- 通信エラーはキャッシュしない（次回再試行）
+- HTTP セッションはスレッドごとに再利用（バックフィルの並列実行で接続を使い回す）
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+
+from image_manager import NICONICO_LARGE_THUMB_SUFFIX
+from niconico_user_name_cache import get_niconico_user_name_cache
+
+# ★ v3.4.0: ロギングプラグイン導入時はThumbnailsLogger、未導入時はAppLoggerにフォールバック
+def _get_logger():
+    """ロギングプラグイン対応のロガー取得（ThumbnailsLogger優先、未導入時はAppLogger）"""
+    thumbnails_logger = logging.getLogger("ThumbnailsLogger")
+    # ThumbnailsLogger にハンドラーが存在する = プラグイン導入時
+    if thumbnails_logger.handlers:
+        return thumbnails_logger
+    # プラグイン未導入時は AppLogger にフォールバック
+    return logging.getLogger("AppLogger")
+
+logger = _get_logger()
+
+NICONICO_THUMBINFO_URL = "https://ext.nicovideo.jp/api/getthumbinfo/{video_id}"
+NICONICO_THUMBINFO_TIMEOUT = 10
+NICONICO_METADATA_CACHE_FILE = "data/niconico_metadata_cache.json"
+NICONICO_METADATA_NEGATIVE_TTL = 24 * 60 * 60  # 取得失敗（削除済みなど）結果の有効期間（秒）
+_METADATA_CACHE_SAVE_INTERVAL = 5.0            # キャッシュ保存の最小間隔（秒）
+
+# <thumb> の子要素名 → 返却する dict のキー
+_THUMB_FIELDS = {
+    "video_id": "video_id",
+    "title": "title",
+    "description": "description",
+    "thumbnail_url": "thumbnail_url_small",
+    "first_retrieve": "published_at",
+    "length": "length",
+    "view_counter": "view_counter",
+    "watch_url": "video_url",
+    "user_id": "user_id",
+    "user_nickname": "channel_name",
+    "ch_id": "channel_id",
+    "ch_name": "channel_name",
+}
+
+_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """現在のスレッド用の requests.Session を取得"""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _local.session = session
+    return session
+
+
+def parse_thumbinfo(xml_bytes: bytes) -> Optional[Dict[str, Any]]:
+    """
+    getthumbinfo の XML を解析
+
+    Args:
+        xml_bytes: レスポンス本文
+
+    Returns:
+        {video_id, title, description, published_at, video_url, channel_name, user_id,
+         thumbnail_url, thumbnail_url_small, length, view_counter}
+        API が fail を返した場合は {"error": "DELETED"} など
+    """
+    root = ET.fromstring(xml_bytes)
+    if root.get("status") != "ok":
+        return {"error": root.findtext("error/code") or "UNKNOWN"}
+
+    thumb = root.find("thumb")
+    if thumb is None:
+        return {"error": "UNKNOWN"}
+
+    # <thumb> の直下を1回だけ走査
+    metadata = {}
+    for child in thumb:
+        key = _THUMB_FIELDS.get(child.tag)
+        if key and child.text:
+            metadata[key] = child.text.strip()
+
+    small = metadata.get("thumbnail_url_small", "")
+    metadata["thumbnail_url"] = small + NICONICO_LARGE_THUMB_SUFFIX if small else ""
+    return metadata
+
+
+class NiconicoMetadataCache:
+    """
+    動画 ID ごとのメタデータキャッシュ
+
+    JSON 構造:
+    {
+        "sm9": {"fetched_at": 1735000000.0, "metadata": {...}},
+        "sm0": {"fetched_at": 1735000000.0, "error": "DELETED"}
+    }
+    """
+
+    def __init__(self, cache_file: str = NICONICO_METADATA_CACHE_FILE):
+        self.cache_file = Path(cache_file)
+        self.data = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = 0.0
+        self._load()
+
+    def _load(self) -> None:
+        """JSON ファイルから読み込み"""
+        if not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                self.data = json.load(f)
+            logger.debug(f"✅ ニコニコメタデータキャッシュを読み込みました: {len(self.data)} 件")
+        except Exception as e:
+            logger.warning(f"⚠️ ニコニコメタデータキャッシュの読み込みに失敗（リセットします）: {e}")
+            self.data = {}
+
+    def flush(self) -> bool:
+        """未保存の変更を JSON ファイルに書き込む"""
+        with self._lock:
+            if not self._dirty:
+                return True
+            snapshot = json.dumps(self.data, ensure_ascii=False)
+            self._dirty = False
+            self._last_save = time.monotonic()
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_file.with_suffix(".tmp")
+            tmp_path.write_text(snapshot, encoding="utf-8")
+            os.replace(tmp_path, self.cache_file)
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ ニコニコメタデータキャッシュの保存に失敗: {e}")
+            return False
+
+    def get(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """キャッシュ済みエントリを取得（期限切れの失敗結果は None）"""
+        with self._lock:
+            entry = self.data.get(video_id)
+        if not entry:
+            return None
+        if "error" in entry and time.time() - entry.get("fetched_at", 0) >= NICONICO_METADATA_NEGATIVE_TTL:
+            return None
+        return entry
+
+    def put(self, video_id: str, metadata: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> None:
+        """取得結果を記録（一定間隔でファイルへ保存）"""
+        entry = {"fetched_at": time.time()}
+        if error:
+            entry["error"] = error
+        else:
+            entry["metadata"] = metadata
+        with self._lock:
+            self.data[video_id] = entry
+            self._dirty = True
+            should_save = time.monotonic() - self._last_save >= _METADATA_CACHE_SAVE_INTERVAL
+        if should_save:
+            self.flush()
+
+
+_metadata_cache = None
+_metadata_cache_lock = threading.Lock()
+
+
+def get_niconico_metadata_cache() -> NiconicoMetadataCache:
+    """NiconicoMetadataCache のシングルトンインスタンスを取得"""
+    global _metadata_cache
+    with _metadata_cache_lock:
+        if _metadata_cache is None:
+            _metadata_cache = NiconicoMetadataCache()
+            atexit.register(_metadata_cache.flush)
+        return _metadata_cache
+
+
+def fetch_niconico_metadata(video_id: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+    """
+    ニコニコ動画のメタデータを取得（getthumbinfo API、動画 ID ごとにキャッシュ）
+
+    Args:
+        video_id: ニコニコ動画ID（sm123456789 など）
+        use_cache: False の場合はキャッシュを使わず API から再取得
+
+    Returns:
+        parse_thumbinfo() の dict（error キーなし）、取得失敗時は None
+    """
+    if not video_id:
+        return None
+
+    cache = get_niconico_metadata_cache()
+    if use_cache:
+        entry = cache.get(video_id)
+        if entry:
+            if "error" in entry:
+                logger.debug(f"[メタデータ] キャッシュ済みの取得失敗: {video_id} ({entry['error']})")
+                return None
+            return dict(entry["metadata"])
+
+    url = NICONICO_THUMBINFO_URL.format(video_id=video_id)
+    try:
+        resp = _get_session().get(url, timeout=NICONICO_THUMBINFO_TIMEOUT)
+        resp.raise_for_status()
+        metadata = parse_thumbinfo(resp.content)
+    except Exception as e:
+        logger.warning(f"[メタデータ取得失敗] {video_id}: {e}")
+        return None
+
+    if "error" in metadata:
+        logger.warning(f"[メタデータ取得失敗] {video_id}: {metadata['error']}")
+        cache.put(video_id, error=metadata["error"])
+        return None
+
+    cache.put(video_id, metadata=metadata)
+    # 投稿者名はユーザー名キャッシュにも記録（監視・手動追加と共有）
+    if metadata.get("user_id") and metadata.get("channel_name"):
+        get_niconico_user_name_cache().put(metadata["user_id"], metadata["channel_name"], "thumbinfo")
+    logger.debug(f"[メタデータ取得] {video_id} -> {metadata.get('title')}")
+    return dict(metadata)
@@ -2,9 +2,10 @@
 """
 YouTube動画のサムネイルURLと画像を一括補完するツール。
 - DB上で source='youtube' かつ thumbnail_url が空、または image_filename が空のレコードを対象
-- get_youtube_thumbnail_url() で多品質フォールバック（maxresdefault → sddefault → hqdefault → mqdefault → default）
+- get_youtube_thumbnail_url() で多品質フォールバック（maxresdefault → sddefault → hqdefault → mqdefault、HEAD/Range で実在確認）
 - 画像をダウンロードして images/YouTube/import に保存
 - DBの thumbnail_url / image_mode / image_filename を更新
+- BackfillPool で並列ダウンロード（ホスト単位の同時接続制限・チェックポイントによる再開対応）
 
 使い方:
     # ドライラン（更新なし、ログのみ）
@@ -14,8 +15,12 @@ YouTube動画のサムネイルURLと画像を一括補完するツール。
     python -m thumbnails.youtube_thumb_backfill --execute
 
 オプション:
-    --limit N   : 最大 N 件に制限
-    --verbose   : DEBUG ログを出力
+    --limit N        : 最大 N 件に制限
+    --workers N      : 同時ダウンロード数（デフォルト: 8）
+    --per-host N     : 1ホストあたりの同時接続数（デフォルト: 4）
+    --restart        : チェックポイントを破棄して最初から実行
+    --retry-failed   : 中断前に失敗した動画も再試行
+    --verbose        : DEBUG ログを出力
 """
 
 import argparse
@@ -27,7 +32,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from database import get_database
-from image_manager import get_image_manager, get_youtube_thumbnail_url
+from image_manager import YOUTUBE_THUMB_HOST_URL, get_image_manager, get_youtube_thumbnail_url
+from thumbnails.backfill_pool import BackfillPool, DEFAULT_MAX_WORKERS, DEFAULT_PER_HOST_LIMIT
 
 # ★ v3.4.0: ロギングプラグイン導入時はThumbnailsLogger、未導入時はAppLoggerにフォールバック
 def _get_logger():
@@ -42,20 +48,19 @@ def _get_logger():
 logger = _get_logger()
 
 
-def backfill_youtube(dry_run: bool = True, limit: int | None = None):
-    """YouTube動画のサムネイルを一括補完"""
+def backfill_youtube(
+    dry_run: bool = True,
+    limit: int | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    resume: bool = True,
+    retry_failed: bool = False,
+):
+    """YouTube動画のサムネイルを一括補完（並列実行・中断再開対応）"""
     db = get_database()
     img = get_image_manager()
 
-    videos = db.get_all_videos()
-    targets = []
-    for v in videos:
-        if (v.get("source") or "").lower() != "youtube":
-            continue
-        missing_thumb = not v.get("thumbnail_url")
-        missing_image = not v.get("image_filename")
-        if missing_thumb or missing_image:
-            targets.append(v)
+    targets = db.get_backfill_targets("youtube")
     if limit:
         targets = targets[:limit]
 
@@ -65,60 +70,64 @@ def backfill_youtube(dry_run: bool = True, limit: int | None = None):
 
     logger.info(f"[SUMMARY] 補完対象 {len(targets)} 件 (dry_run={dry_run})")
 
-    updated_thumb = 0
-    saved_images = 0
-    failed = 0
-
-    for v in targets:
+    def worker(v: dict, pool: BackfillPool) -> dict:
         video_id = v.get("video_id")
-        title = v.get("title", "")
-        logger.info(f"--- {video_id} | {title[:40]}")
+        logger.debug(f"--- {video_id} | {(v.get('title') or '')[:40]}")
 
         # バックフィル用: 既存URLにかかわらず、常に高品質URLを取得
-        thumb_url = get_youtube_thumbnail_url(video_id)
+        with pool.host_slot(YOUTUBE_THUMB_HOST_URL):
+            thumb_url = get_youtube_thumbnail_url(video_id)
         if not thumb_url:
             logger.warning(f"[WARNING] サムネURL取得不可: {video_id}")
-            failed += 1
-            continue
-
-        if not dry_run:
-            ok = db.update_thumbnail_url(video_id, thumb_url)
-            if ok:
-                updated_thumb += 1
+            return {"status": "failed"}
 
         # 画像ダウンロード（image_filename が未設定の場合）
         if v.get("image_filename"):
-            logger.debug("画像は既に設定済み、スキップ")
-            continue
+            logger.debug(f"画像は既に設定済み、スキップ: {video_id}")
+            return {"status": "done", "thumbnail_url": thumb_url}
 
         if dry_run:
             logger.info(f"[DRY] 画像ダウンロード予定: {thumb_url}")
-            continue
-
-        filename = img.download_and_save_thumbnail(
-            thumbnail_url=thumb_url,
-            site="YouTube",
-            video_id=video_id,
-            mode="import",
-        )
-        if filename:
-            db.update_image_info(video_id, image_mode="import", image_filename=filename)
-            saved_images += 1
-            logger.info(f"[OK] 画像保存: {filename}")
-        else:
+            return {"status": "skipped"}
+
+        with pool.host_slot(thumb_url):
+            filename = img.download_and_save_thumbnail(
+                thumbnail_url=thumb_url,
+                site="YouTube",
+                video_id=video_id,
+                mode="import",
+            )
+        if not filename:
             logger.error(f"[ERROR] 画像保存失敗: {video_id}")
-            failed += 1
+            return {"status": "failed", "thumbnail_url": thumb_url}
+
+        logger.info(f"[OK] 画像保存: {filename}")
+        return {
+            "status": "done",
+            "thumbnail_url": thumb_url,
+            "image_mode": "import",
+            "image_filename": filename,
+        }
+
+    pool = BackfillPool(db, "youtube_thumb_backfill", max_workers=max_workers, per_host_limit=per_host_limit)
+    summary = pool.run(targets, worker, dry_run=dry_run, resume=resume, retry_failed=retry_failed)
 
     logger.info("=== SUMMARY ===")
-    logger.info(f"サムネURL更新: {updated_thumb} 件")
-    logger.info(f"画像保存: {saved_images} 件")
-    logger.info(f"失敗: {failed} 件")
+    logger.info(f"サムネURL更新: {summary['updated_thumb']} 件")
+    logger.info(f"画像保存: {summary['saved_images']} 件")
+    logger.info(f"失敗: {summary['failed']} 件")
+    if summary["resumed"]:
+        logger.info(f"再開によりスキップ: {summary['resumed']} 件")
 
 
 def main():
     parser = argparse.ArgumentParser(description="YouTube動画のサムネイルを一括補完")
     parser.add_argument("--execute", action="store_true", help="実際に更新を行う")
     parser.add_argument("--limit", type=int, default=None, help="最大処理件数")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS, help="同時ダウンロード数")
+    parser.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST_LIMIT, help="1ホストあたりの同時接続数")
+    parser.add_argument("--restart", action="store_true", help="チェックポイントを破棄して最初から実行")
+    parser.add_argument("--retry-failed", action="store_true", help="中断前に失敗した動画も再試行")
     parser.add_argument("--verbose", action="store_true", help="DEBUGログを表示")
     args = parser.parse_args()
 
@@ -131,7 +140,14 @@ def main():
     )
 
     dry_run = not args.execute
-    backfill_youtube(dry_run=dry_run, limit=args.limit)
+    backfill_youtube(
+        dry_run=dry_run,
+        limit=args.limit,
+        max_workers=args.workers,
+        per_host_limit=args.per_host,
+        resume=not args.restart,
+        retry_failed=args.retry_failed,
+    )
 
 
 if __name__ == "__main__":
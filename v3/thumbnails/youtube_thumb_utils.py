@@ -19,6 +19,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from youtube_core.youtube_rss import YouTubeRSS
 from image_manager import get_image_manager
 from database import get_database
+from log_routing import route_module_logs
 
 # ★ v3.4.0: ロギングプラグイン導入時はThumbnailsLogger、未導入時はAppLoggerにフォールバック
 def _get_logger():
@@ -58,16 +59,8 @@ class YouTubeThumbManager:
         try:
             youtube_logger = logging.getLogger("YouTubeLogger")
 
-            # image_manager と database のロガーを一時的に YouTubeLogger に変更
-            import image_manager as im_module
-            import database as db_module
-
-            original_im_logger = im_module.logger
-            original_db_logger = db_module.logger
-            im_module.logger = youtube_logger
-            db_module.logger = youtube_logger
-
-            try:
+            # image_manager と database のログを YouTubeLogger に振り替え（このスレッド内のみ）
+            with route_module_logs("YouTubeLogger"):
                 # 画像をダウンロード・保存
                 filename = self.image_manager.download_and_save_thumbnail(
                     thumbnail_url=thumbnail_url,
@@ -77,7 +70,7 @@ class YouTubeThumbManager:
                 )
 
                 if filename:
-                    # DB の image_info を更新（db_module.logger がまだ YouTubeLogger）
+                    # DB の image_info を更新（振り替え中）
                     self.db.update_image_info(
                         video_id=video_id,
                         image_mode="import",
@@ -88,10 +81,6 @@ class YouTubeThumbManager:
                 else:
                     youtube_logger.warning(f"[自動画像取得失敗] {video_id}: 画像ダウンロード失敗")
                     return False
-            finally:
-                # ロガーを元に戻す
-                im_module.logger = original_im_logger
-                db_module.logger = original_db_logger
 
         except Exception as e:
             youtube_logger = logging.getLogger("YouTubeLogger")
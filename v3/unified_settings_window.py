@@ -22,6 +22,9 @@ logger = logging.getLogger("GUILogger")
 
 __version__ = "1.0.0"
 
+# キャッシュ更新ジョブの進捗表示の更新間隔（ミリ秒）
+CACHE_REFRESH_POLL_MS = 200
+
 # コメント状態で保存すべきキー
 COMMENTED_KEYS = {
     'YOUTUBE_LIVE_AUTO_POST_SCHEDULE',
@@ -339,7 +342,7 @@ class UnifiedSettingsWindow:
         ttk.Entry(frame, textvariable=nico_user_id_var, width=30).grid(row=0, column=1, sticky=tk.W, padx=5)
 
         # NICONICO_USER_ID説明
-        explanation_text = "ニコニコのユーザーIDを指定してください。（数字のみ）"
+        explanation_text = "ニコニコのユーザーIDを指定してください。（数字のみ、カンマ区切りで複数指定可）"
         ttk.Label(frame, text=explanation_text, foreground='black', wraplength=400, justify=tk.LEFT, font=("", 9)).grid(
             row=1, column=0, columnspan=3, sticky=tk.W, padx=(10, 0), pady=(0, 5)
         )
@@ -999,9 +1002,26 @@ class UnifiedSettingsWindow:
         ttk.Label(button_frame, text="YouTube 全件キャッシュを更新（50件ごとバッチ処理、時間がかかります）",
                   foreground='red', font=("", 9)).pack(anchor=tk.W, padx=10, pady=2)
 
+        # キャッシュ更新ジョブの進捗（バックグラウンド実行・中断/再開対応）
+        progress_frame = ttk.Frame(frame)
+        progress_frame.pack(fill=tk.X, pady=5)
+        self._cache_progress = ttk.Progressbar(progress_frame, mode='determinate', maximum=1)
+        self._cache_progress.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self._cache_cancel_button = ttk.Button(
+            progress_frame, text="⏹ 中断", command=self._on_cancel_cache_refresh, state=tk.DISABLED
+        )
+        self._cache_cancel_button.pack(side=tk.RIGHT, padx=5)
+        self._cache_progress_label = ttk.Label(frame, text="", font=("", 9))
+        self._cache_progress_label.pack(anchor=tk.W, padx=5)
+
+        # ウィンドウを開き直した時に実行中のジョブがあれば進捗表示を再開
+        from youtube_core.youtube_cache_refresh_job import get_cache_refresh_job
+        if get_cache_refresh_job().is_running:
+            self._poll_cache_refresh()
+
     def _on_clear_live_cache(self):
         """★ 【v3.3.3】LIVEキャッシュをクリア"""
-        if self._cache_operation_running:
+        if self._is_cache_operation_running():
             messagebox.showwarning("警告", "キャッシュ操作が実行中です。終了を待ってください。")
             return
 
@@ -1014,18 +1034,12 @@ class UnifiedSettingsWindow:
             if self.db:
                 # youtube_live_cache テーブルをクリア
                 try:
-                    from deleted_video_cache import get_deleted_video_cache
-                    deleted_cache = get_deleted_video_cache()
-
-                    # Live 関連動画をクリア（簡略版：DB から取得して削除）
-                    videos = self.db.get_all_videos()
-                    live_count = 0
-                    for video in videos:
-                        content_type = video.get('content_type', '')
-                        if content_type in ['schedule', 'live', 'completed', 'archive']:
-                            # キャッシュをクリア（DB の該当レコードを削除）
-                            self.db.delete_video(video['video_id'])
-                            live_count += 1
+                    # Live 関連動画をクリア（DB の該当レコードを1トランザクションで一括削除）
+                    live_ids = []
+                    for content_type in ['schedule', 'live', 'completed', 'archive']:
+                        live_ids.extend(v['video_id'] for v in self.db.get_videos_by_content_type(content_type))
+                    result = self.db.delete_videos_batch(live_ids)
+                    live_count = result["deleted_count"]
 
                     messagebox.showinfo("完了", f"✅ {live_count} 件の Live キャッシュをクリアしました")
                     logger.info(f"[キャッシュ管理] Live キャッシュをクリア: {live_count} 件")
@@ -1039,82 +1053,107 @@ class UnifiedSettingsWindow:
 
     def _on_update_schedule_cache(self):
         """★ 【v3.3.3】Schedule キャッシュを更新"""
-        if self._cache_operation_running:
+        if self._is_cache_operation_running():
             messagebox.showwarning("警告", "キャッシュ操作が実行中です。終了を待ってください。")
             return
 
         if not messagebox.askyesno("確認", "Schedule 状態の Live キャッシュを更新しますか？\n（1時間以内の更新済みはスキップします）"):
             return
 
-        self._cache_operation_running = True
-        try:
-            self._update_cache_by_type('schedule')
-        finally:
-            self._cache_operation_running = False
+        self._update_cache_by_type('schedule')
 
     def _on_update_live_cache(self):
         """★ 【v3.3.3】LIVE（upcoming/live/end）キャッシュを更新"""
-        if self._cache_operation_running:
+        if self._is_cache_operation_running():
             messagebox.showwarning("警告", "キャッシュ操作が実行中です。終了を待ってください。")
             return
 
         if not messagebox.askyesno("確認", "Upcoming/Live/End 状態の Live キャッシュを更新しますか？\n（1時間以内の更新済みはスキップします）"):
             return
 
-        self._cache_operation_running = True
-        try:
-            self._update_cache_by_type('live')
-        finally:
-            self._cache_operation_running = False
+        self._update_cache_by_type('live')
 
     def _on_update_archive_cache(self):
         """★ 【v3.3.3】Archive キャッシュを更新"""
-        if self._cache_operation_running:
+        if self._is_cache_operation_running():
             messagebox.showwarning("警告", "キャッシュ操作が実行中です。終了を待ってください。")
             return
 
         if not messagebox.askyesno("確認", "Archive 状態の Live キャッシュを更新しますか？\n（1時間以内の更新済みはスキップします）"):
             return
 
-        self._cache_operation_running = True
-        try:
-            self._update_cache_by_type('archive')
-        finally:
-            self._cache_operation_running = False
+        self._update_cache_by_type('archive')
 
     def _on_update_video_cache(self):
         """★ 【v3.3.3】動画（video）キャッシュを更新"""
-        if self._cache_operation_running:
+        if self._is_cache_operation_running():
             messagebox.showwarning("警告", "キャッシュ操作が実行中です。終了を待ってください。")
             return
 
         if not messagebox.askyesno("確認", "動画キャッシュを更新しますか？\n（7日以上前のキャッシュのみ更新）"):
             return
 
-        self._cache_operation_running = True
-        try:
-            self._update_cache_by_type('video')
-        finally:
-            self._cache_operation_running = False
+        self._update_cache_by_type('video')
 
     def _on_force_update_all_cache(self):
         """★ 【v3.3.3】キャッシュ強制更新（全件）"""
-        if self._cache_operation_running:
+        if self._is_cache_operation_running():
             messagebox.showwarning("警告", "キャッシュ操作が実行中です。終了を待ってください。")
             return
 
         if not messagebox.askyesno("確認", "YouTube 全件キャッシュを強制更新しますか？\n（時間がかかる場合があります）"):
             return
 
-        self._cache_operation_running = True
-        try:
-            self._update_cache_by_type('all')
-        finally:
-            self._cache_operation_running = False
+        self._update_cache_by_type('all')
+
+    def _is_cache_operation_running(self) -> bool:
+        """キャッシュ操作（クリア・バックグラウンド更新ジョブ）が実行中か"""
+        from youtube_core.youtube_cache_refresh_job import get_cache_refresh_job
+        return self._cache_operation_running or get_cache_refresh_job().is_running
+
+    def _get_cache_refresh_targets(self, cache_type):
+        """キャッシュ種別ごとの更新対象（YouTube 動画のみ）を取得
+
+        Returns:
+            (更新対象の video_id リスト, スキップ件数)
+        """
+        if cache_type == 'all':
+            # 全件更新
+            videos = [v for v in self.db.get_all_videos() if (v.get('source') or 'youtube').lower() == 'youtube']
+            return [v['video_id'] for v in videos], 0
+
+        if cache_type == 'schedule':
+            # Schedule Live のみ更新
+            content_types, expiry_type = ['schedule'], 'live'
+        elif cache_type == 'live':
+            # Upcoming/Live/End Live のみ更新
+            content_types, expiry_type = ['upcoming', 'live', 'end'], 'live'
+        elif cache_type == 'archive':
+            # Archive Live のみ更新
+            content_types, expiry_type = ['archive'], 'live'
+        else:
+            # 動画のみ更新（7日以上前）
+            content_types, expiry_type = ['video'], 'video'
+
+        targets = []
+        skipped_count = 0
+        for content_type in content_types:
+            for video in self.db.get_videos_by_content_type(content_type):
+                if (video.get('source') or 'youtube').lower() != 'youtube':
+                    continue
+                if self._should_update_cache(video, cache_type=expiry_type):
+                    targets.append(video['video_id'])
+                else:
+                    skipped_count += 1
+        return targets, skipped_count
 
     def _update_cache_by_type(self, cache_type):
-        """★ 【v3.3.3】キャッシュを種別ごとに更新（共通メソッド）"""
-        from datetime import datetime, timedelta
+        """★ 【v3.3.3】キャッシュを種別ごとに更新（共通メソッド）
+
+        対象の選定・クォータ確認はメインスレッドで行い、API 取得とキャッシュ保存は
+        CacheRefreshJob でバックグラウンド実行する（50件ごとに1回の API 呼び出し・1回のファイル書き込み）。
+        """
+        from youtube_core.youtube_cache_refresh_job import get_cache_refresh_job, estimate_quota_cost
 
         try:
             if not self.db:
@@ -1143,102 +1182,105 @@ class UnifiedSettingsWindow:
                 messagebox.showerror("エラー", f"❌ Classifier 取得エラー:\n{e}")
                 return
 
-            updated_count = 0
+            job = get_cache_refresh_job()
+            resume_state = None
             skipped_count = 0
-            error_count = 0
-
-            if cache_type == 'schedule':
-                # Schedule Live のみ更新
-                videos = self.db.get_all_videos()
-                for video in videos:
-                    content_type = video.get('content_type', '')
-                    if content_type == 'schedule':
-                        if self._should_update_cache(video, cache_type='live'):
-                            try:
-                                classifier.classify_video(video['video_id'], force_refresh=True)
-                                updated_count += 1
-                            except Exception as e:
-                                error_count += 1
-                                logger.warning(f"[キャッシュ更新] エラー ({video['video_id']}): {e}")
-                        else:
-                            skipped_count += 1
-
-            elif cache_type == 'live':
-                # Upcoming/Live/End Live のみ更新
-                videos = self.db.get_all_videos()
-                for video in videos:
-                    content_type = video.get('content_type', '')
-                    if content_type in ['upcoming', 'live', 'end']:
-                        if self._should_update_cache(video, cache_type='live'):
-                            try:
-                                classifier.classify_video(video['video_id'], force_refresh=True)
-                                updated_count += 1
-                            except Exception as e:
-                                error_count += 1
-                                logger.warning(f"[キャッシュ更新] エラー ({video['video_id']}): {e}")
-                        else:
-                            skipped_count += 1
-
-            elif cache_type == 'archive':
-                # Archive Live のみ更新
-                videos = self.db.get_all_videos()
-                for video in videos:
-                    content_type = video.get('content_type', '')
-                    if content_type == 'archive':
-                        if self._should_update_cache(video, cache_type='live'):
-                            try:
-                                classifier.classify_video(video['video_id'], force_refresh=True)
-                                updated_count += 1
-                            except Exception as e:
-                                error_count += 1
-                                logger.warning(f"[キャッシュ更新] エラー ({video['video_id']}): {e}")
-                        else:
-                            skipped_count += 1
-
-            elif cache_type == 'video':
-                # 動画のみ更新（7日以上前）
-                videos = self.db.get_all_videos()
-                for video in videos:
-                    content_type = video.get('content_type', '')
-                    if content_type == 'video':
-                        if self._should_update_cache(video, cache_type='video'):
-                            try:
-                                classifier.classify_video(video['video_id'], force_refresh=True)
-                                updated_count += 1
-                            except Exception as e:
-                                error_count += 1
-                                logger.warning(f"[キャッシュ更新] エラー ({video['video_id']}): {e}")
-                        else:
-                            skipped_count += 1
-
-            elif cache_type == 'all':
-                # 全件更新（50件ごとバッチ）
-                videos = self.db.get_all_videos()
-                batch_size = 50
-                for i in range(0, len(videos), batch_size):
-                    batch = videos[i:i+batch_size]
-                    for video in batch:
-                        try:
-                            classifier.classify_video(video['video_id'], force_refresh=True)
-                            updated_count += 1
-                        except Exception as e:
-                            error_count += 1
-                            logger.warning(f"[キャッシュ更新] エラー ({video['video_id']}): {e}")
-
-            # 結果を表示
-            message = f"✅ キャッシュ更新完了\n\n更新: {updated_count} 件"
-            if skipped_count > 0:
-                message += f"\nスキップ: {skipped_count} 件"
-            if error_count > 0:
-                message += f"\nエラー: {error_count} 件"
-
-            messagebox.showinfo("完了", message)
-            logger.info(f"[キャッシュ管理] {cache_type} キャッシュ更新完了: 更新 {updated_count}, スキップ {skipped_count}, エラー {error_count}")
+
+            # 前回中断した同種別のジョブがあれば再開を確認
+            pending = job.get_pending()
+            if pending:
+                if pending.get("cache_type") == cache_type and messagebox.askyesno(
+                    "確認",
+                    f"前回中断したキャッシュ更新が残っています（残り {len(pending['remaining'])} 件）。\n続きから再開しますか？\n\n"
+                    "「いいえ」を選ぶと最初からやり直します。"
+                ):
+                    resume_state = pending
+                else:
+                    job.discard_pending()
+
+            if resume_state:
+                video_ids = resume_state["remaining"]
+            else:
+                video_ids, skipped_count = self._get_cache_refresh_targets(cache_type)
+
+            if not video_ids:
+                message = "✅ 更新対象のキャッシュはありません"
+                if skipped_count > 0:
+                    message += f"\n\nスキップ: {skipped_count} 件"
+                messagebox.showinfo("完了", message)
+                return
+
+            # 開始前にクォータを確認（50件ごとに1ユニット）
+            required = estimate_quota_cost(len(video_ids))
+            remaining_quota = youtube_api_plugin.get_remaining_quota()
+            if required > remaining_quota:
+                messagebox.showerror(
+                    "エラー",
+                    f"❌ 本日の API クォータが不足しています\n\n"
+                    f"必要: {required} ユニット（{len(video_ids)} 件）\n残り: {remaining_quota} ユニット"
+                )
+                return
+
+            def fetch_batch(ids):
+                # クォータ超過を検知したら中断（残りは次回再開）
+                if youtube_api_plugin.get_remaining_quota() <= 0:
+                    return None
+                details = youtube_api_plugin.fetch_video_details_batch(ids, force_refresh=True)
+                if not details and youtube_api_plugin.get_remaining_quota() <= 0:
+                    return None  # このバッチ中にクォータ超過を検知（バッチごと次回に持ち越す）
+                return details
+
+            self._cache_refresh_skipped = skipped_count
+            job.start(cache_type, video_ids, fetch_batch, classifier.store_video_details, resume_state=resume_state)
+            self._poll_cache_refresh()
 
         except Exception as e:
             messagebox.showerror("エラー", f"❌ キャッシュ更新中にエラー:\n{e}")
             logger.error(f"[キャッシュ管理] エラー: {e}")
 
+    def _on_cancel_cache_refresh(self):
+        """キャッシュ更新ジョブを中断（続きは次回再開可能）"""
+        from youtube_core.youtube_cache_refresh_job import get_cache_refresh_job
+        get_cache_refresh_job().cancel()
+        self._cache_progress_label.config(text="⏹ 中断しています（現在のバッチの完了後に停止）...")
+
+    def _poll_cache_refresh(self):
+        """キャッシュ更新ジョブの進捗を表示（root.after でポーリング）"""
+        from youtube_core.youtube_cache_refresh_job import get_cache_refresh_job
+
+        if not self.window.winfo_exists():
+            return
+
+        status = get_cache_refresh_job().get_status()
+        self._cache_progress.config(maximum=max(status["total"], 1), value=status["done"])
+        self._cache_progress_label.config(
+            text=f"{status['cache_type']}: {status['done']}/{status['total']} 件"
+                 f"（更新 {status['updated']}, エラー {status['errors']}）"
+        )
+
+        if status["running"]:
+            self._cache_cancel_button.config(state=tk.NORMAL)
+            self.window.after(CACHE_REFRESH_POLL_MS, self._poll_cache_refresh)
+            return
+
+        self._cache_cancel_button.config(state=tk.DISABLED)
+        skipped_count = getattr(self, '_cache_refresh_skipped', 0)
+        self._cache_refresh_skipped = 0
+
+        # 結果を表示
+        if status["cancelled"] or status["interrupted"]:
+            message = f"⏹ キャッシュ更新を{status['message']}\n\n更新: {status['updated']} 件"
+            message += f"\n残り: {status['total'] - status['done']} 件（次回実行時に続きから再開できます）"
+        else:
+            message = f"✅ キャッシュ更新完了\n\n更新: {status['updated']} 件"
+        if skipped_count > 0:
+            message += f"\nスキップ: {skipped_count} 件"
+        if status["errors"] > 0:
+            message += f"\nエラー: {status['errors']} 件"
+
+        messagebox.showinfo("完了", message, parent=self.window)
+        logger.info(f"[キャッシュ管理] {status['cache_type']} キャッシュ更新完了: 更新 {status['updated']}, スキップ {skipped_count}, エラー {status['errors']}")
+
     def _should_update_cache(self, video, cache_type='live'):
         """★ 【v3.3.3】キャッシュを更新すべきかチェック"""
         from datetime import datetime, timedelta
@@ -1958,6 +2000,19 @@ class UnifiedSettingsWindow:
             font=("", 9)
         ).pack(anchor=tk.W, padx=40, pady=(0, 15))
 
+        ttk.Button(
+            frame,
+            text="🗂️ 増分バックアップを作成",
+            command=self._on_create_incremental_backup
+        ).pack(anchor=tk.W, padx=20, pady=5, fill=tk.X)
+
+        ttk.Label(
+            frame,
+            text="backup/incremental/ に前回から変更・追加されたファイルだけを保存します。\n画像フォルダを含めても、2回目以降は追加された画像の分しか増えません。",
+            foreground='black',
+            font=("", 9)
+        ).pack(anchor=tk.W, padx=40, pady=(0, 15))
+
         # === 注意事項 ===
         warning_text = """⚠️ 注意事項
 
@@ -2024,6 +2079,19 @@ class UnifiedSettingsWindow:
             font=("", 9)
         ).pack(anchor=tk.W, padx=40, pady=(0, 15))
 
+        ttk.Button(
+            frame,
+            text="🗂️ 増分バックアップから復元",
+            command=self._on_restore_snapshot_exec
+        ).pack(anchor=tk.W, padx=20, pady=5, fill=tk.X)
+
+        ttk.Label(
+            frame,
+            text="backup/incremental/snapshots/ のスナップショット（.json）を選択してください。\n全ファイルのハッシュを照合し、一致した場合のみ復元します。",
+            foreground='black',
+            font=("", 9)
+        ).pack(anchor=tk.W, padx=40, pady=(0, 15))
+
         # === セパレータ ===
         ttk.Separator(frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=10, padx=10)
 
@@ -2088,6 +2156,74 @@ class UnifiedSettingsWindow:
             logger.error(f"❌ バックアップ処理エラー: {e}")
             messagebox.showerror("エラー", f"バックアップ処理に失敗しました:\n{e}")
 
+    def _on_create_incremental_backup(self):
+        """増分バックアップ作成処理"""
+        try:
+            from backup_manager import get_backup_manager
+
+            backup_manager = get_backup_manager()
+            success, msg = backup_manager.create_incremental_backup(
+                include_api_keys=self.backup_include_api_keys.get(),
+                include_passwords=self.backup_include_passwords.get(),
+                include_images=self.backup_include_images.get()
+            )
+
+            if success:
+                messagebox.showinfo("バックアップ完了", msg)
+            else:
+                messagebox.showerror("バックアップ失敗", msg)
+
+        except ImportError:
+            logger.error("❌ backup_manager モジュールが見つかりません")
+            messagebox.showerror("エラー", "バックアップマネージャーが見つかりません")
+        except Exception as e:
+            logger.error(f"❌ 増分バックアップ処理エラー: {e}")
+            messagebox.showerror("エラー", f"増分バックアップ処理に失敗しました:\n{e}")
+
+    def _on_restore_snapshot_exec(self):
+        """増分バックアップ（スナップショット）からの復元処理"""
+        try:
+            from backup_manager import get_backup_manager
+
+            backup_manager = get_backup_manager()
+            snapshots_dir = backup_manager.incremental_dir / "snapshots"
+
+            # スナップショットを選択
+            snapshot_file = filedialog.askopenfilename(
+                title="スナップショットを選択",
+                filetypes=[("スナップショット", "*.json"), ("すべてのファイル", "*.*")],
+                initialdir=str(snapshots_dir) if snapshots_dir.exists() else None
+            )
+
+            if not snapshot_file:
+                return
+
+            # 確認ダイアログ
+            result = messagebox.askyesno(
+                "復元確認",
+                f"このスナップショットから復元しますか？\n\n{snapshot_file}\n\n⚠️ 現在のデータは上書きされます。\n既存データは自動的にバックアップされます。"
+            )
+
+            if not result:
+                return
+
+            # 復元実行（ハッシュ照合に失敗した場合は何も変更されない）
+            success, msg = backup_manager.restore_snapshot(snapshot_file)
+
+            if success:
+                logger.info(f"✅ 復元完了: {snapshot_file}")
+                messagebox.showinfo("復元完了", msg)
+            else:
+                logger.error(f"❌ 復元失敗: {msg}")
+                messagebox.showerror("復元失敗", msg)
+
+        except ImportError:
+            logger.error("❌ backup_manager モジュールが見つかりません")
+            messagebox.showerror("エラー", "バックアップマネージャーが見つかりません")
+        except Exception as e:
+            logger.error(f"❌ 復元処理エラー: {e}")
+            messagebox.showerror("エラー", f"復元処理に失敗しました:\n{e}")
+
     def _on_restore_backup_exec(self):
         """バックアップ復元処理"""
         try:
@@ -2182,7 +2318,7 @@ class UnifiedSettingsWindow:
 
             messagebox.showinfo(
                 "成功",
-                "設定を保存しました。\n\n※ アプリ再起動時に反映されます。"
+                "設定を保存しました。\n\n※ 設定はすぐに反映されます（ログイン情報・動作モード等の一部の設定はアプリ再起動時に反映）。"
             )
             logger.info("✅ 統合設定ウィンドウから設定を保存しました")
             self.window.destroy()
@@ -2247,6 +2383,11 @@ class UnifiedSettingsWindow:
             with open(self.settings_file, 'w', encoding='utf-8') as f:
                 f.write('\n'.join(lines) + '\n')
 
+            # 設定スナップショットを破棄し、実行中の設定に反映（ホットリロード）
+            from config import invalidate_settings_cache, reload_config
+            invalidate_settings_cache(self.settings_file)
+            reload_config(str(self.settings_file))
+
             logger.info(f"✅ settings.env を更新しました（{len(processed_keys)}個のキー）")
 
         except Exception as e:
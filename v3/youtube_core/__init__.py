@@ -13,6 +13,8 @@ YouTube Core - YouTube 共通ユーティリティライブラリ
   - youtube_rss: YouTube RSS フィード取得・パース・DB保存
   - youtube_websub: YouTube WebSub (PubSubHubbub) 対応
   - youtube_dedup_priority: YouTube 優先度ベース重複排除ロジック
+  - youtube_detail_freshness: API 取得済み動画詳細の鮮度付き共有キャッシュ
+  - youtube_cache_refresh_job: 動画詳細キャッシュの一括更新ジョブ（バックグラウンド・中断/再開）
 """
 
 __version__ = "1.0.0"
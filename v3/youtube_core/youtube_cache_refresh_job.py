@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+
+"""
+YouTube 動画詳細キャッシュの一括更新ジョブ
+
+設定ウィンドウの「キャッシュ強制更新」などをバックグラウンドで実行する。
+
+- 対象 ID を CACHE_REFRESH_BATCH_SIZE（50）件ずつ videos.list に渡し、1バッチ = 1 API 呼び出し
+- キャッシュファイルへの書き込みはバッチごとに1回
+- 残りの ID をバッチごとに data/cache_refresh_job.json に保存し、中断・クォータ不足で
+  止まった場合は次回「続きから再開」できる（最後まで完了した時点で削除）
+- 進捗は get_status() で取得（GUI 側が root.after でポーリングして表示）
+"""
+
+import json
+import logging
+import math
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from metrics import QUEUE_DEPTH
+
+__author__ = "mayuneco(mayunya)"
+__copyright__ = "Copyright (C) 2025 mayuneco(mayunya)"
+__license__ = "GPLv2"
+
+logger = logging.getLogger("AppLogger")
+
+SCRIPT_DIR = Path(__file__).parent.parent  # v3/ ディレクトリ
+CACHE_REFRESH_STATE_FILE = SCRIPT_DIR / "data" / "cache_refresh_job.json"
+CACHE_REFRESH_BATCH_SIZE = 50  # videos.list の id に指定できる上限
+CACHE_REFRESH_BATCH_COST = 1  # videos.list 1回あたりのクォータ消費（ユニット）
+
+_cache_refresh_job = None
+
+
+def estimate_quota_cost(video_count: int) -> int:
+    """video_count 件を更新するのに必要なクォータ（ユニット）を見積もる"""
+    return math.ceil(video_count / CACHE_REFRESH_BATCH_SIZE) * CACHE_REFRESH_BATCH_COST
+
+
+class CacheRefreshJob:
+    """動画詳細キャッシュの一括更新ジョブ（同時に1件のみ実行）"""
+
+    def __init__(self, state_file: Path = CACHE_REFRESH_STATE_FILE):
+        """
+        初期化
+
+        Args:
+            state_file: 中断時の再開用状態ファイルのパス
+        """
+        self.state_file = Path(state_file)
+        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        self._thread = None
+        self._status = self._new_status(None, 0)
+        QUEUE_DEPTH.set_function(self._remaining_count, queue="cache_refresh")
+
+    def _remaining_count(self) -> int:
+        with self._lock:
+            return self._status["total"] - self._status["done"] if self._status["running"] else 0
+
+    @staticmethod
+    def _new_status(cache_type: Optional[str], total: int) -> Dict[str, Any]:
+        return {
+            "cache_type": cache_type,
+            "total": total,
+            "done": 0,
+            "updated": 0,
+            "errors": 0,
+            "running": False,
+            "finished": False,
+            "cancelled": False,
+            "interrupted": False,
+            "message": "",
+        }
+
+    @property
+    def is_running(self) -> bool:
+        """実行中かどうか"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_status(self) -> Dict[str, Any]:
+        """進捗のスナップショットを取得"""
+        with self._lock:
+            return dict(self._status)
+
+    def get_pending(self) -> Optional[Dict[str, Any]]:
+        """
+        前回中断したジョブの状態を取得
+
+        Returns:
+            {"cache_type", "remaining", "total", "updated", "errors"} または None
+        """
+        if not self.state_file.exists():
+            return None
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("remaining"):
+                return state
+        except Exception as e:
+            logger.warning(f"⚠️ キャッシュ更新ジョブの状態読み込みエラー: {e}")
+        return None
+
+    def discard_pending(self) -> None:
+        """前回中断したジョブの状態を破棄"""
+        try:
+            self.state_file.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"⚠️ キャッシュ更新ジョブの状態削除エラー: {e}")
+
+    def start(
+        self,
+        cache_type: str,
+        video_ids: List[str],
+        fetch_batch: Callable[[List[str]], Optional[Dict[str, Dict[str, Any]]]],
+        store_batch: Callable[[Dict[str, Dict[str, Any]]], None],
+        resume_state: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        ジョブをバックグラウンドで開始
+
+        Args:
+            cache_type: キャッシュ種別（表示・再開判定用）
+            video_ids: 更新対象の動画 ID（resume_state 指定時は無視）
+            fetch_batch: fetch_batch(ids) 最大50件の動画詳細を取得して {video_id: details} を返す。
+                         クォータ不足などで続行できない場合は None を返す（ジョブは中断扱いで停止）
+            store_batch: store_batch(details) 取得した動画詳細をキャッシュに保存（バッチごとに1回呼ばれる）
+            resume_state: get_pending() の戻り値（続きから再開する場合）
+
+        Returns:
+            開始できた場合 True（既に実行中の場合 False）
+        """
+        if self.is_running:
+            return False
+
+        if resume_state:
+            cache_type = resume_state.get("cache_type", cache_type)
+            video_ids = list(resume_state.get("remaining", []))
+            total = resume_state.get("total", len(video_ids))
+            status = self._new_status(cache_type, total)
+            status["updated"] = resume_state.get("updated", 0)
+            status["errors"] = resume_state.get("errors", 0)
+            status["done"] = total - len(video_ids)
+        else:
+            video_ids = list(dict.fromkeys(video_ids))
+            status = self._new_status(cache_type, len(video_ids))
+
+        status["running"] = True
+        with self._lock:
+            self._status = status
+        self._cancel_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(video_ids, fetch_batch, store_batch),
+            name="CacheRefreshJob",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(f"[キャッシュ管理] {cache_type} キャッシュ更新ジョブ開始: {len(video_ids)} 件（再開: {bool(resume_state)}）")
+        return True
+
+    def cancel(self) -> None:
+        """実行中のジョブを中断（現在のバッチの完了後に停止し、続きは次回再開可能）"""
+        self._cancel_event.set()
+
+    def _run(self, video_ids: List[str], fetch_batch, store_batch) -> None:
+        remaining = list(video_ids)
+        try:
+            while remaining:
+                if self._cancel_event.is_set():
+                    self._finish(remaining, cancelled=True, message="中断しました")
+                    return
+
+                batch = remaining[:CACHE_REFRESH_BATCH_SIZE]
+                details = fetch_batch(batch)
+                if details is None:
+                    self._finish(remaining, interrupted=True, message="API クォータ不足または API エラーのため停止しました")
+                    return
+
+                if details:
+                    store_batch(details)
+
+                remaining = remaining[CACHE_REFRESH_BATCH_SIZE:]
+                with self._lock:
+                    self._status["done"] += len(batch)
+                    self._status["updated"] += len(details)
+                    # 取得できなかった ID（削除済み・非公開など）はエラーとして数える
+                    self._status["errors"] += len(batch) - len(details)
+                self._save_state(remaining)
+
+            self._finish([], message="完了しました")
+
+        except Exception as e:
+            logger.error(f"[キャッシュ管理] キャッシュ更新ジョブエラー: {e}", exc_info=True)
+            self._finish(remaining, interrupted=True, message=f"エラーのため停止しました: {e}")
+
+    def _finish(self, remaining: List[str], cancelled: bool = False, interrupted: bool = False, message: str = "") -> None:
+        if remaining:
+            self._save_state(remaining)
+        else:
+            self.discard_pending()
+        with self._lock:
+            self._status.update(running=False, finished=True, cancelled=cancelled, interrupted=interrupted, message=message)
+            status = dict(self._status)
+        logger.info(
+            f"[キャッシュ管理] {status['cache_type']} キャッシュ更新ジョブ終了（{message}）: "
+            f"更新 {status['updated']}, エラー {status['errors']}, 残り {len(remaining)}"
+        )
+
+    def _save_state(self, remaining: List[str]) -> None:
+        """再開用の状態を保存（バッチごと）"""
+        if not remaining:
+            return
+        with self._lock:
+            state = {
+                "cache_type": self._status["cache_type"],
+                "remaining": remaining,
+                "total": self._status["total"],
+                "updated": self._status["updated"],
+                "errors": self._status["errors"],
+            }
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.state_file.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False)
+            tmp_path.replace(self.state_file)
+        except Exception as e:
+            logger.warning(f"⚠️ キャッシュ更新ジョブの状態保存エラー: {e}")
+
+
+def get_cache_refresh_job() -> CacheRefreshJob:
+    """CacheRefreshJob インスタンスを取得（シングルトン）"""
+    global _cache_refresh_job
+    if _cache_refresh_job is None:
+        _cache_refresh_job = CacheRefreshJob()
+    return _cache_refresh_job
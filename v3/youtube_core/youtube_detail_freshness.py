@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""
+YouTube 動画詳細の鮮度付き共有キャッシュ
+
+YouTube Data API（videos.list）から「実際に取得した」動画詳細を、取得時刻付きで
+プロセス内に保持する。YouTubeVideoClassifier と YouTubeAPIPlugin の両方が記録し、
+投稿直前の確認など「直近の情報が必要な処理」は、N 秒以内に取得済みであれば
+API を呼ばずにこの結果を再利用する。
+
+例: LiveModule.poll_lives() で分類した直後に BlueskyImagePlugin.post_video() が
+同じ動画の最新情報を確認する場合、クォータ 1 ユニットと往復 1 回を節約できる。
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+__author__ = "mayuneco(mayunya)"
+__copyright__ = "Copyright (C) 2025 mayuneco(mayunya)"
+__license__ = "GPLv2"
+
+# 「最新情報」とみなす取得からの経過時間（秒）
+DETAIL_FRESHNESS_SECONDS = 120
+# 保持する最大件数（古いものから破棄）
+_MAX_ENTRIES = 512
+
+_entries: "OrderedDict[str, tuple]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def record_video_detail(video_id: str, details: Dict[str, Any]) -> None:
+    """
+    API から取得した動画詳細を取得時刻付きで記録
+
+    Args:
+        video_id: YouTube 動画 ID
+        details: videos.list の item
+    """
+    if not video_id or not details:
+        return
+    with _lock:
+        _entries[video_id] = (time.monotonic(), details)
+        _entries.move_to_end(video_id)
+        while len(_entries) > _MAX_ENTRIES:
+            _entries.popitem(last=False)
+
+
+def get_fresh_video_detail(video_id: str, max_age: float = DETAIL_FRESHNESS_SECONDS) -> Optional[Dict[str, Any]]:
+    """
+    max_age 秒以内に API から取得した動画詳細を取得
+
+    Args:
+        video_id: YouTube 動画 ID
+        max_age: 許容する取得からの経過時間（秒）
+
+    Returns:
+        動画詳細（videos.list の item）、該当なし・期限切れの場合は None
+    """
+    with _lock:
+        entry = _entries.get(video_id)
+    if not entry:
+        return None
+    fetched_at, details = entry
+    if time.monotonic() - fetched_at > max_age:
+        return None
+    return details
+
+
+def clear_video_details() -> None:
+    """記録済みの動画詳細をすべて破棄"""
+    with _lock:
+        _entries.clear()
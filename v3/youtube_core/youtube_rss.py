@@ -11,9 +11,12 @@ import feedparser
 import logging
 import requests
 import sqlite3
+import time
 from typing import List, Dict
 from datetime import datetime, timedelta, timezone
 from image_manager import get_youtube_thumbnail_url
+from log_routing import route_module_logs
+from metrics import record_feed_fetch
 
 logger = logging.getLogger("AppLogger")
 
@@ -46,7 +49,9 @@ class YouTubeRSS:
         """
         try:
             logger.debug(f"RSS を取得します: {self.rss_url}")
+            started = time.perf_counter()
             feed = feedparser.parse(self.rss_url)
+            record_feed_fetch("youtube_rss", feed, time.perf_counter() - started)
 
             if feed.status != 200 and feed.bozo:
                 logger.warning(f"RSS 取得に警告がありました: {feed.bozo_exception}")
@@ -62,7 +67,7 @@ class YouTubeRSS:
                     utc_time = datetime.fromisoformat(rss_published_at.replace('Z', '+00:00'))
                     jst_time = utc_time.astimezone(timezone(timedelta(hours=9))).replace(tzinfo=None)
                     published_at_jst = jst_time.isoformat()
-                    logger.debug(f"📡 RSS 日時を JST に変換: {rss_published_at} → {published_at_jst}")
+                    logger.debug("📡 RSS 日時を JST に変換: %s → %s", rss_published_at, published_at_jst)
                 except Exception as e:
                     logger.warning(f"⚠️ RSS 日時の JST 変換失敗、元の値を使用: {e}")
                     published_at_jst = rss_published_at
@@ -225,12 +230,8 @@ class YouTubeRSS:
         except Exception as e:
             youtube_logger.debug(f"⚠️ YouTube API プラグイン未利用: {e}")
 
-        # database モジュールのロガーを一時的に YouTubeLogger に切り替え
-        import database as db_module
-        original_logger = db_module.logger
-        db_module.logger = youtube_logger
-
-        try:
+        # database モジュールのログを YouTubeLogger に振り替え（このスレッド内のみ）
+        with route_module_logs("YouTubeLogger", modules=("database",)):
             for video in videos:
                 # ★ 新: 除外動画リスト確認
                 if deleted_cache and deleted_cache.is_deleted(video["video_id"], source="youtube"):
@@ -242,11 +243,11 @@ class YouTubeRSS:
                 # 既存動画は処理をスキップし、API 呼び出しを削減
                 existing_video = database.get_video_by_id(video["video_id"])
                 if existing_video:
-                    youtube_logger.debug(f"ℹ️ 既存動画のため、スキップします: {video['title']}")
+                    youtube_logger.debug("ℹ️ 既存動画のため、スキップします: %s", video['title'])
                     continue  # 既存動画は詳細情報の再取得をしない（クォータ削減）
 
-                # サムネイル URL を取得（多品質フォールバック）
-                thumbnail_url = get_youtube_thumbnail_url(video["video_id"])
+                # サムネイル URL を取得（実在確認・品質フォールバックは画像ダウンロード時に行う）
+                thumbnail_url = get_youtube_thumbnail_url(video["video_id"], probe=False)
 
                 # ★ 重要: YouTube API プラグイン を優先実行
                 # API から取得した scheduledStartTime を published_at として使用
@@ -307,9 +308,9 @@ class YouTubeRSS:
                         classification_result = classifier.classify_video(video["video_id"])
                         if classification_result.get("success"):
                             video_type = classification_result.get("type")
-                            youtube_logger.debug(f"🎬 動画を分類: {video.get('title')} (type={video_type})")
+                            youtube_logger.debug("🎬 動画を分類: %s (type=%s)", video.get('title'), video_type)
                         else:
-                            youtube_logger.debug(f"⏭️ 分類失敗（通常動画として処理）: {video['video_id']} - {classification_result.get('error')}")
+                            youtube_logger.debug("⏭️ 分類失敗（通常動画として処理）: %s - %s", video['video_id'], classification_result.get('error'))
                             video_type = "video"  # デフォルトは通常動画
                     except Exception as e:
                         youtube_logger.warning(f"⚠️ YouTube VideoClassifier 呼び出しエラー（通常動画として処理）: {e}")
@@ -349,7 +350,7 @@ class YouTubeRSS:
                             try:
                                 from utils_v3 import format_datetime_filter
                                 representative_time_jst = format_datetime_filter(rep_time_utc, fmt="%Y-%m-%d %H:%M:%S")
-                                youtube_logger.debug(f"📡 YouTubeVideoClassifier から representative_time を取得: {rep_time_utc} → {representative_time_jst}")
+                                youtube_logger.debug("📡 YouTubeVideoClassifier から representative_time を取得: %s → %s", rep_time_utc, representative_time_jst)
                             except Exception as e:
                                 youtube_logger.warning(f"⚠️ representative_time_utc の JST 変換失敗: {e}")
                                 representative_time_jst = final_published_at  # フォールバック
@@ -357,7 +358,7 @@ class YouTubeRSS:
                     # フォールバック: classifier が失敗したか representative_time_utc が空の場合
                     if not representative_time_utc:
                         representative_time_utc = video.get("published_at")  # RSS では already JST
-                        youtube_logger.debug(f"📡 フォールバック: RSS の published_at を representative_time として使用")
+                        youtube_logger.debug("📡 フォールバック: RSS の published_at を representative_time として使用")
 
                     # ★ 注意: insert_video() 内で post_video() が呼ばれ、追加の API 呼び出しが発生する可能性があります
                     # post_video() が classification_result を参照できるようにするための準備が必要です
@@ -376,9 +377,9 @@ class YouTubeRSS:
 
                     if is_new:
                         saved_count += 1
-                        youtube_logger.debug(f"[YouTube RSS] 新動画を DB に保存しました: {video['title']} (type={video_type})")
+                        youtube_logger.debug("[YouTube RSS] 新動画を DB に保存しました: %s (type=%s)", video['title'], video_type)
                     else:
-                        youtube_logger.debug(f"[YouTube RSS] 既存動画です: {video['title']}")
+                        youtube_logger.debug("[YouTube RSS] 既存動画です: %s", video['title'])
 
             summary = f"✅ 保存完了: 新規 {saved_count}, 既存 {existing_count}"
             if live_registered_count > 0:
@@ -393,10 +394,6 @@ class YouTubeRSS:
             else:
                 youtube_logger.info(f"ℹ️ 新着動画はありません")
 
-        finally:
-            # ロガーを元に戻す
-            db_module.logger = original_logger
-
         return (saved_count, live_registered_count)
 
     def poll_videos(self):
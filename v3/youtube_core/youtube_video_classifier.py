@@ -10,11 +10,15 @@ Live関連（スケジュール、放送中、放送終了、ライブアーカ
 import logging
 import os
 import json
+import threading
 import time
 from typing import Optional, Dict, Any
 from pathlib import Path
 import requests
 
+from youtube_core.youtube_detail_freshness import record_video_detail
+from metrics import CLASSIFIER_CACHE_TOTAL, YOUTUBE_QUOTA_UNITS_TOTAL
+
 __author__ = "mayuneco(mayunya)"
 __copyright__ = "Copyright (C) 2025 mayuneco(mayunya)"
 __license__ = "GPLv2"
@@ -59,9 +63,25 @@ class YouTubeVideoClassifier:
             logger.warning("⚠️ YOUTUBE_API_KEY が設定されていません")
         self.session = requests.Session()
 
-        # キャッシュの初期化
-        self.video_detail_cache: Dict[str, Dict[str, Any]] = {}
-        self._load_cache()
+        # キャッシュの初期化（ファイルは初回参照時または warm_up() で読み込む）
+        self._video_detail_cache: Dict[str, Dict[str, Any]] = {}
+        self._cache_loaded = False
+        self._cache_lock = threading.Lock()
+
+    @property
+    def video_detail_cache(self) -> Dict[str, Dict[str, Any]]:
+        """ビデオ詳細キャッシュ（未読み込みの場合はここで読み込む）"""
+        if not self._cache_loaded:
+            self.warm_up()
+        return self._video_detail_cache
+
+    def warm_up(self) -> None:
+        """キャッシュファイルを読み込む（初回のみ。起動時にバックグラウンドで事前に呼び出す）"""
+        with self._cache_lock:
+            if self._cache_loaded:
+                return
+            self._load_cache()
+            self._cache_loaded = True
 
     def classify_video(self, video_id: str, force_refresh: bool = False) -> Dict[str, Any]:
         """
@@ -102,7 +122,8 @@ class YouTubeVideoClassifier:
             cache_entry = self._get_cache_entry(video_id)
             if cache_entry:
                 # キャッシュが有効 → そのまま利用（Live関連含む）
-                logger.debug(f"📦 キャッシュから動画詳細を取得: {video_id}")
+                CLASSIFIER_CACHE_TOTAL.inc(result="hit")
+                logger.debug("📦 キャッシュから動画詳細を取得: %s", video_id)
                 video_data = cache_entry
                 classified = self._classify_from_response({
                     "success": True,
@@ -112,8 +133,11 @@ class YouTubeVideoClassifier:
                 return classified
             else:
                 # キャッシュが期限切れ → メモリキャッシュから削除
-                logger.debug(f"🔄 キャッシュ期限切れ（{video_id}）: 再取得します")
+                CLASSIFIER_CACHE_TOTAL.inc(result="expired")
+                logger.debug("🔄 キャッシュ期限切れ（%s）: 再取得します", video_id)
                 del self.video_detail_cache[video_id]
+        elif not force_refresh:
+            CLASSIFIER_CACHE_TOTAL.inc(result="miss")
 
         if not self.api_key:
             return {
@@ -137,9 +161,11 @@ class YouTubeVideoClassifier:
             # キャッシュを再利用して API 呼び出しを削減。状態が頻繁に変わる場合は
             # force_refresh=True を指定して明示的に再取得すること
             if result.get("success") and "video_data" in result:
+                # 投稿直前の確認などで再利用できるよう、取得時刻付きで共有キャッシュにも記録
+                record_video_detail(video_id, result["video_data"])
                 self.video_detail_cache[video_id] = result["video_data"]
                 self._save_cache()
-                logger.debug(f"💾 動画詳細をキャッシュに保存: {video_id}")
+                logger.debug("💾 動画詳細をキャッシュに保存: %s", video_id)
 
             return classified
 
@@ -152,6 +178,23 @@ class YouTubeVideoClassifier:
                 "error": str(e)
             }
 
+    def store_video_details(self, details: Dict[str, Dict[str, Any]]) -> None:
+        """
+        API から取得済みの動画詳細をまとめてキャッシュに保存（ファイル書き込みは1回）
+
+        キャッシュ一括更新ジョブなど、videos.list をバッチで呼び出した結果を反映するために使用。
+
+        Args:
+            details: {video_id: videos.list の item}
+        """
+        if not details:
+            return
+        for video_id, video_data in details.items():
+            record_video_detail(video_id, video_data)
+            self.video_detail_cache[video_id] = video_data
+        self._save_cache(list(details))
+        logger.debug(f"💾 動画詳細をキャッシュに一括保存: {len(details)} 件")
+
     def _call_videos_api(self, video_id: str) -> Dict[str, Any]:
         """
         YouTube Data API の videos.list を呼び出し
@@ -171,6 +214,7 @@ class YouTubeVideoClassifier:
         try:
             response = self.session.get(VIDEOS_API_ENDPOINT, params=params, timeout=10)
             response.raise_for_status()
+            YOUTUBE_QUOTA_UNITS_TOTAL.inc(1, caller="classifier", operation="videos.list")
 
             data = response.json()
 
@@ -283,7 +327,7 @@ class YouTubeVideoClassifier:
                 live_status = None  # アーカイブは live_status を持たない
                 # ★ 【新】基準時刻：actualEndTime
                 representative_time_utc = actual_end_time
-                logger.debug(f"✅ アーカイブ判定: {video_id} (actualEndTime={actual_end})")
+                logger.debug("✅ アーカイブ判定: %s (actualEndTime=%s)", video_id, actual_end)
             else:
                 # 判定不可だが live_details が存在
                 logger.warning(f"⚠️ ライブステータス判定不可（{video_id}）: {live_details}")
@@ -376,9 +420,9 @@ class YouTubeVideoClassifier:
             # キャッシュを辞書に変換（video_id をキーにする）
             for video_id, cache_entry in cache_data.items():
                 if isinstance(cache_entry, dict) and "data" in cache_entry:
-                    self.video_detail_cache[video_id] = cache_entry["data"]
+                    self._video_detail_cache[video_id] = cache_entry["data"]
 
-            logger.info(f"✅ ビデオ詳細キャッシュを読み込みました: {len(self.video_detail_cache)}件")
+            logger.info(f"✅ ビデオ詳細キャッシュを読み込みました: {len(self._video_detail_cache)}件")
 
         except json.JSONDecodeError as e:
             logger.error(f"❌ キャッシュファイルの解析エラー: {e}")
@@ -434,13 +478,13 @@ class YouTubeVideoClassifier:
             if is_live_related:
                 expiry_seconds = CACHE_EXPIRY_LIVE_MINUTES * 60
                 if elapsed_seconds > expiry_seconds:
-                    logger.debug(f"🔄 Live関連動画キャッシュ期限切れ（{video_id}）: {elapsed_seconds:.0f}秒経過")
+                    logger.debug("🔄 Live関連動画キャッシュ期限切れ（%s）: %.0f秒経過", video_id, elapsed_seconds)
                     return None
             else:
                 # 通常動画は長い有効期限（7日）
                 expiry_seconds = CACHE_EXPIRY_DAYS * 86400
                 if elapsed_seconds > expiry_seconds:
-                    logger.debug(f"🔄 通常動画キャッシュ期限切れ（{video_id}）: {elapsed_seconds:.0f}秒経過")
+                    logger.debug("🔄 通常動画キャッシュ期限切れ（%s）: %.0f秒経過", video_id, elapsed_seconds)
                     return None
 
             # 有効期限内
@@ -451,8 +495,14 @@ class YouTubeVideoClassifier:
             # エラー時はメモリキャッシュをそのまま返す
             return video_data
 
-    def _save_cache(self) -> None:
-        """ビデオ詳細キャッシュをファイルに保存"""
+    def _save_cache(self, video_ids: Optional[list] = None) -> None:
+        """
+        ビデオ詳細キャッシュをファイルに保存
+
+        Args:
+            video_ids: 取得時刻（cached_at）を更新する動画 ID（None の場合はメモリ上の全件）
+                       指定外の動画は既存ファイルの cached_at を維持する
+        """
         cache_path = Path(VIDEO_DETAIL_CACHE_FILE)
         cache_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -464,10 +514,14 @@ class YouTubeVideoClassifier:
                     existing_cache = json.load(f)
 
             # 既存キャッシュにマージ
-            for video_id, video_data in self.video_detail_cache.items():
+            now = time.time()
+            targets = self.video_detail_cache.keys() if video_ids is None else video_ids
+            for video_id in targets:
+                if video_id not in self.video_detail_cache:
+                    continue
                 existing_cache[video_id] = {
-                    "data": video_data,
-                    "cached_at": time.time()
+                    "data": self.video_detail_cache[video_id],
+                    "cached_at": now
                 }
 
             # ファイルに保存
@@ -15,6 +15,7 @@ import sqlite3
 from typing import List, Dict
 from datetime import datetime, timedelta, timezone
 from image_manager import get_youtube_thumbnail_url
+from log_routing import route_module_logs
 
 logger = logging.getLogger("AppLogger")
 
@@ -196,7 +197,7 @@ class YouTubeWebSub:
                     published_at_jst = self._ensure_jst_format(published_at)
 
                     # ★ 重要: サムネイル URL を取得
-                    thumbnail_url = get_youtube_thumbnail_url(video_id)
+                    thumbnail_url = get_youtube_thumbnail_url(video_id, probe=False)
                     if not thumbnail_url:
                         logger.warning(f"⚠️ WebSub {video_id}: サムネイル URL が取得できませんでした")
                     else:
@@ -362,12 +363,8 @@ class YouTubeWebSub:
         except Exception as e:
             youtube_logger.debug(f"⚠️ YouTube API プラグイン未利用: {e}")
 
-        # database モジュールのロガーを一時的に YouTubeLogger に切り替え
-        import database as db_module
-        original_logger = db_module.logger
-        db_module.logger = youtube_logger
-
-        try:
+        # database モジュールのログを YouTubeLogger に振り替え（このスレッド内のみ）
+        with route_module_logs("YouTubeLogger", modules=("database",)):
             for video in filtered_videos:
                 # ★ 【v3.3.2】新規動画のみを処理
                 # 既存動画は処理をスキップし、API 呼び出しを削減
@@ -385,8 +382,8 @@ class YouTubeWebSub:
                     blacklist_skip_count += 1
                     continue
 
-                # サムネイル URL を取得（多品質フォールバック）
-                thumbnail_url = get_youtube_thumbnail_url(video["video_id"])
+                # サムネイル URL を取得（実在確認・品質フォールバックは画像ダウンロード時に行う）
+                thumbnail_url = get_youtube_thumbnail_url(video["video_id"], probe=False)
 
                 # ★ 重要: YouTube API プラグイン を優先実行
                 # API から取得した scheduledStartTime を published_at として使用
@@ -515,10 +512,6 @@ class YouTubeWebSub:
             else:
                 youtube_logger.info(f"ℹ️ 新着動画はありません")
 
-        finally:
-            # ロガーを元に戻す
-            db_module.logger = original_logger
-
         summary = f"新規 {saved_count} 件 / 既存 {existing_count} 件"
         if live_registered_count > 0:
             summary += f" / Live登録 {live_registered_count} 件"